@@ -143,6 +143,7 @@ def init_logging(conf_filename: str,
     from ruamel.yaml import YAML
 
     from hummingbot.client.config.global_config_map import global_config_map
+    from hummingbot.logger.queue_log_handler import LogQueueListener
     from hummingbot.logger.struct_logger import (
         StructLogRecord,
         StructLogger
@@ -156,6 +157,9 @@ def init_logging(conf_filename: str,
     # Do not raise exceptions during log handling
     logging.raiseExceptions = False
 
+    # Write out queued log records before the handlers get replaced.
+    LogQueueListener.uninstall()
+
     file_path: str = join(prefix_path(), "conf", conf_filename)
     yaml_parser: YAML = YAML()
     with open(file_path) as fd:
@@ -175,6 +179,14 @@ def init_logging(conf_filename: str,
         if dev_mode:
             add_remote_logger_handler(config_dict.get("loggers", []))
 
+        # Format and write log records on a background thread, rather than on the event loop.
+        if global_config_map["async_logging_enabled"].value is not False:
+            loggers: List[logging.Logger] = [logging.getLogger()]
+            loggers.extend(logging.getLogger(logger_name) for logger_name in config_dict.get("loggers", []))
+            LogQueueListener.install(loggers,
+                                     global_config_map["log_queue_max_size"].value or
+                                     LogQueueListener.DEFAULT_MAX_QUEUE_SIZE)
+
 
 def get_strategy_list() -> List[str]:
     """
@@ -179,7 +179,7 @@ class ConfigCommand:
             balances = await UserBalances.instance().balances(exchange, base, quote)
             if balances is None:
                 return
-            base_ratio = UserBalances.base_amount_ratio(exchange, market, balances)
+            base_ratio = await UserBalances.base_amount_ratio(exchange, market, balances)
             if base_ratio is None:
                 return
             base_ratio = round(base_ratio, 3)
@@ -2,10 +2,7 @@ from typing import TYPE_CHECKING, Optional
 import os
 from typing import List
 import pandas as pd
-from sqlalchemy.orm import (
-    Session,
-    Query
-)
+from sqlalchemy.orm import Query
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.client.config.security import Security
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -91,15 +88,18 @@ class ExportCommand:
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
                                  number_of_rows: Optional[int] = None) -> List[TradeFill]:
-        session: Session = self.trade_fill_db.get_shared_session()
-        query: Query = (session
-                        .query(TradeFill)
-                        .filter(TradeFill.timestamp >= start_timestamp)
-                        .order_by(TradeFill.timestamp.desc()))
-        if number_of_rows is None:
-            result: List[TradeFill] = query.all() or []
-        else:
-            result: List[TradeFill] = query.limit(number_of_rows).all() or []
+        # Trade fills are written behind, write the pending ones first.
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
+        with self.trade_fill_db.begin_reporting() as session:
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(TradeFill.timestamp >= start_timestamp)
+                            .order_by(TradeFill.timestamp.desc()))
+            if number_of_rows is None:
+                result: List[TradeFill] = query.all() or []
+            else:
+                result: List[TradeFill] = query.limit(number_of_rows).all() or []
 
         # Get the latest 100 trades in ascending timestamp order
         result.reverse()
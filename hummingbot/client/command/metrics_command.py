@@ -0,0 +1,39 @@
+from typing import (
+    List,
+    Optional,
+    TYPE_CHECKING
+)
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.core.management.metrics import (
+    EventLoopLagMonitor,
+    MetricsHTTPServer,
+    MetricsRegistry
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class MetricsCommand:
+    def metrics(self,  # type: HummingbotApplication
+                reset: bool = False):
+        registry: MetricsRegistry = MetricsRegistry.get_instance()
+        if reset:
+            registry.reset()
+            self._notify("\n  Metrics histograms reset.")
+            return
+        lines: List[str] = ["", "  Times are in milliseconds."]
+        lines.extend(registry.summary_lines())
+        if self._metrics_http_server is not None:
+            lines.extend(["", f"  Prometheus metrics: http://127.0.0.1:{self._metrics_http_server.port}/metrics"])
+        self._notify("\n".join(lines))
+
+    def _start_metrics(self,  # type: HummingbotApplication
+                       ):
+        EventLoopLagMonitor.get_instance().start()
+        metrics_http_port: Optional[int] = global_config_map.get("metrics_http_port").value
+        if metrics_http_port is not None and self._metrics_http_server is None:
+            self._metrics_http_server = MetricsHTTPServer(int(metrics_http_port))
+            safe_ensure_future(self._metrics_http_server.start())
@@ -117,7 +117,7 @@ class StartCommand:
                     self._notify("Error: script feature is only available for pure_market_making strategy (for now).")
                 else:
                     self._script_iterator = ScriptIterator(script_file, list(self.markets.values()),
-                                                           self.strategy, 0.1)
+                                                           self.strategy)
                     self.clock.add_iterator(self._script_iterator)
                     self._notify(f"Script ({script_file}) started.")
 
@@ -10,7 +10,6 @@ from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.market.market_base import MarketBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.core.utils.ethereum import check_web3
 from hummingbot.client.config.config_helpers import (
     missing_required_configs,
     get_strategy_config_map
@@ -144,6 +143,7 @@ class StatusCommand:
 
         if self.wallet is not None:
             # Only check node url when a wallet has been initialized
+            from hummingbot.core.utils.ethereum import check_web3
             eth_node_valid = check_web3(global_config_map.get("ethereum_rpc_url").value)
             if not eth_node_valid:
                 self._notify('  - Node check: Bad ethereum rpc url. '
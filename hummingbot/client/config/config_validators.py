@@ -4,7 +4,10 @@ from hummingbot.client.settings import (
     STRATEGIES,
 )
 from decimal import Decimal
-from typing import Optional
+from typing import (
+    List,
+    Optional
+)
 
 
 # Validators
@@ -45,12 +48,11 @@ def validate_market_trading_pair(market: str, value: str) -> Optional[str]:
     # Since trading pair validation and autocomplete are UI optimizations that do not impact bot performances,
     # in case of network issues or slow wifi, this check returns true and does not prevent users from proceeding,
     trading_pair_fetcher: TradingPairFetcher = TradingPairFetcher.get_instance()
-    if trading_pair_fetcher.ready:
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market)
-        if len(trading_pairs) == 0:
-            return None
-        elif value not in trading_pairs:
-            return f"{value} is not an active market on {market}."
+    trading_pairs: List[str] = trading_pair_fetcher.get_trading_pairs(market)
+    if len(trading_pairs) == 0:
+        return None
+    elif value not in trading_pairs:
+        return f"{value} is not an active market on {market}."
 
 
 def validate_bool(value: str) -> Optional[str]:
@@ -76,6 +76,18 @@ global_config_map = {
                            "conf"
                            ],
                   type_str="list"),
+    "async_logging_enabled":
+        ConfigVar(key="async_logging_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=True),
+    "log_queue_max_size":
+        ConfigVar(key="log_queue_max_size",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=10000),
     "key_file_path":
         ConfigVar(key="key_file_path",
                   prompt=f"Where would you like to save your private key file? "
@@ -386,6 +398,42 @@ global_config_map = {
                   type_str="str",
                   required_if=lambda: global_config_map.get("db_engine").value != "sqlite",
                   default="dbname"),
+    "db_sqlite_performance_profile":
+        ConfigVar(key="db_sqlite_performance_profile",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=True),
+    "db_sqlite_cache_size":
+        ConfigVar(key="db_sqlite_cache_size",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=65536),
+    "db_sqlite_statement_cache_size":
+        ConfigVar(key="db_sqlite_statement_cache_size",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=256),
+    "market_data_recorder_enabled":
+        ConfigVar(key="market_data_recorder_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
+    "market_data_recorder_depth":
+        ConfigVar(key="market_data_recorder_depth",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=10),
+    "metrics_http_port":
+        ConfigVar(key="metrics_http_port",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=None),
     "0x_active_cancels":
         ConfigVar(key="0x_active_cancels",
                   prompt="Enable active order cancellations for 0x exchanges (warning: this costs gas)?  >>> ",
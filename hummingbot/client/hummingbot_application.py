@@ -4,33 +4,20 @@ import asyncio
 from collections import deque
 import logging
 import time
-from typing import List, Dict, Optional, Tuple, Set, Deque
+from typing import List, Dict, Optional, Tuple, Set, Deque, Type, TYPE_CHECKING
 
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
+from hummingbot.core.utils.market_mid_price import MidPriceService
 from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTrackerDataSourceType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.bittrex.bittrex_market import BittrexMarket
-from hummingbot.market.kucoin.kucoin_market import KucoinMarket
-from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
-from hummingbot.market.huobi.huobi_market import HuobiMarket
-from hummingbot.market.liquid.liquid_market import LiquidMarket
-from hummingbot.market.eterbase.eterbase_market import EterbaseMarket
+from hummingbot.market.connector_registry import MARKET_CLASSES
 from hummingbot.market.market_base import MarketBase
 from hummingbot.market.paper_trade import create_paper_trade_market
-from hummingbot.market.radar_relay.radar_relay_market import RadarRelayMarket
-from hummingbot.market.bamboo_relay.bamboo_relay_market import BambooRelayMarket
-from hummingbot.market.dolomite.dolomite_market import DolomiteMarket
-from hummingbot.market.bitcoin_com.bitcoin_com_market import BitcoinComMarket
-from hummingbot.market.kraken.kraken_market import KrakenMarket
-from hummingbot.market.ocean.ocean_market import OceanMarket
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
-from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
-from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import load_parser, ThrowingArgumentParser
 from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
@@ -47,26 +34,15 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.market.market_data_recorder import MarketDataRecorder
 from hummingbot.client.config.security import Security
+from hummingbot.core.management.metrics import MetricsHTTPServer
 
+if TYPE_CHECKING:
+    from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 
-s_logger = None
 
-MARKET_CLASSES = {
-    "bamboo_relay": BambooRelayMarket,
-    "binance": BinanceMarket,
-    "coinbase_pro": CoinbaseProMarket,
-    "huobi": HuobiMarket,
-    "liquid": LiquidMarket,
-    "radar_relay": RadarRelayMarket,
-    "dolomite": DolomiteMarket,
-    "bittrex": BittrexMarket,
-    "kucoin": KucoinMarket,
-    "bitcoin_com": BitcoinComMarket,
-    "ocean": OceanMarket,
-    "eterbase": EterbaseMarket,
-    "kraken": KrakenMarket
-}
+s_logger = None
 
 
 class HummingbotApplication(*commands):
@@ -97,7 +73,7 @@ class HummingbotApplication(*commands):
         )
 
         self.markets: Dict[str, MarketBase] = {}
-        self.wallet: Optional[Web3Wallet] = None
+        self.wallet: Optional["Web3Wallet"] = None
         # strategy file name and name get assigned value after import or create command
         self.strategy_file_name: str = None
         self.strategy_name: str = None
@@ -121,7 +97,9 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: SQLConnectionManager = SQLConnectionManager.get_trade_fills_instance()
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.market_data_recorder: Optional[MarketDataRecorder] = None
         self._script_iterator = None
+        self._metrics_http_server: Optional[MetricsHTTPServer] = None
 
     @property
     def strategy_config_map(self):
@@ -191,6 +169,7 @@ class HummingbotApplication(*commands):
         return success
 
     async def run(self):
+        self._start_metrics()
         await self.app.run()
 
     def add_application_warning(self, app_warning: ApplicationWarning):
@@ -215,13 +194,17 @@ class HummingbotApplication(*commands):
         if not using_wallet():
             return
 
+        # web3 is only needed when trading on DEXes, so it's not imported at startup.
+        from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+        from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
+
         ethereum_wallet = global_config_map.get("ethereum_wallet").value
         private_key = Security._private_keys[ethereum_wallet]
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
         erc20_token_addresses = get_erc20_token_addresses(token_trading_pairs)
 
         chain_name: str = global_config_map.get("ethereum_chain_name").value
-        self.wallet: Web3Wallet = Web3Wallet(
+        self.wallet = Web3Wallet(
             private_key=private_key,
             backend_urls=[ethereum_rpc_url],
             erc20_token_addresses=erc20_token_addresses,
@@ -236,7 +219,7 @@ class HummingbotApplication(*commands):
         for market_name, trading_pairs in market_names:
             if market_name not in market_trading_pairs_map:
                 market_trading_pairs_map[market_name] = []
-            market_class: MarketBase = MARKET_CLASSES.get(market_name, MarketBase)
+            market_class: Type[MarketBase] = MARKET_CLASSES.get(market_name, MarketBase)
             for trading_pair in trading_pairs:
                 exchange_trading_pair: str = market_class.convert_to_exchange_trading_pair(trading_pair)
                 market_trading_pairs_map[market_name].append(exchange_trading_pair)
@@ -250,11 +233,15 @@ class HummingbotApplication(*commands):
                 paper_trade_account_balance = global_config_map.get("paper_trade_account_balance").value
                 for asset, balance in paper_trade_account_balance:
                     market.set_balance(asset, balance)
+                self.markets[market_name]: MarketBase = market
+                continue
 
-            elif market_name == "binance":
+            # Only looked up when not paper trading, as it imports the connector's module.
+            market_class: Type[MarketBase] = MARKET_CLASSES.get(market_name, MarketBase)
+            if market_name == "binance":
                 binance_api_key = global_config_map.get("binance_api_key").value
                 binance_api_secret = global_config_map.get("binance_api_secret").value
-                market = BinanceMarket(
+                market = market_class(
                     binance_api_key,
                     binance_api_secret,
                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -264,7 +251,7 @@ class HummingbotApplication(*commands):
 
             elif market_name == "radar_relay":
                 assert self.wallet is not None
-                market = RadarRelayMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     trading_pairs=trading_pairs,
@@ -275,7 +262,7 @@ class HummingbotApplication(*commands):
                 assert self.wallet is not None
                 use_coordinator = global_config_map.get("bamboo_relay_use_coordinator").value
                 pre_emptive_soft_cancels = global_config_map.get("bamboo_relay_pre_emptive_soft_cancels").value
-                market = BambooRelayMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     trading_pairs=trading_pairs,
@@ -289,24 +276,24 @@ class HummingbotApplication(*commands):
                 coinbase_pro_secret_key = global_config_map.get("coinbase_pro_secret_key").value
                 coinbase_pro_passphrase = global_config_map.get("coinbase_pro_passphrase").value
 
-                market = CoinbaseProMarket(coinbase_pro_api_key,
-                                           coinbase_pro_secret_key,
-                                           coinbase_pro_passphrase,
-                                           trading_pairs=trading_pairs,
-                                           trading_required=self._trading_required)
+                market = market_class(coinbase_pro_api_key,
+                                      coinbase_pro_secret_key,
+                                      coinbase_pro_passphrase,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "huobi":
                 huobi_api_key = global_config_map.get("huobi_api_key").value
                 huobi_secret_key = global_config_map.get("huobi_secret_key").value
-                market = HuobiMarket(huobi_api_key,
-                                     huobi_secret_key,
-                                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                     trading_pairs=trading_pairs,
-                                     trading_required=self._trading_required)
+                market = market_class(huobi_api_key,
+                                      huobi_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "liquid":
                 liquid_api_key = global_config_map.get("liquid_api_key").value
                 liquid_secret_key = global_config_map.get("liquid_secret_key").value
 
-                market = LiquidMarket(liquid_api_key,
+                market = market_class(liquid_api_key,
                                       liquid_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                       user_stream_tracker_data_source_type=UserStreamTrackerDataSourceType.EXCHANGE_API,
@@ -315,7 +302,7 @@ class HummingbotApplication(*commands):
             elif market_name == "dolomite":
                 assert self.wallet is not None
                 is_test_net: bool = global_config_map.get("ethereum_chain_name").value == "DOLOMITE_TEST"
-                market = DolomiteMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -326,16 +313,16 @@ class HummingbotApplication(*commands):
             elif market_name == "bittrex":
                 bittrex_api_key = global_config_map.get("bittrex_api_key").value
                 bittrex_secret_key = global_config_map.get("bittrex_secret_key").value
-                market = BittrexMarket(bittrex_api_key,
-                                       bittrex_secret_key,
-                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                       trading_pairs=trading_pairs,
-                                       trading_required=self._trading_required)
+                market = market_class(bittrex_api_key,
+                                      bittrex_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "kucoin":
                 kucoin_api_key = global_config_map.get("kucoin_api_key").value
                 kucoin_secret_key = global_config_map.get("kucoin_secret_key").value
                 kucoin_passphrase = global_config_map.get("kucoin_passphrase").value
-                market = KucoinMarket(kucoin_api_key,
+                market = market_class(kucoin_api_key,
                                       kucoin_passphrase,
                                       kucoin_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -344,32 +331,32 @@ class HummingbotApplication(*commands):
             elif market_name == "bitcoin_com":
                 bitcoin_com_api_key = global_config_map.get("bitcoin_com_api_key").value
                 bitcoin_com_secret_key = global_config_map.get("bitcoin_com_secret_key").value
-                market = BitcoinComMarket(bitcoin_com_api_key,
-                                          bitcoin_com_secret_key,
-                                          order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                          trading_pairs=trading_pairs,
-                                          trading_required=self._trading_required)
+                market = market_class(bitcoin_com_api_key,
+                                      bitcoin_com_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "ocean":
                 ocean_uid = global_config_map.get("ocean_uid").value
                 ocean_private_key_file = global_config_map.get("ocean_private_key_file").value
-                market = OceanMarket(ocean_uid,
-                                     ocean_private_key_file,
-                                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                     trading_pairs=trading_pairs,
-                                     trading_required=self._trading_required)
+                market = market_class(ocean_uid,
+                                      ocean_private_key_file,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "eterbase":
                 eterbase_api_key = global_config_map.get("eterbase_api_key").value
                 eterbase_secret_key = global_config_map.get("eterbase_secret_key").value
                 eterbase_account = global_config_map.get("eterbase_account").value
-                market = EterbaseMarket(eterbase_api_key,
-                                        eterbase_secret_key,
-                                        trading_pairs=trading_pairs,
-                                        trading_required=self._trading_required,
-                                        eterbase_account=eterbase_account)
+                market = market_class(eterbase_api_key,
+                                      eterbase_secret_key,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required,
+                                      eterbase_account=eterbase_account)
             elif market_name == "kraken":
                 kraken_api_key = global_config_map.get("kraken_api_key").value
                 kraken_secret_key = global_config_map.get("kraken_secret_key").value
-                market = KrakenMarket(kraken_api_key,
+                market = market_class(kraken_api_key,
                                       kraken_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                       trading_pairs=trading_pairs,
@@ -379,6 +366,8 @@ class HummingbotApplication(*commands):
 
             self.markets[market_name]: MarketBase = market
 
+        MidPriceService.get_instance().add_markets(self.markets.values())
+
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
@@ -387,6 +376,13 @@ class HummingbotApplication(*commands):
         )
         self.markets_recorder.start()
 
+        if global_config_map.get("market_data_recorder_enabled").value:
+            self.market_data_recorder = MarketDataRecorder(
+                list(self.markets.values()),
+                depth=global_config_map.get("market_data_recorder_depth").value,
+            )
+            self.market_data_recorder.start()
+
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
             # TODO: refactor to use single instance
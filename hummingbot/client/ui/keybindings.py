@@ -1,17 +1,8 @@
 #!/usr/bin/env python
 
 from prompt_toolkit.application.current import get_app
-from prompt_toolkit.filters import (
-    is_searching,
-    to_filter,
-)
+from prompt_toolkit.filters import Condition
 from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.search import (
-    start_search,
-    stop_search,
-    do_incremental_search,
-    SearchDirection,
-)
 
 from hummingbot.client.ui.scroll_handlers import (
     scroll_down,
@@ -22,6 +13,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 
 def load_key_bindings(hb) -> KeyBindings:
     bindings = KeyBindings()
+    is_searching = Condition(lambda: hb.app.log_field.is_searching)
 
     @bindings.add("c-c", "c-c")
     def exit_(event):
@@ -43,13 +35,14 @@ def load_key_bindings(hb) -> KeyBindings:
         hb.app.log("\n[CTRL + S] Status")
         hb.status()
 
-    @bindings.add("c-f", filter=to_filter(not is_searching()))
+    @bindings.add("c-f", filter=~is_searching)
     def do_find(event):
-        start_search(hb.app.log_field.control)
+        hb.app.log_field.start_search()
+        get_app().layout.focus(hb.app.search_field.control)
 
     @bindings.add("c-f", filter=is_searching)
     def do_exit_find(event):
-        stop_search()
+        hb.app.log_field.stop_search()
         get_app().layout.focus(hb.app.input_field.control)
         get_app().invalidate()
 
@@ -59,7 +52,7 @@ def load_key_bindings(hb) -> KeyBindings:
 
     @bindings.add("c-m", filter=is_searching)
     def do_find_next(event):
-        do_incremental_search(direction=SearchDirection.FORWARD)
+        hb.app.log_field.search_next()
 
     @bindings.add("c-c")
     def do_copy(event):
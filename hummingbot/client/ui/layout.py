@@ -17,9 +17,12 @@ from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 from prompt_toolkit.completion import Completer
 from prompt_toolkit.utils import is_windows
 from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.widgets import SearchToolbar
 
 from hummingbot.client.ui.custom_widgets import CustomTextArea as TextArea
+from hummingbot.client.ui.log_pane import (
+    LogPane,
+    LogSearchField,
+)
 from hummingbot.client.settings import (
     MAXIMUM_OUTPUT_PANE_LINE_COUNT,
     MAXIMUM_LOG_PANE_LINE_COUNT,
@@ -110,23 +113,18 @@ def create_output_field():
     )
 
 
-def create_search_field() -> SearchToolbar:
-    return SearchToolbar(text_if_not_searching=[('class:primary', "[CTRL + F] to start searching.")],
-                         forward_search_prompt=[('class:primary', "Search logs [Press CTRL + F to hide search] >>> ")],
-                         ignore_case=True)
+def create_search_field() -> LogSearchField:
+    return LogSearchField(text_if_not_searching=[('class:primary', "[CTRL + F] to start searching.")],
+                          search_prompt=[('class:primary', "Search logs [Press CTRL + F to hide search] >>> ")])
 
 
-def create_log_field(search_field: SearchToolbar):
-    return TextArea(
+def create_log_field(search_field: LogSearchField) -> LogPane:
+    return LogPane(
         style='class:log-field',
-        text="Running logs\n",
-        focus_on_click=False,
-        read_only=False,
         scrollbar=True,
         max_line_count=MAXIMUM_LOG_PANE_LINE_COUNT,
-        initial_text="Running Logs \n",
+        initial_text="Running Logs ",
         search_field=search_field,
-        preview_search=False,
     )
 
 
@@ -153,8 +151,8 @@ def get_title_bar_right_text():
 
 def generate_layout(input_field: TextArea,
                     output_field: TextArea,
-                    log_field: TextArea,
-                    search_field: SearchToolbar):
+                    log_field: LogPane,
+                    search_field: LogSearchField):
     root_container = HSplit([
         VSplit([
             Window(FormattedTextControl(get_version), style="class:title"),
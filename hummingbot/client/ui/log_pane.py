@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+
+import asyncio
+import threading
+import time
+from typing import (
+    Iterator,
+    List,
+    Optional
+)
+
+from prompt_toolkit.application.current import get_app
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.data_structures import Point
+from prompt_toolkit.formatted_text import StyleAndTextTuples
+from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.layout.controls import (
+    BufferControl,
+    UIContent,
+    UIControl
+)
+from prompt_toolkit.layout.margins import ScrollbarMargin
+from prompt_toolkit.layout.processors import BeforeInput
+from prompt_toolkit.mouse_events import (
+    MouseEvent,
+    MouseEventType
+)
+
+
+class LogRingBuffer:
+    """
+    Fixed capacity ring buffer of log lines, with O(1) appends and random access. Lines are also addressable by their
+    absolute line number, i.e. the number of lines appended before them, which stays valid as old lines are dropped.
+    """
+    def __init__(self, capacity: int):
+        self._capacity: int = capacity
+        self._lines: List[Optional[str]] = [None] * capacity
+        self._start: int = 0
+        self._count: int = 0
+        self._total_count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Log line index out of range.")
+        return self._lines[(self._start + index) % self._capacity]
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self[i]
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def first_line_number(self) -> int:
+        return self._total_count - self._count
+
+    @property
+    def last_line_number(self) -> int:
+        return self._total_count - 1
+
+    def append(self, line: str):
+        if self._count < self._capacity:
+            self._lines[(self._start + self._count) % self._capacity] = line
+            self._count += 1
+        else:
+            self._lines[self._start] = line
+            self._start = (self._start + 1) % self._capacity
+        self._total_count += 1
+
+    def extend(self, lines: List[str]):
+        for line in lines[-self._capacity:]:
+            self.append(line)
+        self._total_count += max(len(lines) - self._capacity, 0)
+
+    def clear(self):
+        self._lines = [None] * self._capacity
+        self._start = 0
+        self._count = 0
+
+
+class LogSearchField:
+    """
+    One line search input for a `LogPane`.
+    """
+    def __init__(self, text_if_not_searching: StyleAndTextTuples, search_prompt: StyleAndTextTuples):
+        self.is_searching: bool = False
+        self._text_if_not_searching: StyleAndTextTuples = text_if_not_searching
+        self._search_prompt: StyleAndTextTuples = search_prompt
+        self.buffer: Buffer = Buffer(multiline=False)
+        self.control: BufferControl = BufferControl(
+            buffer=self.buffer,
+            input_processors=[BeforeInput(self._get_before_input, style="class:search-toolbar.prompt")]
+        )
+        self.window: Window = Window(self.control, height=1, style="class:search-toolbar")
+
+    def _get_before_input(self) -> StyleAndTextTuples:
+        return self._search_prompt if self.is_searching else self._text_if_not_searching
+
+    def __pt_container__(self) -> Window:
+        return self.window
+
+
+class LogPaneControl(UIControl):
+    def __init__(self, log_pane: "LogPane"):
+        self._log_pane: "LogPane" = log_pane
+
+    def is_focusable(self) -> bool:
+        return False
+
+    def create_content(self, width: int, height: int) -> UIContent:
+        return self._log_pane.create_content()
+
+    def mouse_handler(self, mouse_event: MouseEvent):
+        if mouse_event.event_type == MouseEventType.SCROLL_UP:
+            self._log_pane.scroll_up(self._log_pane.MOUSE_SCROLL_LINES)
+        elif mouse_event.event_type == MouseEventType.SCROLL_DOWN:
+            self._log_pane.scroll_down(self._log_pane.MOUSE_SCROLL_LINES)
+        else:
+            return NotImplemented
+
+
+class LogPane:
+    """
+    Read only log view over a `LogRingBuffer`. Only the lines in the visible viewport are turned into fragments when
+    rendering, and redraws triggered by new log lines are coalesced to at most `MAX_FRAME_RATE` per second.
+
+    `log()` may be called from any thread.
+    """
+    MAX_FRAME_RATE = 20.0
+    MOUSE_SCROLL_LINES = 3
+
+    def __init__(self,
+                 style: str = "",
+                 max_line_count: int = 1000,
+                 initial_text: str = "",
+                 search_field: Optional[LogSearchField] = None,
+                 scrollbar: bool = True):
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._ev_loop_thread: threading.Thread = threading.current_thread()
+        self.log_lines: LogRingBuffer = LogRingBuffer(max_line_count)
+        # Absolute line number to keep in view, or None to follow the latest log line.
+        self._scroll_line: Optional[int] = None
+        self._search_text: str = ""
+        self._search_match: Optional[int] = None
+        self._redraw_handle: Optional[asyncio.Handle] = None
+        self._last_redraw_timestamp: float = 0
+
+        self.search_field: Optional[LogSearchField] = search_field
+        if search_field is not None:
+            search_field.buffer.on_text_changed += lambda buffer: self.search(buffer.text)
+
+        self.control: LogPaneControl = LogPaneControl(self)
+        self.window: Window = Window(content=self.control,
+                                     style="class:text-area " + style,
+                                     wrap_lines=True,
+                                     always_hide_cursor=True,
+                                     right_margins=[ScrollbarMargin(display_arrows=True)] if scrollbar else [])
+        self.log(initial_text)
+
+    def __pt_container__(self) -> Window:
+        return self.window
+
+    @property
+    def is_searching(self) -> bool:
+        return self.search_field is not None and self.search_field.is_searching
+
+    def log(self, text: str):
+        if threading.current_thread() is not self._ev_loop_thread:
+            self._ev_loop.call_soon_threadsafe(self.log, text)
+            return
+        self.log_lines.extend(str(text).split("\n"))
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        if self._redraw_handle is not None:
+            return
+        delay: float = max(0.0, self._last_redraw_timestamp + 1.0 / self.MAX_FRAME_RATE - time.time())
+        self._redraw_handle = self._ev_loop.call_later(delay, self._redraw)
+
+    def _redraw(self):
+        self._redraw_handle = None
+        self._last_redraw_timestamp = time.time()
+        get_app().invalidate()
+
+    def create_content(self) -> UIContent:
+        log_lines: LogRingBuffer = self.log_lines
+        first_line_number: int = log_lines.first_line_number
+        search_text: str = self._search_text.lower() if self.is_searching else ""
+
+        if self.is_searching and self._search_match is not None:
+            cursor_line: int = self._search_match
+        elif self._scroll_line is not None:
+            cursor_line = self._scroll_line
+        else:
+            cursor_line = log_lines.last_line_number
+        cursor_row: int = min(max(cursor_line - first_line_number, 0), max(len(log_lines) - 1, 0))
+
+        def get_line(row: int) -> StyleAndTextTuples:
+            line: str = log_lines[row]
+            if len(search_text) == 0:
+                return [("", line)]
+            style: str = "class:search.current" if row + first_line_number == self._search_match else "class:search"
+            return self._highlight(line, search_text, style)
+
+        return UIContent(get_line=get_line,
+                         line_count=len(log_lines),
+                         cursor_position=Point(x=0, y=cursor_row),
+                         show_cursor=False)
+
+    @staticmethod
+    def _highlight(line: str, search_text: str, style: str) -> StyleAndTextTuples:
+        fragments: StyleAndTextTuples = []
+        lowered: str = line.lower()
+        position: int = 0
+        match_index: int = lowered.find(search_text)
+        while match_index >= 0:
+            if match_index > position:
+                fragments.append(("", line[position:match_index]))
+            position = match_index + len(search_text)
+            fragments.append((style, line[match_index:position]))
+            match_index = lowered.find(search_text, position)
+        if position < len(line) or len(fragments) == 0:
+            fragments.append(("", line[position:]))
+        return fragments
+
+    def scroll_up(self, lines: int):
+        current_line: int = self._scroll_line if self._scroll_line is not None else self.log_lines.last_line_number
+        self._scroll_line = max(current_line - lines, self.log_lines.first_line_number)
+        self._schedule_redraw()
+
+    def scroll_down(self, lines: int):
+        if self._scroll_line is not None:
+            self._scroll_line += lines
+            if self._scroll_line >= self.log_lines.last_line_number:
+                self._scroll_line = None
+        self._schedule_redraw()
+
+    def start_search(self):
+        if self.search_field is None:
+            return
+        self.search_field.is_searching = True
+        self.search_field.buffer.reset()
+        self._search_text = ""
+        self._search_match = None
+
+    def stop_search(self):
+        if self.search_field is None:
+            return
+        self.search_field.is_searching = False
+        self.search_field.buffer.reset()
+        self._search_text = ""
+        self._search_match = None
+        self._scroll_line = None
+        self._schedule_redraw()
+
+    def _find(self, search_text: str, before_line: int) -> Optional[int]:
+        """
+        Finds the latest line containing `search_text` before `before_line`, wrapping around to the latest log line.
+        """
+        needle: str = search_text.lower()
+        log_lines: LogRingBuffer = self.log_lines
+        first_line_number: int = log_lines.first_line_number
+        start_row: int = min(before_line - first_line_number, len(log_lines)) - 1
+        rows: List[range] = [range(start_row, -1, -1), range(len(log_lines) - 1, start_row, -1)]
+        for row_range in rows:
+            for row in row_range:
+                if needle in log_lines[row].lower():
+                    return row + first_line_number
+        return None
+
+    def search(self, search_text: str):
+        self._search_text = search_text
+        self._search_match = None
+        if len(search_text) > 0:
+            self._search_match = self._find(search_text, self.log_lines.last_line_number + 1)
+        self._schedule_redraw()
+
+    def search_next(self):
+        """
+        Moves to the next older match, wrapping around to the latest one.
+        """
+        if len(self._search_text) == 0:
+            return
+        before_line: int = self._search_match if self._search_match is not None \
+            else self.log_lines.last_line_number + 1
+        self._search_match = self._find(self._search_text, before_line)
+        self._schedule_redraw()
@@ -88,4 +88,8 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
     export_parser.add_argument("option", nargs="?", choices=("keys", "trades"), help="Export choices.")
     export_parser.set_defaults(func=hummingbot.export)
 
+    metrics_parser = subparsers.add_parser("metrics", help="Show tick times, event loop lag and queue depths")
+    metrics_parser.add_argument("--reset", action="store_true", default=False, help="Reset the histograms")
+    metrics_parser.set_defaults(func=hummingbot.metrics)
+
     return parser
@@ -10,3 +10,5 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        dict _tick_histograms
+        object _tick_histogram
@@ -8,6 +8,10 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.management.metrics import (
+    iterator_tick_histogram,
+    tick_duration_histogram
+)
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -36,6 +40,9 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        # Wall time of each iterator's ticks, in real time mode.
+        self._tick_histograms = {}
+        self._tick_histogram = tick_duration_histogram()
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -81,6 +88,7 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_histograms.pop(iterator, None)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +98,10 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start_time
+            double iterator_start_time
+            double iterator_end_time
+            object iterator_histogram
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -113,6 +125,8 @@ cdef class Clock:
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
+                tick_start_time = time.perf_counter()
+                iterator_start_time = tick_start_time
                 for ci in self._current_context:
                     child_iterator = ci
                     try:
@@ -122,6 +136,13 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    iterator_end_time = time.perf_counter()
+                    iterator_histogram = self._tick_histograms.get(ci)
+                    if iterator_histogram is None:
+                        iterator_histogram = self._tick_histograms[ci] = iterator_tick_histogram(ci)
+                    iterator_histogram.observe(iterator_end_time - iterator_start_time)
+                    iterator_start_time = iterator_end_time
+                self._tick_histogram.observe(iterator_start_time - tick_start_time)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -1,4 +1,5 @@
 #include "OrderBookEntry.h"
+#include <algorithm>
 #include <iostream>
 
 OrderBookEntry::OrderBookEntry() {
@@ -29,6 +30,43 @@ bool operator<(OrderBookEntry const &a, OrderBookEntry const &b) {
     return a.price < b.price;
 }
 
+// Makes the book hold the given entries, by erasing and inserting only the price levels that changed. The entries are
+// sorted in place. Of entries at the same price, the first one is kept, as with inserting all of them into an empty
+// book. Returns the number of price levels that were erased, inserted or updated.
+int replaceEntries(std::set<OrderBookEntry> &book, std::vector<OrderBookEntry> &entries) {
+    std::stable_sort(entries.begin(), entries.end());
+    int changes = 0;
+    std::set<OrderBookEntry>::iterator bookIterator = book.begin();
+    std::vector<OrderBookEntry>::iterator entryIterator;
+    for (entryIterator = entries.begin(); entryIterator != entries.end(); ++entryIterator) {
+        const OrderBookEntry &entry = *entryIterator;
+        if (entryIterator != entries.begin() && !(*std::prev(entryIterator) < entry)) {
+            continue;
+        }
+        while (bookIterator != book.end() && *bookIterator < entry) {
+            bookIterator = book.erase(bookIterator);
+            changes++;
+        }
+        if (bookIterator != book.end() && !(entry < *bookIterator)) {
+            if (bookIterator->amount != entry.amount) {
+                bookIterator = book.erase(bookIterator);
+                bookIterator = std::next(book.insert(bookIterator, entry));
+                changes++;
+            } else {
+                bookIterator++;
+            }
+        } else {
+            book.insert(bookIterator, entry);
+            changes++;
+        }
+    }
+    while (bookIterator != book.end()) {
+        bookIterator = book.erase(bookIterator);
+        changes++;
+    }
+    return changes;
+}
+
 void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook, const int &dex) {
     if (dex != 0) {
         truncateOverlapEntriesDex(bidBook, askBook);
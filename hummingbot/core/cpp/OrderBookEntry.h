@@ -3,6 +3,7 @@
 
 #include <stdint.h>
 #include <set>
+#include <vector>
 #include <iterator>
 
 class OrderBookEntry {
@@ -19,6 +20,7 @@ class OrderBookEntry {
         friend void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook, const int &dex);
         friend void truncateOverlapEntriesDex(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook);
         friend void truncateOverlapEntriesCentralised(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook);
+        friend int replaceEntries(std::set<OrderBookEntry> &book, std::vector<OrderBookEntry> &entries);
 
         double getPrice() const;
         double getAmount() const;
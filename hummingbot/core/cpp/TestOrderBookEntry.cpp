@@ -5,17 +5,26 @@
 #include <cmath>
 #include <cstdio>
 #include <set>
+#include <vector>
 #include "OrderBookEntry.h"
 
 typedef std::set<OrderBookEntry> OrderBookSide;
 
 void testOverlappingOrderBooks();
+void testReplaceEntries();
 
 int main(const int argc, const char **argv) {
     testOverlappingOrderBooks();
+    testReplaceEntries();
     return 0;
 }
 
+void printEntries(const OrderBookSide &book) {
+    for (OrderBookSide::iterator it = book.begin(); it != book.end(); ++it) {
+        printf("  %.2f x %.2f (update %lld)\n", (*it).getPrice(), (*it).getAmount(), (long long)(*it).getUpdateId());
+    }
+}
+
 void printTopPrices(const OrderBookSide &bidsBook, const OrderBookSide &asksBook) {
     double topBid = nan("");
     double topAsk = nan("");
@@ -78,3 +87,30 @@ void testOverlappingOrderBooks() {
     truncateOverlapEntriesCentralised(bidsBook, asksBook);
     printTopPrices(bidsBook, asksBook);
 }
+
+void testReplaceEntries() {
+    OrderBookSide book;
+    std::vector<OrderBookEntry> entries;
+
+    printf("\n*** testReplaceEntries(): Stage 1 ***\n");
+    entries = {OrderBookEntry(100.0, 1.0, 1), OrderBookEntry(99.9, 2.0, 1), OrderBookEntry(99.8, 4.0, 1)};
+    printf("Changes: %d (expect 3)\n", replaceEntries(book, entries));
+    printEntries(book);
+
+    printf("\n*** testReplaceEntries(): Stage 2 ***\n");
+    // 100.0 is unchanged, 99.9 changes amount, 99.8 is gone, 99.7 and 100.1 are new.
+    entries = {OrderBookEntry(100.1, 0.5, 2), OrderBookEntry(100.0, 1.0, 2), OrderBookEntry(99.9, 3.0, 2),
+               OrderBookEntry(99.7, 8.0, 2)};
+    printf("Changes: %d (expect 4)\n", replaceEntries(book, entries));
+    printEntries(book);
+
+    printf("\n*** testReplaceEntries(): Stage 3 ***\n");
+    entries = {OrderBookEntry(99.0, 1.0, 3), OrderBookEntry(99.0, 2.0, 3)};
+    printf("Changes: %d (expect 5)\n", replaceEntries(book, entries));
+    printEntries(book);
+
+    printf("\n*** testReplaceEntries(): Stage 4 ***\n");
+    entries.clear();
+    printf("Changes: %d (expect 1)\n", replaceEntries(book, entries));
+    printf("Empty? %d\n", book.empty());
+}
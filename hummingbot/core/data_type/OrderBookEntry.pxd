@@ -2,6 +2,7 @@
 
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
+from libcpp.vector cimport vector
 
 cdef extern from "../cpp/OrderBookEntry.h":
     cdef cppclass OrderBookEntry:
@@ -14,3 +15,4 @@ cdef extern from "../cpp/OrderBookEntry.h":
         int64_t getUpdateId() const
 
     void truncateOverlapEntries(set[OrderBookEntry] &bid_book, set[OrderBookEntry] &ask_book, const bint &dex)
+    int replaceEntries(set[OrderBookEntry] &book, vector[OrderBookEntry] &entries)
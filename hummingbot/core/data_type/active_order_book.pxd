@@ -0,0 +1,33 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.string cimport string
+from libcpp.unordered_map cimport unordered_map
+cimport numpy as np
+
+cdef struct ActiveOrder:
+    bint is_bid
+    double price
+    double size
+
+cdef struct ActiveLevel:
+    double volume
+    int64_t order_count
+
+cdef class ActiveOrderBook:
+    cdef unordered_map[string, ActiveOrder] _orders
+    cdef unordered_map[double, ActiveLevel] _bid_levels
+    cdef unordered_map[double, ActiveLevel] _ask_levels
+
+    cdef unordered_map[double, ActiveLevel] *c_levels(self, bint is_bid)
+    cdef bint c_has_order(self, str order_id)
+    cdef ActiveOrder c_get_order(self, str order_id)
+    cdef c_add_order(self, str order_id, bint is_bid, double price, double size)
+    cdef bint c_set_order_size(self, str order_id, double size)
+    cdef bint c_reduce_order_size(self, str order_id, double amount)
+    cdef bint c_remove_order(self, str order_id)
+    cdef c_clear(self)
+    cdef double c_volume_for_price(self, bint is_bid, double price)
+    cdef tuple c_level_to_np_arrays(self, bint is_bid, double price, double timestamp, double update_id)
+    cdef np.ndarray c_levels_to_np_array(self, bint is_bid, double timestamp, double update_id)
+    cdef tuple c_snapshot_np_arrays(self, double timestamp, double update_id)
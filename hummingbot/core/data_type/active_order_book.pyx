@@ -0,0 +1,213 @@
+# distutils: language=c++
+
+from cython.operator cimport(
+    dereference as deref,
+    preincrement as inc
+)
+from libc.math cimport fabs
+from libcpp.string cimport string
+from libcpp.unordered_map cimport unordered_map
+import numpy as np
+from typing import Dict
+
+s_empty_levels = np.ndarray(shape=(0, 4), dtype="float64")
+
+# Running totals pick up rounding errors, e.g. 0.1 + 0.2 - 0.1 - 0.2 is 2.78e-17. Totals this close to 0 are 0, so an
+# emptied level isn't reported as a tiny amount.
+cdef double LEVEL_VOLUME_EPSILON = 1e-12
+
+
+cdef inline void c_add_to_level(ActiveLevel *level, double amount):
+    level.volume += amount
+    if fabs(level.volume) < LEVEL_VOLUME_EPSILON:
+        level.volume = 0.0
+
+
+cdef class ActiveOrderBook:
+    """
+    Order by order (L3) book for the active order trackers of exchanges that publish individual orders. Each order
+    is found by its id, and each price level keeps the running total of the sizes of its orders, so an update costs
+    the same however many orders rest at its price.
+    """
+
+    @property
+    def active_bids(self) -> Dict[float, float]:
+        """
+        :returns: Dict[price, volume]
+        """
+        return {level.first: level.second.volume for level in self._bid_levels}
+
+    @property
+    def active_asks(self) -> Dict[float, float]:
+        """
+        :returns: Dict[price, volume]
+        """
+        return {level.first: level.second.volume for level in self._ask_levels}
+
+    @property
+    def order_count(self) -> int:
+        return self._orders.size()
+
+    def has_order(self, order_id: str) -> bool:
+        return self.c_has_order(order_id)
+
+    def add_order(self, order_id: str, is_bid: bool, price: float, size: float):
+        self.c_add_order(order_id, is_bid, price, size)
+
+    def set_order_size(self, order_id: str, size: float) -> bool:
+        return self.c_set_order_size(order_id, size)
+
+    def reduce_order_size(self, order_id: str, amount: float) -> bool:
+        return self.c_reduce_order_size(order_id, amount)
+
+    def remove_order(self, order_id: str) -> bool:
+        return self.c_remove_order(order_id)
+
+    def clear(self):
+        self.c_clear()
+
+    def volume_for_price(self, is_bid: bool, price: float) -> float:
+        return self.c_volume_for_price(is_bid, price)
+
+    def snapshot_np_arrays(self, timestamp: float, update_id: float):
+        return self.c_snapshot_np_arrays(timestamp, update_id)
+
+    cdef unordered_map[double, ActiveLevel] *c_levels(self, bint is_bid):
+        return &self._bid_levels if is_bid else &self._ask_levels
+
+    cdef bint c_has_order(self, str order_id):
+        return self._orders.find(order_id.encode("utf8")) != self._orders.end()
+
+    cdef ActiveOrder c_get_order(self, str order_id):
+        """
+        The order must be in the book, see `c_has_order()`.
+        """
+        return self._orders[order_id.encode("utf8")]
+
+    cdef c_add_order(self, str order_id, bint is_bid, double price, double size):
+        """
+        Adds an order to its price level. An order already in the book with the same id is replaced.
+        """
+        cdef:
+            string cpp_order_id = order_id.encode("utf8")
+            unordered_map[double, ActiveLevel] *levels = self.c_levels(is_bid)
+            ActiveLevel *level
+
+        if self._orders.find(cpp_order_id) != self._orders.end():
+            self.c_remove_order(order_id)
+        self._orders[cpp_order_id] = ActiveOrder(is_bid=is_bid, price=price, size=size)
+        # A new level starts zeroed.
+        level = &deref(levels)[price]
+        c_add_to_level(level, size)
+        level.order_count += 1
+
+    cdef bint c_set_order_size(self, str order_id, double size):
+        """
+        :returns: whether the order is in the book
+        """
+        cdef:
+            string cpp_order_id = order_id.encode("utf8")
+            unordered_map[string, ActiveOrder].iterator it = self._orders.find(cpp_order_id)
+            ActiveOrder *order
+            ActiveLevel *level
+
+        if it == self._orders.end():
+            return False
+        order = &deref(it).second
+        level = &deref(self.c_levels(order.is_bid))[order.price]
+        c_add_to_level(level, size - order.size)
+        order.size = size
+        return True
+
+    cdef bint c_reduce_order_size(self, str order_id, double amount):
+        """
+        :returns: whether the order is in the book
+        """
+        cdef:
+            string cpp_order_id = order_id.encode("utf8")
+            unordered_map[string, ActiveOrder].iterator it = self._orders.find(cpp_order_id)
+            ActiveOrder *order
+            ActiveLevel *level
+
+        if it == self._orders.end():
+            return False
+        order = &deref(it).second
+        level = &deref(self.c_levels(order.is_bid))[order.price]
+        c_add_to_level(level, -amount)
+        order.size -= amount
+        return True
+
+    cdef bint c_remove_order(self, str order_id):
+        """
+        Removes an order, and its price level once no order is left there.
+        :returns: whether the order was in the book
+        """
+        cdef:
+            string cpp_order_id = order_id.encode("utf8")
+            unordered_map[string, ActiveOrder].iterator it = self._orders.find(cpp_order_id)
+            ActiveOrder order
+            unordered_map[double, ActiveLevel] *levels
+            ActiveLevel *level
+
+        if it == self._orders.end():
+            return False
+        order = deref(it).second
+        self._orders.erase(it)
+        levels = self.c_levels(order.is_bid)
+        level = &deref(levels)[order.price]
+        level.order_count -= 1
+        if level.order_count < 1:
+            levels.erase(order.price)
+        else:
+            c_add_to_level(level, -order.size)
+        return True
+
+    cdef c_clear(self):
+        self._orders.clear()
+        self._bid_levels.clear()
+        self._ask_levels.clear()
+
+    cdef double c_volume_for_price(self, bint is_bid, double price):
+        cdef:
+            unordered_map[double, ActiveLevel] *levels = self.c_levels(is_bid)
+            unordered_map[double, ActiveLevel].iterator it = levels.find(price)
+
+        if it == levels.end():
+            return 0.0
+        return deref(it).second.volume
+
+    cdef tuple c_level_to_np_arrays(self, bint is_bid, double price, double timestamp, double update_id):
+        """
+        :returns: the row of one price level, with a volume of 0 if the level is gone: Tuple(np.array (bids),
+                  np.array (asks))
+        """
+        cdef:
+            np.ndarray row = np.array([[timestamp, price, self.c_volume_for_price(is_bid, price), update_id]],
+                                      dtype="float64")
+
+        if is_bid:
+            return row, s_empty_levels
+        return s_empty_levels, row
+
+    cdef np.ndarray c_levels_to_np_array(self, bint is_bid, double timestamp, double update_id):
+        cdef:
+            unordered_map[double, ActiveLevel] *levels = self.c_levels(is_bid)
+            unordered_map[double, ActiveLevel].iterator it = levels.begin()
+            np.ndarray[np.float64_t, ndim=2] rows = np.empty((levels.size(), 4), dtype="float64")
+            int64_t i = 0
+
+        while it != levels.end():
+            rows[i, 0] = timestamp
+            rows[i, 1] = deref(it).first
+            rows[i, 2] = deref(it).second.volume
+            rows[i, 3] = update_id
+            inc(it)
+            i += 1
+        return rows[np.argsort(-rows[:, 1], kind="stable")]
+
+    cdef tuple c_snapshot_np_arrays(self, double timestamp, double update_id):
+        """
+        :returns: all the price levels, sorted by descending price: Tuple(np.array (bids), np.array (asks))
+        """
+        return (self.c_levels_to_np_array(True, timestamp, update_id),
+                self.c_levels_to_np_array(False, timestamp, update_id))
@@ -20,6 +20,10 @@ cdef class OrderBook(PubSub):
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef int c_apply_snapshot_changes(self,
+                                      vector[OrderBookEntry] bids,
+                                      vector[OrderBookEntry] asks,
+                                      int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
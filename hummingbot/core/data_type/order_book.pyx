@@ -5,13 +5,17 @@ from cython.operator cimport(
     dereference as deref,
     address as ref
 )
-from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.OrderBookEntry cimport (
+    replaceEntries,
+    truncateOverlapEntries
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
     OrderBookTradeEvent
 )
 from typing import (
+    Any,
     List,
     Iterator,
     Tuple,
@@ -30,6 +34,7 @@ import logging
 cimport numpy as np
 ob_logger = None
 NaN = float("nan")
+cdef int64_t ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.UpdateEvent.value
 
 
 cdef class OrderBook(PubSub):
@@ -88,6 +93,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, self)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -128,6 +134,40 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
+    cdef int c_apply_snapshot_changes(self,
+                                      vector[OrderBookEntry] bids,
+                                      vector[OrderBookEntry] asks,
+                                      int64_t update_id):
+        cdef:
+            int changes
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+
+        # Same result as c_apply_snapshot(), but only the price levels that differ from the book are erased or
+        # inserted. Consecutive snapshots of a busy book share most of their levels.
+        changes = replaceEntries(self._bid_book, bids) + replaceEntries(self._ask_book, asks)
+        if self._dex:
+            truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+
+        # Record the current best prices, for faster c_get_price() calls.
+        self._best_bid = self._best_ask = NaN
+        bid_iterator = self._bid_book.rbegin()
+        ask_iterator = self._ask_book.begin()
+        if bid_iterator != self._bid_book.rend():
+            top_bid = deref(bid_iterator)
+            self._best_bid = top_bid.getPrice()
+        if ask_iterator != self._ask_book.end():
+            top_ask = deref(ask_iterator)
+            self._best_ask = top_ask.getPrice()
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+        self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, self)
+        return changes
 
     cdef c_apply_trade(self, object trade_event):
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
@@ -168,6 +208,24 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_snapshot_levels(self, bids: List[Any], asks: List[Any], update_id: int) -> int:
+        """
+        Applies a full depth snapshot given as exchange levels, [price, amount, ...] with numeric or string values,
+        without making OrderBookRow objects. Only the levels that changed are updated.
+
+        :return: the number of price levels that changed
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        cpp_bids.reserve(len(bids))
+        cpp_asks.reserve(len(asks))
+        for level in bids:
+            cpp_bids.push_back(OrderBookEntry(float(level[0]), float(level[1]), update_id))
+        for level in asks:
+            cpp_asks.push_back(OrderBookEntry(float(level[0]), float(level[1]), update_id))
+        return self.c_apply_snapshot_changes(cpp_bids, cpp_asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -251,6 +309,33 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def top_levels(self, int depth) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the top `depth` bid and ask levels as two arrays of [price, amount] rows, ordered from the best price.
+        Missing levels are filled with NaN.
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=2] bids = np.full((depth, 2), NaN, dtype="float64")
+            np.ndarray[np.float64_t, ndim=2] asks = np.full((depth, 2), NaN, dtype="float64")
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            int i = 0
+        while i < depth and bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            bids[i, 0] = entry.getPrice()
+            bids[i, 1] = entry.getAmount()
+            inc(bid_it)
+            i += 1
+        i = 0
+        while i < depth and ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            asks[i, 0] = entry.getPrice()
+            asks[i, 1] = entry.getAmount()
+            inc(ask_it)
+            i += 1
+        return bids, asks
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
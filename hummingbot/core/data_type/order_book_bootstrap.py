@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import logging
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional
+)
+
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_LOW,
+    RateLimiter
+)
+from hummingbot.logger import HummingbotLogger
+
+EntryFetcher = Callable[[str], Awaitable[OrderBookTrackerEntry]]
+BulkEntryFetcher = Callable[[List[str]], Awaitable[Dict[str, OrderBookTrackerEntry]]]
+EntryCallback = Callable[[OrderBookTrackerEntry], None]
+
+
+class OrderBookBootstrap:
+    """
+    Loads the initial order books of many trading pairs concurrently, instead of one snapshot request at a time with
+    a fixed sleep in between.
+
+    Up to `max_concurrency` snapshot requests are in flight at once. With a rate limiter, each request first waits for
+    `request_weight` on the exchange's shared limiter, at low priority so that order requests are served first. With
+    a bulk fetcher, the trading pairs are loaded `bulk_size` at a time, and the ones missing from a bulk response are
+    loaded one by one.
+
+    `on_entry` is called with each order book as soon as it's loaded, so trading pairs can be tracked before all order
+    books are loaded.
+    """
+    DEFAULT_MAX_CONCURRENCY = 8
+    DEFAULT_MAX_ATTEMPTS = 3
+    DEFAULT_RETRY_INTERVAL = 5.0
+
+    _obb_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obb_logger is None:
+            cls._obb_logger = logging.getLogger(__name__)
+        return cls._obb_logger
+
+    def __init__(self,
+                 fetch_entry: EntryFetcher,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 request_weight: int = 1,
+                 endpoint: Optional[str] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 bulk_fetch: Optional[BulkEntryFetcher] = None,
+                 bulk_size: int = 20,
+                 on_entry: Optional[EntryCallback] = None,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 retry_interval: float = DEFAULT_RETRY_INTERVAL):
+        """
+        :param fetch_entry: Loads the order book of one trading pair
+        :param rate_limiter: The exchange's shared rate limiter, or None if `fetch_entry` is rate limited already
+        :param request_weight: Weight of a snapshot request on the rate limiter
+        :param endpoint: Endpoint name of snapshot requests in the rate limiter's endpoint weights
+        :param max_concurrency: Maximum number of snapshot requests in flight
+        :param bulk_fetch: Loads the order books of many trading pairs with one request
+        :param bulk_size: Maximum number of trading pairs per bulk request
+        :param on_entry: Called with each order book as soon as it's loaded
+        :param max_attempts: Number of attempts per trading pair, before giving up on it until the next refresh
+        :param retry_interval: Seconds between attempts
+        """
+        self._fetch_entry: EntryFetcher = fetch_entry
+        self._rate_limiter: Optional[RateLimiter] = rate_limiter
+        self._request_weight: int = request_weight
+        self._endpoint: Optional[str] = endpoint
+        self._max_concurrency: int = max_concurrency
+        self._bulk_fetch: Optional[BulkEntryFetcher] = bulk_fetch
+        self._bulk_size: int = bulk_size
+        self._on_entry: Optional[EntryCallback] = on_entry
+        self._max_attempts: int = max_attempts
+        self._retry_interval: float = retry_interval
+        self._entries: Dict[str, OrderBookTrackerEntry] = {}
+        self._number_of_pairs: int = 0
+
+    async def _acquire(self):
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(self._request_weight, self._endpoint, PRIORITY_LOW)
+
+    def _add_entry(self, trading_pair: str, entry: OrderBookTrackerEntry):
+        self._entries[trading_pair] = entry
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._entries)}/{self._number_of_pairs} completed.")
+        if self._on_entry is not None:
+            try:
+                self._on_entry(entry)
+            except Exception:
+                self.logger().error(f"Error handling the order book for {trading_pair}.", exc_info=True)
+
+    async def _load_trading_pair(self, trading_pair: str):
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                await self._acquire()
+                self._add_entry(trading_pair, await self._fetch_entry(trading_pair))
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Error getting snapshot for {trading_pair}. "
+                                    f"Attempt {attempt}/{self._max_attempts}.", exc_info=True)
+                if attempt < self._max_attempts:
+                    await asyncio.sleep(self._retry_interval)
+
+    async def _load_bulk(self, trading_pairs: List[str]) -> List[str]:
+        """
+        Returns the trading pairs that weren't loaded.
+        """
+        try:
+            await self._acquire()
+            entries: Dict[str, OrderBookTrackerEntry] = await self._bulk_fetch(trading_pairs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(f"Error getting snapshots for {trading_pairs}. Loading them one by one.",
+                                exc_info=True)
+            return trading_pairs
+        for trading_pair in trading_pairs:
+            if trading_pair in entries:
+                self._add_entry(trading_pair, entries[trading_pair])
+        return [trading_pair for trading_pair in trading_pairs if trading_pair not in entries]
+
+    async def _worker(self, bulk_queue: Deque[List[str]], pair_queue: Deque[str]):
+        while len(bulk_queue) > 0:
+            pair_queue.extend(await self._load_bulk(bulk_queue.popleft()))
+        while len(pair_queue) > 0:
+            await self._load_trading_pair(pair_queue.popleft())
+
+    async def run(self, trading_pairs: List[str]) -> Dict[str, OrderBookTrackerEntry]:
+        """
+        Returns the order books that could be loaded, by trading pair.
+        """
+        self._entries = {}
+        self._number_of_pairs = len(trading_pairs)
+        bulk_queue: Deque[List[str]] = deque()
+        pair_queue: Deque[str] = deque()
+        if self._bulk_fetch is not None:
+            bulk_queue.extend(trading_pairs[i:i + self._bulk_size]
+                              for i in range(0, len(trading_pairs), self._bulk_size))
+        else:
+            pair_queue.extend(trading_pairs)
+        number_of_workers: int = max(1, min(self._max_concurrency, len(trading_pairs)))
+        await asyncio.gather(*[self._worker(bulk_queue, pair_queue) for _ in range(number_of_workers)])
+        # Keeps the order of the trading pairs.
+        return {trading_pair: self._entries[trading_pair]
+                for trading_pair in trading_pairs if trading_pair in self._entries}
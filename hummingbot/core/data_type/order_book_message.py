@@ -41,6 +41,15 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
         else:
             return -1
 
+    @property
+    def first_update_id(self) -> Optional[int]:
+        """
+        Update id of the first change in a diff message, for exchanges whose diffs can span many update ids.
+        """
+        if self.type is OrderBookMessageType.DIFF:
+            return self.content.get("first_update_id")
+        return None
+
     @property
     def trade_id(self) -> int:
         if self.type is OrderBookMessageType.TRADE:
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import heapq
+import logging
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_LOW,
+    RateLimiter
+)
+from hummingbot.logger import HummingbotLogger
+
+SnapshotFetcher = Callable[[str], Awaitable[Optional[OrderBookMessage]]]
+
+
+class OrderBookSnapshotScheduler:
+    """
+    Refreshes the order book snapshots of a data source's trading pairs one at a time, spread evenly over
+    `refresh_interval`, instead of sweeping all of them at the top of every hour.
+
+    - At most `request_budget` snapshot requests per second are made. When the trading pairs can't all be refreshed
+      within `refresh_interval` on that budget, the interval is stretched to fit them.
+    - With a rate limiter, each request also waits on the exchange's shared limiter, at low priority.
+    - Trading pairs with more order book activity than average, as reported with `record_activity()`, are refreshed
+      more often, down to every `min_refresh_interval` seconds.
+    - Trading pairs passed to `request_refresh()`, e.g. after a gap in their diffs, are refreshed before all others.
+    """
+    DEFAULT_REFRESH_INTERVAL = 3600.0
+    DEFAULT_MIN_REFRESH_INTERVAL = 60.0
+    DEFAULT_REQUEST_BUDGET = 0.2
+    RETRY_INTERVAL = 5.0
+    TRADING_PAIRS_SYNC_INTERVAL = 60.0
+
+    _obss_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obss_logger is None:
+            cls._obss_logger = logging.getLogger(__name__)
+        return cls._obss_logger
+
+    def __init__(self,
+                 refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+                 min_refresh_interval: float = DEFAULT_MIN_REFRESH_INTERVAL,
+                 request_budget: float = DEFAULT_REQUEST_BUDGET,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 request_weight: int = 1,
+                 endpoint: Optional[str] = None):
+        """
+        :param refresh_interval: Seconds between two snapshots of a trading pair
+        :param min_refresh_interval: Seconds between two snapshots of the most active trading pairs
+        :param request_budget: Maximum number of snapshot requests per second
+        :param rate_limiter: The exchange's shared rate limiter
+        :param request_weight: Weight of a snapshot request on the rate limiter
+        :param endpoint: Endpoint name of snapshot requests in the rate limiter's endpoint weights
+        """
+        self._refresh_interval: float = refresh_interval
+        self._min_refresh_interval: float = min_refresh_interval
+        self._request_budget: float = request_budget
+        self._rate_limiter: Optional[RateLimiter] = rate_limiter
+        self._request_weight: int = request_weight
+        self._endpoint: Optional[str] = endpoint
+
+        # Due times are kept in a heap with lazy deletion: an item is stale if its due time isn't the one in _due_times.
+        self._schedule: List[Tuple[float, str]] = []
+        self._due_times: Dict[str, float] = {}
+        self._urgent_trading_pairs: Deque[str] = deque()
+        self._last_refresh_times: Dict[str, float] = {}
+        self._activity_counts: Dict[str, int] = {}
+        self._activity_rates: Dict[str, float] = {}
+        self._last_request_time: float = float("-inf")
+        self._wakeup_event: asyncio.Event = asyncio.Event()
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._due_times.keys())
+
+    @property
+    def refresh_interval(self) -> float:
+        """
+        The refresh interval, stretched to fit all trading pairs within the request budget.
+        """
+        return max(self._refresh_interval, len(self._due_times) / self._request_budget)
+
+    def due_time(self, trading_pair: str) -> Optional[float]:
+        return self._due_times.get(trading_pair)
+
+    def overdue_count(self) -> int:
+        now: float = time.monotonic()
+        return sum(1 for due_time in self._due_times.values() if due_time <= now) + len(self._urgent_trading_pairs)
+
+    def record_activity(self, trading_pair: str, count: int = 1):
+        if trading_pair in self._activity_counts:
+            self._activity_counts[trading_pair] += count
+
+    def request_refresh(self, trading_pair: str):
+        if trading_pair in self._due_times and trading_pair not in self._urgent_trading_pairs:
+            self._urgent_trading_pairs.append(trading_pair)
+            self._wakeup_event.set()
+
+    def set_trading_pairs(self, trading_pairs: List[str]):
+        """
+        Starts scheduling new trading pairs, spread evenly over the refresh interval, and stops scheduling the ones
+        that are gone.
+        """
+        current_trading_pairs: Set[str] = set(trading_pairs)
+        for trading_pair in list(self._due_times.keys()):
+            if trading_pair not in current_trading_pairs:
+                del self._due_times[trading_pair]
+                self._last_refresh_times.pop(trading_pair, None)
+                self._activity_counts.pop(trading_pair, None)
+                self._activity_rates.pop(trading_pair, None)
+        new_trading_pairs: List[str] = [trading_pair for trading_pair in trading_pairs
+                                        if trading_pair not in self._due_times]
+        if len(new_trading_pairs) == 0:
+            return
+        now: float = time.monotonic()
+        # The initial snapshots were just loaded, so the first refreshes are spread over the whole interval.
+        for trading_pair in new_trading_pairs:
+            self._due_times[trading_pair] = now
+            self._last_refresh_times[trading_pair] = now
+            self._activity_counts[trading_pair] = 0
+        interval: float = self.refresh_interval
+        step: float = interval / len(new_trading_pairs)
+        for index, trading_pair in enumerate(new_trading_pairs):
+            self._set_due_time(trading_pair, now + step * (index + 1))
+        self._wakeup_event.set()
+
+    def _set_due_time(self, trading_pair: str, due_time: float):
+        self._due_times[trading_pair] = due_time
+        heapq.heappush(self._schedule, (due_time, trading_pair))
+
+    def _next_refresh_interval(self, trading_pair: str, now: float) -> float:
+        elapsed: float = now - self._last_refresh_times.get(trading_pair, now)
+        if elapsed > 0:
+            self._activity_rates[trading_pair] = self._activity_counts.get(trading_pair, 0) / elapsed
+        self._activity_counts[trading_pair] = 0
+        self._last_refresh_times[trading_pair] = now
+
+        interval: float = self.refresh_interval
+        rate: float = self._activity_rates.get(trading_pair, 0.0)
+        if rate > 0 and len(self._activity_rates) > 0:
+            mean_rate: float = sum(self._activity_rates.values()) / len(self._activity_rates)
+            if rate > mean_rate:
+                interval = max(self._min_refresh_interval, interval * mean_rate / rate)
+        return interval
+
+    def _reschedule(self, trading_pair: str, succeeded: bool):
+        if trading_pair not in self._due_times:
+            return
+        now: float = time.monotonic()
+        if succeeded:
+            self._set_due_time(trading_pair, now + self._next_refresh_interval(trading_pair, now))
+        else:
+            self._set_due_time(trading_pair, now + self.RETRY_INTERVAL)
+
+    def _pop_due_trading_pair(self) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Returns the next trading pair to refresh if one is due, or else the seconds until the next one is due.
+        """
+        while len(self._urgent_trading_pairs) > 0:
+            trading_pair: str = self._urgent_trading_pairs.popleft()
+            if trading_pair in self._due_times:
+                return trading_pair, None
+        now: float = time.monotonic()
+        while len(self._schedule) > 0:
+            due_time, trading_pair = self._schedule[0]
+            if self._due_times.get(trading_pair) != due_time:
+                heapq.heappop(self._schedule)
+                continue
+            if due_time > now:
+                return None, due_time - now
+            heapq.heappop(self._schedule)
+            return trading_pair, None
+        return None, None
+
+    async def _next_trading_pair(self) -> Optional[str]:
+        """
+        Waits for the next trading pair to refresh, or returns None after a while so the trading pairs can be synced.
+        """
+        trading_pair, wait_time = self._pop_due_trading_pair()
+        if trading_pair is not None:
+            return trading_pair
+        self._wakeup_event.clear()
+        try:
+            await asyncio.wait_for(self._wakeup_event.wait(),
+                                   timeout=min(wait_time or self.TRADING_PAIRS_SYNC_INTERVAL,
+                                               self.TRADING_PAIRS_SYNC_INTERVAL))
+        except asyncio.TimeoutError:
+            pass
+        return self._pop_due_trading_pair()[0]
+
+    async def _acquire(self):
+        wait_time: float = self._last_request_time + 1.0 / self._request_budget - time.monotonic()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        self._last_request_time = time.monotonic()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(self._request_weight, self._endpoint, PRIORITY_LOW)
+
+    async def run(self,
+                  get_trading_pairs: Callable[[], Awaitable[List[str]]],
+                  fetch_snapshot: SnapshotFetcher,
+                  output: asyncio.Queue):
+        """
+        Puts the snapshot messages from `fetch_snapshot` into `output`, forever. `fetch_snapshot` may return None if
+        the snapshot arrives some other way, e.g. on a websocket stream.
+        """
+        while True:
+            trading_pair: Optional[str] = None
+            try:
+                self.set_trading_pairs(await get_trading_pairs())
+                trading_pair = await self._next_trading_pair()
+                if trading_pair is None:
+                    continue
+                await self._acquire()
+                snapshot_msg: Optional[OrderBookMessage] = await fetch_snapshot(trading_pair)
+                if snapshot_msg is not None:
+                    output.put_nowait(snapshot_msg)
+                self.logger().debug(f"Saved order book snapshot for {trading_pair}")
+                self._reschedule(trading_pair, True)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error getting the order book snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error getting order book snapshots. Check network connection."
+                )
+                if trading_pair is not None:
+                    self._reschedule(trading_pair, False)
+                else:
+                    await asyncio.sleep(self.RETRY_INTERVAL)
@@ -20,11 +20,17 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.management.metrics import (
+    GaugeSample,
+    MetricsRegistry,
+    queue_depth_gauges
+)
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
 )
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
@@ -64,6 +70,7 @@ class OrderBookTracker(ABC):
         self._order_book_snapshot_listener_task: Optional[asyncio.Task] = None
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
+        MetricsRegistry.get_instance().add_gauge_source(self)
 
     @property
     @abstractmethod
@@ -80,6 +87,13 @@ class OrderBookTracker(ABC):
         # if no trading_pairs wait for at least 1 order book else wait for trading_pairs
         return len(trading_pairs) <= len(self._order_books) and len(self._order_books) > 0
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order books are loaded, which can be traded on before the tracker is ready.
+        """
+        return list(self._order_books.keys())
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -87,8 +101,19 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def metrics_gauges(self) -> List[GaugeSample]:
+        queues: List[Tuple[str, asyncio.Queue]] = [
+            ("diff_stream", self._order_book_diff_stream),
+            ("snapshot_stream", self._order_book_snapshot_stream),
+            ("trade_stream", self._order_book_trade_stream),
+        ]
+        queues.extend((f"tracking:{trading_pair}", queue)
+                      for trading_pair, queue in self._tracking_message_queues.items())
+        return queue_depth_gauges(type(self).__name__, queues)
+
     def start(self):
         self.stop()
+        self.data_source.order_book_ready_callback = self._on_order_book_ready
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
@@ -153,10 +178,8 @@ class OrderBookTracker(ABC):
         deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
 
         for trading_pair in new_trading_pairs:
-            self._order_books[trading_pair] = available_pairs[trading_pair].order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info("Started order book tracking for %s." % trading_pair)
+            if not self._is_tracking(trading_pair):
+                self._start_tracking_pair(available_pairs[trading_pair])
 
         for trading_pair in deleted_trading_pairs:
             self._tracking_tasks[trading_pair].cancel()
@@ -165,6 +188,36 @@ class OrderBookTracker(ABC):
             del self._tracking_message_queues[trading_pair]
             self.logger().info("Stopped order book tracking for %s." % trading_pair)
 
+    def _is_tracking(self, trading_pair: str) -> bool:
+        return trading_pair in self._tracking_tasks and not self._tracking_tasks[trading_pair].done()
+
+    def _start_tracking_pair(self, entry: OrderBookTrackerEntry):
+        trading_pair: str = entry.trading_pair
+        self._order_books[trading_pair] = entry.order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self.logger().info("Started order book tracking for %s." % trading_pair)
+
+    def _record_diff(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        """
+        Called before a diff is applied. Diffs make the snapshot of a trading pair refreshed more often, and a gap
+        between the order book's last update id and the diff's first update id makes it refreshed right away.
+        """
+        snapshot_scheduler: OrderBookSnapshotScheduler = self.data_source.snapshot_scheduler
+        snapshot_scheduler.record_activity(trading_pair)
+        first_update_id: Optional[int] = message.first_update_id
+        if first_update_id is not None:
+            last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+            if first_update_id > last_update_id + 1 and message.update_id > last_update_id:
+                self.logger().debug("Gap in the order book diffs of %s, from update id %d to %d.",
+                                    trading_pair, last_update_id, first_update_id)
+                snapshot_scheduler.request_refresh(trading_pair)
+
+    def _on_order_book_ready(self, entry: OrderBookTrackerEntry):
+        # Starts tracking a trading pair while the other order books are still being loaded.
+        if not self._is_tracking(entry.trading_pair):
+            self._start_tracking_pair(entry)
+
     async def _refresh_tracking_loop(self):
         """
         Refreshes the tracking of new markets, removes inactive markets, every once in a while.
@@ -252,6 +305,7 @@ class OrderBookTracker(ABC):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
+                    self._record_diff(trading_pair, order_book, message)
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
@@ -10,9 +10,11 @@ from typing import (
     Callable,
     Dict,
     List,
+    Optional
 )
 
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 
 
@@ -20,6 +22,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
     def __init__(self):
         self._order_book_create_function = lambda: OrderBook()
+        self._order_book_ready_callback: Optional[Callable[[OrderBookTrackerEntry], None]] = None
+        self._snapshot_scheduler: Optional[OrderBookSnapshotScheduler] = None
 
     @property
     def order_book_create_function(self) -> Callable[[], OrderBook]:
@@ -29,6 +33,29 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def order_book_ready_callback(self) -> Optional[Callable[[OrderBookTrackerEntry], None]]:
+        """
+        Called by `get_tracking_pairs()` with each order book as soon as it's loaded, where the data source supports it.
+        """
+        return self._order_book_ready_callback
+
+    @order_book_ready_callback.setter
+    def order_book_ready_callback(self, callback: Optional[Callable[[OrderBookTrackerEntry], None]]):
+        self._order_book_ready_callback = callback
+
+    @property
+    def snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        """
+        Schedules the snapshot refreshes of `listen_for_order_book_snapshots()`, where the data source supports it.
+        """
+        if self._snapshot_scheduler is None:
+            self._snapshot_scheduler = self._create_snapshot_scheduler()
+        return self._snapshot_scheduler
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler()
+
     @classmethod
     async def get_active_exchange_markets(cls) -> pd.DataFrame:
         raise NotImplementedError
@@ -51,6 +51,8 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    # Triggered with the order book itself after each diff or snapshot is applied.
+    UpdateEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+
+"""
+Runtime metrics: tick time histograms per clock iterator, event loop lag and queue depth gauges, shown by the
+`metrics` command and optionally served in the Prometheus text format.
+"""
+
+import asyncio
+from bisect import bisect_left
+import logging
+import math
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple
+)
+import weakref
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# Upper bounds in seconds, from 100us to 10s.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                                      0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class GaugeSample(NamedTuple):
+    name: str
+    labels: Labels
+    value: float
+
+
+class Histogram:
+    """
+    Counts of observed values in fixed buckets, along with their sum and maximum. Observing a value is a binary search
+    over the bucket bounds.
+    """
+    __slots__ = ("name", "labels", "bounds", "bucket_counts", "count", "sum", "max")
+
+    def __init__(self, name: str, labels: Labels = (), bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.name: str = name
+        self.labels: Labels = labels
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        # The last bucket counts the values above the largest bound.
+        self.bucket_counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def reset(self):
+        self.bucket_counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count > 0 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the q-quantile by linear interpolation within the bucket it falls in.
+        """
+        if self.count == 0:
+            return 0.0
+        rank: float = q * self.count
+        cumulative: int = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count > 0 and cumulative + bucket_count >= rank:
+                lower: float = self.bounds[i - 1] if i > 0 else 0.0
+                upper: float = self.bounds[i] if i < len(self.bounds) else self.max
+                return min(lower + (upper - lower) * (rank - cumulative) / bucket_count, self.max)
+            cumulative += bucket_count
+        return self.max
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    all_labels: Labels = labels + extra
+    if len(all_labels) == 0:
+        return ""
+    escaped: List[str] = []
+    for key, value in all_labels:
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        escaped.append(f"{key}=\"{value}\"")
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Holds the histograms, and the objects whose gauges are read when the metrics are looked at. Gauge sources are
+    weakly referenced objects with a `metrics_gauges()` method returning GaugeSamples, so reading a queue's depth
+    costs nothing until the metrics are requested.
+    """
+    _mr_logger: Optional[HummingbotLogger] = None
+    _mr_shared_instance: Optional["MetricsRegistry"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        if cls._mr_shared_instance is None:
+            cls._mr_shared_instance = MetricsRegistry()
+        return cls._mr_shared_instance
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._help: Dict[str, str] = {}
+        self._gauge_sources: weakref.WeakSet = weakref.WeakSet()
+
+    @property
+    def histograms(self) -> List[Histogram]:
+        return list(self._histograms.values())
+
+    def histogram(self,
+                  name: str,
+                  labels: Labels = (),
+                  help_text: str = "",
+                  bounds: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        key: Tuple[str, Labels] = (name, labels)
+        if key not in self._histograms:
+            self._histograms[key] = Histogram(name, labels, bounds)
+            if help_text:
+                self._help[name] = help_text
+        return self._histograms[key]
+
+    def set_help(self, name: str, help_text: str):
+        self._help[name] = help_text
+
+    def add_gauge_source(self, source: Any):
+        self._gauge_sources.add(source)
+
+    def remove_gauge_source(self, source: Any):
+        self._gauge_sources.discard(source)
+
+    def gauges(self) -> List[GaugeSample]:
+        samples: List[GaugeSample] = []
+        for source in list(self._gauge_sources):
+            try:
+                samples.extend(source.metrics_gauges())
+            except Exception:
+                self.logger().error(f"Error reading gauges from {source}.", exc_info=True)
+        return samples
+
+    def reset(self):
+        # Clocks, strategies and the event loop monitor keep their histograms, so they're reset in place.
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+    def prometheus_text(self) -> str:
+        lines: List[str] = []
+        histograms_by_name: Dict[str, List[Histogram]] = {}
+        for histogram in self._histograms.values():
+            histograms_by_name.setdefault(histogram.name, []).append(histogram)
+        for name, histograms in histograms_by_name.items():
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for histogram in histograms:
+                cumulative: int = 0
+                for bound, bucket_count in zip(histogram.bounds + (float("inf"),), histogram.bucket_counts):
+                    cumulative += bucket_count
+                    labels: str = _format_labels(histogram.labels, (("le", _format_value(bound)),))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(histogram.labels)} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{_format_labels(histogram.labels)} {histogram.count}")
+        gauges_by_name: Dict[str, List[GaugeSample]] = {}
+        for sample in self.gauges():
+            gauges_by_name.setdefault(sample.name, []).append(sample)
+        for name, samples in gauges_by_name.items():
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} gauge")
+            for sample in samples:
+                lines.append(f"{name}{_format_labels(sample.labels)} {_format_value(sample.value)}")
+        return "\n".join(lines) + "\n"
+
+    def summary_lines(self) -> List[str]:
+        """
+        Human readable summary for the `metrics` command, times in milliseconds.
+        """
+        lines: List[str] = []
+        histograms: List[Histogram] = sorted(self._histograms.values(), key=lambda h: (h.name, h.labels))
+        if len(histograms) > 0:
+            lines.append(f"  {'Histogram':<60} {'Count':>8} {'Mean':>9} {'p50':>9} {'p99':>9} {'Max':>9}")
+            for histogram in histograms:
+                title: str = histogram.name + _format_labels(histogram.labels)
+                lines.append(f"  {title:<60} {histogram.count:>8} "
+                             f"{histogram.mean * 1e3:>9.3f} {histogram.quantile(0.5) * 1e3:>9.3f} "
+                             f"{histogram.quantile(0.99) * 1e3:>9.3f} {histogram.max * 1e3:>9.3f}")
+        gauges: List[GaugeSample] = sorted(self.gauges())
+        if len(gauges) > 0:
+            lines.append("")
+            lines.append(f"  {'Gauge':<60} {'Value':>8}")
+            for sample in gauges:
+                title = sample.name + _format_labels(sample.labels)
+                lines.append(f"  {title:<60} {sample.value:>8g}")
+        return lines
+
+
+def iterator_labels(iterator: Any) -> Labels:
+    """
+    Labels for a clock iterator, with the market name for markets since e.g. paper trade markets share one class.
+    """
+    name: Any = getattr(iterator, "name", None)
+    if isinstance(name, str) and len(name) > 0:
+        return ("iterator", type(iterator).__name__), ("name", name)
+    return ("iterator", type(iterator).__name__),
+
+
+TICK_DURATION_METRIC = "hummingbot_clock_tick_seconds"
+ITERATOR_TICK_DURATION_METRIC = "hummingbot_iterator_tick_seconds"
+EVENT_LOOP_LAG_METRIC = "hummingbot_event_loop_lag_seconds"
+QUEUE_DEPTH_METRIC = "hummingbot_queue_depth"
+
+
+def tick_duration_histogram() -> Histogram:
+    return MetricsRegistry.get_instance().histogram(TICK_DURATION_METRIC,
+                                                    help_text="Wall time of a whole clock tick.")
+
+
+def iterator_tick_histogram(iterator: Any) -> Histogram:
+    return MetricsRegistry.get_instance().histogram(ITERATOR_TICK_DURATION_METRIC, iterator_labels(iterator),
+                                                    help_text="Wall time of c_tick() per clock iterator.")
+
+
+class EventLoopLagMonitor:
+    """
+    Sleeps for `interval` seconds at a time, and records how late the event loop woke it up. Lag means callbacks or
+    coroutines are hogging the event loop, e.g. order book parsing or a strategy tick.
+    """
+    DEFAULT_INTERVAL = 0.25
+
+    _ellm_shared_instance: Optional["EventLoopLagMonitor"] = None
+
+    @classmethod
+    def get_instance(cls) -> "EventLoopLagMonitor":
+        if cls._ellm_shared_instance is None:
+            cls._ellm_shared_instance = EventLoopLagMonitor()
+        return cls._ellm_shared_instance
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self._interval: float = interval
+        self._histogram: Histogram = MetricsRegistry.get_instance().histogram(
+            EVENT_LOOP_LAG_METRIC,
+            help_text="Delay between the scheduled and the actual wakeup time of a sleeping task."
+        )
+        self._last_lag: float = 0.0
+        self._monitor_task: Optional[asyncio.Task] = None
+
+    @property
+    def histogram(self) -> Histogram:
+        return self._histogram
+
+    @property
+    def last_lag(self) -> float:
+        return self._last_lag
+
+    @property
+    def started(self) -> bool:
+        return self._monitor_task is not None
+
+    def start(self):
+        if self._monitor_task is None:
+            self._monitor_task = safe_ensure_future(self._monitor_loop())
+
+    def stop(self):
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+
+    async def _monitor_loop(self):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        while True:
+            scheduled_time: float = ev_loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self._last_lag = max(0.0, ev_loop.time() - scheduled_time)
+            self._histogram.observe(self._last_lag)
+
+
+class MetricsHTTPServer:
+    """
+    Minimal HTTP server answering GET /metrics with the Prometheus text exposition format.
+    """
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    _mhs_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mhs_logger is None:
+            cls._mhs_logger = logging.getLogger(__name__)
+        return cls._mhs_logger
+
+    def __init__(self, port: int, host: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None):
+        self._port: int = port
+        self._host: str = host
+        self._registry: MetricsRegistry = registry or MetricsRegistry.get_instance()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self._host, self._port)
+        self.logger().info(f"Serving metrics on http://{self._host}:{self._port}/metrics")
+
+    def stop(self):
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line: bytes = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            # Skip the request headers.
+            while True:
+                header: bytes = await asyncio.wait_for(reader.readline(), timeout=5.0)
+                if header in (b"\r\n", b"\n", b""):
+                    break
+            parts: List[str] = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] in ("/metrics", "/"):
+                status, body = "200 OK", self._registry.prometheus_text().encode("utf-8")
+            else:
+                status, body = "404 Not Found", b"Not found\n"
+            writer.write(f"HTTP/1.1 {status}\r\n"
+                         f"Content-Type: {self.CONTENT_TYPE}\r\n"
+                         f"Content-Length: {len(body)}\r\n"
+                         f"Connection: close\r\n\r\n".encode("latin-1") + body)
+            await writer.drain()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug("Error serving metrics request.", exc_info=True)
+        finally:
+            writer.close()
+
+
+def queue_depth_gauges(owner: str, queues: Iterable[Tuple[str, asyncio.Queue]]) -> List[GaugeSample]:
+    return [GaugeSample(QUEUE_DEPTH_METRIC, (("owner", owner), ("queue", queue_name)), queue.qsize())
+            for queue_name, queue in queues]
+
+
+MetricsRegistry.get_instance().set_help(QUEUE_DEPTH_METRIC, "Number of messages waiting in a queue.")
@@ -2,34 +2,75 @@
 
 import asyncio
 from async_timeout import timeout
+from collections import deque
+import inspect
 import logging
+import time
 from typing import (
-    Optional,
+    Any,
+    Awaitable,
+    Callable,
     Coroutine,
+    Deque,
+    Dict,
     NamedTuple,
-    Callable
+    Optional,
+    Tuple
 )
 
 import hummingbot
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITIES,
+    PRIORITY_NORMAL
+)
 
 
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
-    coroutine: Coroutine
+    # Creates the awaitable when the call is started, so that nothing runs while the call is waiting in the queue.
+    call_factory: Callable[[], Awaitable]
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    enqueue_time: float = 0.0
+
+
+class AsyncCallSchedulerMetrics(NamedTuple):
+    queue_depth: int
+    queue_depths: Tuple[int, ...]
+    in_flight: int
+    completed: int
+    failed: int
+    timed_out: int
+    cancelled: int
+    mean_wait_time: float
+    max_wait_time: float
+    mean_run_time: float
+    max_run_time: float
 
 
 class AsyncCallScheduler:
+    """
+    Runs scheduled calls with at most `max_concurrency` of them in flight, and at least `call_interval` seconds between
+    the starts of two calls.
+
+    Waiting calls are served by priority (PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW from asyncio_throttle), and
+    in FIFO order within a priority. A call's timeout starts when the call is started, and a call that times out gives
+    up its slot right away. Calls whose callers stop waiting for them are dropped if they haven't been started yet, and
+    cancelled otherwise.
+    """
+    # The shared instance is the funnel for the web3 calls, which are independent of each other.
+    SHARED_MAX_CONCURRENCY = 8
+
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
     @classmethod
     def shared_instance(cls):
         if cls._acs_shared_instance is None:
-            cls._acs_shared_instance = AsyncCallScheduler()
+            cls._acs_shared_instance = AsyncCallScheduler(call_interval=0.0,
+                                                          max_concurrency=cls.SHARED_MAX_CONCURRENCY)
         return cls._acs_shared_instance
 
     @classmethod
@@ -38,91 +79,196 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
+    def __init__(self, call_interval: float = 0.01, max_concurrency: int = 1):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
         self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._lanes: Tuple[Deque[AsyncCallSchedulerItem], ...] = tuple(deque() for _ in PRIORITIES)
+        self._call_tasks: Dict[asyncio.Task, AsyncCallSchedulerItem] = {}
+        self._started: bool = False
+        self._last_call_start: float = float("-inf")
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+        self._completed_count: int = 0
+        self._failed_count: int = 0
+        self._timed_out_count: int = 0
+        self._cancelled_count: int = 0
+        self._wait_count: int = 0
+        self._total_wait_time: float = 0.0
+        self._max_wait_time: float = 0.0
+        self._run_count: int = 0
+        self._total_run_time: float = 0.0
+        self._max_run_time: float = 0.0
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value: int):
+        if value < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {value}.")
+        self._max_concurrency = value
+        self._dispatch()
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+    def queue_depth(self) -> int:
+        return sum(len(lane) for lane in self._lanes)
 
     @property
-    def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+    def in_flight(self) -> int:
+        return len(self._call_tasks)
 
     @property
     def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+        return self._started
 
-    def start(self):
-        if self._coro_scheduler_task is not None:
-            self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
+    @property
+    def metrics(self) -> AsyncCallSchedulerMetrics:
+        return AsyncCallSchedulerMetrics(
+            queue_depth=self.queue_depth,
+            queue_depths=tuple(len(lane) for lane in self._lanes),
+            in_flight=self.in_flight,
+            completed=self._completed_count,
+            failed=self._failed_count,
+            timed_out=self._timed_out_count,
+            cancelled=self._cancelled_count,
+            mean_wait_time=self._total_wait_time / self._wait_count if self._wait_count > 0 else 0.0,
+            max_wait_time=self._max_wait_time,
+            mean_run_time=self._total_run_time / self._run_count if self._run_count > 0 else 0.0,
+            max_run_time=self._max_run_time,
         )
 
+    def start(self):
+        self._started = True
+        self._dispatch()
+
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
-
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
-        while True:
-            app_warning_msg = "API call error."
-            try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
-            except asyncio.CancelledError:
-                try:
-                    fut.cancel()
-                except Exception:
-                    pass
-                raise
-            except asyncio.InvalidStateError:
-                # The future is already cancelled from outside. Ignore.
-                pass
-            except Exception as e:
-                # Add exception information.
-                app_warning_msg += f" [[Got exception: {str(e)}]]"
-                self.logger().debug(app_warning_msg,
-                                    exc_info=True,
-                                    app_warning_msg=app_warning_msg)
-                try:
-                    fut.set_exception(e)
-                except Exception:
-                    pass
-
-            try:
-                await asyncio.sleep(interval)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Scheduler sleep interrupted.", exc_info=True)
+        """
+        Cancels the calls in flight. Waiting calls stay queued until the scheduler is started again.
+        """
+        self._started = False
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        for task in list(self._call_tasks):
+            task.cancel()
 
-    async def schedule_async_call(self,
-                                  coro: Coroutine,
-                                  timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+    def _dispatch(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        if not self._started:
+            return
+        for lane in self._lanes:
+            while len(lane) > 0 and len(self._call_tasks) < self._max_concurrency:
+                item: AsyncCallSchedulerItem = lane[0]
+                if item.future.done():
+                    # The caller stopped waiting for the call.
+                    lane.popleft()
+                    self._cancelled_count += 1
+                    self._record_wait_time(time.monotonic() - item.enqueue_time)
+                    continue
+                now: float = time.monotonic()
+                wait_time: float = self._last_call_start + self._call_interval - now
+                if wait_time > 0:
+                    self._wakeup_handle = self._ev_loop.call_later(wait_time, self._dispatch)
+                    return
+                lane.popleft()
+                self._last_call_start = now
+                self._record_wait_time(now - item.enqueue_time)
+                task: asyncio.Task = safe_ensure_future(self._run_call(item))
+                self._call_tasks[task] = item
+                task.add_done_callback(self._on_call_done)
+                item.future.add_done_callback(lambda fut, call_task=task: fut.cancelled() and call_task.cancel())
+
+    def _on_call_done(self, task: asyncio.Task):
+        item: AsyncCallSchedulerItem = self._call_tasks.pop(task)
+        if not item.future.done():
+            # Cancelled before the call was started.
+            item.future.cancel()
+            self._cancelled_count += 1
+        self._dispatch()
+
+    def _record_wait_time(self, wait_time: float):
+        self._wait_count += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    def _record_run_time(self, run_time: float):
+        self._run_count += 1
+        self._total_run_time += run_time
+        self._max_run_time = max(self._max_run_time, run_time)
+
+    async def _run_call(self, item: AsyncCallSchedulerItem):
+        fut, call_factory, timeout_seconds, app_warning_msg, _ = item
+        start_time: float = time.monotonic()
+        try:
+            async with timeout(timeout_seconds):
+                result: Any = await call_factory()
+            if not fut.done():
+                fut.set_result(result)
+            self._completed_count += 1
+        except asyncio.CancelledError:
+            if not fut.done():
+                fut.cancel()
+            self._cancelled_count += 1
+            raise
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                self._timed_out_count += 1
+            else:
+                self._failed_count += 1
+            # Add exception information.
+            app_warning_msg += f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg,
+                                exc_info=True,
+                                app_warning_msg=app_warning_msg)
+            if not fut.done():
+                fut.set_exception(e)
+        finally:
+            self._record_run_time(time.monotonic() - start_time)
+
+    async def _schedule(self,
+                        call_factory: Callable[[], Awaitable],
+                        timeout_seconds: float,
+                        app_warning_msg: str,
+                        priority: int) -> Any:
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
+        self._lanes[priority].append(AsyncCallSchedulerItem(fut, call_factory, timeout_seconds,
+                                                            app_warning_msg=app_warning_msg,
+                                                            enqueue_time=time.monotonic()))
+        if not self._started:
             self.start()
+        else:
+            self._dispatch()
         return await fut
 
+    async def schedule_async_call(self,
+                                  coro: Coroutine,
+                                  timeout_seconds: float,
+                                  app_warning_msg: str = "API call error.",
+                                  priority: int = PRIORITY_NORMAL) -> any:
+        try:
+            return await self._schedule(lambda: coro, timeout_seconds, app_warning_msg, priority)
+        finally:
+            # Avoids "coroutine was never awaited" warnings for calls dropped before they're started.
+            if inspect.iscoroutine(coro) and inspect.getcoroutinestate(coro) == inspect.CORO_CREATED:
+                coro.close()
+
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
+                         app_warning_msg: str = "API call error.",
+                         priority: int = PRIORITY_NORMAL) -> any:
+        """
+        Runs `func(*args)` on the hummingbot executor, once the scheduler starts the call.
+        """
+        return await self._schedule(
+            lambda: self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args),
+            timeout_seconds,
+            app_warning_msg,
+            priority
         )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
@@ -3,116 +3,280 @@ import time
 import asyncio
 from collections import deque
 from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
     Optional,
-    Tuple,
-    Deque
+    Tuple
 )
 
 RequestWeight = int
 Seconds = float
-Timestamp_s = float
-TaskLog = Tuple[Timestamp_s, RequestWeight]
 
+# Priority lanes, lower is served first. Cancels are served before order creations, which are served before polling.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
 
-class Throttler:
-    def __init__(self,
-                 rate_limit: Tuple[RequestWeight, Seconds],
-                 period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
-        """
-        :param rate_limit: Max weight allowed in the given period
-        :param retry_interval: Time between each limit check
-        """
-        self._rate_limit_weight: int = rate_limit[0]
-        self._period: float = rate_limit[1]
-        self._retry_interval: float = retry_interval
-        self._period_safety_margin = period_safety_margin
-        self._task_logs: Deque[TaskLog] = deque()
 
-    def weighted_task(self,
-                      request_weight):
-        return ThrottlerContextManager(
-            rate_limit=self._rate_limit_weight,
-            period=self._period,
-            request_weight=request_weight,
-            task_logs=self._task_logs)
+def http_method_priority(http_method: str) -> int:
+    """
+    Priority of a request to a REST API where orders are cancelled with DELETE and created with POST.
+    """
+    http_method = http_method.upper()
+    if http_method == "DELETE":
+        return PRIORITY_HIGH
+    if http_method in ("POST", "PUT"):
+        return PRIORITY_NORMAL
+    return PRIORITY_LOW
+
+
+class RateLimit(NamedTuple):
+    """
+    A limit of `capacity` request weight per `period` seconds, e.g. Binance's 1200 request weight per minute per IP.
+
+    Every request counts against a limit with `counts_all_requests` with its request weight. Other limits, e.g. an
+    order count limit, only count the endpoints which list them in their endpoint weights.
+    """
+    limit_id: str
+    capacity: RequestWeight
+    period: Seconds
+    counts_all_requests: bool = True
+
+
+EndpointWeights = Dict[str, Dict[str, RequestWeight]]
+
+
+class TokenBucket:
+    """
+    Holds up to `capacity` tokens, refilled continuously at `capacity` tokens per `period`. Tokens are only refilled
+    when the bucket is looked at, so taking tokens is O(1).
+    """
+    __slots__ = ("capacity", "rate", "tokens", "timestamp")
+
+    def __init__(self, capacity: float, period: Seconds):
+        self.capacity: float = capacity
+        self.rate: float = capacity / period
+        self.tokens: float = capacity
+        self.timestamp: float = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+        self.timestamp = now
+
+    def time_until_available(self, weight: float) -> Seconds:
+        return max(0.0, (min(weight, self.capacity) - self.tokens) / self.rate)
+
+    def take(self, weight: float):
+        self.tokens -= min(weight, self.capacity)
+
+
+class RateLimitedTask:
+    """
+    Async context manager which waits until the rate limiter has capacity for the request on entering.
+    """
+    __slots__ = ("_rate_limiter", "_weights", "_priority")
+
+    def __init__(self, rate_limiter: "RateLimiter", weights: Dict[str, RequestWeight], priority: int):
+        self._rate_limiter: "RateLimiter" = rate_limiter
+        self._weights: Dict[str, RequestWeight] = weights
+        self._priority: int = priority
+
+    async def __aenter__(self):
+        await self._rate_limiter.acquire_weights(self._weights, self._priority)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
 
+class RateLimiter:
+    """
+    Token bucket rate limiter for the requests to one exchange, with any number of concurrent limits.
 
-class ThrottlerContextManager:
-    throttler_logger: Optional[logging.Logger] = None
+    Requests that can't be served right away wait in FIFO lanes per priority, and a waiting request of a higher
+    priority is always served first. Instead of polling, one timer is set for when the request at the head of the
+    lanes will have enough tokens.
+
+    Each bucket refills over its period plus `period_safety_margin`, to account for network latency.
+    """
+    rl_logger: Optional[logging.Logger] = None
 
     @classmethod
     def logger(cls) -> logging.Logger:
-        if cls.throttler_logger is None:
-            cls.throttler_logger = logging.getLogger(__name__)
-        return cls.throttler_logger
+        if cls.rl_logger is None:
+            cls.rl_logger = logging.getLogger(__name__)
+        return cls.rl_logger
 
     def __init__(self,
-                 task_logs: Deque[TaskLog],
-                 rate_limit: RequestWeight,
-                 request_weight: RequestWeight = 1,
-                 period_safety_margin: Seconds = 0.1,
-                 period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
+                 rate_limits: Iterable[RateLimit],
+                 endpoint_weights: Optional[EndpointWeights] = None,
+                 period_safety_margin: Seconds = 0.1):
         """
-        :param task_logs: Shared task logs
-        :param rate_limit: Max weight allowed in the given period
-        :param request_weight: Weight of the request of the added task
+        :param rate_limits: The exchange's rate limits
+        :param endpoint_weights: Request weights per rate limit id, for each endpoint whose weights differ from the
+        default of its request weight on every limit with `counts_all_requests`
         :param period_safety_margin: estimate for the network latency
-        :param period: Time interval of the rate limit
-        :param retry_interval: Time between each limit check
         """
-        self._period_safety_margin = period_safety_margin
-        self._lock = asyncio.Lock()
-        self._request_weight: RequestWeight = request_weight
-        self._rate_limit: int = rate_limit
-        self._period: float = period
-        self._retry_interval: float = retry_interval
-        self._task_logs: Deque[TaskLog] = task_logs
-
-    def flush(self):
+        self._rate_limits: List[RateLimit] = list(rate_limits)
+        self._buckets: Dict[str, TokenBucket] = {
+            rate_limit.limit_id: TokenBucket(rate_limit.capacity, rate_limit.period + period_safety_margin)
+            for rate_limit in self._rate_limits
+        }
+        self._all_request_limit_ids: List[str] = [rate_limit.limit_id for rate_limit in self._rate_limits
+                                                  if rate_limit.counts_all_requests]
+        self._endpoint_weights: EndpointWeights = endpoint_weights or {}
+        self._lanes: Tuple[Deque[Tuple[Dict[str, RequestWeight], asyncio.Future]], ...] = \
+            tuple(deque() for _ in PRIORITIES)
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return self._rate_limits
+
+    def add_rate_limits(self,
+                        rate_limits: Iterable[RateLimit],
+                        endpoint_weights: Optional[EndpointWeights] = None,
+                        period_safety_margin: Seconds = 0.1):
         """
-        Remove task logs that have passed rate limit periods
-        :return:
+        Adds the limits and endpoint weights that aren't known yet. Known ones are kept as they are.
         """
-        now: float = time.time()
-        while self._task_logs:
-            task_ts, _ = self._task_logs[0]
-            elapsed: float = now - task_ts
-            if elapsed > self._period - self._period_safety_margin:
-                self._task_logs.popleft()
-            else:
-                break
-
-    async def acquire(self):
-        while True:
-            self.flush()
-            current_capacity: int = self._rate_limit - sum(weight for (ts, weight) in self._task_logs)
-            if current_capacity - self._request_weight > 0:
-                break
-            await asyncio.sleep(self._retry_interval)
-        self._task_logs.append((time.time(), self._request_weight))
+        for rate_limit in rate_limits:
+            if rate_limit.limit_id in self._buckets:
+                continue
+            self._rate_limits.append(rate_limit)
+            self._buckets[rate_limit.limit_id] = TokenBucket(rate_limit.capacity,
+                                                             rate_limit.period + period_safety_margin)
+            if rate_limit.counts_all_requests:
+                self._all_request_limit_ids.append(rate_limit.limit_id)
+        for endpoint, weights in (endpoint_weights or {}).items():
+            self._endpoint_weights.setdefault(endpoint, weights)
 
-    async def __aenter__(self):
-        async with self._lock:
-            await self.acquire()
+    @property
+    def waiting_count(self) -> int:
+        return sum(len(lane) for lane in self._lanes)
 
-    async def __aexit__(self, exc_type, exc, tb):
-        pass
+    def available_tokens(self, limit_id: str) -> float:
+        bucket: TokenBucket = self._buckets[limit_id]
+        bucket.refill(time.monotonic())
+        return bucket.tokens
+
+    def request_weights(self, request_weight: RequestWeight = 1, endpoint: Optional[str] = None) \
+            -> Dict[str, RequestWeight]:
+        weights: Dict[str, RequestWeight] = {limit_id: request_weight for limit_id in self._all_request_limit_ids}
+        if endpoint is not None:
+            weights.update(self._endpoint_weights.get(endpoint, {}))
+        return weights
+
+    def weighted_task(self,
+                      request_weight: RequestWeight = 1,
+                      endpoint: Optional[str] = None,
+                      priority: int = PRIORITY_NORMAL) -> RateLimitedTask:
+        """
+        :param request_weight: Weight of the request on every limit with `counts_all_requests`
+        :param endpoint: Endpoint name in the endpoint weights, which override the request weight
+        :param priority: One of PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+        """
+        return RateLimitedTask(self, self.request_weights(request_weight, endpoint), priority)
+
+    def _time_until_available(self, weights: Dict[str, RequestWeight]) -> Seconds:
+        wait_time: float = 0.0
+        for limit_id, weight in weights.items():
+            bucket: Optional[TokenBucket] = self._buckets.get(limit_id)
+            if bucket is not None:
+                wait_time = max(wait_time, bucket.time_until_available(weight))
+        return wait_time
+
+    def _take(self, weights: Dict[str, RequestWeight]):
+        for limit_id, weight in weights.items():
+            bucket: Optional[TokenBucket] = self._buckets.get(limit_id)
+            if bucket is not None:
+                bucket.take(weight)
+
+    def _refill(self):
+        now: float = time.monotonic()
+        for bucket in self._buckets.values():
+            bucket.refill(now)
+
+    async def acquire(self,
+                      request_weight: RequestWeight = 1,
+                      endpoint: Optional[str] = None,
+                      priority: int = PRIORITY_NORMAL):
+        """
+        Waits until the request can be made, see `weighted_task()`.
+        """
+        await self.acquire_weights(self.request_weights(request_weight, endpoint), priority)
+
+    async def acquire_weights(self, weights: Dict[str, RequestWeight], priority: int = PRIORITY_NORMAL):
+        # Serve right away if no request of the same or a higher priority is waiting.
+        if all(len(self._lanes[p]) == 0 for p in range(priority + 1)):
+            self._refill()
+            if self._time_until_available(weights) == 0:
+                self._take(weights)
+                return
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._lanes[priority].append((weights, future))
+        self._dispatch()
+        await future
+
+    def _dispatch(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        self._refill()
+        for lane in self._lanes:
+            while len(lane) > 0:
+                weights, future = lane[0]
+                if future.done():
+                    # Cancelled while waiting.
+                    lane.popleft()
+                    continue
+                wait_time: float = self._time_until_available(weights)
+                if wait_time > 0:
+                    self._wakeup_handle = asyncio.get_event_loop().call_later(wait_time, self._dispatch)
+                    return
+                self._take(weights)
+                lane.popleft()
+                future.set_result(None)
+
+
+_shared_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str,
+                     rate_limits: Iterable[RateLimit],
+                     endpoint_weights: Optional[EndpointWeights] = None,
+                     **kwargs: Any) -> RateLimiter:
+    """
+    Returns the rate limiter shared by all connectors using the same exchange, since per IP and per account limits
+    apply to all of them together. Limits are identified by their limit ids: the ones given by the first caller that
+    named a limit are used.
+    """
+    if name not in _shared_rate_limiters:
+        _shared_rate_limiters[name] = RateLimiter(rate_limits, endpoint_weights, **kwargs)
+    else:
+        _shared_rate_limiters[name].add_rate_limits(rate_limits, endpoint_weights, **kwargs)
+    return _shared_rate_limiters[name]
 
 
 # Dev only
 if __name__ == "__main__":
 
-    throttler = Throttler(rate_limit=(20, 1.0))
+    rate_limiter = RateLimiter([RateLimit("weight", 20, 1.0), RateLimit("orders", 2, 1.0, counts_all_requests=False)],
+                               endpoint_weights={"create_order": {"weight": 1, "orders": 1}})
 
-    async def task(task_id, weight):
-        async with throttler.weighted_task(weight):
-            print(int(time.time()), f"Cat {task_id}: Meow {weight}")
+    async def task(task_id, weight, endpoint=None, priority=PRIORITY_NORMAL):
+        async with rate_limiter.weighted_task(weight, endpoint, priority):
+            print(f"{time.time():.3f}", f"Cat {task_id}: Meow {weight} {endpoint}")
 
     async def test_main():
         tasks = [
-            task(1, 5), task(2, 15), task(3, 1), task(4, 10), task(5, 5), task(6, 5)
+            task(1, 5), task(2, 15), task(3, 1), task(4, 10), task(5, 5), task(6, 5),
+            task(7, 1, "create_order"), task(8, 1, "create_order"), task(9, 1, "create_order"),
+            task(10, 1, priority=PRIORITY_HIGH)
         ]
         await asyncio.gather(*tasks)
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+"""
+JSON decoding for websocket frames and REST responses.
+
+`loads()` uses the fastest installed backend: orjson, then ujson, then the standard library's json. It takes `bytes`
+as well as `str`, so frames don't need to be decoded to `str` first.
+
+Integers beyond 64 bits, e.g. some of Huobi's ids, are decoded exactly: orjson would turn them into floats and ujson
+refuses them, so payloads with them are decoded by the standard library instead.
+
+`Inflater` decompresses the zlib, gzip or raw deflate frames of one connection.
+"""
+
+import json
+import logging
+import zlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Union
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# ujson 1.x rounds floats unless asked not to. From 2.0 floats are always exact, and the option is gone.
+_UJSON_KWARGS: Dict[str, Any] = {}
+if ujson is not None:
+    try:
+        ujson.loads("0.1", precise_float=True)
+        _UJSON_KWARGS["precise_float"] = True
+    except TypeError:
+        pass
+
+JSONData = Union[str, bytes, bytearray, memoryview]
+
+# Integers of 19 or more digits may not fit in 64 bits. Runs of digits are found by mapping every digit to "0" and
+# everything else to "x", which is several times faster than a regular expression search. Runs within floats and
+# strings are found as well, those payloads just take the slower path.
+_DIGITS_TABLE: bytes = bytes(ord("0") if ord("0") <= c <= ord("9") else ord("x") for c in range(256))
+_BIG_INT_DIGITS: bytes = b"0" * 19
+
+
+def _has_big_int(data: JSONData) -> bool:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return _BIG_INT_DIGITS in data.translate(_DIGITS_TABLE)
+
+
+def _json_loads(data: JSONData) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _orjson_loads(data: JSONData) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    if _has_big_int(data):
+        return _json_loads(data)
+    return orjson.loads(data)
+
+
+def _ujson_loads(data: JSONData) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    try:
+        return ujson.loads(data, **_UJSON_KWARGS)
+    except ValueError:
+        # ujson raises on integers beyond 64 bits. Invalid JSON raises again below.
+        return json.loads(data)
+
+
+class JSONBackend(NamedTuple):
+    name: str
+    loads: Callable[[JSONData], Any]
+
+
+BACKENDS: Dict[str, JSONBackend] = {"json": JSONBackend("json", _json_loads)}
+if ujson is not None:
+    BACKENDS["ujson"] = JSONBackend("ujson", _ujson_loads)
+if orjson is not None:
+    BACKENDS["orjson"] = JSONBackend("orjson", _orjson_loads)
+
+_backend: JSONBackend = BACKENDS.get("orjson") or BACKENDS.get("ujson") or BACKENDS["json"]
+
+
+def backend_name() -> str:
+    return _backend.name
+
+
+def set_backend(name: str):
+    """
+    Switches the decoding backend, e.g. to compare backends, or to rule one out when debugging.
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend {name} is not available. Available backends: {list(BACKENDS.keys())}.")
+    _backend = BACKENDS[name]
+    logging.getLogger(__name__).info(f"Using the {name} JSON backend.")
+
+
+def loads(data: JSONData) -> Any:
+    return _backend.loads(data)
+
+
+# Window bits of the zlib formats.
+ZLIB_WBITS = zlib.MAX_WBITS
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+RAW_DEFLATE_WBITS = -zlib.MAX_WBITS
+
+
+class Inflater:
+    """
+    Decompresses the frames of one connection. For a continuous stream, e.g. per-connection deflate, the
+    decompressor is reused across frames. For frames which are complete streams of their own, e.g. Huobi's gzip
+    frames, a new decompressor is started whenever the previous stream ended.
+    """
+    __slots__ = ("_wbits", "_decompressor")
+
+    def __init__(self, wbits: int = ZLIB_WBITS):
+        self._wbits: int = wbits
+        self._decompressor: Optional[Any] = None
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._decompressor is None or self._decompressor.eof:
+            self._decompressor = zlib.decompressobj(self._wbits)
+        return self._decompressor.decompress(data)
+
+    def loads(self, data: bytes) -> Any:
+        return loads(self.decompress(data))
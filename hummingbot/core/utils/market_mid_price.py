@@ -1,10 +1,23 @@
-import requests
+import aiohttp
+import asyncio
 from decimal import Decimal
-from typing import Optional
-import cachetools.func
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.kraken.kraken_market import KrakenMarket
-from hummingbot.market.ocean.ocean_market import OceanMarket
+import logging
+import math
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple
+)
+import weakref
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.connector_registry import MARKET_CLASSES
 
 
 BINANCE_PRICE_URL = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -15,119 +28,246 @@ KRAKEN_PRICE_URL = "https://api.kraken.com/0/public/Ticker?pair="
 COINBASE_PRO_PRICE_URL = "https://api.pro.coinbase.com/products/TO_BE_REPLACED/ticker"
 OCEAN_PRICE_URL = "https://api.oceanex.pro/v1/tickers"
 
+PriceMap = Dict[str, Decimal]
+# (exchange, None) for exchanges whose prices are fetched all at once, (exchange, trading_pair) otherwise.
+FetchKey = Tuple[str, Optional[str]]
 
-def get_mid_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
-    if exchange == "binance":
-        return binance_mid_price(trading_pair)
-    elif exchange == "kucoin":
-        return kucoin_mid_price(trading_pair)
-    elif exchange == "liquid":
-        return liquid_mid_price(trading_pair)
-    elif exchange == "bittrex":
-        return bittrex_mid_price(trading_pair)
-    elif exchange == "kraken":
-        return kraken_mid_price(trading_pair)
-    elif exchange == "coinbase_pro":
-        return coinbase_pro_mid_price(trading_pair)
-    elif exchange == "ocean":
-        return ocean_mid_price(trading_pair)
-    else:
-        return binance_mid_price(trading_pair)
-
-
-@cachetools.func.ttl_cache(ttl=10)
-def binance_mid_price(trading_pair: str) -> Optional[Decimal]:
-    resp = requests.get(url=BINANCE_PRICE_URL)
-    records = resp.json()
-    result = None
-    for record in records:
-        pair = BinanceMarket.convert_from_exchange_trading_pair(record["symbol"])
-        if trading_pair == pair and record["bidPrice"] is not None and record["askPrice"] is not None:
-            result = (Decimal(record["bidPrice"]) + Decimal(record["askPrice"])) / Decimal("2")
-            break
-    return result
-
-
-@cachetools.func.ttl_cache(ttl=10)
-def kucoin_mid_price(trading_pair: str) -> Optional[Decimal]:
-    resp = requests.get(url=KUCOIN_PRICE_URL)
-    records = resp.json()
-    result = None
-    for record in records["data"]["ticker"]:
-        if trading_pair == record["symbolName"] and record["buy"] is not None and record["sell"] is not None:
-            result = (Decimal(record["buy"]) + Decimal(record["sell"])) / Decimal("2")
-            break
-    return result
-
-
-@cachetools.func.ttl_cache(ttl=10)
-def liquid_mid_price(trading_pair: str) -> Optional[Decimal]:
-    resp = requests.get(url=LIQUID_PRICE_URL)
-    records = resp.json()
-    result = None
-    for record in records:
-        pair = f"{record['base_currency']}-{record['quoted_currency']}"
-        if trading_pair == pair and record["market_ask"] is not None and record["market_bid"] is not None:
-            result = (Decimal(record["market_ask"]) + Decimal(record["market_bid"])) / Decimal("2")
-            break
-    return result
-
-
-@cachetools.func.ttl_cache(ttl=10)
-def bittrex_mid_price(trading_pair: str) -> Optional[Decimal]:
-    resp = requests.get(url=BITTREX_PRICE_URL)
-    records = resp.json()
-    result = None
-    for record in records["result"]:
-        symbols = record["MarketName"].split("-")
-        pair = f"{symbols[1]}-{symbols[0]}"
-        if trading_pair == pair and record["Bid"] is not None and record["Ask"] is not None:
-            result = (Decimal(record["Bid"]) + Decimal(record["Ask"])) / Decimal("2")
-            break
-    return result
-
-
-@cachetools.func.ttl_cache(ttl=10)
-def kraken_mid_price(trading_pair: str) -> Optional[Decimal]:
-    k_pair = KrakenMarket.convert_to_exchange_trading_pair(trading_pair)
-    resp = requests.get(url=KRAKEN_PRICE_URL + k_pair)
-    resp_json = resp.json()
-    if len(resp_json["error"]) == 0:
-        for record in resp_json["result"]:  # assume only one pair is received
-            record = resp_json["result"][record]
-            result = (Decimal(record["a"][0]) + Decimal(record["b"][0])) / Decimal("2")
-        return result
-
-
-@cachetools.func.ttl_cache(ttl=10)
-def coinbase_pro_mid_price(trading_pair: str) -> Optional[Decimal]:
-    resp = requests.get(url=COINBASE_PRO_PRICE_URL.replace("TO_BE_REPLACED", trading_pair))
-    record = resp.json()
-    if "bid" in record and "ask" in record:
-        result = (Decimal(record["bid"]) + Decimal(record["ask"])) / Decimal("2")
-        return result
-
-
-@cachetools.func.ttl_cache(ttl=10)
-def ocean_mid_price(trading_pair: str) -> Optional[Decimal]:
-    exch_sym = OceanMarket.convert_to_exchange_trading_pair(trading_pair)
-    url = OCEAN_PRICE_URL + "/" + exch_sym
-    resp = requests.get(url=url)
-    if resp.status_code != 200:
-        return None
 
-    resp_body = resp.json()
-    resp_data = resp_body.get('data')
-    if resp_data is None:
-        return None
-    resp_ticker = resp_data.get('ticker')
-    if resp_ticker is None:
+def _mid_price(bid: Any, ask: Any) -> Optional[Decimal]:
+    if bid is None or ask is None:
         return None
+    return (Decimal(bid) + Decimal(ask)) / Decimal("2")
 
-    bid: str = resp_ticker.get('buy')
-    ask: str = resp_ticker.get('sell')
-    if bid and ask:
-        mid_price = (Decimal(bid) + Decimal(ask)) / Decimal("2")
-        return mid_price
-    else:
-        return None
+
+class MidPriceService:
+    """
+    Mid prices for trading pairs on exchanges, for use outside of running strategies (e.g. default order amounts and
+    inventory ratios when configuring a strategy).
+
+    Live order books are used when a market for the exchange is running. Otherwise, the exchange's whole ticker set is
+    fetched with one request where the exchange supports it, and kept for `TTL` seconds. Concurrent requests for the
+    same prices share one in-flight HTTP request.
+    """
+    TTL = 10.0
+    REQUEST_TIMEOUT = 10.0
+
+    _mps_logger: Optional[HummingbotLogger] = None
+    _mps_shared_instance: Optional["MidPriceService"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mps_logger is None:
+            cls._mps_logger = logging.getLogger(__name__)
+        return cls._mps_logger
+
+    @classmethod
+    def get_instance(cls) -> "MidPriceService":
+        if cls._mps_shared_instance is None:
+            cls._mps_shared_instance = MidPriceService()
+        return cls._mps_shared_instance
+
+    def __init__(self):
+        self._prices: Dict[str, PriceMap] = {}
+        self._fetch_timestamps: Dict[FetchKey, float] = {}
+        self._fetch_tasks: Dict[FetchKey, asyncio.Task] = {}
+        self._markets: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._exchange_fetchers: Dict[str, Callable[[], Awaitable[PriceMap]]] = {
+            "binance": self.fetch_binance_prices,
+            "kucoin": self.fetch_kucoin_prices,
+            "liquid": self.fetch_liquid_prices,
+            "bittrex": self.fetch_bittrex_prices,
+        }
+        self._trading_pair_fetchers: Dict[str, Callable[[str], Awaitable[PriceMap]]] = {
+            "kraken": self.fetch_kraken_prices,
+            "coinbase_pro": self.fetch_coinbase_pro_prices,
+            "ocean": self.fetch_ocean_prices,
+        }
+
+    def _get_shared_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT))
+        return self._shared_client
+
+    def add_markets(self, markets: Iterable[Any]):
+        """
+        Registers running markets, whose order books are used in place of the exchange's ticker endpoint. Markets are
+        weakly referenced, so they don't need to be removed.
+        """
+        for market in markets:
+            self._markets[market.name] = market
+
+    def _live_mid_price(self, exchange: str, trading_pair: str) -> Optional[Decimal]:
+        market = self._markets.get(exchange)
+        if market is None:
+            return None
+        try:
+            order_book = market.order_books.get(market.convert_to_exchange_trading_pair(trading_pair))
+            if order_book is None:
+                return None
+            bid: float = order_book.get_price(False)
+            ask: float = order_book.get_price(True)
+        except Exception:
+            return None
+        if math.isnan(bid) or math.isnan(ask):
+            return None
+        return _mid_price(str(bid), str(ask))
+
+    def _fetch_key(self, exchange: str, trading_pair: str) -> FetchKey:
+        if exchange in self._trading_pair_fetchers:
+            return exchange, trading_pair
+        return exchange, None
+
+    def _resolve_exchange(self, exchange: str) -> str:
+        # Exchanges without a ticker endpoint fall back to Binance prices.
+        if exchange in self._exchange_fetchers or exchange in self._trading_pair_fetchers:
+            return exchange
+        return "binance"
+
+    def _is_stale(self, key: FetchKey) -> bool:
+        return time.time() - self._fetch_timestamps.get(key, 0) > self.TTL
+
+    def _refresh(self, exchange: str, trading_pair: str) -> asyncio.Task:
+        key: FetchKey = self._fetch_key(exchange, trading_pair)
+        if key not in self._fetch_tasks:
+            task: asyncio.Task = safe_ensure_future(self._fetch(key))
+            self._fetch_tasks[key] = task
+            task.add_done_callback(lambda _: self._fetch_tasks.pop(key, None))
+        return self._fetch_tasks[key]
+
+    async def _fetch(self, key: FetchKey):
+        exchange, trading_pair = key
+        try:
+            if trading_pair is None:
+                prices: PriceMap = await self._exchange_fetchers[exchange]()
+            else:
+                prices = await self._trading_pair_fetchers[exchange](trading_pair)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Error fetching mid prices from {exchange}.", exc_info=True)
+            return
+        if trading_pair is None:
+            self._prices[exchange] = prices
+        else:
+            self._prices.setdefault(exchange, {}).update(prices)
+        self._fetch_timestamps[key] = time.time()
+
+    def get_cached_mid_price(self, exchange: str, trading_pair: str) -> Optional[Decimal]:
+        """
+        Returns the live or most recently fetched mid price without waiting, and refreshes stale prices in the
+        background. Returns None if the price hasn't been fetched yet.
+        """
+        live_price: Optional[Decimal] = self._live_mid_price(exchange, trading_pair)
+        if live_price is not None:
+            return live_price
+        exchange = self._resolve_exchange(exchange)
+        if self._is_stale(self._fetch_key(exchange, trading_pair)):
+            self._refresh(exchange, trading_pair)
+        return self._prices.get(exchange, {}).get(trading_pair)
+
+    async def get_mid_price(self, exchange: str, trading_pair: str) -> Optional[Decimal]:
+        live_price: Optional[Decimal] = self._live_mid_price(exchange, trading_pair)
+        if live_price is not None:
+            return live_price
+        exchange = self._resolve_exchange(exchange)
+        if self._is_stale(self._fetch_key(exchange, trading_pair)):
+            await asyncio.shield(self._refresh(exchange, trading_pair))
+        return self._prices.get(exchange, {}).get(trading_pair)
+
+    def prefetch(self, exchange: str, trading_pair: Optional[str] = None):
+        """
+        Starts fetching prices in the background, so that they're cached by the time `get_cached_mid_price` is called.
+        Exchanges without a ticker set endpoint are fetched one trading pair at a time, and only when `trading_pair` is
+        given.
+        """
+        exchange = self._resolve_exchange(exchange)
+        if exchange in self._trading_pair_fetchers and trading_pair is None:
+            return
+        if self._is_stale(self._fetch_key(exchange, trading_pair)):
+            self._refresh(exchange, trading_pair)
+
+    async def _get_json(self, url: str) -> Any:
+        client: aiohttp.ClientSession = self._get_shared_client()
+        async with client.get(url) as response:
+            if response.status != 200:
+                raise IOError(f"Error fetching {url}. HTTP status is {response.status}.")
+            return await response.json()
+
+    async def fetch_binance_prices(self) -> PriceMap:
+        records = await self._get_json(BINANCE_PRICE_URL)
+        binance_market_class = MARKET_CLASSES["binance"]
+        prices: PriceMap = {}
+        for record in records:
+            trading_pair: Optional[str] = binance_market_class.convert_from_exchange_trading_pair(record["symbol"])
+            mid_price: Optional[Decimal] = _mid_price(record["bidPrice"], record["askPrice"])
+            if trading_pair is not None and mid_price is not None:
+                prices[trading_pair] = mid_price
+        return prices
+
+    async def fetch_kucoin_prices(self) -> PriceMap:
+        records = await self._get_json(KUCOIN_PRICE_URL)
+        prices: PriceMap = {}
+        for record in records["data"]["ticker"]:
+            mid_price: Optional[Decimal] = _mid_price(record["buy"], record["sell"])
+            if mid_price is not None:
+                prices[record["symbolName"]] = mid_price
+        return prices
+
+    async def fetch_liquid_prices(self) -> PriceMap:
+        records = await self._get_json(LIQUID_PRICE_URL)
+        prices: PriceMap = {}
+        for record in records:
+            mid_price: Optional[Decimal] = _mid_price(record["market_bid"], record["market_ask"])
+            if mid_price is not None:
+                prices[f"{record['base_currency']}-{record['quoted_currency']}"] = mid_price
+        return prices
+
+    async def fetch_bittrex_prices(self) -> PriceMap:
+        records = await self._get_json(BITTREX_PRICE_URL)
+        prices: PriceMap = {}
+        for record in records["result"]:
+            symbols = record["MarketName"].split("-")
+            mid_price: Optional[Decimal] = _mid_price(record["Bid"], record["Ask"])
+            if mid_price is not None:
+                prices[f"{symbols[1]}-{symbols[0]}"] = mid_price
+        return prices
+
+    async def fetch_kraken_prices(self, trading_pair: str) -> PriceMap:
+        k_pair: str = MARKET_CLASSES["kraken"].convert_to_exchange_trading_pair(trading_pair)
+        resp_json = await self._get_json(KRAKEN_PRICE_URL + k_pair)
+        if len(resp_json["error"]) > 0:
+            return {}
+        # Only the requested pair is returned.
+        for record in resp_json["result"].values():
+            return {trading_pair: _mid_price(record["b"][0], record["a"][0])}
+        return {}
+
+    async def fetch_coinbase_pro_prices(self, trading_pair: str) -> PriceMap:
+        record = await self._get_json(COINBASE_PRO_PRICE_URL.replace("TO_BE_REPLACED", trading_pair))
+        if "bid" in record and "ask" in record:
+            return {trading_pair: _mid_price(record["bid"], record["ask"])}
+        return {}
+
+    async def fetch_ocean_prices(self, trading_pair: str) -> PriceMap:
+        exch_sym: str = MARKET_CLASSES["ocean"].convert_to_exchange_trading_pair(trading_pair)
+        resp_body = await self._get_json(OCEAN_PRICE_URL + "/" + exch_sym)
+        resp_ticker = (resp_body.get("data") or {}).get("ticker")
+        if resp_ticker is None:
+            return {}
+        bid: str = resp_ticker.get("buy")
+        ask: str = resp_ticker.get("sell")
+        if bid and ask:
+            return {trading_pair: _mid_price(bid, ask)}
+        return {}
+
+
+def get_mid_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
+    """
+    Non-blocking, see `MidPriceService.get_cached_mid_price`. Coroutines should await `get_mid_price_async` instead.
+    """
+    return MidPriceService.get_instance().get_cached_mid_price(exchange, trading_pair)
+
+
+async def get_mid_price_async(exchange: str, trading_pair: str) -> Optional[Decimal]:
+    return await MidPriceService.get_instance().get_mid_price(exchange, trading_pair)
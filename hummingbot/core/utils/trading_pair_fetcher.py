@@ -1,11 +1,17 @@
 import aiohttp
 import asyncio
+import json
+import os
+from os.path import join
+import time
 from typing import (
     List,
     Dict,
     Any,
+    Iterable,
     Optional,
 )
+from hummingbot import data_path
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 import logging
@@ -28,9 +34,22 @@ ETERBASE_ENDPOINT = "https://api.eterbase.exchange/api/markets"
 KRAKEN_ENDPOINT = "https://api.kraken.com/0/public/AssetPairs"
 
 API_CALL_TIMEOUT = 5
+RADAR_RELAY_PAGE_SIZE = 100
+BAMBOO_RELAY_PAGE_SIZE = 1000
 
 
 class TradingPairFetcher:
+    """
+    Fetches the active trading pairs of exchanges, for CLI autocomplete and trading pair validation.
+
+    Trading pairs are cached on disk per exchange. Cached trading pairs are served right away, and refreshed in the
+    background once they are older than `CACHE_TTL`. Only the exchanges used by the current configuration are refreshed
+    at start, other exchanges are fetched the first time their trading pairs are asked for.
+    """
+    CACHE_TTL = 24 * 60 * 60.0
+    RETRY_INTERVAL = 60.0
+    MAX_CONCURRENT_FETCHES = 4
+
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
     _tpf_http_client: Optional[aiohttp.ClientSession] = None
@@ -55,10 +74,89 @@ class TradingPairFetcher:
             cls._tpf_http_client = aiohttp.ClientSession(request_class=SSLClientRequest)
         return cls._tpf_http_client
 
-    def __init__(self):
-        self.ready = False
-        self.trading_pairs: Dict[str, Any] = {}
-        safe_ensure_future(self.fetch_all())
+    def __init__(self, cache_path: Optional[str] = None, exchanges: Optional[Iterable[str]] = None):
+        self._cache_path: str = cache_path if cache_path is not None else join(data_path(), "trading_pairs_cache.json")
+        self.trading_pairs: Dict[str, List[str]] = {}
+        self._fetch_timestamps: Dict[str, float] = {}
+        self._last_attempt_timestamps: Dict[str, float] = {}
+        self._fetch_tasks: Dict[str, asyncio.Task] = {}
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
+        self._load_cache()
+        self.ready = True
+
+        if exchanges is None:
+            from hummingbot.client.settings import required_exchanges
+            exchanges = required_exchanges
+        for exchange in exchanges:
+            self.refresh(exchange)
+
+    def _load_cache(self):
+        try:
+            if not os.path.exists(self._cache_path):
+                return
+            with open(self._cache_path) as fd:
+                cache: Dict[str, Dict[str, Any]] = json.load(fd)
+            for exchange, entry in cache.items():
+                self.trading_pairs[exchange] = list(entry["trading_pairs"])
+                self._fetch_timestamps[exchange] = float(entry["timestamp"])
+        except Exception:
+            self.logger().debug("Error reading the trading pairs cache, ignoring it.", exc_info=True)
+
+    def _save_cache(self):
+        try:
+            cache: Dict[str, Dict[str, Any]] = {
+                exchange: {"timestamp": self._fetch_timestamps[exchange], "trading_pairs": trading_pairs}
+                for exchange, trading_pairs in self.trading_pairs.items()
+                if exchange in self._fetch_timestamps
+            }
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            tmp_path: str = f"{self._cache_path}.tmp"
+            with open(tmp_path, "w") as fd:
+                json.dump(cache, fd)
+            os.replace(tmp_path, self._cache_path)
+        except Exception:
+            self.logger().debug("Error writing the trading pairs cache.", exc_info=True)
+
+    def is_stale(self, exchange: str) -> bool:
+        return time.time() - self._fetch_timestamps.get(exchange, 0) > self.CACHE_TTL
+
+    def get_trading_pairs(self, exchange: str) -> List[str]:
+        """
+        Returns the cached trading pairs of an exchange, which may be empty, and refreshes them in the background if
+        they're stale.
+        """
+        self.refresh(exchange)
+        return self.trading_pairs.get(exchange, [])
+
+    def refresh(self, exchange: str, force: bool = False) -> Optional[asyncio.Task]:
+        """
+        Starts fetching the trading pairs of an exchange in the background, unless they're fresh, a fetch is already
+        running, or the last attempt failed less than `RETRY_INTERVAL` seconds ago.
+        """
+        if not hasattr(self, f"fetch_{exchange}_trading_pairs"):
+            return None
+        if exchange in self._fetch_tasks:
+            return self._fetch_tasks[exchange]
+        if not force and not self.is_stale(exchange):
+            return None
+        if not force and time.time() - self._last_attempt_timestamps.get(exchange, 0) < self.RETRY_INTERVAL:
+            return None
+        self._last_attempt_timestamps[exchange] = time.time()
+        task: asyncio.Task = safe_ensure_future(self._fetch(exchange))
+        self._fetch_tasks[exchange] = task
+        task.add_done_callback(lambda _: self._fetch_tasks.pop(exchange, None))
+        return task
+
+    async def _fetch(self, exchange: str):
+        if self._fetch_semaphore is None:
+            self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        async with self._fetch_semaphore:
+            trading_pairs: List[str] = await getattr(self, f"fetch_{exchange}_trading_pairs")()
+        # The fetch methods return an empty list when the request fails, keep the cached trading pairs in that case.
+        if len(trading_pairs) > 0:
+            self.trading_pairs[exchange] = trading_pairs
+            self._fetch_timestamps[exchange] = time.time()
+            self._save_cache()
 
     async def fetch_binance_trading_pairs(self) -> List[str]:
         try:
@@ -91,27 +189,24 @@ class TradingPairFetcher:
             page_count = 1
             client: aiohttp.ClientSession = self.http_client()
             while True:
-                async with client.get(f"{RADAR_RELAY_ENDPOINT}?perPage=100&page={page_count}", timeout=API_CALL_TIMEOUT) \
-                        as response:
-                    if response.status == 200:
-                        markets = await response.json()
-                        new_trading_pairs = set(map(lambda details: details.get('id'), markets))
-                        if len(new_trading_pairs) == 0:
-                            break
-                        else:
-                            trading_pairs = trading_pairs.union(new_trading_pairs)
-                        page_count += 1
-                        trading_pair_list: List[str] = []
-                        for raw_trading_pair in trading_pairs:
-                            converted_trading_pair: Optional[str] = \
-                                RadarRelayMarket.convert_from_exchange_trading_pair(raw_trading_pair)
-                            if converted_trading_pair is not None:
-                                trading_pair_list.append(converted_trading_pair)
-                            else:
-                                self.logger().debug(f"Could not parse the trading pair {raw_trading_pair}, skipping it...")
-                        return trading_pair_list
-                    else:
+                async with client.get(f"{RADAR_RELAY_ENDPOINT}?perPage={RADAR_RELAY_PAGE_SIZE}&page={page_count}",
+                                      timeout=API_CALL_TIMEOUT) as response:
+                    if response.status != 200:
+                        break
+                    markets = await response.json()
+                    trading_pairs.update(map(lambda details: details.get('id'), markets))
+                    if len(markets) < RADAR_RELAY_PAGE_SIZE:
                         break
+                    page_count += 1
+            trading_pair_list: List[str] = []
+            for raw_trading_pair in trading_pairs:
+                converted_trading_pair: Optional[str] = \
+                    RadarRelayMarket.convert_from_exchange_trading_pair(raw_trading_pair)
+                if converted_trading_pair is not None:
+                    trading_pair_list.append(converted_trading_pair)
+                else:
+                    self.logger().debug(f"Could not parse the trading pair {raw_trading_pair}, skipping it...")
+            return trading_pair_list
         except Exception:
             # Do nothing if the request fails -- there will be no autocomplete for radar trading pairs
             pass
@@ -126,28 +221,24 @@ class TradingPairFetcher:
             page_count = 1
             client: aiohttp.ClientSession = self.http_client()
             while True:
-                async with client.get(f"{BAMBOO_RELAY_ENDPOINT}?perPage=1000&page={page_count}",
+                async with client.get(f"{BAMBOO_RELAY_ENDPOINT}?perPage={BAMBOO_RELAY_PAGE_SIZE}&page={page_count}",
                                       timeout=API_CALL_TIMEOUT) as response:
-                    if response.status == 200:
-
-                        markets = await response.json()
-                        new_trading_pairs = set(map(lambda details: details.get("id"), markets))
-                        if len(new_trading_pairs) == 0:
-                            break
-                        else:
-                            trading_pairs = trading_pairs.union(new_trading_pairs)
-                        page_count += 1
-                        trading_pair_list: List[str] = []
-                        for raw_trading_pair in trading_pairs:
-                            converted_trading_pair: Optional[str] = \
-                                BambooRelayMarket.convert_from_exchange_trading_pair(raw_trading_pair)
-                            if converted_trading_pair is not None:
-                                trading_pair_list.append(converted_trading_pair)
-                            else:
-                                self.logger().debug(f"Could not parse the trading pair {raw_trading_pair}, skipping it...")
-                        return trading_pair_list
-                    else:
+                    if response.status != 200:
+                        break
+                    markets = await response.json()
+                    trading_pairs.update(map(lambda details: details.get("id"), markets))
+                    if len(markets) < BAMBOO_RELAY_PAGE_SIZE:
                         break
+                    page_count += 1
+            trading_pair_list: List[str] = []
+            for raw_trading_pair in trading_pairs:
+                converted_trading_pair: Optional[str] = \
+                    BambooRelayMarket.convert_from_exchange_trading_pair(raw_trading_pair)
+                if converted_trading_pair is not None:
+                    trading_pair_list.append(converted_trading_pair)
+                else:
+                    self.logger().debug(f"Could not parse the trading pair {raw_trading_pair}, skipping it...")
+            return trading_pair_list
 
         except Exception:
             # Do nothing if the request fails -- there will be no autocomplete for bamboo trading pairs
@@ -184,7 +275,7 @@ class TradingPairFetcher:
         try:
             from hummingbot.market.eterbase.eterbase_market import EterbaseMarket
 
-            client: aiohttp.ClientSession() = self.http_client()
+            client: aiohttp.ClientSession = self.http_client()
             async with client.get(ETERBASE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
                     markets = await response.json()
@@ -269,36 +360,36 @@ class TradingPairFetcher:
 
     @staticmethod
     async def fetch_kucoin_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        try:
+            client: aiohttp.ClientSession = TradingPairFetcher.http_client()
             async with client.get(KUCOIN_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
                 if response.status == 200:
-                    try:
-                        data: Dict[str, Any] = await response.json()
-                        all_trading_pairs = data.get("data", [])
-                        return [item["symbol"] for item in all_trading_pairs if item["enableTrading"] is True]
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for kucoin trading pairs
-                return []
+                    data: Dict[str, Any] = await response.json()
+                    all_trading_pairs = data.get("data", [])
+                    return [item["symbol"] for item in all_trading_pairs if item["enableTrading"] is True]
+        except Exception:
+            # Do nothing if the request fails -- there will be no autocomplete for kucoin trading pairs
+            pass
+        return []
 
     @staticmethod
     async def fetch_kraken_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(KRAKEN_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                    if response.status == 200:
-                        from hummingbot.market.kraken.kraken_market import KrakenMarket
-                        data: Dict[str, Any] = await response.json()
-                        raw_pairs = data.get("result", [])
-                        converted_pairs: List[str] = []
-                        for pair, details in raw_pairs.items():
-                            if "." not in pair:
-                                try:
-                                    wsname = details["wsname"]  # pair in format BASE/QUOTE
-                                    converted_pairs.append(KrakenMarket.convert_from_exchange_trading_pair(wsname))
-                                except IOError:
-                                    pass
-                        return [item for item in converted_pairs]
+            client: aiohttp.ClientSession = TradingPairFetcher.http_client()
+            async with client.get(KRAKEN_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+                if response.status == 200:
+                    from hummingbot.market.kraken.kraken_market import KrakenMarket
+                    data: Dict[str, Any] = await response.json()
+                    raw_pairs = data.get("result", [])
+                    converted_pairs: List[str] = []
+                    for pair, details in raw_pairs.items():
+                        if "." not in pair:
+                            try:
+                                wsname = details["wsname"]  # pair in format BASE/QUOTE
+                                converted_pairs.append(KrakenMarket.convert_from_exchange_trading_pair(wsname))
+                            except IOError:
+                                pass
+                    return [item for item in converted_pairs]
         except Exception:
             pass
             # Do nothing if the request fails -- there will be no autocomplete for kraken trading pairs
@@ -374,39 +465,14 @@ class TradingPairFetcher:
             pass
         return []
 
-    async def fetch_all(self):
-        tasks = [self.fetch_binance_trading_pairs(),
-                 self.fetch_bamboo_relay_trading_pairs(),
-                 self.fetch_coinbase_pro_trading_pairs(),
-                 self.fetch_dolomite_trading_pairs(),
-                 self.fetch_huobi_trading_pairs(),
-                 self.fetch_liquid_trading_pairs(),
-                 self.fetch_bittrex_trading_pairs(),
-                 self.fetch_kucoin_trading_pairs(),
-                 self.fetch_bitcoin_com_trading_pairs(),
-                 self.fetch_kraken_trading_pairs(),
-                 self.fetch_radar_relay_trading_pairs(),
-                 self.fetch_eterbase_trading_pairs(),
-                 self.fetch_ocean_trading_pairs()]
-
-        # Radar Relay has not yet been migrated to a new version
-        # Endpoint needs to be updated after migration
-        # radar_relay_trading_pairs = await self.fetch_radar_relay_trading_pairs()
-
-        results = await safe_gather(*tasks, return_exceptions=True)
-        self.trading_pairs = {
-            "binance": results[0],
-            "bamboo_relay": results[1],
-            "coinbase_pro": results[2],
-            "dolomite": results[3],
-            "huobi": results[4],
-            "liquid": results[5],
-            "bittrex": results[6],
-            "kucoin": results[7],
-            "bitcoin_com": results[8],
-            "kraken": results[9],
-            "radar_relay": results[10],
-            "eterbase": results[11],
-            "ocean": results[12]
-        }
-        self.ready = True
+    async def fetch_all(self, exchanges: Optional[Iterable[str]] = None):
+        """
+        Refreshes the trading pairs of the given exchanges, or of all supported exchanges, regardless of their age.
+        At most `MAX_CONCURRENT_FETCHES` exchanges are fetched at the same time.
+        """
+        if exchanges is None:
+            exchanges = [name[len("fetch_"):-len("_trading_pairs")] for name in dir(self)
+                         if name.startswith("fetch_") and name.endswith("_trading_pairs")]
+        tasks: List[asyncio.Task] = [task for task in (self.refresh(exchange, force=True) for exchange in exchanges)
+                                     if task is not None]
+        await safe_gather(*tasks, return_exceptions=True)
@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+
+"""
+Websocket connections shared by all the streams of an exchange.
+
+A data source subscribes to channels, e.g. the trades and order book channels of its trading pairs, and reads their
+messages from a `WebSocketSubscription`. The manager spreads the channels over as few connections as the exchange's
+per connection limit allows, routes each message to the subscriptions of its channel, and on a dropped connection
+reconnects and resubscribes right away, then with jittered exponential backoff while the exchange can't be reached.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set
+)
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.management.metrics import (
+    GaugeSample,
+    MetricsRegistry
+)
+from hummingbot.core.utils import fast_json
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+WS_CONNECTED_METRIC = "hummingbot_websocket_connected"
+WS_CHANNELS_METRIC = "hummingbot_websocket_channels"
+WS_MESSAGE_RATE_METRIC = "hummingbot_websocket_messages_per_second"
+WS_LATENCY_METRIC = "hummingbot_websocket_latency_seconds"
+WS_RECONNECTS_METRIC = "hummingbot_websocket_reconnects"
+
+ChannelMessages = Callable[[List[str]], List[Any]]
+
+
+class WebSocketConnectionStats(NamedTuple):
+    connection_id: int
+    connected: bool
+    channels: int
+    message_count: int
+    message_rate: float
+    latency: float
+    ping_rtt: float
+    reconnects: int
+
+
+class WebSocketSubscription:
+    """
+    The messages of some channels, in the order they were received. Closing the subscription unsubscribes from the
+    channels no other subscription needs.
+
+        async with ws_manager.subscribe(channels) as subscription:
+            async for msg in subscription:
+                ...
+    """
+
+    def __init__(self, manager: "WebSocketManager", channels: Iterable[str]):
+        self._manager: "WebSocketManager" = manager
+        self._channels: Set[str] = set(channels)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed: bool = False
+
+    @property
+    def channels(self) -> Set[str]:
+        return self._channels
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        return self._queue
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._manager.unsubscribe(self)
+
+    async def __aenter__(self) -> "WebSocketSubscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __aiter__(self) -> "WebSocketSubscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self._queue.get()
+
+
+class WebSocketConnection:
+    """
+    One connection of a WebSocketManager, which keeps itself connected and subscribed to its channels.
+    """
+    # Weight of the latest second in the message rate, and of the latest message in the latency.
+    SMOOTHING = 0.2
+    # A connection up for this long resets the reconnection backoff, even if its channels were quiet.
+    STABLE_CONNECTION_TIME = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        return WebSocketManager.logger()
+
+    def __init__(self, manager: "WebSocketManager", connection_id: int):
+        self._manager: "WebSocketManager" = manager
+        self.connection_id: int = connection_id
+        self.channels: Set[str] = set()
+        self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._task: Optional[asyncio.Task] = None
+        self._failed_attempts: int = 0
+        self.message_count: int = 0
+        self.reconnects: int = 0
+        self.message_rate: float = 0.0
+        self.latency: float = 0.0
+        self.ping_rtt: float = 0.0
+        self._rate_window_start: float = time.monotonic()
+        self._rate_window_count: int = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    def stats(self) -> WebSocketConnectionStats:
+        return WebSocketConnectionStats(self.connection_id, self.connected, len(self.channels), self.message_count,
+                                        self.message_rate, self.latency, self.ping_rtt, self.reconnects)
+
+    def start(self):
+        if self._task is None:
+            self._task = safe_ensure_future(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def send_subscribe(self, channels: List[str]):
+        """
+        Subscribes to channels added to `channels` since the connection was opened. Channels added before are
+        subscribed to when the connection is opened.
+        """
+        if self._ws is not None:
+            safe_ensure_future(self._send_all(self._ws, self._manager.subscribe_messages(channels)))
+
+    def send_unsubscribe(self, channels: List[str]):
+        if self._ws is not None and self._manager.unsubscribe_messages is not None:
+            safe_ensure_future(self._send_all(self._ws, self._manager.unsubscribe_messages(channels)))
+
+    async def _send_all(self, ws: websockets.WebSocketClientProtocol, messages: List[Any]):
+        for message in messages:
+            await ws.send(message if isinstance(message, (str, bytes)) else self._manager.encode(message))
+
+    def _backoff_delay(self) -> float:
+        # The first reconnection is immediate. After that, the delay is drawn from an exponentially growing range, so
+        # that many clients dropped at once don't reconnect in lockstep.
+        if self._failed_attempts == 0:
+            return 0.0
+        return random.uniform(0, min(self._manager.max_backoff,
+                                     self._manager.min_backoff * 2 ** (self._failed_attempts - 1)))
+
+    def _record_message(self, msg: Any):
+        now: float = time.monotonic()
+        self.message_count += 1
+        self._rate_window_count += 1
+        elapsed: float = now - self._rate_window_start
+        if elapsed >= 1.0:
+            self.message_rate += self.SMOOTHING * (self._rate_window_count / elapsed - self.message_rate)
+            self._rate_window_start = now
+            self._rate_window_count = 0
+        if self._manager.get_event_time is not None:
+            event_time: Optional[float] = self._manager.get_event_time(msg)
+            if event_time is not None:
+                self.latency += self.SMOOTHING * (time.time() - event_time - self.latency)
+
+    async def _ping(self, ws: websockets.WebSocketClientProtocol):
+        start: float = time.monotonic()
+        pong_waiter = await ws.ping()
+        await asyncio.wait_for(pong_waiter, timeout=self._manager.ping_timeout)
+        self.ping_rtt = time.monotonic() - start
+
+    async def _listen(self, ws: websockets.WebSocketClientProtocol):
+        while True:
+            try:
+                raw_msg = await asyncio.wait_for(ws.recv(), timeout=self._manager.message_timeout)
+            except asyncio.TimeoutError:
+                await self._ping(ws)
+                continue
+            msg: Any = self._manager.decode(raw_msg)
+            self._record_message(msg)
+            if self._manager.reply is not None:
+                reply: Optional[Any] = self._manager.reply(msg)
+                if reply is not None:
+                    await self._send_all(ws, [reply])
+                    continue
+            # Servers may greet or acknowledge subscriptions and then drop the connection, so only channel messages
+            # show the connection works.
+            if self._manager.route(msg):
+                self._failed_attempts = 0
+
+    async def _run(self):
+        while len(self.channels) > 0:
+            connected_time: Optional[float] = None
+            try:
+                async with websockets.connect(self._manager.url) as ws:
+                    self._ws = ws
+                    connected_time = time.monotonic()
+                    self.logger().debug(f"{self._manager.name} websocket connection {self.connection_id} "
+                                        f"subscribing to {len(self.channels)} channels.")
+                    await self._send_all(ws, self._manager.subscribe_messages(sorted(self.channels)))
+                    await self._listen(ws)
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                self.logger().warning(f"{self._manager.name} websocket connection {self.connection_id} ping timed out."
+                                      f" Reconnecting...")
+            except ConnectionClosed:
+                self.logger().info(f"{self._manager.name} websocket connection {self.connection_id} closed. "
+                                   f"Reconnecting...")
+            except Exception:
+                self.logger().network(f"Unexpected error with {self._manager.name} websocket connection "
+                                      f"{self.connection_id}.",
+                                      exc_info=True,
+                                      app_warning_msg=f"Could not connect to {self._manager.name} websocket. "
+                                                      f"Check network connection.")
+            finally:
+                self._ws = None
+            if len(self.channels) == 0:
+                break
+            if connected_time is not None and time.monotonic() - connected_time >= self.STABLE_CONNECTION_TIME:
+                self._failed_attempts = 0
+            delay: float = self._backoff_delay()
+            self._failed_attempts += 1
+            self.reconnects += 1
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+class WebSocketManager:
+    """
+    Multiplexes the channels of one exchange over up to `max_connections` websocket connections, each with at most
+    `max_channels_per_connection` channels.
+
+    The exchange's protocol is described by functions of the manager:
+    - `subscribe_messages(channels)` returns the messages that subscribe a connection to the channels. Messages which
+      aren't str or bytes are encoded with `encode`.
+    - `get_channel(msg)` returns the channel of a decoded message, or None for messages of no channel, which are
+      dropped.
+    - `unsubscribe_messages(channels)`, optional, returns the messages that unsubscribe from the channels. Without
+      it, channels no longer needed stay subscribed until the connection is dropped.
+    - `reply(msg)`, optional, returns the reply to a control message, e.g. a pong to a ping, or None.
+    - `get_event_time(msg)`, optional, returns the exchange's timestamp of a message in seconds, for the latency.
+    """
+    DEFAULT_MAX_CHANNELS_PER_CONNECTION = 100
+    DEFAULT_MAX_CONNECTIONS = 4
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+    MIN_BACKOFF = 0.5
+    MAX_BACKOFF = 30.0
+
+    _wsm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wsm_logger is None:
+            cls._wsm_logger = logging.getLogger(__name__)
+        return cls._wsm_logger
+
+    def __init__(self,
+                 name: str,
+                 url: str,
+                 subscribe_messages: ChannelMessages,
+                 get_channel: Callable[[Any], Optional[str]],
+                 unsubscribe_messages: Optional[ChannelMessages] = None,
+                 reply: Optional[Callable[[Any], Optional[Any]]] = None,
+                 get_event_time: Optional[Callable[[Any], Optional[float]]] = None,
+                 max_channels_per_connection: int = DEFAULT_MAX_CHANNELS_PER_CONNECTION,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 decode: Callable[[Any], Any] = fast_json.loads,
+                 encode: Callable[[Any], str] = json.dumps,
+                 message_timeout: float = MESSAGE_TIMEOUT,
+                 ping_timeout: float = PING_TIMEOUT,
+                 min_backoff: float = MIN_BACKOFF,
+                 max_backoff: float = MAX_BACKOFF):
+        self.name: str = name
+        self.url: str = url
+        self.subscribe_messages: ChannelMessages = subscribe_messages
+        self.get_channel: Callable[[Any], Optional[str]] = get_channel
+        self.unsubscribe_messages: Optional[ChannelMessages] = unsubscribe_messages
+        self.reply: Optional[Callable[[Any], Optional[Any]]] = reply
+        self.get_event_time: Optional[Callable[[Any], Optional[float]]] = get_event_time
+        self.max_channels_per_connection: int = max_channels_per_connection
+        self.max_connections: int = max_connections
+        self.decode: Callable[[Any], Any] = decode
+        self.encode: Callable[[Any], str] = encode
+        self.message_timeout: float = message_timeout
+        self.ping_timeout: float = ping_timeout
+        self.min_backoff: float = min_backoff
+        self.max_backoff: float = max_backoff
+
+        self._connections: List[WebSocketConnection] = []
+        self._channel_connections: Dict[str, WebSocketConnection] = {}
+        self._subscriptions: Dict[str, List[WebSocketSubscription]] = {}
+        self._next_connection_id: int = 0
+        MetricsRegistry.get_instance().add_gauge_source(self)
+
+    @property
+    def connections(self) -> List[WebSocketConnection]:
+        return self._connections
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self._channel_connections.keys())
+
+    def _connection_with_room(self) -> WebSocketConnection:
+        candidates: List[WebSocketConnection] = [connection for connection in self._connections
+                                                 if len(connection.channels) < self.max_channels_per_connection]
+        if len(candidates) > 0:
+            return min(candidates, key=lambda connection: len(connection.channels))
+        if len(self._connections) < self.max_connections:
+            connection: WebSocketConnection = WebSocketConnection(self, self._next_connection_id)
+            self._next_connection_id += 1
+            self._connections.append(connection)
+            return connection
+        self.logger().warning(f"All {self.max_connections} {self.name} websocket connections have "
+                              f"{self.max_channels_per_connection} channels. Exceeding the channel limit.")
+        return min(self._connections, key=lambda connection: len(connection.channels))
+
+    def subscribe(self, channels: Iterable[str]) -> WebSocketSubscription:
+        subscription: WebSocketSubscription = WebSocketSubscription(self, channels)
+        new_channels: Dict[WebSocketConnection, List[str]] = {}
+        for channel in sorted(subscription.channels):
+            self._subscriptions.setdefault(channel, []).append(subscription)
+            if channel not in self._channel_connections:
+                connection: WebSocketConnection = self._connection_with_room()
+                connection.channels.add(channel)
+                self._channel_connections[channel] = connection
+                new_channels.setdefault(connection, []).append(channel)
+        for connection, channels_to_add in new_channels.items():
+            connection.send_subscribe(channels_to_add)
+            connection.start()
+        return subscription
+
+    def unsubscribe(self, subscription: WebSocketSubscription):
+        removed_channels: Dict[WebSocketConnection, List[str]] = {}
+        for channel in subscription.channels:
+            subscriptions: List[WebSocketSubscription] = self._subscriptions.get(channel, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            if len(subscriptions) == 0 and channel in self._channel_connections:
+                del self._subscriptions[channel]
+                connection: WebSocketConnection = self._channel_connections.pop(channel)
+                connection.channels.discard(channel)
+                removed_channels.setdefault(connection, []).append(channel)
+        for connection, channels in removed_channels.items():
+            connection.send_unsubscribe(channels)
+            if len(connection.channels) == 0:
+                connection.stop()
+                self._connections.remove(connection)
+
+    def route(self, msg: Any) -> bool:
+        """
+        Returns False for messages of no channel.
+        """
+        channel: Optional[str] = self.get_channel(msg)
+        if channel is None:
+            return False
+        for subscription in self._subscriptions.get(channel, ()):
+            subscription.queue.put_nowait(msg)
+        return True
+
+    def stop(self):
+        for connection in self._connections:
+            connection.stop()
+        self._connections.clear()
+        self._channel_connections.clear()
+        self._subscriptions.clear()
+
+    def connection_stats(self) -> List[WebSocketConnectionStats]:
+        return [connection.stats() for connection in self._connections]
+
+    def metrics_gauges(self) -> List[GaugeSample]:
+        samples: List[GaugeSample] = []
+        for stats in self.connection_stats():
+            labels = (("exchange", self.name), ("connection", str(stats.connection_id)))
+            samples.extend([
+                GaugeSample(WS_CONNECTED_METRIC, labels, float(stats.connected)),
+                GaugeSample(WS_CHANNELS_METRIC, labels, stats.channels),
+                GaugeSample(WS_MESSAGE_RATE_METRIC, labels, stats.message_rate),
+                GaugeSample(WS_LATENCY_METRIC, labels, stats.latency or stats.ping_rtt),
+                GaugeSample(WS_RECONNECTS_METRIC, labels, stats.reconnects),
+            ])
+        return samples
+
+
+_shared_websocket_managers: Dict[str, WebSocketManager] = {}
+
+
+def get_websocket_manager(name: str, url: str, **kwargs: Any) -> WebSocketManager:
+    """
+    Returns the websocket manager shared by all the data sources of an exchange, creating it on the first call.
+    """
+    if name not in _shared_websocket_managers:
+        _shared_websocket_managers[name] = WebSocketManager(name, url, **kwargs)
+    return _shared_websocket_managers[name]
+
+
+MetricsRegistry.get_instance().set_help(WS_CONNECTED_METRIC, "1 if the websocket connection is open.")
+MetricsRegistry.get_instance().set_help(WS_CHANNELS_METRIC, "Number of channels on the websocket connection.")
+MetricsRegistry.get_instance().set_help(WS_MESSAGE_RATE_METRIC, "Messages received per second, smoothed.")
+MetricsRegistry.get_instance().set_help(WS_LATENCY_METRIC,
+                                        "Delay of the exchange's messages, or the ping round trip time, smoothed.")
+MetricsRegistry.get_instance().set_help(WS_RECONNECTS_METRIC, "Number of reconnections of the websocket connection.")
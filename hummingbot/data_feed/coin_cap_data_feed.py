@@ -28,11 +28,10 @@ class CoinCapDataFeed(DataFeedBase):
         return cls.ccdf_logger
 
     def __init__(self, update_interval: float = 5.0):
-        super().__init__()
+        super().__init__(update_interval)
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
         self._price_dict: Dict[str, float] = {}
-        self._update_interval: float = update_interval
         self._fetch_price_task: Optional[asyncio.Task] = None
 
     @property
@@ -62,7 +61,7 @@ class CoinCapDataFeed(DataFeedBase):
                                       app_warning_msg="Couldn't fetch newest prices from CoinCap. "
                                                       "Check network connection.")
 
-            await asyncio.sleep(self._update_interval)
+            await self.wait_for_next_update()
 
     async def fetch_prices(self):
         try:
@@ -82,6 +81,7 @@ class CoinCapDataFeed(DataFeedBase):
 
             # CoinCap does not have a separate feed for WETH
             self._price_dict["WETH"] = self._price_dict["ETH"]
+            self.publish_usd_prices(self._price_dict)
             self._ready_event.set()
         except Exception:
             raise
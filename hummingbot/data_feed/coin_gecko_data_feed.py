@@ -29,10 +29,9 @@ class CoinGeckoDataFeed(DataFeedBase):
         return cls.cgdf_logger
 
     def __init__(self, update_interval: float = 30.0):
-        super().__init__()
+        super().__init__(update_interval)
         self._ev_loop = asyncio.get_event_loop()
         self._price_dict: Dict[str, float] = {}
-        self._update_interval = update_interval
         self.fetch_data_loop_task: Optional[asyncio.Task] = None
 
     @property
@@ -61,7 +60,7 @@ class CoinGeckoDataFeed(DataFeedBase):
                                       app_warning_msg="Couldn't fetch newest prices from Coin Gecko. "
                                                       "Check network connection.")
 
-            await asyncio.sleep(self._update_interval)
+            await self.wait_for_next_update()
 
     async def update_asset_prices(self):
         try:
@@ -87,6 +86,7 @@ class CoinGeckoDataFeed(DataFeedBase):
                     raise e
                 await asyncio.sleep(0.1)
             self._price_dict = price_dict
+            self.publish_usd_prices(price_dict)
         except Exception:
             raise
 
@@ -3,15 +3,21 @@ import aiohttp
 import logging
 from typing import (
     Dict,
+    List,
     Optional,
 )
-from hummingbot.core.network_base import NetworkBase, NetworkStatus
+from hummingbot.core.network_base import NetworkStatus
+from hummingbot.data_feed.data_feed_base import DataFeedBase
+from hummingbot.data_feed.price_oracle import (
+    PriceOracle,
+    custom_api_price_key,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from decimal import Decimal
 
 
-class CustomAPIDataFeed(NetworkBase):
+class CustomAPIDataFeed(DataFeedBase):
     cadf_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -21,14 +27,12 @@ class CustomAPIDataFeed(NetworkBase):
         return cls.cadf_logger
 
     def __init__(self, api_url, update_interval: float = 5.0):
-        super().__init__()
-        self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        super().__init__(update_interval)
         self._api_url = api_url
+        self._price_key: str = custom_api_price_key(api_url)
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
         self._price: Decimal = 0
-        self._update_interval: float = update_interval
         self._fetch_price_task: Optional[asyncio.Task] = None
 
     @property
@@ -39,13 +43,20 @@ class CustomAPIDataFeed(NetworkBase):
     def health_check_endpoint(self):
         return self._api_url
 
-    def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+    @property
+    def price_key(self) -> str:
+        return self._price_key
+
+    @property
+    def price_keys(self) -> List[str]:
+        return [self._price_key]
+
+    @property
+    def price_dict(self) -> Dict[str, float]:
+        return {}
 
     async def check_network(self) -> NetworkStatus:
-        client = self._http_client()
+        client = await self._http_client()
         async with client.request("GET", self.health_check_endpoint) as resp:
             status_text = await resp.text()
             if resp.status != 200:
@@ -66,15 +77,16 @@ class CustomAPIDataFeed(NetworkBase):
                                       app_warning_msg="Couldn't fetch newest price from CustomAPI. "
                                                       "Check network connection.")
 
-            await asyncio.sleep(self._update_interval)
+            await self.wait_for_next_update()
 
     async def fetch_price(self):
-        client = self._http_client()
+        client: aiohttp.ClientSession = await self._http_client()
         async with client.request("GET", self._api_url) as resp:
             resp_text = await resp.text()
             if resp.status != 200:
                 raise Exception(f"Custom API Feed {self.name} server error: {resp_text}")
             self._price = Decimal(str(resp_text))
+        PriceOracle.get_instance().set_price(self._price_key, self._price, self.name)
         self._ready_event.set()
 
     async def start_network(self):
@@ -85,9 +97,3 @@ class CustomAPIDataFeed(NetworkBase):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
-
-    def start(self):
-        NetworkBase.start(self)
-
-    def stop(self):
-        NetworkBase.stop(self)
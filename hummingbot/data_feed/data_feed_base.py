@@ -1,17 +1,32 @@
 import aiohttp
 import logging
 import asyncio
+from decimal import Decimal
+import time
 from typing import (
     Optional,
     Dict,
+    List,
 )
 
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
+from hummingbot.data_feed.price_oracle import (
+    PriceOracle,
+    usd_price_key,
+)
 from hummingbot.logger import HummingbotLogger
 
 
 class DataFeedBase(NetworkBase):
+    """
+    Base class for price data feeds. Data feeds publish their prices to the `PriceOracle`, and poll at their
+    update interval only while some of their prices are subscribed to, or `IDLE_UPDATE_INTERVAL` otherwise.
+    """
+    IDLE_UPDATE_INTERVAL = 300.0
+
     dfb_logger: Optional[HummingbotLogger] = None
+    # Shared by all data feeds.
+    _dfb_shared_client: Optional[aiohttp.ClientSession] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -19,10 +34,10 @@ class DataFeedBase(NetworkBase):
             cls.dfb_logger = logging.getLogger(__name__)
         return cls.dfb_logger
 
-    def __init__(self):
+    def __init__(self, update_interval: float = 30.0):
         super().__init__()
         self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._update_interval: float = update_interval
 
     @property
     def name(self):
@@ -36,13 +51,36 @@ class DataFeedBase(NetworkBase):
     def health_check_endpoint(self) -> str:
         raise NotImplementedError
 
+    @property
+    def price_keys(self) -> List[str]:
+        return [usd_price_key(asset) for asset in self.price_dict.keys()]
+
+    @property
+    def update_interval(self) -> float:
+        if not self._ready_event.is_set() or PriceOracle.get_instance().any_subscribed(self.price_keys):
+            return self._update_interval
+        return max(self._update_interval, self.IDLE_UPDATE_INTERVAL)
+
     def get_price(self, asset: str) -> float:
         raise NotImplementedError
 
+    def publish_usd_prices(self, price_dict: Dict[str, float]):
+        PriceOracle.get_instance().set_prices({usd_price_key(asset): Decimal(str(price))
+                                               for asset, price in price_dict.items()},
+                                              self.name)
+
+    async def wait_for_next_update(self):
+        # Sleeps in steps of the normal update interval, so that new subscriptions are picked up while idle.
+        started: float = time.time()
+        while True:
+            await asyncio.sleep(self._update_interval)
+            if time.time() - started >= self.update_interval:
+                return
+
     async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+        if DataFeedBase._dfb_shared_client is None or DataFeedBase._dfb_shared_client.closed:
+            DataFeedBase._dfb_shared_client = aiohttp.ClientSession()
+        return DataFeedBase._dfb_shared_client
 
     async def get_ready(self):
         try:
@@ -62,11 +100,11 @@ class DataFeedBase(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.health_check_endpoint) as resp:
-                    status_text = await resp.text()
-                    if resp.status != 200:
-                        raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
+            client: aiohttp.ClientSession = await self._http_client()
+            async with client.get(self.health_check_endpoint) as resp:
+                status_text = await resp.text()
+                if resp.status != 200:
+                    raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -0,0 +1,161 @@
+import logging
+import math
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple
+)
+
+from hummingbot.logger import HummingbotLogger
+
+
+class PriceEntry(NamedTuple):
+    price: Decimal
+    source: str
+    timestamp: float
+    # Incremented on every update of the price, so consumers can tell whether it changed since they last read it.
+    version: int
+
+
+class PriceOracle:
+    """
+    One table of the latest prices from all price sources, keyed by price key:
+
+    - USD prices from the data feeds, keyed by "{ASSET}-USD" (e.g. "ETH-USD").
+    - Custom API prices, keyed by `custom_api_price_key(api_url)`.
+    - Mid prices of live order books, keyed by `order_book_price_key(market_name, trading_pair)`. These are read
+      from the order book when they are looked up, so they are never stale.
+
+    Consumers subscribe to the keys they use. Data feeds poll at their normal rate only while one of their keys is
+    subscribed to.
+    """
+    DEFAULT_MAX_AGE = 120.0
+
+    po_logger: Optional[HummingbotLogger] = None
+    _po_shared_instance: Optional["PriceOracle"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls.po_logger is None:
+            cls.po_logger = logging.getLogger(__name__)
+        return cls.po_logger
+
+    @classmethod
+    def get_instance(cls) -> "PriceOracle":
+        if cls._po_shared_instance is None:
+            cls._po_shared_instance = PriceOracle()
+        return cls._po_shared_instance
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE):
+        self._max_age: float = max_age
+        self._prices: Dict[str, PriceEntry] = {}
+        self._order_books: Dict[str, Tuple[object, str]] = {}
+        self._subscriptions: Dict[int, Set[str]] = {}
+        self._subscriber_counts: Dict[str, int] = {}
+        self._next_subscription_id: int = 1
+
+    @property
+    def max_age(self) -> float:
+        return self._max_age
+
+    @property
+    def subscribed_keys(self) -> Set[str]:
+        return set(self._subscriber_counts.keys())
+
+    def is_subscribed(self, key: str) -> bool:
+        return key in self._subscriber_counts
+
+    def any_subscribed(self, keys: Iterable[str]) -> bool:
+        return any(key in self._subscriber_counts for key in keys)
+
+    def subscribe(self, keys: Iterable[str]) -> int:
+        """
+        Returns a subscription id, to be passed to `unsubscribe()` once the prices aren't needed anymore.
+        """
+        subscription_id: int = self._next_subscription_id
+        self._next_subscription_id += 1
+        self._subscriptions[subscription_id] = set(keys)
+        for key in self._subscriptions[subscription_id]:
+            self._subscriber_counts[key] = self._subscriber_counts.get(key, 0) + 1
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: int):
+        for key in self._subscriptions.pop(subscription_id, set()):
+            self._subscriber_counts[key] -= 1
+            if self._subscriber_counts[key] == 0:
+                del self._subscriber_counts[key]
+
+    def set_price(self, key: str, price: Decimal, source: str, timestamp: Optional[float] = None):
+        previous: Optional[PriceEntry] = self._prices.get(key)
+        version: int = previous.version + 1 if previous is not None else 1
+        self._prices[key] = PriceEntry(price, source, timestamp if timestamp is not None else time.time(), version)
+
+    def set_prices(self, prices: Dict[str, Decimal], source: str, timestamp: Optional[float] = None):
+        timestamp = timestamp if timestamp is not None else time.time()
+        for key, price in prices.items():
+            self.set_price(key, price, source, timestamp)
+
+    def add_order_book(self, market: object, trading_pair: str) -> str:
+        """
+        Adds the mid price of a market's order book to the table, and returns its price key.
+        """
+        key: str = order_book_price_key(market.name, trading_pair)
+        self._order_books[key] = (market, trading_pair)
+        return key
+
+    def remove_order_book(self, market: object, trading_pair: str):
+        self._order_books.pop(order_book_price_key(market.name, trading_pair), None)
+
+    def _update_order_book_price(self, key: str):
+        market, trading_pair = self._order_books[key]
+        order_book = market.get_order_book(trading_pair)
+        bid: float = order_book.get_price(False)
+        ask: float = order_book.get_price(True)
+        if math.isnan(bid) or math.isnan(ask):
+            return
+        mid_price: Decimal = (Decimal(str(bid)) + Decimal(str(ask))) / Decimal("2")
+        entry: Optional[PriceEntry] = self._prices.get(key)
+        if entry is None or entry.price != mid_price:
+            self.set_price(key, mid_price, market.name)
+
+    def get_entry(self, key: str) -> Optional[PriceEntry]:
+        if key in self._order_books:
+            self._update_order_book_price(key)
+        return self._prices.get(key)
+
+    def is_stale(self, key: str, max_age: Optional[float] = None) -> bool:
+        entry: Optional[PriceEntry] = self.get_entry(key)
+        max_age = max_age if max_age is not None else self._max_age
+        return entry is None or (key not in self._order_books and time.time() - entry.timestamp > max_age)
+
+    def get_price(self, key: str, max_age: Optional[float] = None) -> Optional[Decimal]:
+        """
+        Returns the latest price for the key, or None if there's no price younger than `max_age` seconds.
+        """
+        if self.is_stale(key, max_age):
+            return None
+        return self._prices[key].price
+
+    def get_prices(self, keys: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Optional[Decimal]]:
+        return {key: self.get_price(key, max_age) for key in keys}
+
+    def stale_keys(self, max_age: Optional[float] = None) -> List[str]:
+        return [key for key in self._subscriber_counts if self.is_stale(key, max_age)]
+
+
+def usd_price_key(asset: str) -> str:
+    return f"{asset.upper()}-USD"
+
+
+def custom_api_price_key(api_url: str) -> str:
+    return f"custom_api:{api_url}"
+
+
+def order_book_price_key(market_name: str, trading_pair: str) -> str:
+    return f"{market_name}:{trading_pair}"
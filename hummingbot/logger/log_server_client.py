@@ -1,21 +1,68 @@
 import asyncio
+from collections import (
+    defaultdict,
+    deque
+)
+import gzip
+import itertools
+import json
 import logging
-from typing import Optional
+import os
+from os.path import join
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple
+)
+from urllib.parse import urlencode
 import aiohttp
 
+from hummingbot import prefix_path
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.logger import HummingbotLogger
+from hummingbot.logger import (
+    HummingbotLogger,
+    log_encoder
+)
+
+BatchKey = Tuple[str, str, str]
 
 
 class LogServerClient(NetworkBase):
+    """
+    Sends log and metrics requests to the reporting proxy.
+
+    Requests are batched by (method, url, params): list payloads of requests in the same batch are concatenated, and
+    sent as one gzip compressed JSON body once `MAX_BATCH_SIZE` entries are pending or `MAX_BATCH_DELAY` seconds have
+    passed. Batches that can't be sent are written to a bounded on-disk spool, and retried with exponential backoff.
+    Pending batches are sent on `stop()`, and spooled to be sent on the next start if that fails.
+
+    `request()` may be called from any thread.
+    """
     lsc_logger: Optional[HummingbotLogger] = None
     _lsc_shared_instance: "LogServerClient" = None
 
+    DEFAULT_LOG_SERVER_URL = "https://api.coinalpha.com/reporting-proxy"
+    MAX_BATCH_SIZE = 100
+    MAX_BATCH_DELAY = 5.0
+    MAX_PENDING_REQUESTS = 1000
+    MIN_BACKOFF = 1.0
+    MAX_BACKOFF = 300.0
+    MAX_SPOOL_SIZE = 10 * 1024 * 1024
+    REQUEST_TIMEOUT = 30.0
+    STOP_FLUSH_TIMEOUT = 5.0
+
     @classmethod
-    def get_instance(cls) -> "LogServerClient":
+    def get_instance(cls, log_server_url: Optional[str] = None) -> "LogServerClient":
         if cls._lsc_shared_instance is None:
-            cls._lsc_shared_instance = LogServerClient()
+            cls._lsc_shared_instance = LogServerClient(log_server_url or cls.DEFAULT_LOG_SERVER_URL)
         return cls._lsc_shared_instance
 
     @classmethod
@@ -24,53 +71,234 @@ class LogServerClient(NetworkBase):
             cls.lsc_logger = logging.getLogger(__name__)
         return cls.lsc_logger
 
-    def __init__(self):
+    def __init__(self,
+                 log_server_url: str = DEFAULT_LOG_SERVER_URL,
+                 spool_dir: Optional[str] = None):
         super().__init__()
-        self.queue = asyncio.Queue()
-        self.consume_queue_task = None
+        self._log_server_url: str = log_server_url
+        self._spool_dir: str = spool_dir if spool_dir is not None else join(prefix_path(), "logs", "log_server_spool")
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._pending_requests: Deque[Dict[str, Any]] = deque()
+        self._pending_entries_count: int = 0
+        self._pending_lock: threading.Lock = threading.Lock()
+        self._batch_ready: asyncio.Event = asyncio.Event()
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._backoff: float = 0
+        self._spool_sequence: Iterator[int] = itertools.count(1)
+        self.consume_queue_task: Optional[asyncio.Task] = None
+
+    @property
+    def log_server_url(self) -> str:
+        return self._log_server_url
 
-    def request(self, req):
+    @property
+    def pending_requests_count(self) -> int:
+        return len(self._pending_requests)
+
+    def _get_shared_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = aiohttp.ClientSession(connector=aiohttp.TCPConnector(verify_ssl=False),
+                                                        timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT))
+        return self._shared_client
+
+    def request(self, req: Dict[str, Any]):
+        """
+        Queues a request of the form {"url": ..., "method": ..., "request_obj": {"headers", "data", "params"}}.
+        If `data` is a list, it's batched with other requests to the same url and params.
+        """
+        overflow: List[Dict[str, Any]] = []
+        with self._pending_lock:
+            self._pending_requests.append(req)
+            self._pending_entries_count += self._entries_count(req)
+            while len(self._pending_requests) > self.MAX_PENDING_REQUESTS:
+                overflow.append(self._pending_requests.popleft())
+                self._pending_entries_count -= self._entries_count(overflow[-1])
+            batch_ready: bool = self._pending_entries_count >= self.MAX_BATCH_SIZE
+        if len(overflow) > 0:
+            # Don't let memory grow while the log server can't keep up.
+            for batch in self._make_batches(overflow):
+                self._spool_batch(batch)
+        if threading.current_thread() is threading.main_thread():
+            self._did_request(batch_ready)
+        else:
+            self._ev_loop.call_soon_threadsafe(self._did_request, batch_ready)
+
+    def _did_request(self, batch_ready: bool):
         if not self.started:
             self.start()
-        self.queue.put_nowait(req)
+        if batch_ready:
+            self._batch_ready.set()
 
-    async def consume_queue(self, session):
-        while True:
-            try:
-                req = await self.queue.get()
-                self.logger().debug(
-                    f"Remote logging payload: {req}"
-                )
-                async with session.request(req["method"], req["url"], **req["request_obj"]) as resp:
-                    resp_text = await resp.text()
-                    self.logger().debug(f"Sent logs: {resp.status} {resp.url} {resp_text} ",
+    @staticmethod
+    def _entries_count(req: Dict[str, Any]) -> int:
+        data: Any = req["request_obj"].get("data")
+        return len(data) if isinstance(data, list) else 1
+
+    def _take_batches(self) -> List[Dict[str, Any]]:
+        with self._pending_lock:
+            requests: List[Dict[str, Any]] = list(self._pending_requests)
+            self._pending_requests.clear()
+            self._pending_entries_count = 0
+        return self._make_batches(requests)
+
+    def _make_batches(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Groups requests into batches of at most `MAX_BATCH_SIZE` entries, each with a serialized and compressed body.
+        """
+        grouped: Dict[BatchKey, List[Dict[str, Any]]] = defaultdict(list)
+        batches: List[Dict[str, Any]] = []
+        for req in requests:
+            request_obj: Dict[str, Any] = req["request_obj"]
+            if not isinstance(request_obj.get("data"), list):
+                batches.append(self._make_batch(req, request_obj.get("data")))
+                continue
+            key: BatchKey = (req["method"], req["url"], json.dumps(request_obj.get("params"), sort_keys=True))
+            grouped[key].append(req)
+
+        for key, group in grouped.items():
+            entries: List[Any] = [entry for req in group for entry in req["request_obj"]["data"]]
+            for i in range(0, len(entries), self.MAX_BATCH_SIZE):
+                batches.append(self._make_batch(group[0], entries[i:i + self.MAX_BATCH_SIZE]))
+        return batches
+
+    @staticmethod
+    def _make_batch(req: Dict[str, Any], data: Any) -> Dict[str, Any]:
+        request_obj: Dict[str, Any] = req["request_obj"]
+        headers: Dict[str, str] = dict(request_obj.get("headers") or {})
+        body: Any = data
+        if isinstance(data, list):
+            body = gzip.compress(json.dumps(data, default=log_encoder).encode("utf8"))
+            headers["Content-Type"] = "application/json"
+            headers["Content-Encoding"] = "gzip"
+        elif isinstance(data, str):
+            body = data.encode("utf8")
+        elif isinstance(data, dict):
+            # Form encoded, as aiohttp sends dicts.
+            body = urlencode(data).encode("utf8")
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+        elif data is not None and not isinstance(data, (bytes, bytearray)):
+            body = json.dumps(data, default=log_encoder).encode("utf8")
+            headers.setdefault("Content-Type", "application/json")
+        return {"method": req["method"],
+                "url": req["url"],
+                "headers": headers,
+                "params": request_obj.get("params"),
+                "body": body}
+
+    async def _send_batch(self, batch: Dict[str, Any]) -> bool:
+        """
+        Returns False if the batch should be retried later.
+        """
+        try:
+            async with self._get_shared_client().request(batch["method"],
+                                                         batch["url"],
+                                                         headers=batch["headers"],
+                                                         params=batch["params"],
+                                                         data=batch["body"]) as resp:
+                resp_text: str = await resp.text()
+                if resp.status >= 500 or resp.status == 429:
+                    self.logger().debug(f"Log server unavailable: {resp.status} {resp_text}",
                                         extra={"do_not_send": True})
+                    return False
+                self.logger().debug(f"Sent logs: {resp.status} {resp.url} {resp_text} ",
+                                    extra={"do_not_send": True})
+                return True
+        except asyncio.CancelledError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.logger().network(f"Network error sending logs.", exc_info=True, extra={"do_not_send": True})
+            return False
 
-            except asyncio.CancelledError:
-                raise
-            except aiohttp.ClientError:
-                self.logger().network(f"Network error sending logs.", exc_info=True, extra={"do_not_send": True})
-                return
+    def _spool_batch(self, batch: Dict[str, Any]):
+        try:
+            os.makedirs(self._spool_dir, exist_ok=True)
+            header: Dict[str, Any] = {k: batch[k] for k in ("method", "url", "headers", "params")}
+            # Bodies are serialized by `_make_batch()`, only requests without data have none.
+            body: bytes = bytes(batch["body"]) if batch["body"] is not None else b""
+            file_name: str = f"{time.time_ns():020d}-{next(self._spool_sequence):06d}.spool"
+            with open(join(self._spool_dir, file_name), "wb") as fd:
+                fd.write(json.dumps(header).encode("utf8") + b"\n" + body)
+            self._trim_spool()
+        except Exception:
+            self.logger().error("Error writing logs to the spool directory.", exc_info=True,
+                                extra={"do_not_send": True})
+
+    def _spool_files(self) -> List[str]:
+        if not os.path.isdir(self._spool_dir):
+            return []
+        return sorted(f for f in os.listdir(self._spool_dir) if f.endswith(".spool"))
+
+    def _trim_spool(self):
+        files: List[str] = self._spool_files()
+        sizes: Dict[str, int] = {f: os.path.getsize(join(self._spool_dir, f)) for f in files}
+        total_size: int = sum(sizes.values())
+        while total_size > self.MAX_SPOOL_SIZE and len(files) > 0:
+            oldest: str = files.pop(0)
+            os.remove(join(self._spool_dir, oldest))
+            total_size -= sizes[oldest]
+
+    def _read_spooled_batch(self, file_name: str) -> Dict[str, Any]:
+        with open(join(self._spool_dir, file_name), "rb") as fd:
+            header_line, body = fd.read().split(b"\n", 1)
+        batch: Dict[str, Any] = json.loads(header_line)
+        batch["body"] = body
+        return batch
+
+    async def _send_spooled_batches(self) -> bool:
+        for file_name in self._spool_files():
+            try:
+                batch: Dict[str, Any] = self._read_spooled_batch(file_name)
             except Exception:
-                self.logger().network(f"Unexpected error sending logs.", exc_info=True, extra={"do_not_send": True})
-                return
+                self.logger().error(f"Dropping unreadable spooled logs {file_name}.", exc_info=True,
+                                    extra={"do_not_send": True})
+                os.remove(join(self._spool_dir, file_name))
+                continue
+            if not await self._send_batch(batch):
+                return False
+            os.remove(join(self._spool_dir, file_name))
+        return True
+
+    async def flush(self) -> bool:
+        """
+        Sends all spooled and pending batches. Batches that fail, or that aren't sent before the flush is cancelled,
+        are spooled. Returns True if everything was sent.
+        """
+        batches: List[Dict[str, Any]] = self._take_batches()
+        sent: bool = False
+        try:
+            sent = await self._send_spooled_batches()
+            while sent and len(batches) > 0:
+                sent = await self._send_batch(batches[0])
+                if sent:
+                    batches.pop(0)
+        finally:
+            for batch in batches:
+                self._spool_batch(batch)
+        return sent
 
-    async def request_loop(self):
+    async def consume_queue(self):
         while True:
-            loop = asyncio.get_event_loop()
             try:
-                async with aiohttp.ClientSession(loop=loop,
-                                                 connector=aiohttp.TCPConnector(verify_ssl=False)) as session:
-                    await self.consume_queue(session)
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.MAX_BATCH_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+                self._batch_ready.clear()
+
+                if await self.flush():
+                    self._backoff = 0
+                else:
+                    self._backoff = min(max(self._backoff * 2, self.MIN_BACKOFF), self.MAX_BACKOFF)
+                    await asyncio.sleep(self._backoff * random.uniform(0.5, 1.0))
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().network(f"Unexpected error running logging task.",
-                                      exc_info=True, extra={"do_not_send": True})
-                await asyncio.sleep(5.0)
+                self.logger().network(f"Unexpected error sending logs.", exc_info=True, extra={"do_not_send": True})
+                await asyncio.sleep(self.MAX_BATCH_DELAY)
 
     async def start_network(self):
-        self.consume_queue_task = safe_ensure_future(self.request_loop())
+        if self.consume_queue_task is None:
+            self.consume_queue_task = safe_ensure_future(self.consume_queue())
 
     async def stop_network(self):
         if self.consume_queue_task is not None:
@@ -79,13 +307,10 @@ class LogServerClient(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            loop = asyncio.get_event_loop()
-            async with aiohttp.ClientSession(loop=loop,
-                                             connector=aiohttp.TCPConnector(verify_ssl=False)) as session:
-                async with session.get("https://api.coinalpha.com/reporting-proxy/") as resp:
-                    status_text = await resp.text()
-                    if status_text != "OK":
-                        raise Exception("Log proxy server is down.")
+            async with self._get_shared_client().get(f"{self._log_server_url}/") as resp:
+                status_text = await resp.text()
+                if status_text != "OK":
+                    raise Exception("Log proxy server is down.")
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -95,5 +320,23 @@ class LogServerClient(NetworkBase):
     def start(self):
         NetworkBase.start(self)
 
+    async def _flush_and_close(self):
+        try:
+            await asyncio.wait_for(self.flush(), timeout=self.STOP_FLUSH_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger().debug("Timed out sending logs on stop. Unsent logs are spooled.", extra={"do_not_send": True})
+        except Exception:
+            self.logger().error("Unexpected error sending logs.", exc_info=True, extra={"do_not_send": True})
+        finally:
+            if self._shared_client is not None:
+                await self._shared_client.close()
+                self._shared_client = None
+
     def stop(self):
         NetworkBase.stop(self)
+        # Try to send whatever hasn't been sent yet. `flush()` keeps what it can't send on disk, to be sent on the
+        # next start.
+        if self._ev_loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._flush_and_close(), self._ev_loop)
+        else:
+            self._ev_loop.run_until_complete(self._flush_and_close())
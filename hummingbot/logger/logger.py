@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
 import io
-from logging import Logger as PythonLogger
+from logging import (
+    DEBUG,
+    Logger as PythonLogger
+)
 import os
 import time
 import sys
@@ -25,17 +28,18 @@ else:   # pragma: no cover
 #  --- Copied from logging module ---
 
 
+NETWORK = DEBUG + 6
+
+
 class HummingbotLogger(PythonLogger):
     def __init__(self, name: str):
         super().__init__(name)
 
     def network(self, log_msg: str, app_warning_msg: Optional[str] = None, *args, **kwargs):
-        from hummingbot.client.hummingbot_application import HummingbotApplication
-        from . import NETWORK
-        from os import getcwd
-
         self.log(NETWORK, log_msg, *args, **kwargs)
-        if app_warning_msg is not None and "test" not in getcwd():
+        if app_warning_msg is not None and "test" not in os.getcwd():
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+
             app_warning: ApplicationWarning = ApplicationWarning(
                 time.time(),
                 self.name,
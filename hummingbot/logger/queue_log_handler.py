@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+import atexit
+from collections import defaultdict
+import logging
+from logging import (
+    Handler,
+    LogRecord
+)
+from logging.handlers import (
+    QueueHandler,
+    QueueListener
+)
+import queue
+import threading
+import time
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+
+
+class LogRateCounter:
+    """
+    Counts log records per logger name. Counting happens on the logging caller's thread, so it's kept to a dictionary
+    increment.
+    """
+    def __init__(self):
+        self._counts: Dict[str, int] = defaultdict(int)
+        self._totals: Dict[str, int] = defaultdict(int)
+        self._last_reset_timestamp: float = time.time()
+        self._lock: threading.Lock = threading.Lock()
+
+    def increment(self, logger_name: str):
+        self._counts[logger_name] += 1
+
+    @property
+    def totals(self) -> Dict[str, int]:
+        with self._lock:
+            totals: Dict[str, int] = dict(self._totals)
+            for logger_name, count in self._counts.items():
+                totals[logger_name] = totals.get(logger_name, 0) + count
+            return totals
+
+    def rates(self) -> Dict[str, float]:
+        """
+        Returns the log rate per logger name, in records per second, since the last call.
+        """
+        with self._lock:
+            now: float = time.time()
+            elapsed: float = max(now - self._last_reset_timestamp, 1e-6)
+            counts, self._counts = self._counts, defaultdict(int)
+            self._last_reset_timestamp = now
+            for logger_name, count in counts.items():
+                self._totals[logger_name] += count
+            return {logger_name: count / elapsed for logger_name, count in counts.items()}
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    Stands in for all the handlers of one logger. Records are put on the shared log queue as they are, and formatted
+    and written to the original handlers by the `LogQueueListener` thread.
+    """
+    def __init__(self, listener: "LogQueueListener", target_handlers: List[Handler]):
+        super().__init__(listener.queue)
+        self._listener: "LogQueueListener" = listener
+        self.target_handlers: List[Handler] = target_handlers
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        # Message formatting is deferred to the listener thread.
+        return record
+
+    def enqueue(self, record: LogRecord):
+        self._listener.enqueue(self, record)
+
+
+class LogQueueListener(QueueListener):
+    """
+    Background writer for `QueueLogHandler`s. The queue is bounded: when it's full, records are dropped and counted,
+    and a summary of the dropped records is logged once the queue has space again.
+    """
+    DEFAULT_MAX_QUEUE_SIZE = 10000
+
+    _shared_instance: Optional["LogQueueListener"] = None
+
+    @classmethod
+    def get_instance(cls) -> Optional["LogQueueListener"]:
+        return cls._shared_instance
+
+    @classmethod
+    def install(cls,
+                loggers: Iterable[logging.Logger],
+                max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE) -> "LogQueueListener":
+        """
+        Moves the handlers of the given loggers behind a shared log queue, and starts the writer thread.
+        """
+        cls.uninstall()
+        listener: "LogQueueListener" = LogQueueListener(max_queue_size)
+        for logger in loggers:
+            listener.wrap_logger(logger)
+        listener.start()
+        cls._shared_instance = listener
+        return listener
+
+    @classmethod
+    def uninstall(cls):
+        """
+        Writes out all queued records and puts the original handlers back in place.
+        """
+        if cls._shared_instance is not None:
+            cls._shared_instance.stop()
+            cls._shared_instance.unwrap_loggers()
+            cls._shared_instance = None
+
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        super().__init__(queue.Queue(max_queue_size), respect_handler_level=True)
+        self.rate_counter: LogRateCounter = LogRateCounter()
+        self._dropped_counts: Dict[str, int] = defaultdict(int)
+        self._dropped_lock: threading.Lock = threading.Lock()
+        self._wrapped_loggers: List[Tuple[logging.Logger, QueueLogHandler]] = []
+        self._started: bool = False
+
+    @property
+    def dropped_count(self) -> int:
+        return sum(self._dropped_counts.values())
+
+    def wrap_logger(self, logger: logging.Logger):
+        if len(logger.handlers) == 0 or any(isinstance(h, QueueLogHandler) for h in logger.handlers):
+            return
+        queue_handler: QueueLogHandler = QueueLogHandler(self, list(logger.handlers))
+        logger.handlers = [queue_handler]
+        self._wrapped_loggers.append((logger, queue_handler))
+
+    def unwrap_loggers(self):
+        for logger, queue_handler in self._wrapped_loggers:
+            if logger.handlers == [queue_handler]:
+                logger.handlers = list(queue_handler.target_handlers)
+        self._wrapped_loggers.clear()
+
+    def enqueue(self, queue_handler: QueueLogHandler, record: LogRecord):
+        self.rate_counter.increment(record.name)
+        try:
+            if len(self._dropped_counts) > 0:
+                self._enqueue_dropped_summary(queue_handler)
+            self.queue.put_nowait((queue_handler, record))
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped_counts[record.levelname] += 1
+
+    def _enqueue_dropped_summary(self, queue_handler: QueueLogHandler):
+        with self._dropped_lock:
+            dropped_counts, self._dropped_counts = self._dropped_counts, defaultdict(int)
+        if len(dropped_counts) == 0:
+            return
+        details: str = ", ".join(f"{count} {level_name}" for level_name, count in sorted(dropped_counts.items()))
+        summary: LogRecord = logging.makeLogRecord({
+            "name": __name__,
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "msg": f"Log queue overloaded - dropped {sum(dropped_counts.values())} log records ({details})."
+        })
+        try:
+            self.queue.put_nowait((queue_handler, summary))
+        except queue.Full:
+            with self._dropped_lock:
+                for level_name, count in dropped_counts.items():
+                    self._dropped_counts[level_name] += count
+            raise
+
+    def handle(self, item: Tuple[QueueLogHandler, LogRecord]):
+        queue_handler, record = item
+        for handler in queue_handler.target_handlers:
+            if not self.respect_handler_level or record.levelno >= handler.level:
+                handler.handle(record)
+
+    def enqueue_sentinel(self):
+        # Blocks until the writer thread makes room, rather than failing on a full queue.
+        self.queue.put(self._sentinel)
+
+    def start(self):
+        super().start()
+        if not self._started:
+            self._started = True
+            atexit.register(self.stop)
+
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
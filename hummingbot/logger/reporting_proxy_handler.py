@@ -5,16 +5,12 @@ from os.path import (
     realpath,
     join
 )
-import json
 import logging
 import traceback
 from typing import Optional
 
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.logger import (
-    HummingbotLogger,
-    log_encoder
-)
+from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.log_server_client import LogServerClient
 
 
@@ -40,7 +36,7 @@ class ReportingProxyHandler(logging.Handler):
         self._log_queue: list = []
         self.capacity: int = capacity
         self.proxy_url: str = proxy_url
-        self.log_server_client: LogServerClient = LogServerClient.get_instance()
+        self.log_server_client: LogServerClient = LogServerClient.get_instance(proxy_url)
 
     @property
     def client_id(self):
@@ -49,8 +45,6 @@ class ReportingProxyHandler(logging.Handler):
     def emit(self, record):
         if record.__dict__.get("do_not_send", False):
             return
-        if not self.log_server_client.started:
-            self.log_server_client.start()
         log_type = record.__dict__.get("message_type", "log")
         if not log_type == "event":
             self.process_log(record)
@@ -90,6 +84,7 @@ class ReportingProxyHandler(logging.Handler):
         self._log_queue.append(message)
 
     def send_logs(self, logs):
+        # Logs are serialized, compressed and batched with other pending logs by `LogServerClient`.
         request_obj = {
             "url": f"{self.proxy_url}/logs",
             "method": "POST",
@@ -97,7 +92,7 @@ class ReportingProxyHandler(logging.Handler):
                 "headers": {
                     'Content-Type': "application/json"
                 },
-                "data": json.dumps(logs, default=log_encoder),
+                "data": logs,
                 "params": {"ddtags": f"client_id:{self.client_id},"
                                      f"client_version:{CLIENT_VERSION},"
                                      f"type:log",
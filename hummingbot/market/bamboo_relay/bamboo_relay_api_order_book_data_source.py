@@ -18,7 +18,10 @@ from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.core.utils.ssl_client_request import SSLClientRequest
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -235,7 +238,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     if not self._motd_done:
                         try:
                             raw_msg = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                            msg = ujson.loads(raw_msg)
+                            msg = fast_json.loads(raw_msg)
                             # Print MOTD and announcements if present
                             if "motd" in msg:
                                 self._motd_done = True
@@ -256,7 +259,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         # Try here, else any errors cause the websocket to disconnect
                         try:
-                            msg = ujson.loads(raw_msg)
+                            msg = fast_json.loads(raw_msg)
                             # Valid Diff messages from BambooRelay have actions array
                             if "actions" in msg:
                                 diff_msg: BambooRelayOrderBookMessage = BambooRelayOrderBook.diff_message_from_exchange(
@@ -271,36 +274,15 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await asyncio.sleep(30.0)
 
-    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                client: aiohttp.ClientSession = self.http_client()
-                for trading_pair in trading_pairs:
-                    try:
-                        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_endpoint, self._api_prefix)
-                        snapshot_timestamp: float = time.time()
-                        snapshot_msg: OrderBookMessage = BambooRelayOrderBook.snapshot_message_from_exchange(
-                            snapshot,
-                            snapshot_timestamp,
-                            metadata={"trading_pair": trading_pair}
-                        )
-                        output.put_nowait(snapshot_msg)
-                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-
-                        await asyncio.sleep(5.0)
+    async def _get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        client: aiohttp.ClientSession = self.http_client()
+        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_endpoint, self._api_prefix)
+        snapshot_timestamp: float = time.time()
+        return BambooRelayOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
 
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception:
-                        self.logger().error("Unexpected error.", exc_info=True)
-                        await asyncio.sleep(5.0)
-                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                delta: float = next_hour.timestamp() - time.time()
-                await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await self.snapshot_scheduler.run(self.get_trading_pairs, self._get_snapshot_message, output)
@@ -27,6 +27,7 @@ cdef class BambooRelayMarket(MarketBase):
         list _filled_order_hashes
         object _order_expiry_queue
         TransactionTracker _tx_tracker
+        object _rate_limiter
         object _w3
         object _exchange
         object _coordinator
@@ -44,6 +44,11 @@ from hummingbot.core.event.events import (
     TradeFee,
     ZeroExFillEvent
 )
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
@@ -105,6 +110,8 @@ from hummingbot.core.utils.estimate_fee import estimate_fee
 
 brm_logger = None
 s_decimal_0 = Decimal(0)
+# Conservative limit, shared by public and private requests.
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
 
 cdef class BambooRelayTransactionTracker(TransactionTracker):
     cdef:
@@ -183,6 +190,7 @@ cdef class BambooRelayMarket(MarketBase):
         self._filled_order_hashes = []      # To prevent market filling trying to overfill an inflight market order that's pending
         self._order_expiry_queue = deque()
         self._tx_tracker = BambooRelayTransactionTracker(self)
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
         self._w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         self._provider = Web3.HTTPProvider(ethereum_rpc_url)
         self._withdraw_rules = {}
@@ -944,6 +952,7 @@ cdef class BambooRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        await self._rate_limiter.acquire(priority=http_method_priority(http_method))
         async with aiohttp.ClientSession() as client:
             async with client.request(http_method,
                                       url=url,
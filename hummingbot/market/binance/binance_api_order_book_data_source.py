@@ -2,23 +2,30 @@
 
 import asyncio
 import aiohttp
+from functools import partial
 import logging
 import pandas as pd
 from typing import (
     Any,
-    AsyncIterable,
     Dict,
     List,
     Optional
 )
 import re
 import time
-import ujson
-import websockets
-from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter
+)
+from hummingbot.core.utils.websocket_manager import (
+    WebSocketManager,
+    get_websocket_manager
+)
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -29,15 +36,35 @@ from hummingbot.market.binance.binance_order_book import BinanceOrderBook
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 SNAPSHOT_REST_URL = "https://api.binance.com/api/v1/depth"
-DIFF_STREAM_URL = "wss://stream.binance.com:9443/ws"
+STREAM_URL = "wss://stream.binance.com:9443/stream"
 TICKER_PRICE_CHANGE_URL = "https://api.binance.com/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.com/api/v1/exchangeInfo"
 
+# Snapshots count against the request weight limit shared with BinanceMarket. One with 1000 levels weighs 10.
+RATE_LIMITS = [RateLimit("request_weight", 1200, 60.0)]
+SNAPSHOT_LIMIT = 1000
+SNAPSHOT_REQUEST_WEIGHT = 10
 
-class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
+# Binance allows 1024 streams per connection, and 5 messages per second from the client, so all the streams of a
+# connection are (un)subscribed with one request.
+WS_MAX_STREAMS_PER_CONNECTION = 1024
+
+
+def stream_request_messages(method: str, streams: List[str]) -> List[Dict[str, Any]]:
+    return [{"method": method, "params": streams, "id": int(time.time() * 1e3)}]
+
+
+def stream_name(msg: Dict[str, Any]) -> Optional[str]:
+    # Responses to requests have no stream.
+    return msg.get("stream")
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
+
+def stream_event_time(msg: Dict[str, Any]) -> Optional[float]:
+    event_time: Optional[int] = msg.get("data", {}).get("E")
+    return event_time / 1e3 if event_time is not None else None
+
+
+class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     _baobds_logger: Optional[HummingbotLogger] = None
 
@@ -132,126 +159,89 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
+    async def _get_tracker_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, SNAPSHOT_LIMIT)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
         async with aiohttp.ClientSession() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
-
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    # Each 1000 limit snapshot costs 10 requests and Binance rate limit is 20 requests per second.
-                    await asyncio.sleep(1.0)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
-
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    try:
-                        pong_waiter = await ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        raise
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
-        finally:
-            await ws.close()
+            bootstrap: OrderBookBootstrap = OrderBookBootstrap(
+                partial(self._get_tracker_entry, client),
+                rate_limiter=get_rate_limiter("binance", RATE_LIMITS),
+                request_weight=SNAPSHOT_REQUEST_WEIGHT,
+                on_entry=self.order_book_ready_callback
+            )
+            return await bootstrap.run(trading_pairs)
+
+    @property
+    def ws_manager(self) -> WebSocketManager:
+        return get_websocket_manager("binance",
+                                     STREAM_URL,
+                                     subscribe_messages=partial(stream_request_messages, "SUBSCRIBE"),
+                                     unsubscribe_messages=partial(stream_request_messages, "UNSUBSCRIBE"),
+                                     get_channel=stream_name,
+                                     get_event_time=stream_event_time,
+                                     max_channels_per_connection=WS_MAX_STREAMS_PER_CONNECTION)
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                ws_path: str = "/".join([f"{trading_pair.lower()}@trade" for trading_pair in trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
+                streams: List[str] = [f"{trading_pair.lower()}@trade" for trading_pair in trading_pairs]
+                async with self.ws_manager.subscribe(streams) as subscription:
+                    async for msg in subscription:
+                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg["data"])
                         output.put_nowait(trade_msg)
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
+                self.logger().error("Unexpected error processing Binance trades. Resubscribing after 5 seconds...",
                                     exc_info=True)
-                await asyncio.sleep(30.0)
+                await asyncio.sleep(5.0)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                ws_path: str = "/".join([f"{trading_pair.lower()}@depth" for trading_pair in trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                streams: List[str] = [f"{trading_pair.lower()}@depth" for trading_pair in trading_pairs]
+                async with self.ws_manager.subscribe(streams) as subscription:
+                    async for msg in subscription:
                         order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
+                            msg["data"], time.time())
                         output.put_nowait(order_book_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
+                self.logger().error("Unexpected error processing Binance order book diffs. "
+                                    "Resubscribing after 5 seconds...",
                                     exc_info=True)
-                await asyncio.sleep(30.0)
+                await asyncio.sleep(5.0)
+
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, SNAPSHOT_LIMIT)
+        snapshot_timestamp: float = time.time()
+        return BinanceOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(rate_limiter=get_rate_limiter("binance", RATE_LIMITS),
+                                          request_weight=SNAPSHOT_REQUEST_WEIGHT)
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"trading_pair": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above Binance's API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
@@ -9,10 +9,10 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils import fast_json
 from binance.client import Client as BinanceClient
 from hummingbot.logger import HummingbotLogger
 
@@ -139,7 +139,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         while True:
             try:
                 async for message in self.messages():
-                    decoded: Dict[str, any] = ujson.loads(message)
+                    decoded: Dict[str, any] = fast_json.loads(message)
                     output.put_nowait(decoded)
             except asyncio.CancelledError:
                 raise
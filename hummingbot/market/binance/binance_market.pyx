@@ -27,7 +27,13 @@ from typing import (
 )
 
 import conf
-from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    RateLimit,
+    get_rate_limiter,
+)
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -75,6 +81,25 @@ s_decimal_0 = Decimal(0)
 TRADING_PAIR_SPLITTER = re.compile(r"^(\w+)(BTC|ETH|BNB|XRP|USDT|USDC|USDS|TUSD|PAX|TRX|BUSD|NGN|RUB|TRY|EUR|IDRT|ZAR|UAH|GBP|BKRW|BIDR)$")
 BROKER_ID = "x-XEKWYICX"
 
+# https://github.com/binance-exchange/binance-official-api-docs/blob/master/rest-api.md#limits
+RATE_LIMITS = [
+    RateLimit("request_weight", 1200, 60.0),
+    RateLimit("orders_per_second", 10, 1.0, counts_all_requests=False),
+    RateLimit("orders_per_day", 200000, 86400.0, counts_all_requests=False),
+]
+ENDPOINT_WEIGHTS = {
+    "get_account": {"request_weight": 5},
+    "get_my_trades": {"request_weight": 5},
+    "get_order": {"request_weight": 1},
+    # With a symbol. Without one, openOrders weighs 40.
+    "get_open_orders": {"request_weight": 1},
+    "create_order": {"request_weight": 1, "orders_per_second": 1, "orders_per_day": 1},
+}
+ENDPOINT_PRIORITIES = {
+    "cancel_order": PRIORITY_HIGH,
+    "create_order": PRIORITY_NORMAL,
+}
+
 
 cdef str get_client_order_id(str order_side, object trading_pair):
     cdef:
@@ -158,7 +183,7 @@ cdef class BinanceMarket(MarketBase):
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS, ENDPOINT_WEIGHTS)
 
     @staticmethod
     def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
@@ -252,7 +277,10 @@ cdef class BinanceMarket(MarketBase):
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             request_weight: int = 1,
             **kwargs) -> Dict[str, any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        cdef:
+            str endpoint = func.__name__
+        async with self._rate_limiter.weighted_task(request_weight, endpoint,
+                                                    ENDPOINT_PRIORITIES.get(endpoint, PRIORITY_LOW)):
             try:
                 return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
                                                               timeout_seconds=self.API_CALL_TIMEOUT,
@@ -267,7 +295,7 @@ cdef class BinanceMarket(MarketBase):
                 raise ex
 
     async def query_url(self, url, request_weight: int = 1) -> any:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        async with self._rate_limiter.weighted_task(request_weight, priority=PRIORITY_LOW):
             async with aiohttp.ClientSession() as client:
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
                     if response.status != 200:
@@ -409,20 +437,17 @@ cdef class BinanceMarket(MarketBase):
                 self.logger().error(f"Error parsing the trading pair rule {rule}. Skipping.", exc_info=True)
         return retval
 
-    async def _update_order_fills_from_trades(self):
-        cdef:
-            # This is intended to be a backup measure to get filled events with trade ID for orders,
-            # in case Binance's user stream events are not working.
-            # This is separated from _update_order_status which only updates the order status without producing filled
-            # events, since Binance's get order endpoint does not return trade IDs.
-            # The minimum poll interval for order status is 10 seconds.
-            int64_t last_tick = <int64_t>(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-            int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-
-        if current_tick > last_tick and len(self._in_flight_orders) > 0:
+    async def _update_order_fills_from_trades(self, trading_pairs: List[str]):
+        # This is intended to be a backup measure to get filled events with trade ID for orders,
+        # in case Binance's user stream events are not working.
+        # This is separated from _update_order_status which only updates the order status without producing filled
+        # events, since Binance's order endpoints do not return trade IDs. _update_order_status calls it for the
+        # trading pairs with orders executed further than the fills seen so far.
+        if len(self._in_flight_orders) > 0:
             trading_pairs_to_order_map = defaultdict(lambda: {})
             for o in self._in_flight_orders.values():
-                trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
+                if o.trading_pair in trading_pairs:
+                    trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
 
             trading_pairs = list(trading_pairs_to_order_map.keys())
             tasks = [self.query_api(self._binance_client.get_my_trades, symbol=trading_pair)
@@ -463,6 +488,36 @@ cdef class BinanceMarket(MarketBase):
                                                      exchange_trade_id=trade["id"]
                                                  ))
 
+    async def _get_order_status_updates(self, tracked_orders: List[BinanceInFlightOrder]) -> Dict[str, Any]:
+        """
+        Order status of the tracked orders by client order id, or the exception fetching it. The open orders of each
+        trading pair are fetched with one openOrders call. Only the orders that are no longer open, or whose trading
+        pair's open orders couldn't be fetched, are fetched one by one.
+        """
+        trading_pairs = list({o.trading_pair for o in tracked_orders})
+        results = await safe_gather(*[self.query_api(self._binance_client.get_open_orders, symbol=trading_pair)
+                                      for trading_pair in trading_pairs],
+                                    return_exceptions=True)
+        order_updates = {}
+        for open_orders, trading_pair in zip(results, trading_pairs):
+            if isinstance(open_orders, Exception):
+                self.logger().network(
+                    f"Error fetching open orders of {trading_pair}: {open_orders}.",
+                    app_warning_msg=f"Failed to fetch open orders of {trading_pair}."
+                )
+                continue
+            for order_update in open_orders:
+                order_updates[order_update["clientOrderId"]] = order_update
+
+        missing_orders = [o for o in tracked_orders if o.client_order_id not in order_updates]
+        results = await safe_gather(*[self.query_api(self._binance_client.get_order,
+                                                     symbol=o.trading_pair, origClientOrderId=o.client_order_id)
+                                      for o in missing_orders],
+                                    return_exceptions=True)
+        for order_update, tracked_order in zip(results, missing_orders):
+            order_updates[tracked_order.client_order_id] = order_update
+        return order_updates
+
     async def _update_order_status(self):
         cdef:
             # This is intended to be a backup measure to close straggler orders, in case Binance's user stream events
@@ -473,20 +528,29 @@ cdef class BinanceMarket(MarketBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order,
-                                    symbol=o.trading_pair, origClientOrderId=o.client_order_id)
-                     for o in tracked_orders]
-            self.logger().debug("Polling for order status updates of %d orders.", len(tasks))
-            results = await safe_gather(*tasks, return_exceptions=True)
-            for order_update, tracked_order in zip(results, tracked_orders):
+            self.logger().debug("Polling for order status updates of %d orders.", len(tracked_orders))
+            order_updates = await self._get_order_status_updates(tracked_orders)
+
+            # Fills missed by the user stream are fetched before the orders they complete stop being tracked.
+            trading_pairs_with_missed_fills = list({
+                o.trading_pair for o in tracked_orders
+                if not isinstance(order_updates[o.client_order_id], Exception) and
+                Decimal(order_updates[o.client_order_id]["executedQty"]) > o.executed_amount_base
+            })
+            if len(trading_pairs_with_missed_fills) > 0:
+                await self._update_order_fills_from_trades(trading_pairs_with_missed_fills)
+
+            for tracked_order in tracked_orders:
                 client_order_id = tracked_order.client_order_id
+                order_update = order_updates[client_order_id]
 
                 # If the order has already been cancelled or has failed do nothing
                 if client_order_id not in self._in_flight_orders:
                     continue
 
                 if isinstance(order_update, Exception):
-                    if order_update.code == 2013 or order_update.message == "Order does not exist.":
+                    if getattr(order_update, "code", None) == 2013 or \
+                            getattr(order_update, "message", None) == "Order does not exist.":
                         self._order_not_found_records[client_order_id] = \
                             self._order_not_found_records.get(client_order_id, 0) + 1
                         if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
@@ -715,7 +779,6 @@ cdef class BinanceMarket(MarketBase):
                 await self._poll_notifier.wait()
                 await safe_gather(
                     self._update_balances(),
-                    self._update_order_fills_from_trades(),
                     self._update_order_status(),
                 )
                 self._last_poll_timestamp = self._current_timestamp
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 import asyncio
 import logging
-import time
 import aiohttp
 import pandas as pd
 import hummingbot.market.bitcoin_com.bitcoin_com_constants as constants
@@ -260,43 +259,17 @@ class BitcoinComAPIOrderBookDataSource(OrderBookTrackerDataSource):
             finally:
                 await ws.disconnect()
 
+    async def _get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, any] = await self.get_orderbook(trading_pair)
+        snapshot_timestamp: float = pd.Timestamp(snapshot["timestamp"]).timestamp()
+        return BitcoinComOrderBook.snapshot_message_from_exchange(
+            add_event_type(EventTypes.OrderbookSnapshot, snapshot),
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
         Listen for orderbook snapshots by fetching orderbook
         """
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-
-                for trading_pair in trading_pairs:
-                    try:
-                        snapshot: Dict[str, any] = await self.get_orderbook(trading_pair)
-                        snapshot_timestamp: float = pd.Timestamp(snapshot["timestamp"]).timestamp()
-                        snapshot_msg: OrderBookMessage = BitcoinComOrderBook.snapshot_message_from_exchange(
-                            add_event_type(EventTypes.OrderbookSnapshot, snapshot),
-                            snapshot_timestamp,
-                            metadata={"trading_pair": trading_pair}
-                        )
-                        output.put_nowait(snapshot_msg)
-                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                        # Be careful not to go above API rate limits.
-                        await asyncio.sleep(5.0)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception:
-                        self.logger().network(
-                            f"Unexpected error with WebSocket connection.",
-                            exc_info=True,
-                            app_warning_msg=f"Unexpected error with WebSocket connection. Retrying in 5 seconds. "
-                                            f"Check network connection."
-                        )
-                        await asyncio.sleep(5.0)
-                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                delta: float = next_hour.timestamp() - time.time()
-                await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        await self.snapshot_scheduler.run(self.get_trading_pairs, self._get_snapshot_message, output)
@@ -25,6 +25,7 @@ cdef class BitcoinComMarket(MarketBase):
         public object _trading_rules_polling_task
         public object _withdraw_fees_polling_task
         public object _shared_client
+        object _rate_limiter
 
     cdef c_start_tracking_order(self,
                                 str order_id,
@@ -57,12 +57,19 @@ from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.market.bitcoin_com.bitcoin_com_in_flight_order import BitcoinComInFlightOrder
 from hummingbot.market.bitcoin_com.bitcoin_com_in_flight_order cimport BitcoinComInFlightOrder
 from hummingbot.market.bitcoin_com.bitcoin_com_utils import EventTypes, join_paths
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
 s_logger = None
 s_decimal_0 = Decimal(0)
 s_decimal_nan = Decimal("nan")
 TRADING_PAIR_SPLITTER = re.compile(r"^(\w+)(BTC|ETH|USD|USDT|BCH)$")
+# Conservative limit, shared by public and private requests.
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
 
 cdef class BitcoinComMarketTransactionTracker(TransactionTracker):
     cdef:
@@ -162,6 +169,7 @@ cdef class BitcoinComMarket(MarketBase):
         self._trading_rules_polling_task = None
         self._withdraw_fees_polling_task = None
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
 
     @staticmethod
     def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
@@ -367,6 +375,7 @@ cdef class BitcoinComMarket(MarketBase):
         :returns: json data from the endpoints
         """
         assert path_url is not None or url is not None
+        await self._rate_limiter.acquire(priority=http_method_priority(http_method))
 
         url = f"{constants.REST_URL}{path_url}" if url is None else url
         data_str = "" if data is None else json.dumps(data)
@@ -7,6 +7,7 @@ import hummingbot.market.bitcoin_com.bitcoin_com_constants as constants
 
 from typing import Dict, Optional, AsyncIterable, Any
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils import fast_json
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bitcoin_com.bitcoin_com_utils import raw_to_response
 
@@ -57,7 +58,7 @@ class BitcoinComWebsocket():
             while True:
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    raw_msg = ujson.loads(raw_msg_str)
+                    raw_msg = fast_json.loads(raw_msg_str)
 
                     yield raw_to_response(raw_msg)
                 except asyncio.TimeoutError:
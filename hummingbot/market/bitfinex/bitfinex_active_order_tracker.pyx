@@ -3,7 +3,6 @@
 
 import logging
 import numpy as np
-from decimal import Decimal
 from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
@@ -12,8 +11,6 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 _tracker_logger = None
 s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 
-TRACKING_DICT_TYPE = Dict[Decimal, Dict[str, Dict[str, any]]]
-
 TYPE_OPEN = "open"
 TYPE_CHANGE = "change"
 TYPE_MATCH = "match"
@@ -24,12 +21,9 @@ SIDE_SELL = "sell"
 
 cdef class BitfinexActiveOrderTracker:
 
-    def __init__(self,
-                 active_asks: TRACKING_DICT_TYPE = None,
-                 active_bids: TRACKING_DICT_TYPE = None):
+    def __init__(self):
         super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        self._active_order_book = ActiveOrderBook()
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,34 +33,34 @@ cdef class BitfinexActiveOrderTracker:
         return _tracker_logger
 
     @property
-    def active_asks(self) -> TRACKING_DICT_TYPE:
+    def active_asks(self) -> Dict[float, float]:
         """
         Get all asks on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
+        :returns: Dict[price, volume]
         """
-        return self._active_asks
+        return self._active_order_book.active_asks
 
     @property
-    def active_bids(self) -> TRACKING_DICT_TYPE:
+    def active_bids(self) -> Dict[float, float]:
         """
         Get all bids on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
+        :returns: Dict[price, volume]
         """
-        return self._active_bids
+        return self._active_order_book.active_bids
 
     def volume_for_ask_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all ask order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_asks[price].values()])
+        return self._active_order_book.c_volume_for_price(False, float(price))
 
     def volume_for_bid_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all bid order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_bids[price].values()])
+        return self._active_order_book.c_volume_for_price(True, float(price))
 
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
         cdef:
@@ -75,7 +69,6 @@ cdef class BitfinexActiveOrderTracker:
             list ask_entries = content["asks"]
             double order_id
             object price
-            dict order_dict
             double timestamp = message.timestamp
             double quantity = 0
 
@@ -119,81 +112,15 @@ cdef class BitfinexActiveOrderTracker:
         Interpret an incoming snapshot message and apply changes to the order book accordingly
         :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
         """
-        cdef:
-            object price
-            double order_id
-            double amount
-            dict order_dict
-
         # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
+        self._active_order_book.c_clear()
+        for snapshot_orders, is_bid in [(message.content["bids"], True),
+                                        (message.content["asks"], False)]:
             for order in snapshot_orders:
-                print("order from snapshot->", order)
-                price = Decimal(order[0])
-                order_id = order[2]
-                amount = order[1]
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": amount
-                }
-
-                if price in active_orders:
-                    active_orders[price][order_id] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_id: order_dict
-                    }
+                self._active_order_book.c_add_order(str(order[2]), is_bid, float(order[0]), float(order[1]))
 
         # Return the sorted snapshot tables.
-        cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [
-                    [
-                        message.timestamp,
-                        float(price),
-                        sum(
-                            [
-                                float(order_dict["remaining_size"])
-                                for order_dict in self._active_bids[price].values()
-                            ]
-                        ),
-                        message.update_id
-                    ]
-                    for price in sorted(self._active_bids.keys(), reverse=True)
-                ],
-                dtype="float64",
-                ndmin=2
-            )
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [
-                    [
-                        message.timestamp,
-                        float(price),
-                        sum(
-                            [
-                                float(order_dict["remaining_size"])
-                                for order_dict in self._active_asks[price].values()
-                            ]
-                        ),
-                        message.update_id
-                    ]
-                    for price in sorted(self._active_asks.keys(), reverse=True)
-                ],
-                dtype="float64",
-                ndmin=2
-            )
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-
-        return bids, asks
+        return self._active_order_book.c_snapshot_np_arrays(message.timestamp, message.update_id)
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         """
@@ -21,6 +21,7 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.core.data_type.order_book_tracker_entry import (
     OrderBookTrackerEntry
 )
@@ -28,7 +29,10 @@ from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
     OrderBookMessageType,
 )
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bitfinex import BITFINEX_REST_URL, BITFINEX_WS_URI
@@ -324,7 +328,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     def _prepare_trade(self, raw_response: str) -> Dict[str, Any]:
-        *_, content = ujson.loads(raw_response)
+        *_, content = fast_json.loads(raw_response)
         try:
             trade = TradeStructure(*content)
         except Exception as err:
@@ -423,7 +427,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Parses raw update, if price for a tracked order identified by ID is 0, then order is deleted
         Returns OrderBookMessage
         """
-        _, content = ujson.loads(raw_response)
+        _, content = fast_json.loads(raw_response)
 
         if isinstance(content, list) and len(content) == 3:
             order_id = content[0]
@@ -502,48 +506,22 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         await asyncio.gather(*tasks)
 
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, pair)
+        snapshot_timestamp: float = time.time()
+        return BitfinexOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"product_id": pair}
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(request_budget=1.0 / self.TIME_SLEEP_BETWEEN_REQUESTS)
+
     async def listen_for_order_book_snapshots(self,
                                               ev_loop: asyncio.BaseEventLoop,
                                               output: asyncio.Queue):
-        while True:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-
-            try:
-                async with aiohttp.ClientSession() as client:
-                    for pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = BitfinexOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"product_id": pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {pair}")
-
-                            await asyncio.sleep(self.TIME_SLEEP_BETWEEN_REQUESTS)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception as err:
-                            self.logger().error("Listening snapshots", err)
-                            self.logger().network(
-                                f"Unexpected error with WebSocket connection.",
-                                exc_info=True,
-                                app_warning_msg="Unexpected error with WebSocket connection. "
-                                                f"Retrying in {self.TIME_SLEEP_BETWEEN_REQUESTS} sec."
-                                                f"Check network connection."
-                            )
-                            await asyncio.sleep(self.TIME_SLEEP_BETWEEN_REQUESTS)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(
-                        minute=0, second=0, microsecond=0
-                    )
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception as err:
-                self.logger().error("Listening snapshots", err)
-                self.logger().error("Unexpected error", exc_info=True)
-                await asyncio.sleep(self.TIME_SLEEP_BETWEEN_REQUESTS)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
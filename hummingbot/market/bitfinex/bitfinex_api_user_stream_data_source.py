@@ -4,12 +4,12 @@ import logging
 import time
 from typing import Optional, List
 
-import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import \
     UserStreamTrackerDataSource
+from hummingbot.core.utils import fast_json
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bitfinex.bitfinex_order_book import BitfinexOrderBook
 from hummingbot.market.bitfinex import BITFINEX_WS_URI
@@ -71,7 +71,7 @@ class BitfinexAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 await asyncio.sleep(self.MESSAGE_TIMEOUT)
 
     def _transform_message_from_exchange(self, raw_msg) -> Optional[BitfinexOrderBookMessage]:
-        msg = ujson.loads(raw_msg)
+        msg = fast_json.loads(raw_msg)
         order_book_message: BitfinexOrderBookMessage = BitfinexOrderBook.diff_message_from_exchange(msg, time.time())
         if any([
             order_book_message.type_heartbeat,
@@ -197,6 +197,7 @@ class BitfinexOrderBookTracker(OrderBookTracker):
 
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = self._convert_diff_message_to_order_book_row(message)
+                    self._record_diff(trading_pair, order_book, message)
                     order_book.apply_diffs(bids, asks, message.update_id)
 
                     past_diffs_window.append(message)
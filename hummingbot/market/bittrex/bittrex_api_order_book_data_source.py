@@ -9,7 +9,6 @@ from zlib import decompress, MAX_WBITS
 import aiohttp
 import pandas as pd
 import signalr_aio
-import ujson
 from signalr_aio import Connection
 from signalr_aio.hubs import Hub
 from async_timeout import timeout
@@ -18,7 +17,10 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.bittrex.bittrex_active_order_tracker import BittrexActiveOrderTracker
@@ -276,7 +278,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             except Exception:
                 return {}
 
-            return ujson.loads(decoded_msg.decode())
+            return fast_json.loads(decoded_msg)
 
         def _is_snapshot(msg) -> bool:
             return type(msg.get("R", False)) is not bool
@@ -285,7 +287,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return len(msg.get("M", [])) > 0 and type(msg["M"][0]) == dict and msg["M"][0].get("M", None) == "uE"
 
         output: Dict[str, Any] = {"nonce": None, "type": None, "results": {}}
-        msg: Dict[str, Any] = ujson.loads(msg)
+        msg: Dict[str, Any] = fast_json.loads(msg)
 
         if _is_snapshot(msg):
             output["results"] = _decode_message(msg["R"])
@@ -315,26 +317,18 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return output
 
+    async def _query_snapshot(self, trading_pair: str) -> None:
+        # The snapshot arrives on the websocket stream, see listen_for_order_book_stream().
+        connection, hub = await self.websocket_connection()
+        # TODO: Refactor accordingly when V3 WebSocket API is released
+        # WebSocket API requires trading_pair to be in 'Quote-Base' format
+        trading_pair = f"{trading_pair.split('-')[1]}-{trading_pair.split('-')[0]}"
+        hub.server.invoke("queryExchangeState", trading_pair)
+        self.logger().info(f"Query {trading_pair} snapshots.[Scheduled]")
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         # Technically this does not listen for snapshot, Instead it periodically queries for snapshots.
-        while True:
-            try:
-                connection, hub = await self.websocket_connection()
-                trading_pairs = await self.get_trading_pairs()  # Symbols of trading pair in V3 format i.e. 'Base-Quote'
-                for trading_pair in trading_pairs:
-                    # TODO: Refactor accordingly when V3 WebSocket API is released
-                    # WebSocket API requires trading_pair to be in 'Quote-Base' format
-                    trading_pair = f"{trading_pair.split('-')[1]}-{trading_pair.split('-')[0]}"
-                    hub.server.invoke("queryExchangeState", trading_pair)
-                    self.logger().info(f"Query {trading_pair} snapshots.[Scheduled]")
-
-                # Waits for delta amount of time before getting new snapshots
-                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                delta: float = next_hour.timestamp() - time.time()
-                await asyncio.sleep(delta)
-            except Exception:
-                self.logger().error("Unexpected error occurred invoking queryExchangeState", exc_info=True)
+        await self.snapshot_scheduler.run(self.get_trading_pairs, self._query_snapshot, output)
 
     async def listen_for_order_book_stream(self,
                                            ev_loop: asyncio.BaseEventLoop,
@@ -10,9 +10,9 @@ from typing import AsyncIterable, Dict, Optional, List, Any
 from zlib import decompress, MAX_WBITS
 
 import signalr_aio
-import ujson
 from async_timeout import timeout
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils import fast_json
 from hummingbot.market.bittrex.bittrex_auth import BittrexAuth
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -77,7 +77,7 @@ class BittrexAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 self.logger().error(f"Error decoding message", exc_info=True)
                 return {"error": "Error decoding message"}
 
-            return ujson.loads(decode_msg.decode(), precise_float=True)
+            return fast_json.loads(decode_msg)
 
         def _is_auth_context(msg):
             return "R" in msg and type(msg["R"]) is not bool and msg["I"] == str(0)
@@ -92,7 +92,7 @@ class BittrexAPIUserStreamDataSource(UserStreamTrackerDataSource):
             return hmac.new(api_secret.encode(), challenge.encode(), hashlib.sha512).hexdigest()
 
         output: Dict[str, Any] = {"event_type": None, "content": None, "error": None}
-        msg: Dict[str, Any] = ujson.loads(msg)
+        msg: Dict[str, Any] = fast_json.loads(msg)
 
         if _is_auth_context(msg):
             output["event_type"] = "auth"
@@ -21,6 +21,7 @@ cdef class BittrexMarket(MarketBase):
         dict _trading_rules
         public object _coro_scheduler_task
         public object _shared_client
+        object _rate_limiter
         public object _status_polling_task
         public object _trading_rules_polling_task
         public object _user_stream_event_listener_task
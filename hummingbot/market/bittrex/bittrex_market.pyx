@@ -34,12 +34,19 @@ from hummingbot.market.bittrex.bittrex_user_stream_tracker import BittrexUserStr
 from hummingbot.market.deposit_info import DepositInfo
 from hummingbot.market.market_base import NaN
 from hummingbot.market.trading_rule cimport TradingRule
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 bm_logger = None
 s_decimal_0 = Decimal(0)
+# https://bittrex.github.io/api/v3#topic-Best-Practices
+RATE_LIMITS = [RateLimit("requests", 60, 60.0)]
 
 cdef class BittrexMarketTransactionTracker(TransactionTracker):
     cdef:
@@ -102,6 +109,7 @@ cdef class BittrexMarket(MarketBase):
         self._poll_notifier = asyncio.Event()
         self._poll_interval = poll_interval
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
         self._status_polling_task = None
         self._trading_required = trading_required
         self._trading_rules = {}
@@ -1002,6 +1010,7 @@ cdef class BittrexMarket(MarketBase):
                            body: Dict[str, any] = None,
                            subaccount_id: str = '') -> Dict[str, Any]:
         assert path_url is not None
+        await self._rate_limiter.acquire(priority=http_method_priority(http_method))
 
         url = f"{self.BITTREX_API_ENDPOINT}{path_url}"
 
@@ -1,9 +1,13 @@
 # distutils: language=c++
 cimport numpy as np
 
+from hummingbot.core.data_type.active_order_book cimport (
+    ActiveOrder,
+    ActiveOrderBook
+)
+
 cdef class CoinbaseProActiveOrderTracker:
-    cdef dict _active_bids
-    cdef dict _active_asks
+    cdef ActiveOrderBook _active_order_book
 
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
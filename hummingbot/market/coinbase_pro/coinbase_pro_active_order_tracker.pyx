@@ -3,7 +3,6 @@
 
 import logging
 import numpy as np
-from decimal import Decimal
 from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
@@ -12,8 +11,6 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 _cbpaot_logger = None
 s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 
-CoinbaseProOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
-
 TYPE_OPEN = "open"
 TYPE_CHANGE = "change"
 TYPE_MATCH = "match"
@@ -22,12 +19,9 @@ SIDE_BUY = "buy"
 SIDE_SELL = "sell"
 
 cdef class CoinbaseProActiveOrderTracker:
-    def __init__(self,
-                 active_asks: CoinbaseProOrderBookTrackingDictionary = None,
-                 active_bids: CoinbaseProOrderBookTrackingDictionary = None):
+    def __init__(self):
         super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        self._active_order_book = ActiveOrderBook()
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -37,34 +31,34 @@ cdef class CoinbaseProActiveOrderTracker:
         return _cbpaot_logger
 
     @property
-    def active_asks(self) -> CoinbaseProOrderBookTrackingDictionary:
+    def active_asks(self) -> Dict[float, float]:
         """
         Get all asks on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
+        :returns: Dict[price, volume]
         """
-        return self._active_asks
+        return self._active_order_book.active_asks
 
     @property
-    def active_bids(self) -> CoinbaseProOrderBookTrackingDictionary:
+    def active_bids(self) -> Dict[float, float]:
         """
         Get all bids on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
+        :returns: Dict[price, volume]
         """
-        return self._active_bids
+        return self._active_order_book.active_bids
 
     def volume_for_ask_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all ask order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_asks[price].values()])
+        return self._active_order_book.c_volume_for_price(False, float(price))
 
     def volume_for_bid_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all bid order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_bids[price].values()])
+        return self._active_order_book.c_volume_for_price(True, float(price))
 
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
         """
@@ -78,12 +72,11 @@ cdef class CoinbaseProActiveOrderTracker:
             str order_id
             str order_side
             str price_raw
-            object price
-            dict order_dict
-            str remaining_size
+            double price
+            double remaining_size
+            ActiveOrder order
             double timestamp = message.timestamp
-            double quantity = 0
-        
+
         order_id = content.get("order_id") or content.get("maker_order_id")
         order_side = content.get("side")
         price_raw = content.get("price")
@@ -95,113 +88,32 @@ cdef class CoinbaseProActiveOrderTracker:
             raise ValueError(f"Unknown order price for message - '{message}'. Aborting.")
         elif price_raw == "null": # 'change' messages have 'null' as price for market orders
             return s_empty_diff, s_empty_diff
-        price = Decimal(price_raw)
+        price = float(price_raw)
 
         if msg_type == TYPE_OPEN:
-            order_dict = {
-                "order_id": order_id,
-                "remaining_size": content["remaining_size"]
-            }
-            if order_side == SIDE_BUY:
-                if price in self._active_bids:
-                    self._active_bids[price][order_id] = order_dict
-                else:
-                    self._active_bids[price] = {order_id: order_dict}
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-            else:
-                if price in self._active_asks:
-                    self._active_asks[price][order_id] = order_dict
-                else:
-                    self._active_asks[price] = {order_id: order_dict}
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-
-        elif msg_type == TYPE_CHANGE:
-            if content.get("new_size") is not None:
-                remaining_size = content["new_size"]
-            elif content.get("new_funds") is not None:
-                remaining_size = str(Decimal(content["new_funds"]) / price)
-            else:
-                raise ValueError(f"Invalid change message - '{message}'. Aborting.")
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    self._active_bids[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    self._active_asks[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-
-        elif msg_type == TYPE_MATCH:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    remaining_size = self._active_bids[price][order_id]["remaining_size"]
-                    self._active_bids[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    remaining_size = self._active_asks[price][order_id]["remaining_size"]
-                    self._active_asks[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
+            self._active_order_book.c_add_order(order_id, order_side == SIDE_BUY, price,
+                                                float(content["remaining_size"]))
+            return self._active_order_book.c_level_to_np_arrays(order_side == SIDE_BUY, price, timestamp,
+                                                                message.update_id)
 
-        elif msg_type == TYPE_DONE:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    del self._active_bids[price][order_id]
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
+        elif msg_type in [TYPE_CHANGE, TYPE_MATCH, TYPE_DONE]:
+            if not self._active_order_book.c_has_order(order_id):
                 return s_empty_diff, s_empty_diff
+            order = self._active_order_book.c_get_order(order_id)
+            if msg_type == TYPE_CHANGE:
+                if content.get("new_size") is not None:
+                    remaining_size = float(content["new_size"])
+                elif content.get("new_funds") is not None:
+                    remaining_size = float(content["new_funds"]) / price
+                else:
+                    raise ValueError(f"Invalid change message - '{message}'. Aborting.")
+                self._active_order_book.c_set_order_size(order_id, remaining_size)
+            elif msg_type == TYPE_MATCH:
+                self._active_order_book.c_reduce_order_size(order_id, float(content["size"]))
             else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    del self._active_asks[price][order_id]
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64")
-                        )
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                        )
-                return s_empty_diff, s_empty_diff
+                self._active_order_book.c_remove_order(order_id)
+            return self._active_order_book.c_level_to_np_arrays(order.is_bid, order.price, timestamp,
+                                                                message.update_id)
 
         else:
             raise ValueError(f"Unknown message type '{msg_type}' - {message}. Aborting.")
@@ -211,58 +123,15 @@ cdef class CoinbaseProActiveOrderTracker:
         Interpret an incoming snapshot message and apply changes to the order book accordingly
         :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
         """
-        cdef:
-            object price
-            str order_id
-            str amount
-            dict order_dict
-
         # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
+        self._active_order_book.c_clear()
+        for snapshot_orders, is_bid in [(message.content["bids"], True),
+                                        (message.content["asks"], False)]:
             for order in snapshot_orders:
-                price = Decimal(order[0])
-                order_id = order[2]
-                amount = order[1]
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": amount
-                }
-
-                if price in active_orders:
-                    active_orders[price][order_id] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_id: order_dict
-                    }
+                self._active_order_book.c_add_order(order[2], is_bid, float(order[0]), float(order[1]))
 
         # Return the sorted snapshot tables.
-        cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-
-        return bids, asks
+        return self._active_order_book.c_snapshot_np_arrays(message.timestamp, message.update_id)
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         """
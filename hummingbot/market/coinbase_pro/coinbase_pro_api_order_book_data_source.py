@@ -2,6 +2,7 @@
 
 import asyncio
 import aiohttp
+from functools import partial
 import logging
 import pandas as pd
 from typing import (
@@ -19,7 +20,16 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.market.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter
+)
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -31,6 +41,10 @@ COINBASE_WS_FEED = "wss://ws-feed.pro.coinbase.com"
 MAX_RETRIES = 20
 NaN = float("nan")
 
+# Snapshots count against the public request limit per IP, rather than the private one of CoinbaseProMarket.
+RATE_LIMITS = [RateLimit("public_requests", 3, 1.0, counts_all_requests=False)]
+ENDPOINT_WEIGHTS = {"public": {"private_requests": 0, "public_requests": 1}}
+
 
 class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
@@ -158,41 +172,34 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         # Get the currently active markets
         async with aiohttp.ClientSession() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+            bootstrap: OrderBookBootstrap = OrderBookBootstrap(
+                partial(self._get_tracker_entry, client),
+                rate_limiter=get_rate_limiter("coinbase_pro", RATE_LIMITS, ENDPOINT_WEIGHTS),
+                endpoint="public",
+                on_entry=self.order_book_ready_callback
+            )
+            return await bootstrap.run(trading_pairs)
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
-                    bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
-
-                    retval[trading_pair] = CoinbaseProOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        order_book,
-                        active_order_tracker
-                    )
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    await asyncio.sleep(0.6)
-                except IOError:
-                    self.logger().network(
-                        f"Error getting snapshot for {trading_pair}.",
-                        exc_info=True,
-                        app_warning_msg=f"Error getting snapshot for {trading_pair}. Check network connection."
-                    )
-                except Exception:
-                    self.logger().error(f"Error initializing order book for {trading_pair}. ", exc_info=True)
-            return retval
+    async def _get_tracker_entry(self,
+                                 client: aiohttp.ClientSession,
+                                 trading_pair: str) -> CoinbaseProOrderBookTrackerEntry:
+        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
+        bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
+        order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        return CoinbaseProOrderBookTrackerEntry(
+            trading_pair,
+            snapshot_timestamp,
+            order_book,
+            active_order_tracker
+        )
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -244,7 +251,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     }
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = fast_json.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Coinbase Pro Websocket message does not contain a type - {msg}")
@@ -272,6 +279,19 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 )
                 await asyncio.sleep(30.0)
 
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        return CoinbaseProOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"product_id": trading_pair}
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(rate_limiter=get_rate_limiter("coinbase_pro", RATE_LIMITS, ENDPOINT_WEIGHTS),
+                                          endpoint="public")
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
         *required
@@ -279,39 +299,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :param ev_loop: ev_loop to execute this function in
         :param output: an async queue where the incoming messages are stored
         """
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"product_id": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().network(
-                                f"Unexpected error with WebSocket connection.",
-                                exc_info=True,
-                                app_warning_msg=f"Unexpected error with WebSocket connection. Retrying in 5 seconds. "
-                                                f"Check network connection."
-                            )
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
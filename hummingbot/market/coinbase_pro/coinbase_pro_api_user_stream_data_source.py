@@ -17,6 +17,7 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.market.coinbase_pro.coinbase_pro_auth import CoinbaseProAuth
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils import fast_json
 from hummingbot.market.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
 
 COINBASE_REST_URL = "https://api.pro.coinbase.com"
@@ -79,7 +80,7 @@ class CoinbaseProAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     subscribe_request.update(auth_dict)
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = fast_json.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Coinbase Pro Websocket message does not contain a type - {msg}")
@@ -57,9 +57,17 @@ from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
+
 s_logger = None
 s_decimal_0 = Decimal("0.0")
 s_decimal_nan = Decimal("nan")
+# https://docs.pro.coinbase.com/#rate-limits, all requests through _api_request are private.
+RATE_LIMITS = [RateLimit("private_requests", 5, 1.0)]
 
 cdef class CoinbaseProMarketTransactionTracker(TransactionTracker):
     cdef:
@@ -159,6 +167,7 @@ cdef class CoinbaseProMarket(MarketBase):
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
         self._maker_fee_percentage = Decimal(self.MAKER_FEE_PERCENTAGE_DEFAULT)
         self._taker_fee_percentage = Decimal(self.TAKER_FEE_PERCENTAGE_DEFAULT)
 
@@ -339,6 +348,7 @@ cdef class CoinbaseProMarket(MarketBase):
         :returns: json data from the endpoints
         """
         assert path_url is not None or url is not None
+        await self._rate_limiter.acquire(priority=http_method_priority(http_method))
 
         url = f"{self.COINBASE_API_ENDPOINT}{path_url}" if url is None else url
         data_str = "" if data is None else json.dumps(data)
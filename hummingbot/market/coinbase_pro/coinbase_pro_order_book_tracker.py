@@ -26,7 +26,6 @@ from hummingbot.core.data_type.order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
 )
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.market.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
 from hummingbot.market.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
 from hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker_entry import CoinbaseProOrderBookTrackerEntry
@@ -91,12 +90,8 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
         deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
 
         for trading_pair in new_trading_pairs:
-            order_book_tracker_entry: CoinbaseProOrderBookTrackerEntry = available_pairs[trading_pair]
-            self._active_order_trackers[trading_pair] = order_book_tracker_entry.active_order_tracker
-            self._order_books[trading_pair] = order_book_tracker_entry.order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info("Started order book tracking for %s." % trading_pair)
+            if not self._is_tracking(trading_pair):
+                self._start_tracking_pair(available_pairs[trading_pair])
 
         for trading_pair in deleted_trading_pairs:
             self._tracking_tasks[trading_pair].cancel()
@@ -106,6 +101,10 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
             del self._tracking_message_queues[trading_pair]
             self.logger().info("Stopped order book tracking for %s." % trading_pair)
 
+    def _start_tracking_pair(self, entry: CoinbaseProOrderBookTrackerEntry):
+        self._active_order_trackers[entry.trading_pair] = entry.active_order_tracker
+        super()._start_tracking_pair(entry)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -192,6 +191,7 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
 
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
+                    self._record_diff(trading_pair, order_book, message)
                     order_book.apply_diffs(bids, asks, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
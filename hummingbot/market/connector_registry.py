@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+import importlib
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Type
+)
+
+# Connector classes are referred to by their import path, so that only the connectors which are actually used get
+# imported. Each connector pulls in its own dependencies (web3, aiokafka, exchange client libraries, ...).
+MARKET_CLASS_PATHS: Dict[str, str] = {
+    "bamboo_relay": "hummingbot.market.bamboo_relay.bamboo_relay_market.BambooRelayMarket",
+    "binance": "hummingbot.market.binance.binance_market.BinanceMarket",
+    "coinbase_pro": "hummingbot.market.coinbase_pro.coinbase_pro_market.CoinbaseProMarket",
+    "huobi": "hummingbot.market.huobi.huobi_market.HuobiMarket",
+    "liquid": "hummingbot.market.liquid.liquid_market.LiquidMarket",
+    "radar_relay": "hummingbot.market.radar_relay.radar_relay_market.RadarRelayMarket",
+    "dolomite": "hummingbot.market.dolomite.dolomite_market.DolomiteMarket",
+    "bittrex": "hummingbot.market.bittrex.bittrex_market.BittrexMarket",
+    "kucoin": "hummingbot.market.kucoin.kucoin_market.KucoinMarket",
+    "bitcoin_com": "hummingbot.market.bitcoin_com.bitcoin_com_market.BitcoinComMarket",
+    "ocean": "hummingbot.market.ocean.ocean_market.OceanMarket",
+    "eterbase": "hummingbot.market.eterbase.eterbase_market.EterbaseMarket",
+    "kraken": "hummingbot.market.kraken.kraken_market.KrakenMarket",
+}
+
+ORDER_BOOK_TRACKER_CLASS_PATHS: Dict[str, str] = {
+    "bamboo_relay": "hummingbot.market.bamboo_relay.bamboo_relay_order_book_tracker.BambooRelayOrderBookTracker",
+    "binance": "hummingbot.market.binance.binance_order_book_tracker.BinanceOrderBookTracker",
+    "coinbase_pro": "hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker.CoinbaseProOrderBookTracker",
+    "huobi": "hummingbot.market.huobi.huobi_order_book_tracker.HuobiOrderBookTracker",
+    "liquid": "hummingbot.market.liquid.liquid_order_book_tracker.LiquidOrderBookTracker",
+    "radar_relay": "hummingbot.market.radar_relay.radar_relay_order_book_tracker.RadarRelayOrderBookTracker",
+    "dolomite": "hummingbot.market.dolomite.dolomite_order_book_tracker.DolomiteOrderBookTracker",
+    "bittrex": "hummingbot.market.bittrex.bittrex_order_book_tracker.BittrexOrderBookTracker",
+    "kucoin": "hummingbot.market.kucoin.kucoin_order_book_tracker.KucoinOrderBookTracker",
+    "bitcoin_com": "hummingbot.market.bitcoin_com.bitcoin_com_order_book_tracker.BitcoinComOrderBookTracker",
+    "ocean": "hummingbot.market.ocean.ocean_order_book_tracker.OceanOrderBookTracker",
+    "eterbase": "hummingbot.market.eterbase.eterbase_order_book_tracker.EterbaseOrderBookTracker",
+    "kraken": "hummingbot.market.kraken.kraken_order_book_tracker.KrakenOrderBookTracker",
+}
+
+
+def import_class(class_path: str) -> Type[Any]:
+    module_name, class_name = class_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class LazyClassRegistry(Mapping):
+    """
+    Read only mapping from connector names to classes. A connector's module is imported the first time its class is
+    looked up, so `name in registry` and iterating over the names are free, but `values()` and `items()` import
+    every connector.
+    """
+    def __init__(self, class_paths: Dict[str, str]):
+        self._class_paths: Dict[str, str] = class_paths
+        self._classes: Dict[str, Type[Any]] = {}
+
+    def __getitem__(self, name: str) -> Type[Any]:
+        if name not in self._classes:
+            self._classes[name] = import_class(self._class_paths[name])
+        return self._classes[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._class_paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._class_paths)
+
+    def __len__(self) -> int:
+        return len(self._class_paths)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._classes
+
+
+MARKET_CLASSES: LazyClassRegistry = LazyClassRegistry(MARKET_CLASS_PATHS)
+ORDER_BOOK_TRACKER_CLASSES: LazyClassRegistry = LazyClassRegistry(ORDER_BOOK_TRACKER_CLASS_PATHS)
@@ -1,9 +1,10 @@
 # distutils: language=c++
 cimport numpy as np
 
+from hummingbot.core.data_type.active_order_book cimport ActiveOrderBook
+
 cdef class DolomiteActiveOrderTracker:
-    cdef dict _active_bids
-    cdef dict _active_asks
+    cdef ActiveOrderBook _active_order_book
 
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
     
\ No newline at end of file
@@ -15,7 +15,10 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.market.dolomite.dolomite_active_order_tracker import DolomiteActiveOrderTracker
 from hummingbot.market.dolomite.dolomite_order_book import DolomiteOrderBook
 from hummingbot.market.dolomite.dolomite_order_book_tracker_entry import DolomiteOrderBookTrackerEntry
@@ -205,7 +208,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     await ws.send(ujson.dumps(orderbook_subscription_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        message = ujson.loads(raw_msg)
+                        message = fast_json.loads(raw_msg)
 
                         if message["route"] == SNAPSHOT_WS_ROUTE and message["action"] == SNAPSHOT_WS_UPDATE_ACTION:
                             snapshot_timestamp: float = time.time()
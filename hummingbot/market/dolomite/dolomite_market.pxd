@@ -12,6 +12,7 @@ cdef class DolomiteMarket(MarketBase):
         object _wallet
         object _web3
         object _shared_client
+        object _rate_limiter
 
         public object _polling_update_task
 
@@ -26,6 +26,11 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.market.dolomite.dolomite_order_book_tracker import DolomiteOrderBookTracker
 from hummingbot.market.dolomite.dolomite_api_order_book_data_source import DolomiteAPIOrderBookDataSource
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
 )
@@ -84,6 +89,8 @@ ORDER_FAILURE_EVENT = MarketEvent.OrderFailure.value
 BUY_ORDER_CREATED_EVENT = MarketEvent.BuyOrderCreated.value
 SELL_ORDER_CREATED_EVENT = MarketEvent.SellOrderCreated.value
 API_CALL_TIMEOUT = 10.0
+# Conservative limit, shared by public and private requests.
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
 
 # ==========================================================
 
@@ -157,6 +164,7 @@ cdef class DolomiteMarket(MarketBase):
         self._last_timestamp = 0
         self._poll_interval = poll_interval
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
         self._polling_update_task = None
 
         # State
@@ -751,6 +759,7 @@ cdef class DolomiteMarket(MarketBase):
                           params: Optional[Dict[str, Any]] = None,
                           headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
 
+        await self._rate_limiter.acquire(priority=http_method_priority(http_method))
         if self._shared_client is None:
             self._shared_client = aiohttp.ClientSession()
 
@@ -3,7 +3,6 @@
 
 import logging
 import numpy as np
-from decimal import Decimal
 from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
@@ -12,8 +11,6 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 _eaot_logger = None
 s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 
-EterbaseOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
-
 TYPE_OPEN = "o_placed"
 TYPE_CHANGE = "o_triggered"
 TYPE_MATCH = "o_fill"
@@ -24,12 +21,10 @@ SIDE_NaN = 0
 ORDER_TYPE_MARKET = 1
 
 cdef class EterbaseActiveOrderTracker:
-    def __init__(self,
-                 active_asks: EterbaseOrderBookTrackingDictionary = None,
-                 active_bids: EterbaseOrderBookTrackingDictionary = None):
+    def __init__(self):
         super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        self._active_order_book = ActiveOrderBook()
+        self._market_order_ids = set()
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,34 +34,34 @@ cdef class EterbaseActiveOrderTracker:
         return _eaot_logger
 
     @property
-    def active_asks(self) -> EterbaseOrderBookTrackingDictionary:
+    def active_asks(self) -> Dict[float, float]:
         """
         Get all asks on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
+        :returns: Dict[price, volume]
         """
-        return self._active_asks
+        return self._active_order_book.active_asks
 
     @property
-    def active_bids(self) -> EterbaseOrderBookTrackingDictionary:
+    def active_bids(self) -> Dict[float, float]:
         """
         Get all bids on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
+        :returns: Dict[price, volume]
         """
-        return self._active_bids
+        return self._active_order_book.active_bids
 
     def volume_for_ask_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all ask order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_asks[price].values()])
+        return self._active_order_book.c_volume_for_price(False, float(price))
 
     def volume_for_bid_price(self, price) -> float:
         """
         For a certain price, get the volume sum of all bid order book rows with that price
         :returns: volume sum
         """
-        return sum([float(msg["remaining_size"]) for msg in self._active_bids[price].values()])
+        return self._active_order_book.c_volume_for_price(True, float(price))
 
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
         """
@@ -79,9 +74,8 @@ cdef class EterbaseActiveOrderTracker:
             str order_id
             int order_side = SIDE_NaN
             str price_raw
-            object price
-            dict order_dict
-            str remaining_size
+            double price = 0
+            ActiveOrder order
             double timestamp = message.timestamp
             double quantity = 0
         order_id = content.get("orderId")
@@ -99,136 +93,52 @@ cdef class EterbaseActiveOrderTracker:
         # 'change' messages have 'null' as price for market orders
         elif price_raw == "null":
             return s_empty_diff, s_empty_diff
-        price = None
         if (price_raw is not None):
-            price = Decimal(price_raw)
+            price = float(price_raw)
         if msg_type!="ob_update":
             if (content.get("side") is not None):
                 order_side = content.get("side")
-            if order_side == SIDE_NaN:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    order_side = self._active_bids[price][order_id]["side"]
+            if order_side == SIDE_NaN and self._active_order_book.c_has_order(order_id):
+                order_side = SIDE_BUY if self._active_order_book.c_get_order(order_id).is_bid else SIDE_SELL
             if ((order_side != SIDE_BUY) and (order_side != SIDE_SELL)):
                 raise ValueError(f"Invalid msg side it is not sell nor buy - found side: {order_side} for message {message}'. Aborting.")
 
         if msg_type == "ob_update":
             changes = content["changes"]
             for change in changes:
-                price = change[0]
-                quantity = change[1]
+                price = float(change[0])
+                quantity = float(change[1])
 
                 side = change[3]
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": quantity,
-                    "side": side
-                }
-
-                if side == SIDE_BUY:
-                    if price in self._active_bids:
-                        self._active_bids[price][order_id] = order_dict
-                    else:
-                        self._active_bids[price] = {order_id: order_dict}
-                    return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-                elif side == SIDE_SELL:
-                    if price in self._active_asks:
-                        self._active_asks[price][order_id] = order_dict
-                    else:
-                        self._active_asks[price] = {order_id: order_dict}
-                    return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                else:
+                if side != SIDE_BUY and side != SIDE_SELL:
                     raise ValueError(f"Invalid msg side it is not sell nor buy, found side: {side} for message {message}'. Aborting.")
-        elif msg_type == TYPE_OPEN:
-
-            order_dict = {
-                "order_id": order_id,
-                "remaining_size": content["qty"],
-                "side": order_side,
-                "order_type": content["oType"]
-            }
-            if order_side == SIDE_BUY:
-                if price in self._active_bids:
-                    self._active_bids[price][order_id] = order_dict
-                else:
-                    self._active_bids[price] = {order_id: order_dict}
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-            elif order_side == SIDE_SELL:
-                if price in self._active_asks:
-                    self._active_asks[price][order_id] = order_dict
-                else:
-                    self._active_asks[price] = {order_id: order_dict}
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-            else:
-                raise ValueError(f"Cannot determine order side - {order_side} for message - {message}. Aborting.")
-
-        elif msg_type == TYPE_MATCH:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    remaining_size = self._active_bids[price][order_id]["remaining_size"]
-
-                    if (self._active_bids[price][order_id]["order_type"] == ORDER_TYPE_MARKET):
-                        self._active_bids[price][order_id]["remaining_size"] = str(float(content["remainingCost"]))
-                    else:
-                        self._active_bids[price][order_id]["remaining_size"] = str(float(content["remainingQty"]))
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            elif order_side == SIDE_SELL:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    remaining_size = self._active_asks[price][order_id]["remaining_size"]
-                    self._active_asks[price][order_id]["remaining_size"] = str(float(content["remainingQty"]))
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                raise ValueError(f"Cannot determine order side - {order_side} for message - {message}. Aborting.")
-
-        elif msg_type == TYPE_DONE:
+                self._active_order_book.c_add_order(order_id, side == SIDE_BUY, price, quantity)
+                if side == SIDE_BUY:
+                    return np.array([[timestamp, price, quantity, message.update_id]], dtype="float64"), s_empty_diff
+                return s_empty_diff, np.array([[timestamp, price, quantity, message.update_id]], dtype="float64")
+            return s_empty_diff, s_empty_diff
 
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    del self._active_bids[price][order_id]
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                return s_empty_diff, s_empty_diff
-            elif order_side == SIDE_SELL:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    del self._active_asks[price][order_id]
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64")
-                        )
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                        )
+        elif msg_type == TYPE_OPEN:
+            self._active_order_book.c_add_order(order_id, order_side == SIDE_BUY, price, float(content["qty"]))
+            if content["oType"] == ORDER_TYPE_MARKET:
+                self._market_order_ids.add(order_id)
+            return self._active_order_book.c_level_to_np_arrays(order_side == SIDE_BUY, price, timestamp,
+                                                                message.update_id)
+
+        elif msg_type == TYPE_MATCH or msg_type == TYPE_DONE:
+            if not self._active_order_book.c_has_order(order_id):
                 return s_empty_diff, s_empty_diff
+            order = self._active_order_book.c_get_order(order_id)
+            if msg_type == TYPE_MATCH:
+                if order_side == SIDE_BUY and order_id in self._market_order_ids:
+                    self._active_order_book.c_set_order_size(order_id, float(content["remainingCost"]))
+                else:
+                    self._active_order_book.c_set_order_size(order_id, float(content["remainingQty"]))
             else:
-                raise ValueError(f"Cannot determine order side - {order_side} for message - {message}. Aborting.")
+                self._active_order_book.c_remove_order(order_id)
+                self._market_order_ids.discard(order_id)
+            return self._active_order_book.c_level_to_np_arrays(order.is_bid, order.price, timestamp,
+                                                                message.update_id)
 
         else:
             raise ValueError(f"Unknown message type '{msg_type}' - {message}. Aborting.")
@@ -239,60 +149,20 @@ cdef class EterbaseActiveOrderTracker:
         :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
         """
         cdef:
-            object price
             str order_id
-            str amount
-            dict order_dict
 
         # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
+        self._active_order_book.c_clear()
+        self._market_order_ids.clear()
 
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
+        for snapshot_orders, is_bid in [(message.content["bids"], True),
+                                        (message.content["asks"], False)]:
             for order in snapshot_orders:
-                price = Decimal(order[0])
-
-                amount = str(order[1])
-
-                order_id = str(price) + "_" + amount + "_" + str(order[2])
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": amount
-                }
-
-                if price in active_orders:
-                    active_orders[price][order_id] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_id: order_dict
-                    }
+                order_id = str(order[0]) + "_" + str(order[1]) + "_" + str(order[2])
+                self._active_order_book.c_add_order(order_id, is_bid, float(order[0]), float(order[1]))
 
         # Return the sorted snapshot tables.
-        cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-
-        return bids, asks
+        return self._active_order_book.c_snapshot_np_arrays(message.timestamp, message.update_id)
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         """
@@ -2,6 +2,7 @@
 
 import asyncio
 import aiohttp
+from functools import partial
 import logging
 import pandas as pd
 from typing import (
@@ -19,7 +20,12 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.market.eterbase.eterbase_order_book import EterbaseOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
+from hummingbot.core.utils.asyncio_throttle import get_rate_limiter
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_entry import (
     OrderBookTrackerEntry
@@ -28,6 +34,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.market.eterbase.eterbase_active_order_tracker import EterbaseActiveOrderTracker
 from hummingbot.market.eterbase.eterbase_order_book_tracker_entry import EterbaseOrderBookTrackerEntry
 import hummingbot.market.eterbase.eterbase_constants as constants
+from hummingbot.market.eterbase.eterbase_utils import RATE_LIMITS
 
 MAX_RETRIES = 20
 NaN = float("nan")
@@ -297,7 +304,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     }
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = fast_json.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Eterbase Websocket message does not contain a type - {msg}")
@@ -325,6 +332,18 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 )
                 await asyncio.sleep(30.0)
 
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        return EterbaseOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"product_id": trading_pair}
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(rate_limiter=get_rate_limiter(constants.EXCHANGE_NAME, RATE_LIMITS))
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
         *required
@@ -332,39 +351,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :param ev_loop: ev_loop to execute this function in
         :param output: an async queue where the incoming messages are stored
         """
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = EterbaseOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"product_id": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().network(
-                                "Unexpected error with WebSocket connection.",
-                                exc_info=True,
-                                app_warning_msg="Unexpected error with WebSocket connection. Retrying in 5 seconds. "
-                                                "Check network connection."
-                            )
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute = 0, second = 0, microsecond = 0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours = 1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info = True)
-                await asyncio.sleep(5.0)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
@@ -12,6 +12,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils import fast_json
 from hummingbot.market.eterbase.eterbase_auth import EterbaseAuth
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -84,7 +85,7 @@ class EterbaseAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
                         self.logger().debug(f"websocket raw msg: {raw_msg}")
-                        msg = ujson.loads(raw_msg)
+                        msg = fast_json.loads(raw_msg)
                         msg_type: str = msg.get("type", None)
                         if msg_type is None:
                             raise ValueError(f"Eterbase Websocket message does not contain a type - {msg}")
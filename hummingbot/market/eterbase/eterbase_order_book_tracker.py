@@ -190,6 +190,7 @@ class EterbaseOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
+                    self._record_diff(trading_pair, order_book, message)
                     order_book.apply_diffs(bids, asks, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
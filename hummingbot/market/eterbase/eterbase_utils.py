@@ -2,6 +2,11 @@ import logging
 from typing import Dict, Any, Optional
 import hummingbot.market.eterbase.eterbase_constants as constants
 from hummingbot.market.eterbase.eterbase_auth import EterbaseAuth
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 
 import aiohttp
 import asyncio
@@ -16,6 +21,9 @@ marketid_map = None
 
 API_CALL_TIMEOUT = 10.0
 
+# Conservative limit, shared by public and private requests.
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
+
 
 async def _http_client(loop: Optional = None) -> aiohttp.ClientSession:
     """
@@ -63,6 +71,10 @@ async def api_request(http_method: str,
     if data is not None:
         headers['Content-Type'] = "application/json"
 
+    # Requests from other threads run on their own event loop, which the rate limiter can't wait on.
+    if loop is None:
+        await get_rate_limiter(constants.EXCHANGE_NAME, RATE_LIMITS).acquire(priority=http_method_priority(http_method))
+
     client = await _http_client(loop)
     async with client.request(http_method,
                               url=url,
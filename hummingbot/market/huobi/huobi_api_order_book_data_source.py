@@ -2,11 +2,10 @@
 
 import aiohttp
 import asyncio
-import gzip
+from functools import partial
 import json
 import logging
 import pandas as pd
-import time
 from typing import (
     Any,
     AsyncIterable,
@@ -21,8 +20,17 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter
+)
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.huobi.huobi_order_book import HuobiOrderBook
 
@@ -31,6 +39,10 @@ HUOBI_TICKER_URL = "https://api.huobi.pro/market/tickers"
 HUOBI_DEPTH_URL = "https://api.huobi.pro/market/depth"
 HUOBI_WS_URI = "wss://api.huobi.pro/ws"
 
+# Snapshots count against the public request limit shared with HuobiMarket.
+RATE_LIMITS = [RateLimit("ip_requests", 10, 1.0, counts_all_requests=False)]
+ENDPOINT_WEIGHTS = {"public": {"ip_requests": 1}}
+
 
 class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
@@ -119,34 +131,30 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 raise IOError(f"Error fetching Huobi market snapshot for {trading_pair}. "
                               f"HTTP status is {response.status}.")
             api_data = await response.read()
-            data: Dict[str, Any] = json.loads(api_data)
+            data: Dict[str, Any] = fast_json.loads(api_data)
             return data
 
+    async def _get_tracker_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return OrderBookTrackerEntry(trading_pair, snapshot_msg.timestamp, order_book)
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
         async with aiohttp.ClientSession() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
-
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_msg.timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index + 1}/{number_of_pairs} completed.")
-                    # Huobi rate limit is 100 https requests per 10 seconds
-                    await asyncio.sleep(0.4)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+            bootstrap: OrderBookBootstrap = OrderBookBootstrap(
+                partial(self._get_tracker_entry, client),
+                rate_limiter=get_rate_limiter("huobi", RATE_LIMITS, ENDPOINT_WEIGHTS),
+                endpoint="public",
+                on_entry=self.order_book_ready_callback
+            )
+            return await bootstrap.run(trading_pairs)
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -183,11 +191,10 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(json.dumps(subscribe_request))
 
+                    # Huobi gzips every frame. Its ids can be too large for 64 bit ints, fast_json decodes them exactly.
+                    inflater: fast_json.Inflater = fast_json.Inflater(fast_json.GZIP_WBITS)
                     async for raw_msg in self._inner_messages(ws):
-                        # Huobi compresses their ws data
-                        encoded_msg: bytes = gzip.decompress(raw_msg)
-                        # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        msg: Dict[str, Any] = inflater.loads(raw_msg)
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
@@ -221,11 +228,10 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(json.dumps(subscribe_request))
 
+                    # Huobi gzips every frame. Its ids can be too large for 64 bit ints, fast_json decodes them exactly.
+                    inflater: fast_json.Inflater = fast_json.Inflater(fast_json.GZIP_WBITS)
                     async for raw_msg in self._inner_messages(ws):
-                        # Huobi compresses their ws data
-                        encoded_msg: bytes = gzip.decompress(raw_msg)
-                        # Huobi's data value for id is a large int too big for ujson to parse
-                        msg: Dict[str, Any] = json.loads(encoded_msg.decode('utf-8'))
+                        msg: Dict[str, Any] = inflater.loads(raw_msg)
                         if "ping" in msg:
                             await ws.send(f'{{"op":"pong","ts": {str(msg["ping"])}}}')
                         elif "subbed" in msg:
@@ -242,32 +248,19 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await asyncio.sleep(30.0)
 
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        return HuobiOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            metadata={"trading_pair": trading_pair}
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(rate_limiter=get_rate_limiter("huobi", RATE_LIMITS, ENDPOINT_WEIGHTS),
+                                          endpoint="public")
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_message: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                metadata={"trading_pair": trading_pair}
-                            )
-                            output.put_nowait(snapshot_message)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
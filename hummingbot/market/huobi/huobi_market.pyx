@@ -59,12 +59,28 @@ from hummingbot.market.market_base import (
     MarketBase,
     NaN,
     s_decimal_NaN)
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    RateLimit,
+    get_rate_limiter,
+)
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 hm_logger = None
 s_decimal_0 = Decimal(0)
+# Market data requests are limited per IP, and account requests per API key, to 10 per second each.
+RATE_LIMITS = [
+    RateLimit("ip_requests", 10, 1.0, counts_all_requests=False),
+    RateLimit("account_requests", 10, 1.0, counts_all_requests=False),
+]
+ENDPOINT_WEIGHTS = {
+    "public": {"ip_requests": 1},
+    "private": {"account_requests": 1},
+}
 TRADING_PAIR_SPLITTER = re.compile(r"^(\w+)(usdt|husd|btc|eth|ht|trx)$")
 HUOBI_ROOT_API = "https://api.huobi.pro/v1/"
 
@@ -134,6 +150,7 @@ cdef class HuobiMarket(MarketBase):
         self._poll_notifier = asyncio.Event()
         self._poll_interval = poll_interval
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS, ENDPOINT_WEIGHTS)
         self._status_polling_task = None
         self._trading_required = trading_required
         self._trading_rules = {}
@@ -275,6 +292,13 @@ cdef class HuobiMarket(MarketBase):
         content_type = "application/json" if method == "post" else "application/x-www-form-urlencoded"
         headers = {"Content-Type": content_type}
         url = HUOBI_ROOT_API + path_url
+        if "cancel" in path_url:
+            priority = PRIORITY_HIGH
+        elif "place" in path_url:
+            priority = PRIORITY_NORMAL
+        else:
+            priority = PRIORITY_LOW
+        await self._rate_limiter.acquire(endpoint="private" if is_auth_required else "public", priority=priority)
         client = await self._http_client()
         if is_auth_required:
             params = self._huobi_auth.add_auth_to_params(method, path_url, params)
@@ -2,6 +2,7 @@
 
 import asyncio
 import aiohttp
+from functools import partial
 import logging
 import pandas as pd
 from typing import (
@@ -17,7 +18,16 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 from collections import defaultdict
 
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter
+)
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -32,6 +42,10 @@ DIFF_STREAM_URL = "wss://ws.kraken.com"
 TICKER_URL = "https://api.kraken.com/0/public/Ticker"
 ASSET_PAIRS_URL = "https://api.kraken.com/0/public/AssetPairs"
 
+# Snapshots count against the public request limit shared with KrakenMarket.
+RATE_LIMITS = [RateLimit("public_requests", 1, 1.0, counts_all_requests=False)]
+ENDPOINT_WEIGHTS = {"public": {"public_requests": 1}}
+
 
 class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
@@ -174,33 +188,29 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
+    async def _get_tracker_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = KrakenOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
         async with aiohttp.ClientSession() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
-
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = KrakenOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    # Each 1000 limit snapshot costs 10 requests and Binance rate limit is 20 requests per second.
-                    await asyncio.sleep(1.0)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5.0)
-            return retval
+            bootstrap: OrderBookBootstrap = OrderBookBootstrap(
+                partial(self._get_tracker_entry, client),
+                rate_limiter=get_rate_limiter("kraken", RATE_LIMITS, ENDPOINT_WEIGHTS),
+                endpoint="public",
+                on_entry=self.order_book_ready_callback
+            )
+            return await bootstrap.run(trading_pairs)
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -236,7 +246,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg: List[Any] = ujson.loads(raw_msg)
+                        msg: List[Any] = fast_json.loads(raw_msg)
                         trades: List[Dict[str, Any]] = [{"pair": msg[-1], "trade": trade} for trade in msg[1]]
                         for trade in trades:
                             trade_msg: OrderBookMessage = KrakenOrderBook.trade_message_from_exchange(trade)
@@ -256,7 +266,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     ws: websockets.WebSocketClientProtocol = ws
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = fast_json.loads(raw_msg)
 
                         msg_dict = {"trading_pair": msg[-1],
                                     "asks": msg[1].get("a", []) or msg[1].get("as", []) or [],
@@ -277,37 +287,24 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await asyncio.sleep(30.0)
 
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        return KrakenOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(rate_limiter=get_rate_limiter("kraken", RATE_LIMITS, ENDPOINT_WEIGHTS),
+                                          endpoint="public")
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = KrakenOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"trading_pair": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error. ", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error. ", exc_info=True)
-                await asyncio.sleep(5.0)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
 
     async def get_ws_subscription_message(self, subscription_type: str):
         # all_markets: pd.DataFrame = await self.get_active_exchange_markets()
@@ -13,6 +13,7 @@ import time
 import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils import fast_json
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.kraken.kraken_auth import KrakenAuth
 from hummingbot.market.kraken.kraken_order_book import KrakenOrderBook
@@ -111,7 +112,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     async for raw_msg in self._inner_messages(ws):
                         self._last_recv_time = time.time()
 
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = fast_json.loads(raw_msg)
                         output.put_nowait(diff_msg)
             except asyncio.CancelledError:
                 raise
@@ -28,6 +28,7 @@ cdef class KrakenMarket(MarketBase):
         object _set_server_time_offset_task
         public object _kraken_auth
         object _shared_client
+        object _rate_limiter
         dict _asset_pairs
         int32_t _last_userref
 
@@ -53,6 +53,13 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTrackerDataS
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.market.trading_rule cimport TradingRule
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    RateLimit,
+    get_rate_limiter,
+)
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -67,6 +74,17 @@ OPEN_ORDERS_URI = "/0/private/OpenOrders"
 QUERY_ORDERS_URI = "/0/private/QueryOrders"
 ASSET_PAIRS_URI = "https://api.kraken.com/0/public/AssetPairs"
 TIME_URL = "https://api.kraken.com/0/public/Time"
+# https://support.kraken.com/hc/en-us/articles/206548367-What-are-the-API-rate-limits-
+# Private requests raise a counter of at most 15 by one, which decays by 0.33 per second (Starter tier). Adding and
+# cancelling orders doesn't count.
+RATE_LIMITS = [
+    RateLimit("public_requests", 1, 1.0, counts_all_requests=False),
+    RateLimit("private_counter", 15, 45.0, counts_all_requests=False),
+]
+ENDPOINT_WEIGHTS = {
+    "public": {"public_requests": 1},
+    "private": {"private_counter": 1},
+}
 
 
 cdef class KrakenMarketTransactionTracker(TransactionTracker):
@@ -147,6 +165,7 @@ cdef class KrakenMarket(MarketBase):
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_pull_timestamp = 0
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS, ENDPOINT_WEIGHTS)
         self._asset_pairs = {}
         self._last_userref = 0
 
@@ -749,6 +768,13 @@ cdef class KrakenMarket(MarketBase):
                            data: Optional[Dict[str, Any]] = None,
                            is_auth_required: bool = False) -> Dict[str, Any]:
         url = KRAKEN_ROOT_API + path_url
+        if path_url == CANCEL_ORDER_URI:
+            await self._rate_limiter.acquire(endpoint="order", priority=PRIORITY_HIGH)
+        elif path_url == ADD_ORDER_URI:
+            await self._rate_limiter.acquire(endpoint="order", priority=PRIORITY_NORMAL)
+        else:
+            await self._rate_limiter.acquire(endpoint="private" if is_auth_required else "public",
+                                             priority=PRIORITY_LOW)
 
         client = await self._http_client()
 
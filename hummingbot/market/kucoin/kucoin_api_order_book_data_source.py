@@ -3,6 +3,7 @@
 import asyncio
 import json
 import aiohttp
+from functools import partial
 import logging
 import pandas as pd
 from typing import (
@@ -15,8 +16,17 @@ from typing import (
 import time
 import websockets
 from websockets.exceptions import ConnectionClosed
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter
+)
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.market.kucoin.kucoin_order_book_tracker_entry import KucoinOrderBookTrackerEntry
@@ -32,6 +42,9 @@ DIFF_STREAM_URL = ""
 TICKER_PRICE_CHANGE_URL = "https://api.kucoin.com/api/v1/market/allTickers"
 EXCHANGE_INFO_URL = "https://api.kucoin.com/api/v1/symbols"
 
+# Snapshots count against the request limit shared with KucoinMarket.
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
+
 
 class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
@@ -131,35 +144,30 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             data: Dict[str, Any] = await response.json()
             return data
 
+    async def _get_tracker_entry(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"symbol": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        active_order_tracker: KucoinActiveOrderTracker = KucoinActiveOrderTracker()
+        bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
+        order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        return KucoinOrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book, active_order_tracker)
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
         async with aiohttp.ClientSession() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
-
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    active_order_tracker: KucoinActiveOrderTracker = KucoinActiveOrderTracker()
-                    bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
-                    retval[trading_pair] = KucoinOrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book, active_order_tracker)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    # Kucoin rate limit is 100 https requests per 10 seconds
-                    await asyncio.sleep(0.4)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+            bootstrap: OrderBookBootstrap = OrderBookBootstrap(
+                partial(self._get_tracker_entry, client),
+                rate_limiter=get_rate_limiter("kucoin", RATE_LIMITS),
+                on_entry=self.order_book_ready_callback
+            )
+            return await bootstrap.run(trading_pairs)
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -213,7 +221,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(json.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        msg: Dict[str, Any] = json.loads(raw_msg)
+                        msg: Dict[str, Any] = fast_json.loads(raw_msg)
                         if msg["type"] == "pong" or msg["type"] == "ack":
                             pass
                         elif msg["type"] == "message":
@@ -250,7 +258,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         await ws.send(json.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        msg: Dict[str, Any] = json.loads(raw_msg)
+                        msg: Dict[str, Any] = fast_json.loads(raw_msg)
                         if msg["type"] == "pong" or msg["type"] == "ack":
                             pass
                         elif msg["type"] == "message":
@@ -265,34 +273,20 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await asyncio.sleep(30.0)
 
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        return KucoinOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"symbol": trading_pair}
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(rate_limiter=get_rate_limiter("kucoin", RATE_LIMITS))
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"symbol": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
@@ -9,11 +9,11 @@ from typing import (
     Dict,
     Optional
 )
-import ujson
 import websockets
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils import fast_json
 from hummingbot.market.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.logger import HummingbotLogger
 
@@ -135,7 +135,7 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
         while True:
             try:
                 async for message in self.messages():
-                    decoded: Dict[str, any] = ujson.loads(message)
+                    decoded: Dict[str, any] = fast_json.loads(message)
                     output.put_nowait(decoded)
             except asyncio.CancelledError:
                 raise
@@ -17,6 +17,7 @@ cdef class KucoinMarket(MarketBase):
         object _poll_notifier
         double _poll_interval
         object _shared_client
+        object _rate_limiter
         public object _status_polling_task
         dict _trading_rules
         public object _trading_rules_polling_task
@@ -46,12 +46,19 @@ from hummingbot.market.kucoin.kucoin_in_flight_order import KucoinInFlightOrder
 from hummingbot.market.kucoin.kucoin_order_book_tracker import KucoinOrderBookTracker
 from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.market.market_base import MarketBase
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 km_logger = None
 s_decimal_0 = Decimal(0)
+# Conservative limit, shared by public and private requests.
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
 KUCOIN_ROOT_API = "https://api.kucoin.com"
 
 
@@ -121,6 +128,7 @@ cdef class KucoinMarket(MarketBase):
         self._poll_notifier = asyncio.Event()
         self._poll_interval = poll_interval
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
         self._status_polling_task = None
         self._trading_required = trading_required
         self._trading_rules = {}
@@ -255,6 +263,7 @@ cdef class KucoinMarket(MarketBase):
                            is_auth_required: bool = False,
                            is_partner_required: bool = False) -> Dict[str, Any]:
         url = KUCOIN_ROOT_API + path_url
+        await self._rate_limiter.acquire(priority=http_method_priority(method))
         client = await self._http_client()
         if is_auth_required:
             if is_partner_required:
@@ -76,12 +76,8 @@ class KucoinOrderBookTracker(OrderBookTracker):
         deleted_trading_pair: Set[str] = tracking_trading_pair - available_trading_pair
 
         for trading_pair in new_trading_pair:
-            order_book_tracker_entry: KucoinOrderBookTrackerEntry = available_pairs[trading_pair]
-            self._active_order_trackers[trading_pair] = order_book_tracker_entry.active_order_tracker
-            self._order_books[trading_pair] = order_book_tracker_entry.order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = asyncio.ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Started order book tracking for {trading_pair}.")
+            if not self._is_tracking(trading_pair):
+                self._start_tracking_pair(available_pairs[trading_pair])
 
         for trading_pair in deleted_trading_pair:
             self._tracking_tasks[trading_pair].cancel()
@@ -91,6 +87,10 @@ class KucoinOrderBookTracker(OrderBookTracker):
             del self._tracking_message_queues[trading_pair]
             self.logger().info(f"Stopped order book tracking for {trading_pair}.")
 
+    def _start_tracking_pair(self, entry: KucoinOrderBookTrackerEntry):
+        self._active_order_trackers[entry.trading_pair] = entry.active_order_tracker
+        super()._start_tracking_pair(entry)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -166,6 +166,7 @@ class KucoinOrderBookTracker(OrderBookTracker):
 
                 if message.type is OrderBookMessageType.DIFF:
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
+                    self._record_diff(trading_pair, order_book, message)
                     order_book.apply_diffs(bids, asks, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
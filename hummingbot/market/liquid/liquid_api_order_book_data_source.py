@@ -1,5 +1,6 @@
 import asyncio
 import aiohttp
+from functools import partial
 import logging
 import pandas as pd
 import time
@@ -8,7 +9,16 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter
+)
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -17,6 +27,9 @@ from hummingbot.market.liquid.liquid_order_book import LiquidOrderBook
 from hummingbot.market.liquid.liquid_order_book_tracker_entry import LiquidOrderBookTrackerEntry
 from hummingbot.market.liquid.constants import Constants
 
+# Snapshots count against the request limit shared with LiquidMarket.
+RATE_LIMITS = [RateLimit("requests", 300, 300.0)]
+
 
 class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
@@ -211,36 +224,29 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         # Get the currently active markets
         async with aiohttp.ClientSession() as client:
-
             trading_pairs: List[str] = await self.get_trading_pairs()
+            bootstrap: OrderBookBootstrap = OrderBookBootstrap(
+                partial(self._get_tracker_entry, client),
+                rate_limiter=get_rate_limiter("liquid", RATE_LIMITS),
+                on_entry=self.order_book_ready_callback
+            )
+            return await bootstrap.run(trading_pairs)
+
+    async def _get_tracker_entry(self,
+                                 client: aiohttp.ClientSession,
+                                 trading_pair: str) -> LiquidOrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = LiquidOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
 
-            retval: Dict[str, LiquidOrderBookTrackerEntry] = {}
-            number_of_pairs: int = len(trading_pairs)
-
-            for index, trading_pair in enumerate(trading_pairs):
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
 
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = LiquidOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-
-                    retval[trading_pair] = LiquidOrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed")
-                    # Each 1000 limit snapshot costs ?? requests and Liquid rate limit is ?? requests per second.
-                    await asyncio.sleep(1.0)  # Might need to be changed
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+        return LiquidOrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         pass
@@ -305,7 +311,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             await ws.send(ujson.dumps(subscribe_request))
 
                     async for raw_msg in self._inner_messages(ws):
-                        diff_msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        diff_msg: Dict[str, Any] = fast_json.loads(raw_msg)
 
                         event_type = diff_msg.get('event', None)
                         if event_type == 'updated':
@@ -317,7 +323,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                             buy_or_sell = diff_msg.get('channel').split('_')[-1].lower()
                             side = 'asks' if buy_or_sell == Constants.SIDE_ASK else 'bids'
                             diff_msg = {
-                                '{0}'.format(side): ujson.loads(diff_msg.get('data', [])),
+                                '{0}'.format(side): fast_json.loads(diff_msg.get('data', [])),
                                 'trading_pair': trading_pair
                             }
                             diff_timestamp: float = time.time()
@@ -340,52 +346,29 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await asyncio.sleep(30.0)
 
+    async def _get_snapshot_message(self, client: aiohttp.ClientSession, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        snapshot['asks'] = snapshot.get('sell_price_levels')
+        snapshot['bids'] = snapshot.get('buy_price_levels')
+        return LiquidOrderBook.snapshot_message_from_exchange(
+            msg=snapshot,
+            timestamp=snapshot_timestamp,
+            metadata={
+                'trading_pair': trading_pair
+            }
+        )
+
+    def _create_snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        return OrderBookSnapshotScheduler(rate_limiter=get_rate_limiter("liquid", RATE_LIMITS))
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
         Fetches order book snapshots for each trading pair, and use them to update the local order book
         :param ev_loop: ev_loop to execute this function in
         :param output: an async queue where the incoming messages are stored
-        TODO: This method needs to be further break down, otherwise, whenever error occurs, the only message
-        getting is something similar to `Unexpected error with WebSocket connection.`
         """
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot['asks'] = snapshot.get('sell_price_levels')
-                            snapshot['bids'] = snapshot.get('buy_price_levels')
-                            snapshot_msg: OrderBookMessage = LiquidOrderBook.snapshot_message_from_exchange(
-                                msg=snapshot,
-                                timestamp=snapshot_timestamp,
-                                metadata={
-                                    'trading_pair': trading_pair
-                                }
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception as e:
-                            print(e)
-                            self.logger().network(
-                                f"Unexpected error with WebSocket connection.",
-                                exc_info=True,
-                                app_warning_msg=f"Unexpected error with WebSocket connection. Retrying in 5 seconds. "
-                                                f"Check network connection."
-                            )
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        async with aiohttp.ClientSession() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
@@ -17,6 +17,7 @@ from websockets.exceptions import ConnectionClosed
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils import fast_json
 from hummingbot.market.liquid.constants import Constants
 from hummingbot.market.liquid.liquid_auth import LiquidAuth
 from hummingbot.market.liquid.liquid_order_book import LiquidOrderBook
@@ -88,7 +89,7 @@ class LiquidAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(subscribe_request))
                     async for raw_msg in self._inner_messages(ws):
-                        diff_msg = ujson.loads(raw_msg)
+                        diff_msg = fast_json.loads(raw_msg)
 
                         event_type = diff_msg.get('event', None)
                         if event_type == 'updated':
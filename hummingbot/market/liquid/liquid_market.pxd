@@ -23,6 +23,7 @@ cdef class LiquidMarket(MarketBase):
         public object _product_dict
         public object _trading_rules_polling_task
         public object _shared_client
+        object _rate_limiter
 
     cdef c_start_tracking_order(self,
                                 str order_id,
@@ -57,6 +57,12 @@ from hummingbot.market.market_base import (
 from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.market.liquid.liquid_in_flight_order import LiquidInFlightOrder
 from hummingbot.market.liquid.liquid_in_flight_order cimport LiquidInFlightOrder
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -64,6 +70,8 @@ from hummingbot.core.utils.estimate_fee import estimate_fee
 s_logger = None
 s_decimal_0 = Decimal(0)
 s_decimal_nan = Decimal("nan")
+# https://developers.liquid.com/#rate-limiting
+RATE_LIMITS = [RateLimit("requests", 300, 300.0)]
 
 cdef class LiquidMarketTransactionTracker(TransactionTracker):
     cdef:
@@ -155,6 +163,7 @@ cdef class LiquidMarket(MarketBase):
         self._product_dict = {}
         self._trading_rules_polling_task = None
         self._shared_client = None
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
 
     @property
     def name(self) -> str:
@@ -335,6 +344,9 @@ cdef class LiquidMarket(MarketBase):
         :returns: json data from the endpoints
         """
         assert path_url is not None or url is not None
+        # Orders are cancelled with PUT /orders/{id}/cancel
+        await self._rate_limiter.acquire(priority=PRIORITY_HIGH if path_url is not None and "cancel" in path_url
+                                         else http_method_priority(http_method))
 
         url = f"{Constants.BASE_URL}{path_url}" if url is None else url
         data_str = "" if data is None else json.dumps(data)
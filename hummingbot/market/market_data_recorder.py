@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import defaultdict
+import logging
+import os
+from os.path import join
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import (
+    data_path,
+    get_executor
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent
+)
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.market_base import MarketBase
+
+MarketTradingPair = Tuple[str, str]
+OrderBookForwarders = List[Tuple[OrderBookEvent, EventForwarder]]
+
+
+class OrderBookSampleBatch:
+    """
+    Column buffers of top-N order book samples for a single (market, trading pair).
+    """
+    def __init__(self):
+        self.timestamps: List[int] = []
+        self.bids: List[np.ndarray] = []
+        self.asks: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, timestamp: int, bids: np.ndarray, asks: np.ndarray):
+        self.timestamps.append(timestamp)
+        self.bids.append(bids)
+        self.asks.append(asks)
+
+
+class TradeSampleBatch:
+    """
+    Column buffers of order book trades for a single (market, trading pair).
+    """
+    def __init__(self):
+        self.timestamps: List[int] = []
+        self.trade_types: List[int] = []
+        self.prices: List[float] = []
+        self.amounts: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, timestamp: int, trade_type: int, price: float, amount: float):
+        self.timestamps.append(timestamp)
+        self.trade_types.append(trade_type)
+        self.prices.append(price)
+        self.amounts.append(amount)
+
+
+class MarketDataStore:
+    """
+    Append-only, compressed columnar store of order book samples and trades.
+
+    Data is partitioned by market and trading pair, and each flushed batch becomes one immutable file named after the
+    millisecond timestamp range it covers:
+
+        {data_dir}/{market}/{trading_pair}/order_book_{first_timestamp}_{last_timestamp}.npz
+        {data_dir}/{market}/{trading_pair}/trades_{first_timestamp}_{last_timestamp}.npz
+
+    Files are never overwritten. A batch covering the same range as an existing file gets a sequence number, e.g.
+    `trades_{first_timestamp}_{last_timestamp}_1.npz`.
+
+    Timestamps are in milliseconds, like `TradeFill.timestamp`, so loaded frames can be joined against trade fills.
+    """
+    ORDER_BOOK_PREFIX = "order_book"
+    TRADES_PREFIX = "trades"
+
+    def __init__(self, data_dir: Optional[str] = None):
+        self._data_dir: str = data_dir if data_dir is not None else join(data_path(), "market_data")
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    def _partition_dir(self, market: str, trading_pair: str) -> str:
+        partition_dir: str = join(self._data_dir, market, trading_pair)
+        os.makedirs(partition_dir, exist_ok=True)
+        return partition_dir
+
+    def _write_file(self, market: str, trading_pair: str, prefix: str, timestamps: np.ndarray, **arrays: np.ndarray):
+        partition_dir: str = self._partition_dir(market, trading_pair)
+        file_name: str = f"{prefix}_{timestamps[0]}_{timestamps[-1]}"
+        sequence: int = 0
+        while True:
+            file_path: str = join(partition_dir, f"{file_name}_{sequence}.npz" if sequence > 0 else f"{file_name}.npz")
+            try:
+                # Exclusive creation, so that concurrent writers can't pick the same file either.
+                with open(file_path, "xb") as fd:
+                    np.savez_compressed(fd, timestamp=timestamps, **arrays)
+                return
+            except FileExistsError:
+                sequence += 1
+
+    def write_order_book_samples(self, market: str, trading_pair: str, batch: OrderBookSampleBatch):
+        if len(batch) == 0:
+            return
+        timestamps: np.ndarray = np.array(batch.timestamps, dtype="int64")
+        bids: np.ndarray = np.stack(batch.bids)
+        asks: np.ndarray = np.stack(batch.asks)
+        self._write_file(market, trading_pair, self.ORDER_BOOK_PREFIX, timestamps,
+                         bid_price=bids[:, :, 0],
+                         bid_amount=bids[:, :, 1],
+                         ask_price=asks[:, :, 0],
+                         ask_amount=asks[:, :, 1])
+
+    def write_trades(self, market: str, trading_pair: str, batch: TradeSampleBatch):
+        if len(batch) == 0:
+            return
+        timestamps: np.ndarray = np.array(batch.timestamps, dtype="int64")
+        self._write_file(market, trading_pair, self.TRADES_PREFIX, timestamps,
+                         trade_type=np.array(batch.trade_types, dtype="int8"),
+                         price=np.array(batch.prices, dtype="float64"),
+                         amount=np.array(batch.amounts, dtype="float64"))
+
+    def _find_files(self,
+                    market: str,
+                    trading_pair: str,
+                    prefix: str,
+                    start_timestamp: Optional[int],
+                    end_timestamp: Optional[int]) -> List[str]:
+        partition_dir: str = join(self._data_dir, market, trading_pair)
+        if not os.path.isdir(partition_dir):
+            return []
+        file_ranges: List[Tuple[int, str]] = []
+        for file_name in os.listdir(partition_dir):
+            if not file_name.startswith(f"{prefix}_") or not file_name.endswith(".npz"):
+                continue
+            first_timestamp, last_timestamp = (int(ts) for ts in file_name[len(prefix) + 1:-4].split("_")[:2])
+            if start_timestamp is not None and last_timestamp < start_timestamp:
+                continue
+            if end_timestamp is not None and first_timestamp > end_timestamp:
+                continue
+            file_ranges.append((first_timestamp, join(partition_dir, file_name)))
+        return [file_path for _, file_path in sorted(file_ranges)]
+
+    @staticmethod
+    def _time_mask(timestamps: np.ndarray, start_timestamp: Optional[int], end_timestamp: Optional[int]) -> np.ndarray:
+        mask: np.ndarray = np.ones(len(timestamps), dtype=bool)
+        if start_timestamp is not None:
+            mask &= timestamps >= start_timestamp
+        if end_timestamp is not None:
+            mask &= timestamps <= end_timestamp
+        return mask
+
+    def load_order_book_samples(self,
+                                market: str,
+                                trading_pair: str,
+                                start_timestamp: Optional[int] = None,
+                                end_timestamp: Optional[int] = None) -> pd.DataFrame:
+        """
+        Loads order book samples as a data frame indexed by millisecond timestamp, with one column per side, field and
+        level, e.g. `bid_price_0`, `ask_amount_4`.
+        """
+        frames: List[pd.DataFrame] = []
+        for file_path in self._find_files(market, trading_pair, self.ORDER_BOOK_PREFIX,
+                                          start_timestamp, end_timestamp):
+            with np.load(file_path) as data:
+                mask: np.ndarray = self._time_mask(data["timestamp"], start_timestamp, end_timestamp)
+                columns: Dict[str, np.ndarray] = {}
+                for field in ("bid_price", "bid_amount", "ask_price", "ask_amount"):
+                    values: np.ndarray = data[field][mask]
+                    for level in range(values.shape[1]):
+                        columns[f"{field}_{level}"] = values[:, level]
+                frames.append(pd.DataFrame(columns, index=pd.Index(data["timestamp"][mask], name="timestamp")))
+        if len(frames) == 0:
+            return pd.DataFrame()
+        return pd.concat(frames)
+
+    def load_trades(self,
+                    market: str,
+                    trading_pair: str,
+                    start_timestamp: Optional[int] = None,
+                    end_timestamp: Optional[int] = None) -> pd.DataFrame:
+        frames: List[pd.DataFrame] = []
+        for file_path in self._find_files(market, trading_pair, self.TRADES_PREFIX, start_timestamp, end_timestamp):
+            with np.load(file_path) as data:
+                mask: np.ndarray = self._time_mask(data["timestamp"], start_timestamp, end_timestamp)
+                frames.append(pd.DataFrame({"trade_type": data["trade_type"][mask],
+                                            "price": data["price"][mask],
+                                            "amount": data["amount"][mask]},
+                                           index=pd.Index(data["timestamp"][mask], name="timestamp")))
+        if len(frames) == 0:
+            return pd.DataFrame()
+        return pd.concat(frames)
+
+
+class MarketDataRecorder:
+    """
+    Records market context next to `MarketsRecorder`'s own orders and fills: top-N levels of every tracked order book,
+    sampled whenever an update changes the top of the book, and every order book trade. Samples are keyed by the
+    market's display name, like `TradeFill.market`.
+
+    Samples are buffered in memory and written to a `MarketDataStore` in batches, on the shared executor.
+    """
+    # How often to look for order books that markets started tracking since.
+    WATCH_INTERVAL = 1.0
+
+    _mdr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdr_logger is None:
+            cls._mdr_logger = logging.getLogger(__name__)
+        return cls._mdr_logger
+
+    def __init__(self,
+                 markets: List[MarketBase],
+                 store: Optional[MarketDataStore] = None,
+                 depth: int = 10,
+                 flush_interval: float = 30.0):
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._markets: List[MarketBase] = markets
+        self._store: MarketDataStore = store if store is not None else MarketDataStore()
+        self._depth: int = depth
+        self._flush_interval: float = flush_interval
+
+        self._order_book_samples: Dict[MarketTradingPair, OrderBookSampleBatch] = defaultdict(OrderBookSampleBatch)
+        self._trade_samples: Dict[MarketTradingPair, TradeSampleBatch] = defaultdict(TradeSampleBatch)
+        self._last_top_of_book: Dict[MarketTradingPair, np.ndarray] = {}
+        # Order books only hold weak references to their listeners.
+        self._order_book_listeners: Dict[MarketTradingPair, Tuple[OrderBook, OrderBookForwarders]] = {}
+        self._recording_task: Optional[asyncio.Task] = None
+        self._last_flush_timestamp: float = 0
+
+    @property
+    def store(self) -> MarketDataStore:
+        return self._store
+
+    def start(self):
+        if self._recording_task is None:
+            self._last_flush_timestamp = time.time()
+            self._recording_task = safe_ensure_future(self.recording_loop())
+
+    def stop(self):
+        if self._recording_task is not None:
+            self._recording_task.cancel()
+            self._recording_task = None
+        for key in list(self._order_book_listeners.keys()):
+            self._remove_listeners(key)
+        get_executor().submit(self._write_batches, *self._take_batches())
+
+    async def recording_loop(self):
+        while True:
+            try:
+                self.watch_order_books()
+                now: float = time.time()
+                if now - self._last_flush_timestamp >= self._flush_interval:
+                    self._last_flush_timestamp = now
+                    await self._ev_loop.run_in_executor(get_executor(), self._write_batches, *self._take_batches())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error while recording market data.", exc_info=True)
+            await asyncio.sleep(self.WATCH_INTERVAL)
+
+    def watch_order_books(self):
+        """
+        Starts recording the order books of the markets that aren't recorded yet, including those that replaced a
+        recorded order book.
+        """
+        for market in self._markets:
+            for trading_pair, order_book in market.order_books.items():
+                key: MarketTradingPair = (market.display_name, trading_pair)
+                listeners = self._order_book_listeners.get(key)
+                if listeners is not None and listeners[0] is order_book:
+                    continue
+                if listeners is not None:
+                    self._remove_listeners(key)
+                self._add_listeners(key, order_book)
+                self.sample_order_book(key, order_book, int(time.time() * 1e3))
+
+    def sample_order_book(self, key: MarketTradingPair, order_book: OrderBook, timestamp: int):
+        """
+        Records the top levels of the order book, unless the top of the book is the same as in the last sample.
+        """
+        bids, asks = order_book.top_levels(1)
+        top_of_book: np.ndarray = np.nan_to_num(np.concatenate((bids[0], asks[0])))
+        last_top_of_book: Optional[np.ndarray] = self._last_top_of_book.get(key)
+        if last_top_of_book is not None and (top_of_book == last_top_of_book).all():
+            return
+        self._last_top_of_book[key] = top_of_book
+        self._order_book_samples[key].append(timestamp, *order_book.top_levels(self._depth))
+
+    def _add_listeners(self, key: MarketTradingPair, order_book: OrderBook):
+        def did_update(_):
+            self.sample_order_book(key, order_book, int(time.time() * 1e3))
+
+        def did_trade(evt: OrderBookTradeEvent):
+            self._trade_samples[key].append(int(evt.timestamp * 1e3),
+                                            evt.type.value,
+                                            float(evt.price),
+                                            float(evt.amount))
+
+        forwarders: OrderBookForwarders = [
+            (OrderBookEvent.UpdateEvent, EventForwarder(did_update)),
+            (OrderBookEvent.TradeEvent, EventForwarder(did_trade)),
+        ]
+        for event, forwarder in forwarders:
+            order_book.add_listener(event, forwarder)
+        self._order_book_listeners[key] = (order_book, forwarders)
+
+    def _remove_listeners(self, key: MarketTradingPair):
+        order_book, forwarders = self._order_book_listeners.pop(key)
+        for event, forwarder in forwarders:
+            order_book.remove_listener(event, forwarder)
+
+    def _take_batches(self) -> Tuple[Dict[MarketTradingPair, OrderBookSampleBatch],
+                                     Dict[MarketTradingPair, TradeSampleBatch]]:
+        order_book_samples, trade_samples = self._order_book_samples, self._trade_samples
+        self._order_book_samples = defaultdict(OrderBookSampleBatch)
+        self._trade_samples = defaultdict(TradeSampleBatch)
+        return order_book_samples, trade_samples
+
+    def _write_batches(self,
+                       order_book_samples: Dict[MarketTradingPair, OrderBookSampleBatch],
+                       trade_samples: Dict[MarketTradingPair, TradeSampleBatch]):
+        try:
+            for (market, trading_pair), batch in order_book_samples.items():
+                self._store.write_order_book_samples(market, trading_pair, batch)
+            for (market, trading_pair), batch in trade_samples.items():
+                self._store.write_trades(market, trading_pair, batch)
+        except Exception:
+            self.logger().error("Unexpected error while writing market data samples.", exc_info=True)
+
+    def flush(self):
+        """
+        Writes the buffered samples to the store, without waiting for the next periodic flush.
+        """
+        self._write_batches(*self._take_batches())
@@ -1,16 +1,28 @@
 #!/usr/bin/env python
 
 import asyncio
+import logging
+from sqlalchemy import (
+    bindparam,
+    select
+)
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import (
     Session,
     Query
 )
+from sqlalchemy.sql import (
+    Insert,
+    Update
+)
 import time
 import threading
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Union
 )
@@ -28,6 +40,7 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.logger import HummingbotLogger
 from hummingbot.market.market_base import MarketBase
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -37,16 +50,45 @@ from hummingbot.model.trade_fill import TradeFill
 
 
 class MarketsRecorder:
+    """
+    Records order and trade fill events from markets into the trade fills database.
+
+    Records are written behind: events are converted into plain row dictionaries and buffered, then written in one
+    transaction with Core-level `executemany` inserts, either every `flush_interval` seconds or as soon as
+    `flush_batch_size` rows are pending. Any read through the recorder flushes the pending rows first. If the
+    transaction fails, its rows are written again one by one, so that a bad row only loses itself.
+    """
+    _mr_logger: Optional[HummingbotLogger] = None
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    # SQLite limits the number of host parameters in a single statement to 999.
+    ID_QUERY_CHUNK_SIZE = 500
+
+    insert_order_stmt: Insert = Order.__table__.insert()
+    insert_order_status_stmt: Insert = OrderStatus.__table__.insert()
+    insert_trade_fill_stmt: Insert = TradeFill.__table__.insert()
+    update_order_stmt: Update = (Order.__table__.update()
+                                 .where(Order.__table__.c.id == bindparam("b_id"))
+                                 .values(last_status=bindparam("b_last_status"),
+                                         last_update_timestamp=bindparam("b_last_update_timestamp")))
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[MarketBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 flush_interval: float = 1.0,
+                 flush_batch_size: int = 1000):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -55,6 +97,19 @@ class MarketsRecorder:
         self._markets: List[MarketBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._flush_interval: float = flush_interval
+        self._flush_batch_size: int = flush_batch_size
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Pending rows, keyed by column names, waiting for the next flush.
+        self._pending_orders: Dict[str, Dict[str, Any]] = {}
+        self._pending_order_statuses: List[Dict[str, Any]] = []
+        self._pending_trade_fills: List[Dict[str, Any]] = []
+        # Latest status update for orders written in previous flushes.
+        self._pending_order_updates: Dict[str, Dict[str, Any]] = {}
+        # Order status rows which are only recorded if the order itself has been recorded.
+        self._pending_conditional_order_statuses: List[Dict[str, Any]] = []
+        self._pending_markets: Dict[int, MarketBase] = {}
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -103,8 +158,115 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self.flush()
+
+    @property
+    def pending_records_count(self) -> int:
+        return (len(self._pending_orders) +
+                len(self._pending_order_statuses) +
+                len(self._pending_trade_fills) +
+                len(self._pending_order_updates) +
+                len(self._pending_conditional_order_statuses))
+
+    def flush(self):
+        """
+        Writes all pending order, order status and trade fill records to the database in a single transaction.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self.pending_records_count == 0 and len(self._pending_markets) == 0:
+            return
+
+        orders: List[Dict[str, Any]] = list(self._pending_orders.values())
+        order_statuses: List[Dict[str, Any]] = self._pending_order_statuses
+        trade_fills: List[Dict[str, Any]] = self._pending_trade_fills
+        order_updates: List[Dict[str, Any]] = list(self._pending_order_updates.values())
+        conditional_order_statuses: List[Dict[str, Any]] = self._pending_conditional_order_statuses
+        markets: List[MarketBase] = list(self._pending_markets.values())
+        self._pending_orders = {}
+        self._pending_order_statuses = []
+        self._pending_trade_fills = []
+        self._pending_order_updates = {}
+        self._pending_conditional_order_statuses = []
+        self._pending_markets = {}
+
+        # Orders go first, since status rows and trade fills refer to them.
+        batches: List[Tuple[Union[Insert, Update], List[Dict[str, Any]]]] = [
+            (self.insert_order_stmt, orders),
+            (self.insert_order_status_stmt, order_statuses),
+            (self.insert_trade_fill_stmt, trade_fills),
+            (self.update_order_stmt, order_updates),
+        ]
+        session: Session = self.session
+        try:
+            if len(conditional_order_statuses) > 0:
+                recorded_order_ids: Set[str] = self._get_recorded_order_ids(
+                    set(row["order_id"] for row in conditional_order_statuses)
+                )
+                order_statuses.extend(row for row in conditional_order_statuses
+                                      if row["order_id"] in recorded_order_ids)
+            for statement, rows in batches:
+                if len(rows) > 0:
+                    session.execute(statement, rows)
+            for market in markets:
+                self.save_market_states(self._config_file_path, market, no_commit=True)
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            self.logger().warning(f"Error while writing {len(orders)} orders, {len(order_statuses)} order statuses "
+                                  f"and {len(trade_fills)} trade fills to the database. Writing them one by one.",
+                                  exc_info=True)
+            self._write_one_by_one(batches, markets)
+
+    def _write_one_by_one(self,
+                          batches: List[Tuple[Union[Insert, Update], List[Dict[str, Any]]]],
+                          markets: List[MarketBase]):
+        session: Session = self.session
+        for statement, rows in batches:
+            for row in rows:
+                try:
+                    session.execute(statement, row)
+                    session.commit()
+                except SQLAlchemyError:
+                    session.rollback()
+                    self.logger().error(f"Unexpected error while writing {row} to the database.", exc_info=True)
+        for market in markets:
+            try:
+                self.save_market_states(self._config_file_path, market)
+            except SQLAlchemyError:
+                session.rollback()
+                self.logger().error(f"Unexpected error while saving the states of {market.display_name}.",
+                                    exc_info=True)
+
+    def _get_recorded_order_ids(self, order_ids: Set[str]) -> Set[str]:
+        order_id_list: List[str] = list(order_ids)
+        recorded_order_ids: Set[str] = set()
+        for i in range(0, len(order_id_list), self.ID_QUERY_CHUNK_SIZE):
+            chunk: List[str] = order_id_list[i:i + self.ID_QUERY_CHUNK_SIZE]
+            query = select([Order.__table__.c.id]).where(Order.__table__.c.id.in_(chunk))
+            recorded_order_ids.update(row[0] for row in self.session.execute(query))
+        return recorded_order_ids
+
+    def _schedule_flush(self, market: MarketBase):
+        self._pending_markets[id(market)] = market
+        if self._flush_interval <= 0 or self.pending_records_count >= self._flush_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(self._flush_interval, self.flush)
+
+    def _set_order_last_status(self, order_id: str, status: str, timestamp: int):
+        pending_order: Optional[Dict[str, Any]] = self._pending_orders.get(order_id)
+        if pending_order is not None:
+            pending_order["last_status"] = status
+            pending_order["last_update_timestamp"] = timestamp
+        else:
+            self._pending_order_updates[order_id] = {"b_id": order_id,
+                                                     "b_last_status": status,
+                                                     "b_last_update_timestamp": timestamp}
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: MarketBase) -> List[Order]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(Order)
@@ -114,15 +276,16 @@ class MarketsRecorder:
         return query.all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
-        session: Session = self.session
-        query: Query = (session
-                        .query(TradeFill)
-                        .filter(TradeFill.config_file_path == config_file_path)
-                        .order_by(TradeFill.timestamp.desc()))
-        if number_of_rows is None:
-            return query.all()
-        else:
-            return query.limit(number_of_rows).all()
+        self.flush()
+        with self._sql.begin_reporting() as session:
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(TradeFill.config_file_path == config_file_path)
+                            .order_by(TradeFill.timestamp.desc()))
+            if number_of_rows is None:
+                return query.all()
+            else:
+                return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: MarketBase, no_commit: bool = False):
         session: Session = self.session
@@ -149,6 +312,7 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: MarketBase) -> Optional[MarketState]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -165,30 +329,28 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_trading_pair(evt.trading_pair)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_record: Order = Order(id=evt.order_id,
-                                    config_file_path=self._config_file_path,
-                                    strategy=self._strategy_name,
-                                    market=market.display_name,
-                                    symbol=evt.trading_pair,
-                                    base_asset=base_asset,
-                                    quote_asset=quote_asset,
-                                    creation_timestamp=timestamp,
-                                    order_type=evt.type.name,
-                                    amount=float(evt.amount),
-                                    price=float(evt.price) if evt.price == evt.price else 0,
-                                    last_status=event_type.name,
-                                    last_update_timestamp=timestamp)
-        order_status: OrderStatus = OrderStatus(order=order_record,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        self._pending_orders[evt.order_id] = {
+            "id": evt.order_id,
+            "config_file_path": self._config_file_path,
+            "strategy": self._strategy_name,
+            "market": market.display_name,
+            "symbol": evt.trading_pair,
+            "base_asset": base_asset,
+            "quote_asset": quote_asset,
+            "creation_timestamp": timestamp,
+            "order_type": evt.type.name,
+            "amount": float(evt.amount),
+            "price": float(evt.price) if evt.price == evt.price else 0,
+            "last_status": event_type.name,
+            "last_update_timestamp": timestamp
+        }
+        self._pending_order_statuses.append({"order_id": evt.order_id,
+                                             "timestamp": timestamp,
+                                             "status": event_type.name})
+        self._schedule_flush(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -198,41 +360,36 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_trading_pair(evt.trading_pair)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
+        # Update the order record if it exists.
+        self._set_order_last_status(order_id, event_type.name, timestamp)
 
         # Order status and trade fill record should be added even if the order record is not found, because it's
         # possible for fill event to come in before the order created event for market orders.
-        order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
-                                                 strategy=self.strategy_name,
-                                                 market=market.display_name,
-                                                 symbol=evt.trading_pair,
-                                                 base_asset=base_asset,
-                                                 quote_asset=quote_asset,
-                                                 timestamp=timestamp,
-                                                 order_id=order_id,
-                                                 trade_type=evt.trade_type.name,
-                                                 order_type=evt.order_type.name,
-                                                 price=float(evt.price) if evt.price == evt.price else 0,
-                                                 amount=float(evt.amount),
-                                                 trade_fee=TradeFee.to_json(evt.trade_fee),
-                                                 exchange_trade_id=evt.exchange_trade_id)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        self._pending_order_statuses.append({"order_id": order_id,
+                                             "timestamp": timestamp,
+                                             "status": event_type.name})
+        self._pending_trade_fills.append({
+            "config_file_path": self._config_file_path,
+            "strategy": self._strategy_name,
+            "market": market.display_name,
+            "symbol": evt.trading_pair,
+            "base_asset": base_asset,
+            "quote_asset": quote_asset,
+            "timestamp": timestamp,
+            "order_id": order_id,
+            "trade_type": evt.trade_type.name,
+            "order_type": evt.order_type.name,
+            "price": float(evt.price) if evt.price == evt.price else 0,
+            "amount": float(evt.amount),
+            "trade_fee": TradeFee.to_json(evt.trade_fee),
+            "exchange_trade_id": evt.exchange_trade_id
+        })
+        self._schedule_flush(market)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -246,23 +403,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
+        order_status: Dict[str, Any] = {"order_id": order_id,
+                                        "timestamp": timestamp,
+                                        "status": event_type.name}
+
+        # Status updates are only recorded for orders that have been recorded.
+        self._set_order_last_status(order_id, event_type.name, timestamp)
+        if order_id in self._pending_orders:
+            self._pending_order_statuses.append(order_status)
         else:
-            session.rollback()
+            self._pending_conditional_order_statuses.append(order_status)
+        self._schedule_flush(market)
 
     def _did_cancel_order(self,
                           event_tag: int,
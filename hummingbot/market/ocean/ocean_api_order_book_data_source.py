@@ -1,26 +1,31 @@
 #!/usr/bin/env python
 
 import asyncio
-import json
+from functools import partial
 import logging
 import os
 import pandas as pd
 from typing import (
     Any,
-    AsyncIterable,
     Dict,
     List,
     Optional
 )
 import time
-import websockets
-from websockets.exceptions import ConnectionClosed
 
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.utils.websocket_manager import (
+    WebSocketManager,
+    get_websocket_manager
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.ocean.ocean_order_book import OceanOrderBook
 from hummingbot.market.ocean.ocean_client import OceanClient
@@ -28,12 +33,28 @@ from hummingbot.market.ocean.ocean_client import OceanClient
 
 OCEAN_WS_URL = os.environ.get('ocean_websocket_api_base_url',
                               'wss://ws-slanger.oceanex.pro/app/a4931d3a95e48863076c739e9527?protocol=7&version=4.3.1&flash=false&client=js')
+WS_MAX_CHANNELS_PER_CONNECTION = 100
 
 
-class OceanAPIOrderBookDataSource(OrderBookTrackerDataSource):
+def pusher_subscribe_messages(channels: List[str]) -> List[Dict[str, Any]]:
+    return [{"event": "pusher:subscribe", "data": {"channel": channel}} for channel in channels]
+
+
+def pusher_unsubscribe_messages(channels: List[str]) -> List[Dict[str, Any]]:
+    return [{"event": "pusher:unsubscribe", "data": {"channel": channel}} for channel in channels]
+
+
+def pusher_channel(msg: Dict[str, Any]) -> Optional[str]:
+    return msg.get("channel")
+
+
+def pusher_reply(msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if msg.get("event") == "pusher:ping":
+        return {"event": "pusher:pong", "data": {}}
+    return None
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
+
+class OceanAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     _oaobds_logger: Optional[HummingbotLogger] = None
 
@@ -140,87 +161,82 @@ class OceanAPIOrderBookDataSource(OrderBookTrackerDataSource):
         data: Dict[str, Any] = await client.get_order_book(trading_pair, limit)
         return data['data']
 
+    @staticmethod
+    async def get_snapshots(client: OceanClient, trading_pairs: List[str],
+                            limit: int = 2) -> Dict[str, Dict[str, Any]]:
+        '''
+        Snapshots of many trading pairs with one request, by trading pair.
+        '''
+        data: Dict[str, Any] = await client.get_multiple_order_books(trading_pairs, limit)
+        snapshots: List[Dict[str, Any]] = data['data']
+        if all('market' in snapshot for snapshot in snapshots):
+            return {snapshot['market']: snapshot for snapshot in snapshots}
+        if len(snapshots) == len(trading_pairs):
+            # The order books are returned in the order of the request.
+            return dict(zip(trading_pairs, snapshots))
+        return {}
+
+    def _tracker_entry_from_snapshot(self, trading_pair: str, snapshot: Dict[str, Any]) -> OrderBookTrackerEntry:
+        snapshot_timestamp = snapshot['timestamp']
+        snapshot_msg: OrderBookMessage = OceanOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
+
+    async def _get_tracker_entry(self, client: OceanClient, trading_pair: str) -> OrderBookTrackerEntry:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        return self._tracker_entry_from_snapshot(trading_pair, snapshot)
+
+    async def _get_tracker_entries(self, client: OceanClient,
+                                   trading_pairs: List[str]) -> Dict[str, OrderBookTrackerEntry]:
+        snapshots: Dict[str, Dict[str, Any]] = await self.get_snapshots(client, trading_pairs)
+        return {trading_pair: self._tracker_entry_from_snapshot(trading_pair, snapshots[trading_pair])
+                for trading_pair in trading_pairs if trading_pair in snapshots}
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         trading_pairs: List[str] = await self.get_trading_pairs()
-        number_of_pairs: int = len(trading_pairs)
-        trackers: Dict[str, OrderBookTrackerEntry] = {}
         async with OceanClient() as client:
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp = snapshot['timestamp']
-                    snapshot_msg: OrderBookMessage = OceanOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    trackers[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    # stay under rate limit of 3000/min
-                    await asyncio.sleep(1.0)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ",
-                                        exc_info=True)
-                    await asyncio.sleep(1)
-        return trackers
-
-    async def _subscribe_to(self, ws: websockets.WebSocketClientProtocol,
-                            channel: str):
-        subscribe_request: Dict[str, Any] = {
-            "event": "pusher:subscribe",
-            "data": {"channel": channel}
-        }
-        await ws.send(json.dumps(subscribe_request))
-
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    try:
-                        pong_waiter = await ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-                    except asyncio.TimeoutError:
-                        raise
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
-        finally:
-            await ws.close()
+            # OceanClient waits on the shared Ocean rate limiter already. The order books are loaded with the
+            # multiple order books endpoint, and the ones missing from its responses one by one.
+            bootstrap: OrderBookBootstrap = OrderBookBootstrap(
+                partial(self._get_tracker_entry, client),
+                bulk_fetch=partial(self._get_tracker_entries, client),
+                on_entry=self.order_book_ready_callback
+            )
+            return await bootstrap.run(trading_pairs)
+
+    @property
+    def ws_manager(self) -> WebSocketManager:
+        return get_websocket_manager("ocean",
+                                     OCEAN_WS_URL,
+                                     subscribe_messages=pusher_subscribe_messages,
+                                     unsubscribe_messages=pusher_unsubscribe_messages,
+                                     get_channel=pusher_channel,
+                                     reply=pusher_reply,
+                                     max_channels_per_connection=WS_MAX_CHANNELS_PER_CONNECTION)
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with websockets.connect(OCEAN_WS_URL) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    for trading_pair in trading_pairs:
-                        channel = f"market-{trading_pair}-trade-global"
-                        await self._subscribe_to(ws, channel)
-
-                    async for raw_msg in self._inner_messages(ws):
-                        msg: Dict[str, Any] = json.loads(raw_msg)
+                channels: List[str] = [f"market-{trading_pair}-trade-global" for trading_pair in trading_pairs]
+                async with self.ws_manager.subscribe(channels) as subscription:
+                    async for msg in subscription:
                         event_type: str = msg['event']
                         if "trades" == event_type:
                             trading_pair = msg["channel"].split("-")[1]
-                            data = json.loads(msg['data'])
+                            # Pusher sends the event data JSON encoded inside the envelope.
+                            data = fast_json.loads(msg['data'])
                             trades = data['trades']
                             for trade in trades:
                                 trade_message: OrderBookMessage = OceanOrderBook.trade_message_from_exchange(
                                     trade, metadata={"trading_pair": trading_pair}
                                 )
                                 output.put_nowait(trade_message)
-                        elif "pusher:connection_established" == event_type:
-                            pass
                         elif "pusher_internal:subscription_succeeded" == event_type:
                             pass
                         else:
@@ -228,9 +244,9 @@ class OceanAPIOrderBookDataSource(OrderBookTrackerDataSource):
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
+                self.logger().error("Unexpected error processing Ocean trades. Resubscribing after 5 seconds...",
                                     exc_info=True)
-                await asyncio.sleep(30.0)
+                await asyncio.sleep(5.0)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         pass  # no diffs on ocean
@@ -238,54 +254,33 @@ class OceanAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         await self._listen_for_order_book_snapshots_ws(ev_loop, output)
 
+    async def _get_snapshot_message(self, client: OceanClient, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp = snapshot['timestamp']
+        return OceanOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
     async def _listen_for_order_book_snapshots_http(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                async with OceanClient() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp = snapshot['timestamp']
-                            snapshot_msg: OrderBookMessage = OceanOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"trading_pair": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            # stay below rate limit
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        # OceanClient waits on the shared Ocean rate limiter already.
+        async with OceanClient() as client:
+            await self.snapshot_scheduler.run(self.get_trading_pairs,
+                                              partial(self._get_snapshot_message, client),
+                                              output)
 
     async def _listen_for_order_book_snapshots_ws(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with websockets.connect(OCEAN_WS_URL) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    for trading_pair in trading_pairs:
-                        channel = f"market-{trading_pair}-global"
-                        await self._subscribe_to(ws, channel)
-
-                    async for raw_msg in self._inner_messages(ws):
-                        msg: Dict[str, Any] = json.loads(raw_msg)
+                channels: List[str] = [f"market-{trading_pair}-global" for trading_pair in trading_pairs]
+                async with self.ws_manager.subscribe(channels) as subscription:
+                    async for msg in subscription:
                         event_type: str = msg['event']
                         if "update" == event_type:
                             trading_pair = msg["channel"].split("-")[1]
-                            snapshot = json.loads(msg['data'])
+                            snapshot = fast_json.loads(msg['data'])
                             snapshot_timestamp = int(time.time())
                             snapshot_msg: OrderBookMessage = OceanOrderBook.snapshot_message_from_exchange(
                                 snapshot,
@@ -293,8 +288,6 @@ class OceanAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                 metadata={"trading_pair": trading_pair}
                             )
                             output.put_nowait(snapshot_msg)
-                        elif "pusher:connection_established" == event_type:
-                            pass
                         elif "pusher_internal:subscription_succeeded" == event_type:
                             pass
                         else:
@@ -302,6 +295,6 @@ class OceanAPIOrderBookDataSource(OrderBookTrackerDataSource):
             except asyncio.CancelledError:
                 raise
             except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
+                self.logger().error("Unexpected error processing Ocean order books. Resubscribing after 5 seconds...",
                                     exc_info=True)
-                await asyncio.sleep(30.0)
+                await asyncio.sleep(5.0)
@@ -1,16 +1,44 @@
 import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import time
 
-from typing import (Any, Dict, List)
+from typing import (Any, Deque, Dict, List, Optional)
 
 import aiohttp
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 import json
 import jwt
 
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    RateLimit,
+    get_rate_limiter,
+)
+
 
 log_format = '%(asctime)s.%(msecs)03d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s'
 Response = Dict[str, Any]
+# Conservative limit. Breaching the exchange's limit is also handled by retrying in _post().
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
+# Above this many signatures per second, requests are signed on the signing executor instead of the event loop.
+SIGNING_EXECUTOR_RATE = 5
+SIGNING_EXECUTOR_WORKERS = 2
+
+_signing_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_signing_executor() -> ThreadPoolExecutor:
+    global _signing_executor
+    if _signing_executor is None:
+        _signing_executor = ThreadPoolExecutor(max_workers=SIGNING_EXECUTOR_WORKERS,
+                                               thread_name_prefix="ocean-signing")
+    return _signing_executor
 
 
 class OceanException(Exception):
@@ -37,6 +65,8 @@ class OceanClient:
         self._auth: Dict[str, Any] = None
 
         self._rate_limit_breaches: int = 0
+        self._signing_times: Deque[float] = deque(maxlen=SIGNING_EXECUTOR_RATE)
+        self._rate_limiter = get_rate_limiter("ocean", RATE_LIMITS)
 
         self._init_auth(uid, private_key_file)
         self.logger().debug(f"create client: api_base_url={self._api_base_url}")
@@ -74,12 +104,13 @@ class OceanClient:
         self.logger().debug(f"uid={uid} "
                             f" private_key_file={private_key_file}")
 
-        with open(private_key_file) as infile:
+        with open(private_key_file, "rb") as infile:
             private_key = infile.read()
 
+        # Parsing the PEM key is a large part of signing a request, so it's only done once.
         self._auth = {
             "uid": uid,
-            "private_key": private_key
+            "private_key": load_pem_private_key(private_key, password=None, backend=default_backend())
         }
 
     def _encode_request_body(self, body={}):
@@ -100,6 +131,21 @@ class OceanClient:
         }
         return encoded_body
 
+    async def _sign_request_body(self, body={}):
+        '''
+        Signs like _encode_request_body(), on the signing executor when requests are being signed faster than
+        SIGNING_EXECUTOR_RATE per second, so RSA signatures don't hold up the event loop under heavy quoting.
+        '''
+        now: float = time.monotonic()
+        busy: bool = (len(self._signing_times) == SIGNING_EXECUTOR_RATE and
+                      now - self._signing_times[0] < 1.0)
+        self._signing_times.append(now)
+        if not busy:
+            return self._encode_request_body(body)
+        return await asyncio.get_event_loop().run_in_executor(get_signing_executor(),
+                                                              self._encode_request_body,
+                                                              body)
+
     def close(self):
         '''
         Must be called after use to close session.
@@ -115,9 +161,18 @@ class OceanClient:
         url = self._api_base_url + f"/{path}"
         return url
 
+    def _request_priority(self, url: str) -> int:
+        path: str = url[len(self._api_base_url):]
+        if path.startswith("/order/delete") or path == "/orders/clear":
+            return PRIORITY_HIGH
+        if path in ("/orders", "/orders/multi"):
+            return PRIORITY_NORMAL
+        return PRIORITY_LOW
+
     async def _get(self, url: str, params: Dict[str, Any] = None,
                    data = None) -> Response:
         self.logger().debug(f"get url={url} params = {params} data = {data}")
+        await self._rate_limiter.acquire(priority=PRIORITY_LOW)
         async with self._session.get(url, params=params, data=data) as resp:
             if logging.DEBUG == self.logger().getEffectiveLevel():
                 resp_text = await resp.text()
@@ -129,6 +184,7 @@ class OceanClient:
     async def _post_no_retry(self, url: str, params: Dict[str, Any] = None,
                              data = None) -> Response:
         self.logger().debug(f"post url={url} params = {params} data = {data}")
+        await self._rate_limiter.acquire(priority=self._request_priority(url))
         async with self._session.post(url, params=params, data=data) as resp:
             if logging.DEBUG == self.logger().getEffectiveLevel():
                 resp_text = await resp.text()
@@ -295,19 +351,19 @@ class OceanClient:
 
     async def get_key(self):
         url = self._create_api_url('key')
-        body = self._encode_request_body()
+        body = await self._sign_request_body()
         resp = await self._get(url, data=body)
         return resp
 
     async def get_account_info(self):
         url = self._create_api_url('members/me')
-        body = self._encode_request_body()
+        body = await self._sign_request_body()
         resp = await self._get(url, data=body)
         return resp
 
     async def create_order(self, **params):
         url = self._create_api_url('orders')
-        body = self._encode_request_body(params)
+        body = await self._sign_request_body(params)
         resp = await self._post(url, data=body)
         return resp
 
@@ -321,39 +377,39 @@ class OceanClient:
             "market": symbol,
             "orders": orders
         }
-        data = self._encode_request_body(data)
+        data = await self._sign_request_body(data)
         resp = await self._post(url, data=data)
         return resp
 
     async def get_order_status(self, order_ids: List[int]):
         url = self._create_api_url('orders')
         params = {'ids': order_ids}
-        data = self._encode_request_body(params)
+        data = await self._sign_request_body(params)
         resp = await self._get(url, data=data)
         return resp
 
     async def get_order_status_filtered(self, **params):
         url = self._create_api_url('orders/filter')
-        data = self._encode_request_body(params)
+        data = await self._sign_request_body(params)
         resp = await self._get(url, data=data)
         return resp
 
     async def cancel_order(self, order_id: int):
         url = self._create_api_url('order/delete')
         data = {'id': order_id}
-        data = self._encode_request_body(data)
+        data = await self._sign_request_body(data)
         resp = await self._post(url, data=data)
         return resp
 
     async def cancel_multiple_orders(self, order_ids: List[int]):
         url = self._create_api_url('order/delete/multi')
         data = {'ids': order_ids}
-        data = self._encode_request_body(data)
+        data = await self._sign_request_body(data)
         resp = await self._post(url, data=data)
         return resp
 
     async def cancel_all_orders(self):
         url = self._create_api_url('orders/clear')
-        data = self._encode_request_body()
+        data = await self._sign_request_body()
         resp = await self._post(url, data=data)
         return resp
@@ -11,6 +11,7 @@ cdef class OceanMarket(MarketBase):
         object _data_source_type
         object _ev_loop
         object _ocean_client
+        object _order_batcher
         dict _in_flight_orders
         double _last_poll_timestamp
         double _last_timestamp
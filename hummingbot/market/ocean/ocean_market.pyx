@@ -60,7 +60,11 @@ from hummingbot.market.market_base import (
     MarketBase,
     NaN,
     s_decimal_NaN)
-from hummingbot.market.ocean.ocean_client import OceanClient
+from hummingbot.market.ocean.ocean_client import (
+    OceanClient,
+    OceanException
+)
+from hummingbot.market.ocean.ocean_order_batcher import OceanOrderBatcher
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 
@@ -95,6 +99,8 @@ cdef class OceanMarket(MarketBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    OPEN_ORDERS_PAGE_LIMIT = 100
+    ORDER_STATUS_CHUNK_SIZE = 50
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -119,6 +125,7 @@ cdef class OceanMarket(MarketBase):
         self._ev_loop = asyncio.get_event_loop()
         self._ocean_client = OceanClient(ocean_uid,
                                          ocean_private_key_file)
+        self._order_batcher = OceanOrderBatcher(self._ocean_client)
         self._in_flight_orders = {}
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
@@ -387,35 +394,107 @@ cdef class OceanMarket(MarketBase):
             msg = f"inflight order: {key}: {repr(order)}"
             self.logger().info(msg)
 
-    async def _update_order_status_now(self):
-        tracked_orders = list(self._in_flight_orders.values())
-        tracked_exch_order_ids = [await x.get_exchange_order_id()
-                                  for x in tracked_orders]
-        response = await self._ocean_client.get_order_status(tracked_exch_order_ids)
+    async def _get_open_order_updates(self, trading_pair: str) -> Optional[Dict[int, Dict[str, Any]]]:
+        '''
+        Open orders of a market by exchange order id, or None if they couldn't be fetched.
+        '''
+        order_updates: Dict[int, Dict[str, Any]] = {}
+        page: int = 1
+        while True:
+            response = await self._ocean_client.get_order_status_filtered(market=trading_pair,
+                                                                          states=["wait"],
+                                                                          limit=self.OPEN_ORDERS_PAGE_LIMIT,
+                                                                          page=page)
+            if 0 != response['code']:
+                self.logger().error(f"ocean failed to get open orders: "
+                                    f"code={response['code']}, message={response['message']}, "
+                                    f"market={trading_pair}")
+                return None
+            entries: List[Dict[str, Any]] = self._order_entries(response['data'])
+            order_updates.update((entry['id'], entry) for entry in entries)
+            if len(entries) < self.OPEN_ORDERS_PAGE_LIMIT:
+                return order_updates
+            page += 1
+
+    async def _get_order_updates(self, exch_order_ids: List[int]) -> Optional[Dict[int, Dict[str, Any]]]:
+        '''
+        Orders by exchange order id, or None if they couldn't be fetched.
+        '''
+        response = await self._ocean_client.get_order_status(exch_order_ids)
         if 0 != response['code']:
             self.logger().error(f"ocean failed to get order status: "
                                 f"code={response['code']}, message={response['message']}, "
-                                f"exch_order_ids={tracked_exch_order_ids}")
-            return
+                                f"exch_order_ids={exch_order_ids}")
+            return None
+        return {entry['id']: entry for entry in self._order_entries(response['data'])}
+
+    @staticmethod
+    def _order_entries(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # The filtered query groups orders by market.
+        if len(data) > 0 and 'orders' in data[0]:
+            return [entry for group in data for entry in group['orders']]
+        return data
+
+    @staticmethod
+    def _is_order_update_new(order: OceanInFlightOrder, order_update: Dict[str, Any]) -> bool:
+        return (order_update["state"] != order.last_state or
+                Decimal(order_update["executed_volume"]) != order.executed_amount_base)
 
-        order_updates: [Int, Any] = {entry['id']: entry for entry in response['data']}
-        for tracked_order in tracked_orders:
-            exch_order_id = await tracked_order.get_exchange_order_id()
-            client_order_id = tracked_order.client_order_id
-            order_update = order_updates.get(int(exch_order_id))
-            # order missing from exchange
-            if order_update is None:
-                self.c_stop_tracking_order(client_order_id)
+    async def _update_order_status_now(self):
+        '''
+        Most tracked orders are open and unchanged between polls. The open orders of each market are fetched with one
+        filtered query, and only the tracked orders that are no longer open are fetched by id, in chunks. Only orders
+        whose state or executed amount changed are updated.
+        '''
+        tracked_orders: Dict[int, OceanInFlightOrder] = {}
+        for order in list(self._in_flight_orders.values()):
+            if order.exchange_order_id is not None:
+                tracked_orders[int(order.exchange_order_id)] = order
+                continue
+            # Orders are only tracked once the exchange has returned their id, so these come from a bad saved state.
+            # Their status can't be fetched, nor can they be cancelled.
+            self.c_stop_tracking_order(order.client_order_id)
+            self.c_trigger_event(
+                self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                MarketOrderFailureEvent(self._current_timestamp,
+                                        order.client_order_id,
+                                        order.order_type)
+            )
+            self.logger().warning(f"stop tracking order without an exchange order id "
+                                  f"{repr(order)}")
+        trading_pairs: List[str] = list({order.trading_pair for order in tracked_orders.values()})
+        order_updates: Dict[int, Dict[str, Any]] = {}
+        for updates in await safe_gather(*[self._get_open_order_updates(trading_pair)
+                                           for trading_pair in trading_pairs]):
+            if updates is not None:
+                order_updates.update(updates)
+        # Tracked orders that are no longer open were filled or cancelled since the last poll, or are of a market whose
+        # open orders couldn't be fetched.
+        unknown_exch_order_ids: List[int] = [exch_order_id for exch_order_id in tracked_orders.keys()
+                                             if exch_order_id not in order_updates]
+        chunks: List[List[int]] = [unknown_exch_order_ids[i:i + self.ORDER_STATUS_CHUNK_SIZE]
+                                   for i in range(0, len(unknown_exch_order_ids), self.ORDER_STATUS_CHUNK_SIZE)]
+        fetched_exch_order_ids: List[int] = []
+        for chunk, updates in zip(chunks, await safe_gather(*[self._get_order_updates(chunk) for chunk in chunks])):
+            if updates is not None:
+                order_updates.update(updates)
+                fetched_exch_order_ids.extend(chunk)
+
+        for exch_order_id in fetched_exch_order_ids:
+            if exch_order_id not in order_updates:
+                tracked_order = tracked_orders[exch_order_id]
+                self.c_stop_tracking_order(tracked_order.client_order_id)
                 self.c_trigger_event(
                     self.MARKET_ORDER_FAILURE_EVENT_TAG,
                     MarketOrderFailureEvent(self._current_timestamp,
-                                            client_order_id,
+                                            tracked_order.client_order_id,
                                             tracked_order.order_type)
                 )
                 self.logger().warning(f"stop tracking order not in exchange "
                                       f"{repr(tracked_order)}")
-                continue
-            else:
+        for exch_order_id, tracked_order in tracked_orders.items():
+            order_update = order_updates.get(exch_order_id)
+            if order_update is not None and self._is_order_update_new(tracked_order, order_update):
                 await self._update_an_order_status(tracked_order, order_update)
 
     ORDER_STATES = ('wait', 'done', 'cancelling', 'cancel')
@@ -439,7 +518,7 @@ cdef class OceanMarket(MarketBase):
             order.executed_amount_base = new_confirmed_amount
             execute_price = Decimal(order_update["avg_price"])
             order.executed_amount_quote = new_confirmed_amount * execute_price
-            exch_order_id = await order.get_exchange_order_id()
+            exch_order_id = order.exchange_order_id
 
             tradefee: TradeFee = self.c_get_fee(
                 order.base_asset, order.quote_asset, order.order_type,
@@ -554,24 +633,23 @@ cdef class OceanMarket(MarketBase):
         '''
         :return: exchange order id
         '''
-        path_url = "orders"
         side = "buy" if is_buy else "sell"
         order_type_str = "limit" if order_type is OrderType.LIMIT else "market"
         params = {
-            "market": trading_pair,
             "side": side,
             "volume": f"{amount:f}",
             "ord_type": order_type_str
         }
         if order_type is OrderType.LIMIT:
             params["price"] = f"{price:f}"
-        resp = await self._ocean_client.create_order(**params)
-        if 0 != resp['code']:
-            self.logger().error(f"ocean failed to create order: "
-                                f"code={resp['code']}, message={resp['message']}")
+        # Orders placed within a few milliseconds of each other on a market are sent in one request.
+        try:
+            data = await self._order_batcher.create_order(trading_pair, params)
+        except OceanException as e:
+            self.logger().error(f"ocean failed to create order: {e}")
             raise Exception('create order failed')
 
-        order_id = str(resp['data']['id'])
+        order_id = str(data['id'])
         return order_id
 
     async def execute_buy(self,
@@ -724,14 +802,14 @@ cdef class OceanMarket(MarketBase):
                 raise ValueError(f"Failed to cancel order {order_id}. Order not found.")
 
             exch_order_id = int(tracked_order.exchange_order_id)
-            response: Dict[str, Any] = await self._ocean_client.cancel_order(exch_order_id)
-            if 0 != response['code']:
-                self.logger().error(f"ocean failed to cancel order: "
-                                    f"code={response['code']}, message={response['message']}, "
+            # Orders cancelled within a few milliseconds of each other are cancelled in one request.
+            try:
+                data = await self._order_batcher.cancel_order(exch_order_id)
+            except OceanException as e:
+                self.logger().error(f"ocean failed to cancel order: {e}, "
                                     f"order_id={order_id}, exch_order_id={exch_order_id}")
                 return
 
-            data = response['data']
             if data['state'] in OceanMarket.ORDER_CANCELLED_STATES:
                 self.logger().info(f"Successfully cancelled order: "
                                    f"order_id={order_id} exch_order_id={exch_order_id}.")
@@ -741,7 +819,7 @@ cdef class OceanMarket(MarketBase):
             else:
                 self.logger().error(
                     f"ocean failed to cancel order: order_id={order_id} "
-                    f"exch_order_id={exch_order_id} response={response}"
+                    f"exch_order_id={exch_order_id} response={data}"
                 )
 
         except Exception as e:
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.ocean.ocean_client import (
+    OceanClient,
+    OceanException
+)
+
+PendingCreate = Tuple[Dict[str, Any], asyncio.Future]
+PendingCancel = Tuple[int, asyncio.Future]
+
+
+class OceanOrderBatcher:
+    '''
+    Groups the orders created, and the orders cancelled, within a short window into one request each. Creates are
+    grouped per market, as orders/multi is for one market. Each caller gets its own order back, as returned by the
+    exchange.
+    '''
+    BATCH_WINDOW = 0.005
+    MAX_BATCH_SIZE = 50
+
+    _oob_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._oob_logger is None:
+            cls._oob_logger = logging.getLogger(__name__)
+        return cls._oob_logger
+
+    def __init__(self,
+                 ocean_client: OceanClient,
+                 batch_window: float = BATCH_WINDOW,
+                 max_batch_size: int = MAX_BATCH_SIZE):
+        self._ocean_client: OceanClient = ocean_client
+        self._batch_window: float = batch_window
+        self._max_batch_size: int = max_batch_size
+        self._pending_creates: Dict[str, List[PendingCreate]] = {}
+        self._pending_cancels: List[PendingCancel] = []
+        self._create_request_count: int = 0
+        self._cancel_request_count: int = 0
+
+    @property
+    def create_request_count(self) -> int:
+        return self._create_request_count
+
+    @property
+    def cancel_request_count(self) -> int:
+        return self._cancel_request_count
+
+    async def create_order(self, market: str, order: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        :param order: order parameters except the market
+        :return: the created order
+        '''
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        pending: List[PendingCreate] = self._pending_creates.setdefault(market, [])
+        pending.append((order, future))
+        if len(pending) >= self._max_batch_size:
+            self._flush_creates(market)
+        elif len(pending) == 1:
+            asyncio.get_event_loop().call_later(self._batch_window, self._flush_creates, market)
+        return await future
+
+    async def cancel_order(self, exch_order_id: int) -> Dict[str, Any]:
+        '''
+        :return: the order as cancelled
+        '''
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._pending_cancels.append((exch_order_id, future))
+        if len(self._pending_cancels) >= self._max_batch_size:
+            self._flush_cancels()
+        elif len(self._pending_cancels) == 1:
+            asyncio.get_event_loop().call_later(self._batch_window, self._flush_cancels)
+        return await future
+
+    def _flush_creates(self, market: str):
+        batch: List[PendingCreate] = self._pending_creates.pop(market, [])
+        if len(batch) > 0:
+            safe_ensure_future(self._send_creates(market, batch))
+
+    def _flush_cancels(self):
+        batch: List[PendingCancel] = self._pending_cancels
+        self._pending_cancels = []
+        if len(batch) > 0:
+            safe_ensure_future(self._send_cancels(batch))
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Optional[Dict[str, Any]], error: str):
+        if future.done():
+            return
+        if result is None:
+            future.set_exception(OceanException(error))
+        else:
+            future.set_result(result)
+
+    @staticmethod
+    def _fail(futures: List[asyncio.Future], e: BaseException):
+        for future in futures:
+            if not future.done():
+                future.set_exception(e)
+
+    async def _send_creates(self, market: str, batch: List[PendingCreate]):
+        futures: List[asyncio.Future] = [future for _, future in batch]
+        try:
+            self._create_request_count += 1
+            if len(batch) == 1:
+                response: Dict[str, Any] = await self._ocean_client.create_order(market=market, **batch[0][0])
+            else:
+                response: Dict[str, Any] = await self._ocean_client.create_multiple_orders(
+                    market, [order for order, _ in batch])
+            if 0 != response['code']:
+                raise OceanException(f"create order failed: code={response['code']}, "
+                                     f"message={response['message']}, market={market}")
+            # The created orders are in the order they were requested.
+            entries: List[Dict[str, Any]] = [response['data']] if len(batch) == 1 else response['data']
+            for i, future in enumerate(futures):
+                entry: Optional[Dict[str, Any]] = entries[i] if i < len(entries) else None
+                self._resolve(future,
+                              entry if entry is not None and entry.get('id') is not None else None,
+                              f"create order failed: market={market}, response={entry}")
+        except asyncio.CancelledError:
+            self._fail(futures, asyncio.CancelledError())
+            raise
+        except Exception as e:
+            self._fail(futures, e)
+
+    async def _send_cancels(self, batch: List[PendingCancel]):
+        futures: List[asyncio.Future] = [future for _, future in batch]
+        try:
+            self._cancel_request_count += 1
+            if len(batch) == 1:
+                response: Dict[str, Any] = await self._ocean_client.cancel_order(batch[0][0])
+            else:
+                response: Dict[str, Any] = await self._ocean_client.cancel_multiple_orders(
+                    [exch_order_id for exch_order_id, _ in batch])
+            if 0 != response['code']:
+                raise OceanException(f"cancel order failed: code={response['code']}, "
+                                     f"message={response['message']}")
+            entries_by_id: Dict[int, Dict[str, Any]] = (
+                {int(batch[0][0]): response['data']} if len(batch) == 1 else
+                {int(entry['id']): entry for entry in response['data']}
+            )
+            for exch_order_id, future in batch:
+                self._resolve(future,
+                              entries_by_id.get(int(exch_order_id)),
+                              f"cancel order failed: exch_order_id={exch_order_id} missing from response")
+        except asyncio.CancelledError:
+            self._fail(futures, asyncio.CancelledError())
+            raise
+        except Exception as e:
+            self._fail(futures, e)
@@ -64,8 +64,12 @@ class OceanOrderBookTracker(OrderBookTracker):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.SNAPSHOT:
-                    order_book.apply_snapshot(message.bids, message.asks, message.update_id)
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
+                    # Each websocket update is a full depth snapshot. Only the levels that changed are applied.
+                    changes: int = order_book.apply_snapshot_levels(message.content["bids"],
+                                                                    message.content["asks"],
+                                                                    message.update_id)
+                    self.logger().debug("Processed order book snapshot for %s, %d levels changed.",
+                                        trading_pair, changes)
             except asyncio.CancelledError:
                 raise
             except Exception:
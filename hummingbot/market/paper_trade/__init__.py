@@ -1,55 +1,31 @@
 from typing import List
 
-from hummingbot.market.bamboo_relay.bamboo_relay_order_book_tracker import BambooRelayOrderBookTracker
-from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
-from hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker import CoinbaseProOrderBookTracker
-from hummingbot.market.huobi.huobi_market import HuobiMarket
-from hummingbot.market.huobi.huobi_order_book_tracker import HuobiOrderBookTracker
+from hummingbot.market.connector_registry import (
+    MARKET_CLASS_PATHS,
+    ORDER_BOOK_TRACKER_CLASS_PATHS,
+    LazyClassRegistry,
+)
 from hummingbot.market.paper_trade.market_config import MarketConfig
 from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
-from hummingbot.market.radar_relay.radar_relay_market import RadarRelayMarket
-from hummingbot.market.radar_relay.radar_relay_order_book_tracker import RadarRelayOrderBookTracker
-from hummingbot.market.dolomite.dolomite_order_book_tracker import DolomiteOrderBookTracker
-from hummingbot.market.dolomite.dolomite_market import DolomiteMarket
 
-from hummingbot.market.bamboo_relay.bamboo_relay_market import BambooRelayMarket
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
-
-from hummingbot.market.bittrex.bittrex_market import BittrexOrderBookTracker, BittrexMarket
-from hummingbot.market.bitcoin_com.bitcoin_com_market import BitcoinComOrderBookTracker, BitcoinComMarket
-from hummingbot.market.liquid.liquid_market import LiquidOrderBookTracker, LiquidMarket
-from hummingbot.market.kucoin.kucoin_market import KucoinOrderBookTracker, KucoinMarket
-from hummingbot.market.kraken.kraken_market import KrakenOrderBookTracker, KrakenMarket
-
-ORDER_BOOK_TRACKER_CLASS = {
-    "binance": BinanceOrderBookTracker,
-    "coinbase_pro": CoinbaseProOrderBookTracker,
-    "bamboo_relay": BambooRelayOrderBookTracker,
-    "radar_relay": RadarRelayOrderBookTracker,
-    "huobi": HuobiOrderBookTracker,
-    "bittrex": BittrexOrderBookTracker,
-    "dolomite": DolomiteOrderBookTracker,
-    "bitcoin_com": BitcoinComOrderBookTracker,
-    "liquid": LiquidOrderBookTracker,
-    "kucoin": KucoinOrderBookTracker,
-    "kraken": KrakenOrderBookTracker
-}
-
-
-MARKET_CLASSES = {
-    "binance": BinanceMarket,
-    "coinbase_pro": CoinbaseProMarket,
-    "bamboo_relay": BambooRelayMarket,
-    "radar_relay": RadarRelayMarket,
-    "huobi": HuobiMarket,
-    "bittrex": BittrexMarket,
-    "dolomite": DolomiteMarket,
-    "bitcoin_com": BitcoinComMarket,
-    "liquid": LiquidMarket,
-    "kucoin": KucoinMarket,
-    "kraken": KrakenMarket
-}
+PAPER_TRADE_EXCHANGES = [
+    "binance",
+    "coinbase_pro",
+    "bamboo_relay",
+    "radar_relay",
+    "huobi",
+    "bittrex",
+    "dolomite",
+    "bitcoin_com",
+    "liquid",
+    "kucoin",
+    "kraken"
+]
+
+ORDER_BOOK_TRACKER_CLASS = LazyClassRegistry({name: ORDER_BOOK_TRACKER_CLASS_PATHS[name]
+                                              for name in PAPER_TRADE_EXCHANGES})
+
+MARKET_CLASSES = LazyClassRegistry({name: MARKET_CLASS_PATHS[name] for name in PAPER_TRADE_EXCHANGES})
 
 
 def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
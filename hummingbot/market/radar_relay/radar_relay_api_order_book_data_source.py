@@ -21,7 +21,10 @@ from hummingbot.market.radar_relay.radar_relay_order_book import RadarRelayOrder
 from hummingbot.market.radar_relay.radar_relay_active_order_tracker import RadarRelayActiveOrderTracker
 from hummingbot.market.radar_relay.radar_relay_order_book_message import RadarRelayOrderBookMessage
 from hummingbot.market.radar_relay.radar_relay_order_book_tracker_entry import RadarRelayOrderBookTrackerEntry
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    fast_json
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
@@ -203,7 +206,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(ujson.dumps(request))
                     async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
+                        msg = fast_json.loads(raw_msg)
                         # Valid Diff messages from RadarRelay have action key
                         if "action" in msg:
                             diff_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.diff_message_from_exchange(
@@ -216,36 +219,15 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await asyncio.sleep(30.0)
 
+    async def _get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        client: aiohttp.ClientSession = self.http_client()
+        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+        snapshot_timestamp: float = time.time()
+        return RadarRelayOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                trading_pairs: List[str] = await self.get_trading_pairs()
-                client: aiohttp.ClientSession = self.http_client()
-                for trading_pair in trading_pairs:
-                    try:
-                        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                        snapshot_timestamp: float = time.time()
-                        snapshot_msg: OrderBookMessage = RadarRelayOrderBook.snapshot_message_from_exchange(
-                            snapshot,
-                            snapshot_timestamp,
-                            metadata={"trading_pair": trading_pair}
-                        )
-                        output.put_nowait(snapshot_msg)
-                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-
-                        await asyncio.sleep(5.0)
-
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception:
-                        self.logger().error("Unexpected error.", exc_info=True)
-                        await asyncio.sleep(5.0)
-                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                delta: float = next_hour.timestamp() - time.time()
-                await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        await self.snapshot_scheduler.run(self.get_trading_pairs, self._get_snapshot_message, output)
@@ -21,6 +21,7 @@ cdef class RadarRelayMarket(MarketBase):
         dict _in_flight_market_orders
         object _order_expiry_queue
         TransactionTracker _tx_tracker
+        object _rate_limiter
         object _w3
         object _exchange
         dict _withdraw_rules
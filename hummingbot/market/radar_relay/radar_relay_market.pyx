@@ -41,6 +41,11 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    get_rate_limiter,
+    http_method_priority,
+)
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
@@ -64,6 +69,8 @@ from hummingbot.core.utils.estimate_fee import estimate_fee
 
 rrm_logger = None
 s_decimal_0 = Decimal(0)
+# Conservative limit, shared by public and private requests.
+RATE_LIMITS = [RateLimit("requests", 10, 1.0)]
 
 ZERO_EX_MAINNET_ERC20_PROXY = "0x95E6F48254609A6ee006F7D493c8e5fB97094ceF"
 ZERO_EX_MAINNET_EXCHANGE_ADDRESS = "0x61935CbDd02287B511119DDb11Aeb42F1593b7Ef"
@@ -133,6 +140,7 @@ cdef class RadarRelayMarket(MarketBase):
         self._in_flight_market_orders = {}  # market orders are on chain
         self._order_expiry_queue = deque()
         self._tx_tracker = RadarRelayTransactionTracker(self)
+        self._rate_limiter = get_rate_limiter(self.name, RATE_LIMITS)
         self._w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         self._provider = Web3.HTTPProvider(ethereum_rpc_url)
         self._withdraw_rules = {}
@@ -596,6 +604,7 @@ cdef class RadarRelayMarket(MarketBase):
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None,
                            json: int = 0) -> Dict[str, Any]:
+        await self._rate_limiter.acquire(priority=http_method_priority(http_method))
         async with aiohttp.ClientSession() as client:
             async with (
                     client.request(http_method,
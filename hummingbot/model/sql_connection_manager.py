@@ -3,8 +3,10 @@
 from enum import Enum
 import logging
 from os.path import join
+import sqlite3
 from sqlalchemy import (
     create_engine,
+    event,
     inspect,
     MetaData,
 )
@@ -15,6 +17,7 @@ from sqlalchemy.orm import (
     Session,
     Query
 )
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 from typing import Optional
 from hummingbot.client.config.global_config_map import global_config_map
@@ -49,6 +52,9 @@ class SQLConnectionManager:
     LOCAL_DB_VERSION_KEY = "local_db_version"
     LOCAL_DB_VERSION_VALUE = "20190614"
 
+    # Maximum number of pooled read-only connections used by reporting queries on SQLite.
+    SQLITE_REPORTING_POOL_SIZE = 2
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._scm_logger is None:
@@ -66,8 +72,8 @@ class SQLConnectionManager:
         return cls._scm_trade_fills_instance
 
     @classmethod
-    def get_db_engine(cls, 
-                      dialect: str, 
+    def get_db_engine(cls,
+                      dialect: str,
                       params: dict) -> Engine:
         # Fallback to `sqlite` if dialect is None
         if dialect is None:
@@ -76,7 +82,16 @@ class SQLConnectionManager:
         if "sqlite" in dialect:
             db_path = params.get("db_path")
 
-            return create_engine(f"{dialect}:///{db_path}")
+            if not params.get("sqlite_performance_profile"):
+                return create_engine(f"{dialect}:///{db_path}")
+
+            engine: Engine = create_engine(f"{dialect}:///{db_path}",
+                                           connect_args={
+                                               "cached_statements": params.get("sqlite_statement_cache_size"),
+                                               "check_same_thread": False
+                                           })
+            cls.apply_sqlite_performance_profile(engine, params, journal_mode="WAL")
+            return engine
         else:
             username = params.get("db_username")
             password = params.get("db_password")
@@ -86,6 +101,47 @@ class SQLConnectionManager:
 
             return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}")
 
+    @classmethod
+    def get_sqlite_reporting_engine(cls, params: dict) -> Engine:
+        """
+        Creates a read-only engine over the same SQLite file. In WAL mode, readers on these connections work on a
+        snapshot of the database and never block, nor get blocked by, the writer connection used by the recorder.
+        """
+        db_path: str = params.get("db_path")
+        cached_statements: int = params.get("sqlite_statement_cache_size")
+
+        def connect() -> sqlite3.Connection:
+            return sqlite3.connect(f"file:{db_path}?mode=ro",
+                                   uri=True,
+                                   cached_statements=cached_statements,
+                                   check_same_thread=False)
+
+        engine: Engine = create_engine("sqlite://",
+                                       creator=connect,
+                                       poolclass=QueuePool,
+                                       pool_size=cls.SQLITE_REPORTING_POOL_SIZE,
+                                       max_overflow=0)
+        cls.apply_sqlite_performance_profile(engine, params)
+        return engine
+
+    @classmethod
+    def apply_sqlite_performance_profile(cls,
+                                         engine: Engine,
+                                         params: dict,
+                                         journal_mode: Optional[str] = None):
+        cache_size: int = params.get("sqlite_cache_size")
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragma(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            if journal_mode is not None:
+                cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            # Negative values are interpreted by SQLite as KiB, rather than as a number of pages.
+            cursor.execute(f"PRAGMA cache_size=-{cache_size}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.close()
+
     def __init__(self,
                  connection_type: SQLConnectionType,
                  db_path: Optional[str] = None):
@@ -99,7 +155,10 @@ class SQLConnectionManager:
             "db_username": global_config_map.get("db_username").value,
             "db_password": global_config_map.get("db_password").value,
             "db_name": global_config_map.get("db_name").value,
-            "db_path": db_path
+            "db_path": db_path,
+            "sqlite_performance_profile": global_config_map.get("db_sqlite_performance_profile").value,
+            "sqlite_cache_size": global_config_map.get("db_sqlite_cache_size").value,
+            "sqlite_statement_cache_size": global_config_map.get("db_sqlite_statement_cache_size").value
         }
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
@@ -127,6 +186,13 @@ class SQLConnectionManager:
         self._session_cls = sessionmaker(bind=self._engine)
         self._shared_session: Session = self._session_cls()
 
+        # Reporting queries (e.g. `history`, `export_trades`) get their own connections, so they don't hold up writes
+        # made through the shared session. Objects loaded through them stay usable after the read transaction ends.
+        self._reporting_engine: Engine = self._engine
+        if self._engine.dialect.name == "sqlite" and engine_options.get("sqlite_performance_profile"):
+            self._reporting_engine = self.get_sqlite_reporting_engine(engine_options)
+        self._reporting_session_cls = sessionmaker(bind=self._reporting_engine, expire_on_commit=False)
+
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self.check_and_upgrade_trade_fills_db()
 
@@ -134,6 +200,10 @@ class SQLConnectionManager:
     def engine(self) -> Engine:
         return self._engine
 
+    @property
+    def reporting_engine(self) -> Engine:
+        return self._reporting_engine
+
     def get_shared_session(self) -> Session:
         return self._shared_session
 
@@ -163,3 +233,6 @@ class SQLConnectionManager:
 
     def begin(self) -> SQLSessionWrapper:
         return SQLSessionWrapper(self._session_cls())
+
+    def begin_reporting(self) -> SQLSessionWrapper:
+        return SQLSessionWrapper(self._reporting_session_cls())
@@ -0,0 +1,244 @@
+from bisect import bisect_left, insort
+from collections import deque
+from decimal import Decimal
+from fractions import Fraction
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+# Enough for a day of mid prices at one tick per second.
+DEFAULT_CAPACITY = 86400
+
+
+def _is_finite(value: Any) -> bool:
+    if isinstance(value, Decimal):
+        return value.is_finite()
+    return value == value and value not in (float("inf"), float("-inf"))
+
+
+def _convert(value: Fraction, sample_type: type) -> Any:
+    """
+    Converts an exact result back to the type of the samples, the same way the statistics module does.
+    """
+    if sample_type is Decimal:
+        return Decimal(value.numerator) / Decimal(value.denominator)
+    if sample_type is int:
+        return value.numerator if value.denominator == 1 else float(value)
+    return sample_type(value)
+
+
+class StridedRollingStats:
+    """
+    Rolling mean and median of the last `length` values taken every `interval` indices, ending at the latest index.
+
+    Values at indices with the same remainder modulo `interval` form one window, so each new value updates exactly one
+    window: O(1) for the mean, which is kept as an exact sum, and O(length) memmove for the median's sorted list.
+    """
+    def __init__(self, interval: int, length: int):
+        self._interval: int = interval
+        self._length: int = length
+        self._windows: List[Deque[Any]] = [deque() for _ in range(interval)]
+        self._sorted_windows: List[List[Any]] = [[] for _ in range(interval)]
+        self._sums: List[Fraction] = [Fraction(0)] * interval
+        self._non_finite_counts: List[int] = [0] * interval
+        self._sample_type: Optional[type] = None
+        self._last_index: int = -1
+
+    def add(self, index: int, value: Any):
+        phase: int = index % self._interval
+        window: Deque[Any] = self._windows[phase]
+        self._last_index = index
+        self._sample_type = type(value)
+        window.append(value)
+        self._add_to_stats(phase, value, 1)
+        if len(window) > self._length:
+            self._add_to_stats(phase, window.popleft(), -1)
+
+    def skip(self, index: int):
+        """
+        Marks the latest index as having no value, e.g. a price change without a previous price.
+        """
+        phase: int = index % self._interval
+        self._last_index = index
+        self._windows[phase].clear()
+        self._sorted_windows[phase].clear()
+        self._sums[phase] = Fraction(0)
+        self._non_finite_counts[phase] = 0
+
+    def _add_to_stats(self, phase: int, value: Any, sign: int):
+        if not _is_finite(value):
+            self._non_finite_counts[phase] += sign
+            return
+        sorted_window: List[Any] = self._sorted_windows[phase]
+        if sign > 0:
+            insort(sorted_window, value)
+        else:
+            del sorted_window[bisect_left(sorted_window, value)]
+        self._sums[phase] += sign * Fraction(value)
+
+    def _current_phase(self) -> Optional[int]:
+        if self._last_index < 0:
+            return None
+        phase: int = self._last_index % self._interval
+        if len(self._windows[phase]) < self._length or self._non_finite_counts[phase] > 0:
+            return None
+        return phase
+
+    def mean(self) -> Optional[Any]:
+        phase: Optional[int] = self._current_phase()
+        if phase is None:
+            return None
+        return _convert(self._sums[phase] / self._length, self._sample_type)
+
+    def median(self) -> Optional[Any]:
+        phase: Optional[int] = self._current_phase()
+        if phase is None:
+            return None
+        sorted_window: List[Any] = self._sorted_windows[phase]
+        middle: int = self._length // 2
+        if self._length % 2 == 1:
+            return sorted_window[middle]
+        return (sorted_window[middle - 1] + sorted_window[middle]) / 2
+
+
+class PriceHistory:
+    """
+    Ring buffer of the last `capacity` prices, oldest first.
+
+    Prices are kept in a NumPy object array of twice the capacity, with each price written at both of its positions,
+    so that the retained history, and every strided sample of it, is a view of one contiguous slice. Rolling statistics
+    are kept per (interval, length) from their first use on, and updated as prices are appended.
+    """
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, prices: Iterable[Any] = ()):
+        self._capacity: int = capacity
+        self._buffer: np.ndarray = np.empty(capacity * 2, dtype=object)
+        self._count: int = 0
+        self._total_count: int = 0
+        self._price_stats: Dict[Tuple[int, int], StridedRollingStats] = {}
+        self._change_stats: Dict[Tuple[int, int], StridedRollingStats] = {}
+        self.extend(prices)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total_count(self) -> int:
+        """
+        The number of prices appended so far, including the ones dropped from the history.
+        """
+        return self._total_count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.view())
+
+    def __getitem__(self, key):
+        return self.view()[key]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.view())})"
+
+    def view(self) -> np.ndarray:
+        start: int = (self._total_count - self._count) % self._capacity
+        return self._buffer[start:start + self._count]
+
+    def samples(self, interval: int, length: int) -> Optional[np.ndarray]:
+        """
+        Returns a view of `length` prices taken every `interval` prices, ending at the latest price, or None if the
+        history isn't long enough.
+        """
+        end: int = (self._total_count - self._count) % self._capacity + self._count
+        start: int = end - 1 - (length - 1) * interval
+        if length < 1 or start < end - self._count:
+            return None
+        return self._buffer[start:end:interval]
+
+    def append(self, price: Any):
+        index: int = self._total_count
+        position: int = index % self._capacity
+        self._buffer[position] = price
+        self._buffer[position + self._capacity] = price
+        self._count = min(self._count + 1, self._capacity)
+        self._total_count += 1
+        for stats in self._price_stats.values():
+            stats.add(index, price)
+        for (interval, _), stats in self._change_stats.items():
+            self._add_change(stats, index, interval)
+
+    def extend(self, prices: Iterable[Any]):
+        for price in prices:
+            self.append(price)
+
+    def _price_at(self, index: int) -> Optional[Any]:
+        if index < self._total_count - self._count or index >= self._total_count:
+            return None
+        return self._buffer[index % self._capacity]
+
+    def _add_change(self, stats: StridedRollingStats, index: int, interval: int):
+        previous: Optional[Any] = self._price_at(index - interval)
+        if previous is None or previous == 0:
+            stats.skip(index)
+        else:
+            stats.add(index, abs(self._price_at(index) - previous) / previous)
+
+    def _get_price_stats(self, interval: int, length: int) -> StridedRollingStats:
+        key: Tuple[int, int] = (interval, length)
+        if key not in self._price_stats:
+            stats: StridedRollingStats = StridedRollingStats(interval, length)
+            for index in range(self._total_count - self._count, self._total_count):
+                stats.add(index, self._price_at(index))
+            self._price_stats[key] = stats
+        return self._price_stats[key]
+
+    def _get_change_stats(self, interval: int, length: int) -> StridedRollingStats:
+        key: Tuple[int, int] = (interval, length)
+        if key not in self._change_stats:
+            stats: StridedRollingStats = StridedRollingStats(interval, length)
+            for index in range(self._total_count - self._count, self._total_count):
+                self._add_change(stats, index, interval)
+            self._change_stats[key] = stats
+        return self._change_stats[key]
+
+    def _is_kept(self, interval: int, length: int) -> bool:
+        """
+        Whether `length` prices taken every `interval` prices, ending at the latest price, are all still in the history.
+        The rolling statistics still hold values of dropped prices, so they're only used when this is the case.
+        """
+        return length >= 1 and (length - 1) * interval < self._count
+
+    def mean(self, interval: int, length: int) -> Optional[Any]:
+        if not self._is_kept(interval, length):
+            return None
+        return self._get_price_stats(interval, length).mean()
+
+    def median(self, interval: int, length: int) -> Optional[Any]:
+        if not self._is_kept(interval, length):
+            return None
+        return self._get_price_stats(interval, length).median()
+
+    def volatility_mean(self, interval: int, length: int) -> Optional[Any]:
+        """
+        Mean of the last `length` absolute price changes, relative to the previous price, between prices `interval`
+        apart.
+        """
+        # Each change also needs the price before it.
+        if not self._is_kept(interval, length + 1):
+            return None
+        return self._get_change_stats(interval, length).mean()
+
+    def volatility_median(self, interval: int, length: int) -> Optional[Any]:
+        if not self._is_kept(interval, length + 1):
+            return None
+        return self._get_change_stats(interval, length).median()
@@ -1,10 +1,19 @@
 import asyncio
-from multiprocessing import Queue
 from typing import List, Optional, Dict, Any, Callable
 from decimal import Decimal
 from statistics import mean, median
-from operator import itemgetter
-from .script_interface import OnTick, OnStatus, PMMParameters, CallNotify, CallLog
+from .script_channel import (
+    ScriptChannel,
+    MSG_TICK,
+    MSG_BUY_ORDER_COMPLETED,
+    MSG_SELL_ORDER_COMPLETED,
+    MSG_STATUS,
+    MSG_STOP,
+    MSG_NOTIFY,
+    MSG_LOG,
+)
+from .script_interface import PMMParameters
+from .price_history import PriceHistory
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent
@@ -16,20 +25,30 @@ class ScriptBase:
     ScriptBase provides functionality which a script can use to interact with the main HB application.
     A user defined script should derive from this base class to get all its functionality.
     """
+    # The number of mid prices to keep, a derived class can override this for longer sampling periods.
+    mid_price_history_capacity: int = 86400
+
     def __init__(self):
-        self._parent_queue: Queue = None
-        self._child_queue: Queue = None
-        self._queue_check_interval: float = 0.0
-        self.mid_prices: List[Decimal] = []
+        self._channel: Optional[ScriptChannel] = None
+        self._mid_prices: PriceHistory = PriceHistory(self.mid_price_history_capacity)
         self.pmm_parameters: PMMParameters = None
         # all_total_balances stores balances in {exchange: {token: balance}} format
         # for example {"binance": {"BTC": Decimal("0.1"), "ETH": Decimal("20"}}
         self.all_total_balances: Dict[str, Dict[str, Decimal]] = None
 
-    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
-        self._parent_queue = parent_queue
-        self._child_queue = child_queue
-        self._queue_check_interval = queue_check_interval
+    def assign_init(self, channel: ScriptChannel):
+        self._channel = channel
+
+    @property
+    def mid_prices(self) -> PriceHistory:
+        """
+        The latest mid prices, one per tick, oldest first.
+        """
+        return self._mid_prices
+
+    @mid_prices.setter
+    def mid_prices(self, mid_prices: List[Decimal]):
+        self._mid_prices = PriceHistory(self.mid_price_history_capacity, mid_prices)
 
     @property
     def mid_price(self):
@@ -39,31 +58,41 @@ class ScriptBase:
         return self.mid_prices[-1]
 
     async def run(self):
-        asyncio.ensure_future(self.listen_to_parent())
-
-    async def listen_to_parent(self):
-        while True:
-            if self._parent_queue.empty():
-                await asyncio.sleep(self._queue_check_interval)
-                continue
-            item = self._parent_queue.get()
-            # print(f"child gets {str(item)}")
-            if item is None:
-                # print("child exiting..")
-                asyncio.get_event_loop().stop()
-                break
-            if isinstance(item, OnTick):
-                self.mid_prices.append(item.mid_price)
-                self.pmm_parameters = item.pmm_parameters
-                self.all_total_balances = item.all_total_balances
-                self.on_tick()
-            elif isinstance(item, BuyOrderCompletedEvent):
-                self.on_buy_order_completed(item)
-            elif isinstance(item, SellOrderCompletedEvent):
-                self.on_sell_order_completed(item)
-            elif isinstance(item, OnStatus):
-                status_msg = self.on_status()
-                self.notify(f"Script status: {status_msg}")
+        self._channel.listen(self.on_parent_message)
+
+    def on_parent_message(self, msg_type: int, payload: Any):
+        if msg_type == MSG_TICK:
+            mid_price, parameter_changes, balance_changes = payload
+            self.mid_prices.append(mid_price)
+            if self.pmm_parameters is None:
+                self.pmm_parameters = PMMParameters()
+            self.pmm_parameters.update(parameter_changes)
+            if self.all_total_balances is None:
+                self.all_total_balances = {}
+            self.update_balances(balance_changes)
+            self.on_tick()
+        elif msg_type == MSG_BUY_ORDER_COMPLETED:
+            self.on_buy_order_completed(payload)
+        elif msg_type == MSG_SELL_ORDER_COMPLETED:
+            self.on_sell_order_completed(payload)
+        elif msg_type == MSG_STATUS:
+            status_msg = self.on_status()
+            self.notify(f"Script status: {status_msg}")
+        elif msg_type == MSG_STOP:
+            self._channel.close()
+            asyncio.get_event_loop().stop()
+
+    def update_balances(self, balance_changes: Dict[str, Dict[str, Optional[Decimal]]]):
+        """
+        Applies balance changes from the parent process, a balance of None means the token has no balance anymore.
+        """
+        for exchange, changes in balance_changes.items():
+            balances = self.all_total_balances.setdefault(exchange, {})
+            for token, balance in changes.items():
+                if balance is None:
+                    balances.pop(token, None)
+                else:
+                    balances[token] = balance
 
     def notify(self, msg: str):
         """
@@ -71,14 +100,14 @@ class ScriptBase:
         If Telegram integration enabled, the message will also be sent to the telegram user.
         :param msg: The message.
         """
-        self._child_queue.put(CallNotify(msg))
+        self._channel.send(MSG_NOTIFY, msg)
 
     def log(self, msg: str):
         """
         Logs message to the strategy log file and display it on Running Logs section of HB.
         :param msg: The message.
         """
-        self._child_queue.put(CallLog(msg))
+        self._channel.send(MSG_LOG, msg)
 
     def avg_mid_price(self, interval: int, length: int) -> Optional[Decimal]:
         """
@@ -89,10 +118,7 @@ class ScriptBase:
         :param length: The number of the samples to calculate the average.
         :returns None if there is not enough samples, otherwise the average mid price.
         """
-        samples = self.take_samples(self.mid_prices, interval, length)
-        if samples is None:
-            return None
-        return mean(samples)
+        return self._mid_prices.mean(interval, length)
 
     def avg_price_volatility(self, interval: int, length: int) -> Optional[Decimal]:
         """
@@ -128,8 +154,12 @@ class ScriptBase:
          and many more which are supported by statistics library.
         :returns None if there is not enough samples, otherwise the central location of mid price change.
         """
+        if locate_function is mean:
+            return self._mid_prices.volatility_mean(interval, length)
+        if locate_function is median:
+            return self._mid_prices.volatility_median(interval, length)
         # We need sample size of length + 1, as we need a previous value to calculate the change
-        samples = self.take_samples(self.mid_prices, interval, length + 1)
+        samples = self._mid_prices.samples(interval, length + 1)
         if samples is None:
             return None
         changes = []
@@ -158,16 +188,10 @@ class ScriptBase:
         :param length: The number of the samples.
         :returns None if there is not enough samples to satisfy length, otherwise the sample list.
         """
-        index_list = list(range(len(a_list) - 1, -1, -1 * interval))
-        index_list = sorted(index_list)
-        index_list = index_list[-1 * length:]
-        if len(index_list) < length:
+        first_index = len(a_list) - 1 - (length - 1) * interval
+        if length < 1 or first_index < 0:
             return None
-        if len(index_list) == 1:
-            # return a list with just 1 item in it.
-            return [a_list[index_list[0]]]
-        samples = list(itemgetter(*index_list)(a_list))
-        return samples
+        return [a_list[index] for index in range(first_index, len(a_list), interval)]
 
     def on_tick(self):
         """
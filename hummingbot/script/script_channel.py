@@ -0,0 +1,95 @@
+import asyncio
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+import pickle
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Tuple
+)
+
+# Message types, sent as the first byte of each message. The rest of the message is the pickled payload, which only
+# ever holds builtin types, Decimals and events.
+
+# Parent to child
+MSG_TICK = 1                    # (mid_price, changed parameters {name: value}, changed balances)
+MSG_BUY_ORDER_COMPLETED = 2     # BuyOrderCompletedEvent
+MSG_SELL_ORDER_COMPLETED = 3    # SellOrderCompletedEvent
+MSG_STATUS = 4                  # None
+MSG_STOP = 5                    # None
+
+# Child to parent
+MSG_PARAMETER = 6               # (name, value)
+MSG_NOTIFY = 7                  # message
+MSG_LOG = 8                     # message
+
+MessageHandler = Callable[[int, Any], None]
+
+
+def encode_message(msg_type: int, payload: Any = None) -> bytes:
+    return bytes((msg_type,)) + pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_message(data: bytes) -> Tuple[int, Any]:
+    return data[0], pickle.loads(data[1:])
+
+
+class ScriptChannel:
+    """
+    One end of a duplex pipe between the Hummingbot process and a script process. The pipe's file descriptor is
+    registered with the event loop, so incoming messages are handled as soon as they arrive, without polling.
+    """
+    def __init__(self, connection: Connection):
+        self._connection: Connection = connection
+        self._ev_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handler: Optional[MessageHandler] = None
+
+    @classmethod
+    def create_pair(cls) -> Tuple["ScriptChannel", "ScriptChannel"]:
+        parent_connection, child_connection = Pipe(duplex=True)
+        return cls(parent_connection), cls(child_connection)
+
+    @property
+    def connection(self) -> Connection:
+        return self._connection
+
+    @property
+    def is_listening(self) -> bool:
+        return self._handler is not None
+
+    def send(self, msg_type: int, payload: Any = None):
+        if self._connection.closed:
+            return
+        try:
+            self._connection.send_bytes(encode_message(msg_type, payload))
+        except (BrokenPipeError, EOFError):
+            pass
+
+    def listen(self, handler: MessageHandler, ev_loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Calls `handler(msg_type, payload)` on the event loop for every incoming message.
+        """
+        self._handler = handler
+        self._ev_loop = ev_loop or asyncio.get_event_loop()
+        self._ev_loop.add_reader(self._connection.fileno(), self._on_readable)
+
+    def stop_listening(self):
+        if self._handler is None:
+            return
+        self._handler = None
+        if not self._connection.closed:
+            self._ev_loop.remove_reader(self._connection.fileno())
+
+    def _on_readable(self):
+        try:
+            while self._handler is not None and self._connection.poll():
+                msg_type, payload = decode_message(self._connection.recv_bytes())
+                self._handler(msg_type, payload)
+        except (EOFError, OSError):
+            # The other end is gone.
+            self.stop_listening()
+
+    def close(self):
+        self.stop_listening()
+        self._connection.close()
@@ -1,33 +1,34 @@
-from typing import Dict
-from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from hummingbot.script.script_channel import MSG_PARAMETER
 
-child_queue = None
+parent_channel = None
 
 
-def set_child_queue(queue):
-    global child_queue
-    child_queue = queue
+def set_parent_channel(channel):
+    global parent_channel
+    parent_channel = channel
 
 
 class StrategyParameter(object):
     """
     A strategy parameter class that is used as a property for the collection class with its get and set method.
-    The set method detects if there is a value change it will put itself into the child queue.
+    The set method detects if there is a value change it will send the new value to the parent process.
     """
     def __init__(self, attr):
         self.name = attr
         self.attr = "_" + attr
-        self.updated_value = None
 
     def __get__(self, obj, objtype):
         return getattr(obj, self.attr)
 
     def __set__(self, obj, value):
-        global child_queue
         old_value = getattr(obj, self.attr)
-        if old_value is not None and old_value != value:
-            self.updated_value = value
-            child_queue.put(self)
+        if old_value is not None and old_value != value and parent_channel is not None:
+            parent_channel.send(MSG_PARAMETER, (self.name, value))
         setattr(obj, self.attr, value)
 
     def __repr__(self):
@@ -94,37 +95,16 @@ class PMMParameters:
     # ping_pong_enabled = PMMParameter("ping_pong_enabled")
     # minimum_spread = PMMParameter("minimum_spread")
 
-    def __repr__(self):
-        return f"{self.__class__.__name__} {str(self.__dict__)}"
-
-
-class OnTick:
-    def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]]):
-        self.mid_price = mid_price
-        self.pmm_parameters = pmm_parameters
-        self.all_total_balances = all_total_balances
-
-    def __repr__(self):
-        return f"{self.__class__.__name__} {str(self.__dict__)}"
-
-
-class OnStatus:
-    pass
-
-
-class CallNotify:
-    def __init__(self, msg):
-        self.msg = msg
-
-    def __repr__(self):
-        return f"{self.__class__.__name__} {str(self.__dict__)}"
-
+    @classmethod
+    def parameter_names(cls) -> List[str]:
+        return [name for name, value in cls.__dict__.items() if isinstance(value, StrategyParameter)]
 
-class CallLog:
-    def __init__(self, msg):
-        self.msg = msg
+    def update(self, changes: Dict[str, Any]):
+        """
+        Applies parameter changes received from the parent process, without sending them back.
+        """
+        for name, value in changes.items():
+            setattr(self, "_" + name, value)
 
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
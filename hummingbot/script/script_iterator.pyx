@@ -1,9 +1,13 @@
 # distutils: language=c++
 
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    List,
+)
 import asyncio
 import logging
-from multiprocessing import Process, Queue
+from multiprocessing import Process
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.clock import Clock
 from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
@@ -13,10 +17,20 @@ from hummingbot.core.event.events import (
     MarketEvent,
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.market.market_base import MarketBase
 from hummingbot.script.script_process import run_script
-from hummingbot.script.script_interface import StrategyParameter, PMMParameters, OnTick, OnStatus, CallNotify, CallLog
+from hummingbot.script.script_interface import PMMParameters
+from hummingbot.script.script_channel import (
+    ScriptChannel,
+    MSG_TICK,
+    MSG_BUY_ORDER_COMPLETED,
+    MSG_SELL_ORDER_COMPLETED,
+    MSG_STATUS,
+    MSG_STOP,
+    MSG_PARAMETER,
+    MSG_NOTIFY,
+    MSG_LOG,
+)
 
 s_logger = None
 
@@ -33,14 +47,16 @@ cdef class ScriptIterator(TimeIterator):
                  script_file_path: str,
                  markets: List[MarketBase],
                  strategy: PureMarketMakingStrategy,
-                 queue_check_interval: float = 0.01,
                  is_unit_testing_mode: bool = False):
         super().__init__()
         self._script_file_path = script_file_path
         self._markets = markets
         self._strategy = strategy
         self._is_unit_testing_mode = is_unit_testing_mode
-        self._queue_check_interval = queue_check_interval
+        self._parameter_names = PMMParameters.parameter_names()
+        # The parameter values and balances last sent to the script, only changes are sent on each tick.
+        self._sent_parameters = {}
+        self._sent_balances = {}
         self._did_complete_buy_order_forwarder = SourceInfoEventForwarder(self._did_complete_buy_order)
         self._did_complete_sell_order_forwarder = SourceInfoEventForwarder(self._did_complete_sell_order)
         self._event_pairs = [
@@ -48,16 +64,17 @@ cdef class ScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
-        self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
+        self._channel, child_channel = ScriptChannel.create_pair()
+        self._channel.listen(self._on_child_message, self._ev_loop)
 
         self._script_process = Process(
             target=run_script,
-            args=(script_file_path, self._parent_queue, self._child_queue, queue_check_interval,)
+            args=(script_file_path, child_channel.connection,)
         )
         self.logger().info(f"starting script in {script_file_path}")
         self._script_process.start()
+        # The child process has its own copy of the connection.
+        child_channel.connection.close()
 
     @property
     def strategy(self):
@@ -71,57 +88,69 @@ cdef class ScriptIterator(TimeIterator):
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
-        self._parent_queue.put(None)
-        self._child_queue.put(None)
+        self._channel.send(MSG_STOP)
         self._script_process.join()
-        if self._listen_to_child_task is not None:
-            self._listen_to_child_task.cancel()
+        self._channel.close()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy, self.all_total_balances())
-        self._parent_queue.put(on_tick)
+        self._channel.send(MSG_TICK, (self._strategy.get_mid_price(),
+                                      self.parameter_changes(),
+                                      self.balance_changes()))
+
+    def parameter_changes(self) -> Dict[str, Any]:
+        changes = {}
+        for name in self._parameter_names:
+            value = getattr(self._strategy, name)
+            if name not in self._sent_parameters or self._sent_parameters[name] != value:
+                changes[name] = value
+                self._sent_parameters[name] = value
+        return changes
+
+    def balance_changes(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the total balances that changed since the last tick, in {exchange: {token: balance}} format. Tokens
+        whose balance dropped to zero have a balance of None.
+        """
+        changes = {}
+        for exchange, balances in self.all_total_balances().items():
+            sent_balances = self._sent_balances.setdefault(exchange, {})
+            exchange_changes = {token: bal for token, bal in balances.items() if sent_balances.get(token) != bal}
+            for token in sent_balances.keys() - balances.keys():
+                exchange_changes[token] = None
+            if len(exchange_changes) > 0:
+                changes[exchange] = exchange_changes
+                self._sent_balances[exchange] = balances
+        return changes
 
     def _did_complete_buy_order(self,
                                 event_tag: int,
                                 market: MarketBase,
                                 event: BuyOrderCompletedEvent):
-        self._parent_queue.put(event)
+        self._channel.send(MSG_BUY_ORDER_COMPLETED, event)
 
     def _did_complete_sell_order(self,
                                  event_tag: int,
                                  market: MarketBase,
                                  event: SellOrderCompletedEvent):
-        self._parent_queue.put(event)
-
-    async def listen_to_child_queue(self):
-        while True:
-            if self._child_queue.empty():
-                await asyncio.sleep(self._queue_check_interval)
-                continue
-            item = self._child_queue.get()
-            # print(f"received: {str(item)}")
-            self.logger().info(f"received: {str(item)}")
-            if item is None:
-                break
-            if isinstance(item, StrategyParameter):
-                setattr(self._strategy, item.name, item.updated_value)
-            elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
-                # ignore this on unit testing as the below import will mess up unit testing.
-                from hummingbot.client.hummingbot_application import HummingbotApplication
-                HummingbotApplication.main_application()._notify(item.msg)
-            elif isinstance(item, CallLog):
-                self.logger().info(f"script - {item.msg}")
+        self._channel.send(MSG_SELL_ORDER_COMPLETED, event)
+
+    def _on_child_message(self, msg_type: int, payload: Any):
+        self.logger().info(f"received: {msg_type} {str(payload)}")
+        if msg_type == MSG_PARAMETER:
+            name, value = payload
+            setattr(self._strategy, name, value)
+        elif msg_type == MSG_NOTIFY and not self._is_unit_testing_mode:
+            # ignore this on unit testing as the below import will mess up unit testing.
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+            HummingbotApplication.main_application()._notify(payload)
+        elif msg_type == MSG_LOG:
+            self.logger().info(f"script - {payload}")
 
     def request_status(self):
-        self._parent_queue.put(OnStatus())
+        self._channel.send(MSG_STATUS)
 
     def all_total_balances(self):
         all_bals = {m.name: m.get_all_balances() for m in self._markets}
@@ -2,16 +2,18 @@ import asyncio
 import importlib
 import inspect
 import os
-from multiprocessing import Queue
+from multiprocessing.connection import Connection
 from hummingbot.script.script_base import ScriptBase
-from hummingbot.script.script_interface import set_child_queue
+from hummingbot.script.script_channel import ScriptChannel
+from hummingbot.script.script_interface import set_parent_channel
 
 
-def run_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_script(script_file_name: str, connection: Connection):
     script_class = import_script_sub_class(script_file_name)
     script = script_class()
-    script.assign_init(parent_queue, child_queue, queue_check_interval)
-    set_child_queue(child_queue)
+    channel = ScriptChannel(connection)
+    script.assign_init(channel)
+    set_parent_channel(channel)
     policy = asyncio.get_event_loop_policy()
     policy.set_event_loop(policy.new_event_loop())
     ev_loop = asyncio.get_event_loop()
@@ -25,6 +25,7 @@ cdef class ArbitrageStrategy(StrategyBase):
         bint _cool_off_logged
         object _secondary_to_primary_base_conversion_rate
         object _secondary_to_primary_quote_conversion_rate
+        dict _market_conversion_rates
         bint _hb_app_notification
 
     cdef tuple c_calculate_arbitrage_top_order_profitability(self, object market_pair)
@@ -75,6 +75,11 @@ cdef class ArbitrageStrategy(StrategyBase):
 
         self._secondary_to_primary_base_conversion_rate = secondary_to_primary_base_conversion_rate
         self._secondary_to_primary_quote_conversion_rate = secondary_to_primary_quote_conversion_rate
+        self._market_conversion_rates = {
+            self._market_pairs[0].first: Decimal("1"),
+            self._market_pairs[0].second: secondary_to_primary_quote_conversion_rate /
+            secondary_to_primary_base_conversion_rate,
+        }
 
         self._hb_app_notification = hb_app_notification
 
@@ -367,10 +372,7 @@ cdef class ArbitrageStrategy(StrategyBase):
                                                   sell_market_conversion_rate)
 
     def market_conversion_rate(self, market_info: MarketTradingPairTuple) -> Decimal:
-        if market_info == self._market_pairs[0].first:
-            return Decimal("1")
-        elif market_info == self._market_pairs[0].second:
-            return self._secondary_to_primary_quote_conversion_rate / self._secondary_to_primary_base_conversion_rate
+        return self._market_conversion_rates.get(market_info)
 
     cdef tuple c_find_best_profitable_amount(self, object buy_market_trading_pair_tuple, object sell_market_trading_pair_tuple):
         """
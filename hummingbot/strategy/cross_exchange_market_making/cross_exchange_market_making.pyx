@@ -135,6 +135,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         self._adjust_orders_enabled = adjust_order_enabled
         self._taker_to_maker_base_conversion_rate = taker_to_maker_base_conversion_rate
         self._taker_to_maker_quote_conversion_rate = taker_to_maker_quote_conversion_rate
+        self._market_conversion_rate = taker_to_maker_quote_conversion_rate / taker_to_maker_base_conversion_rate
         self._hb_app_notification = hb_app_notification
 
         cdef:
@@ -1081,7 +1082,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         """
         Return price conversion rate for a taker market (to convert it into maker base asset value)
         """
-        return self._taker_to_maker_quote_conversion_rate / self._taker_to_maker_base_conversion_rate
+        return self._market_conversion_rate
 
     cdef c_check_and_create_new_orders(self, object market_pair, bint has_active_bid, bint has_active_ask):
         """
@@ -6,6 +6,7 @@ from hummingbot.client.config.config_validators import (
     validate_bool
 )
 from hummingbot.client.settings import required_exchanges, EXAMPLE_PAIRS
+from hummingbot.core.utils.market_mid_price import MidPriceService
 from decimal import Decimal
 from hummingbot.client.config.config_helpers import (
     minimum_order_amount
@@ -67,6 +68,18 @@ def validate_order_amount(value: str) -> Optional[str]:
         return "Invalid order amount."
 
 
+def maker_market_on_validated(value: str):
+    required_exchanges.append(value)
+    # The mid price is needed for the minimum order amount prompt.
+    MidPriceService.get_instance().prefetch(value)
+
+
+def maker_market_trading_pair_on_validated(value: str):
+    # Exchanges without a ticker set endpoint are fetched by trading pair.
+    maker_exchange = cross_exchange_market_making_config_map["maker_market"].value
+    MidPriceService.get_instance().prefetch(maker_exchange, value)
+
+
 def taker_market_on_validated(value: str):
     required_exchanges.append(value)
 
@@ -81,7 +94,7 @@ cross_exchange_market_making_config_map = {
         prompt="Enter your maker exchange name >>> ",
         prompt_on_new=True,
         validator=validate_exchange,
-        on_validated=lambda value: required_exchanges.append(value),
+        on_validated=maker_market_on_validated,
     ),
     "taker_market": ConfigVar(
         key="taker_market",
@@ -94,7 +107,8 @@ cross_exchange_market_making_config_map = {
         key="maker_market_trading_pair",
         prompt=maker_trading_pair_prompt,
         prompt_on_new=True,
-        validator=validate_maker_market_trading_pair
+        validator=validate_maker_market_trading_pair,
+        on_validated=maker_market_trading_pair_on_validated,
     ),
     "taker_market_trading_pair": ConfigVar(
         key="taker_market_trading_pair",
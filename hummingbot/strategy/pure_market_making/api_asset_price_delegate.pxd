@@ -1,4 +1,8 @@
 from .asset_price_delegate cimport AssetPriceDelegate
 
 cdef class APIAssetPriceDelegate(AssetPriceDelegate):
-    cdef object _custom_api_feed
+    cdef:
+        object _custom_api_feed
+        object _price_oracle
+        str _price_key
+        int _subscription_id
@@ -1,19 +1,31 @@
 from .asset_price_delegate cimport AssetPriceDelegate
 from hummingbot.data_feed.custom_api_data_feed import CustomAPIDataFeed, NetworkStatus
+from hummingbot.data_feed.price_oracle import PriceOracle
 
 cdef class APIAssetPriceDelegate(AssetPriceDelegate):
     def __init__(self, api_url: str):
         super().__init__()
         self._custom_api_feed = CustomAPIDataFeed(api_url=api_url)
+        self._price_oracle = PriceOracle.get_instance()
+        self._price_key = self._custom_api_feed.price_key
+        self._subscription_id = self._price_oracle.subscribe([self._price_key])
         self._custom_api_feed.start()
 
+    def __dealloc__(self):
+        if self._price_oracle is not None:
+            self._price_oracle.unsubscribe(self._subscription_id)
+
     cdef object c_get_mid_price(self):
-        return self._custom_api_feed.get_price()
+        entry = self._price_oracle.get_entry(self._price_key)
+        if entry is None:
+            return self._custom_api_feed.get_price()
+        return entry.price
 
     @property
     def ready(self) -> bool:
-        return self._custom_api_feed.network_status == NetworkStatus.CONNECTED
+        return self._custom_api_feed.network_status == NetworkStatus.CONNECTED and \
+            not self._price_oracle.is_stale(self._price_key)
 
     @property
     def custom_api_feed(self) -> CustomAPIDataFeed:
-        return self._custom_api_feed
\ No newline at end of file
+        return self._custom_api_feed
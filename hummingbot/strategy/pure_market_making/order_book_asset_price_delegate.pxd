@@ -5,3 +5,6 @@ cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
     cdef:
         MarketBase _market
         str _trading_pair
+        object _price_oracle
+        str _price_key
+        int _subscription_id
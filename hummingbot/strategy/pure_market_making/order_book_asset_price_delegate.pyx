@@ -1,4 +1,5 @@
 from .asset_price_delegate cimport AssetPriceDelegate
+from hummingbot.data_feed.price_oracle import PriceOracle
 from hummingbot.market.market_base import MarketBase
 from decimal import Decimal
 
@@ -7,10 +8,20 @@ cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
         super().__init__()
         self._market = market
         self._trading_pair = trading_pair
+        self._price_oracle = PriceOracle.get_instance()
+        self._price_key = self._price_oracle.add_order_book(market, trading_pair)
+        self._subscription_id = self._price_oracle.subscribe([self._price_key])
+
+    def __dealloc__(self):
+        if self._price_oracle is not None:
+            self._price_oracle.unsubscribe(self._subscription_id)
 
     cdef object c_get_mid_price(self):
-        return (self._market.c_get_price(self._trading_pair, True) +
-                self._market.c_get_price(self._trading_pair, False))/Decimal('2')
+        entry = self._price_oracle.get_entry(self._price_key)
+        if entry is None:
+            return (self._market.c_get_price(self._trading_pair, True) +
+                    self._market.c_get_price(self._trading_pair, False))/Decimal('2')
+        return entry.price
 
     @property
     def ready(self) -> bool:
@@ -12,6 +12,7 @@ from hummingbot.client.settings import (
     required_exchanges,
     EXAMPLE_PAIRS,
 )
+from hummingbot.core.utils.market_mid_price import MidPriceService
 from hummingbot.client.config.global_config_map import (
     using_bamboo_coordinator_mode,
     using_exchange
@@ -92,6 +93,14 @@ def validate_take_if_crossed(value: str) -> Optional[str]:
 
 def exchange_on_validated(value: str):
     required_exchanges.append(value)
+    # The mid price is needed for the minimum order amount prompt.
+    MidPriceService.get_instance().prefetch(value)
+
+
+def market_on_validated(value: str):
+    # Exchanges without a ticker set endpoint are fetched by trading pair.
+    exchange = pure_market_making_config_map["exchange"].value
+    MidPriceService.get_instance().prefetch(exchange, value)
 
 
 pure_market_making_config_map = {
@@ -109,6 +118,7 @@ pure_market_making_config_map = {
         ConfigVar(key="market",
                   prompt=maker_trading_pair_prompt,
                   validator=validate_exchange_trading_pair,
+                  on_validated=market_on_validated,
                   prompt_on_new=True),
     "bid_spread":
         ConfigVar(key="bid_spread",
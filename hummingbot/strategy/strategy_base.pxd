@@ -18,6 +18,7 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_complete_sell_order_listener
         bint _sb_delegate_lock
         OrderTracker _sb_order_tracker
+        object _sb_order_tracker_tick_histogram
 
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
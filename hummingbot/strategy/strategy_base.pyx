@@ -1,12 +1,14 @@
 from decimal import Decimal
 import logging
 import pandas as pd
+import time
 from typing import (
     List)
 
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.event.events import MarketEvent
 from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.management.metrics import iterator_tick_histogram
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -108,6 +110,7 @@ cdef class StrategyBase(TimeIterator):
         self._sb_delegate_lock = False
 
         self._sb_order_tracker = OrderTracker()
+        self._sb_order_tracker_tick_histogram = iterator_tick_histogram(self._sb_order_tracker)
 
     @property
     def active_markets(self) -> List[MarketBase]:
@@ -232,8 +235,10 @@ cdef class StrategyBase(TimeIterator):
         self._sb_order_tracker.c_start(clock, timestamp)
 
     cdef c_tick(self, double timestamp):
+        cdef double start_time = time.perf_counter()
         TimeIterator.c_tick(self, timestamp)
         self._sb_order_tracker.c_tick(timestamp)
+        self._sb_order_tracker_tick_histogram.observe(time.perf_counter() - start_time)
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
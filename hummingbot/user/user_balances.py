@@ -1,13 +1,5 @@
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.bittrex.bittrex_market import BittrexMarket
-from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
-from hummingbot.market.huobi.huobi_market import HuobiMarket
-from hummingbot.market.kucoin.kucoin_market import KucoinMarket
-from hummingbot.market.liquid.liquid_market import LiquidMarket
-from hummingbot.market.kraken.kraken_market import KrakenMarket
-from hummingbot.market.eterbase.eterbase_market import EterbaseMarket
-from hummingbot.market.ocean.ocean_market import OceanMarket
-from hummingbot.core.utils.market_mid_price import get_mid_price
+from hummingbot.market.connector_registry import MARKET_CLASSES
+from hummingbot.core.utils.market_mid_price import get_mid_price_async
 from hummingbot.client.settings import EXCHANGES, DEXES
 from hummingbot.client.config.security import Security
 from hummingbot.core.utils.async_utils import safe_gather
@@ -15,8 +7,6 @@ from hummingbot.client.config.global_config_map import global_config_map
 from typing import Optional, Dict
 from decimal import Decimal
 
-from web3 import Web3
-
 
 class UserBalances:
     __instance = None
@@ -24,24 +14,12 @@ class UserBalances:
     @staticmethod
     def connect_market(exchange, *api_details):
         market = None
-        if exchange == "binance":
-            market = BinanceMarket(api_details[0], api_details[1])
-        elif exchange == "bittrex":
-            market = BittrexMarket(api_details[0], api_details[1])
-        elif exchange == "coinbase_pro":
-            market = CoinbaseProMarket(api_details[0], api_details[1], api_details[2])
-        elif exchange == "huobi":
-            market = HuobiMarket(api_details[0], api_details[1])
+        if exchange in ("binance", "bittrex", "huobi", "liquid", "kraken", "ocean"):
+            market = MARKET_CLASSES[exchange](api_details[0], api_details[1])
+        elif exchange in ("coinbase_pro", "eterbase"):
+            market = MARKET_CLASSES[exchange](api_details[0], api_details[1], api_details[2])
         elif exchange == "kucoin":
-            market = KucoinMarket(api_details[0], api_details[2], api_details[1])
-        elif exchange == "liquid":
-            market = LiquidMarket(api_details[0], api_details[1])
-        elif exchange == "kraken":
-            market = KrakenMarket(api_details[0], api_details[1])
-        elif exchange == "eterbase":
-            market = EterbaseMarket(api_details[0], api_details[1], api_details[2])
-        elif exchange == "ocean":
-            market = OceanMarket(api_details[0], api_details[1])
+            market = MARKET_CLASSES[exchange](api_details[0], api_details[2], api_details[1])
         return market
 
     # return error message if the _update_balances fails
@@ -49,9 +27,7 @@ class UserBalances:
     async def _update_balances(market) -> Optional[str]:
         try:
             # Todo: Check first if _account_id is not already set, but the market objects need to expose this property.
-            if isinstance(market, HuobiMarket):
-                await market._update_account_id()
-            elif isinstance(market, KucoinMarket):
+            if market.name in ("huobi", "kucoin"):
                 await market._update_account_id()
             await market._update_balances()
         except Exception as e:
@@ -125,6 +101,7 @@ class UserBalances:
     def ethereum_balance() -> Decimal:
         ethereum_wallet = global_config_map.get("ethereum_wallet").value
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
+        from web3 import Web3
         web3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         balance = web3.eth.getBalance(ethereum_wallet)
         balance = web3.fromWei(balance, "ether")
@@ -147,12 +124,12 @@ class UserBalances:
         return None
 
     @staticmethod
-    def base_amount_ratio(exchange, trading_pair, balances) -> Optional[Decimal]:
+    async def base_amount_ratio(exchange, trading_pair, balances) -> Optional[Decimal]:
         try:
             base, quote = trading_pair.split("-")
             base_amount = balances.get(base, 0)
             quote_amount = balances.get(quote, 0)
-            price = get_mid_price(exchange, trading_pair)
+            price = await get_mid_price_async(exchange, trading_pair)
             total_value = base_amount + (quote_amount / price)
             return None if total_value <= 0 else base_amount / total_value
         except Exception:
@@ -22,6 +22,7 @@ from eth_abi.codec import (
 from eth_abi.registry import registry
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.asyncio_throttle import PRIORITY_LOW
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -125,7 +126,8 @@ class ContractEventLogger:
                     )
                     break
                 logs = await async_scheduler.call_async(
-                    functools.partial(self._w3.eth.getLogs, event_filter_params)
+                    functools.partial(self._w3.eth.getLogs, event_filter_params),
+                    priority=PRIORITY_LOW
                 )
                 break
             except asyncio.CancelledError:
@@ -28,6 +28,10 @@ from web3.exceptions import (
 )
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW
+)
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import (
@@ -229,7 +233,8 @@ class Web3WalletBackend(PubSub):
 
         # Fetch blockchain data.
         self._local_nonce = await async_scheduler.call_async(
-            lambda: self.get_remote_nonce()
+            lambda: self.get_remote_nonce(),
+            priority=PRIORITY_HIGH
         )
 
         # Create event watchers.
@@ -389,7 +394,8 @@ class Web3WalletBackend(PubSub):
         """
         async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         try:
-            return await async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash)
+            return await async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash,
+                                                    priority=PRIORITY_LOW)
         except TransactionNotFound as e:
             now: float = time.time()
             if now - timestamp > 120:
@@ -408,7 +414,7 @@ class Web3WalletBackend(PubSub):
         transaction_receipts: List[AttributeDict] = [tr for tr in await safe_gather(*tasks)
                                                      if (tr is not None and tr.get("blockHash") is not None)]
         block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash)
+        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash, priority=PRIORITY_LOW)
                              for block_hash in block_hash_set]
         blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
                                                      for block
@@ -448,7 +454,8 @@ class Web3WalletBackend(PubSub):
             signed_transaction: AttributeDict = await self._outgoing_transactions_queue.get()
             tx_hash: str = signed_transaction.hash.hex()
             try:
-                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction)
+                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction,
+                                                 priority=PRIORITY_HIGH)
             except asyncio.CancelledError:
                 raise
             except Exception:
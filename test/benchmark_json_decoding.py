@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+
+"""
+Compares the time taken to decode the websocket frames of each exchange, the way the connectors used to decode them,
+versus `fast_json` with each of its available backends.
+
+Frames are read from `<frames_dir>/<exchange>.jsonl`, one frame per line, when a recording directory is given. Huobi's
+recorded frames are gzipped before decoding, as they are sent. Otherwise frames shaped after each exchange's stream
+messages are generated.
+
+Usage: python test/benchmark_json_decoding.py [number_of_frames] [frames_dir]
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import gzip
+import json
+import os
+import random
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional
+)
+
+from hummingbot.core.utils import fast_json
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def price_levels(count: int) -> List[List[str]]:
+    return [[f"{random.uniform(180, 220):.2f}", f"{random.uniform(0.01, 20):.6f}"] for _ in range(count)]
+
+
+def binance_frame(i: int) -> Dict[str, Any]:
+    return {"stream": "ethusdt@depth",
+            "data": {"e": "depthUpdate", "E": 1580000000000 + i, "s": "ETHUSDT", "U": 1000 * i, "u": 1000 * i + 9,
+                     "b": price_levels(10), "a": price_levels(10)}}
+
+
+def huobi_frame(i: int) -> Dict[str, Any]:
+    return {"ch": "market.ethusdt.depth.step0", "ts": 1580000000000 + i,
+            "tick": {"bids": [[float(p), float(a)] for p, a in price_levels(20)],
+                     "asks": [[float(p), float(a)] for p, a in price_levels(20)],
+                     "version": 100000000000 + i, "ts": 1580000000000 + i}}
+
+
+def huobi_trade_frame(i: int) -> Dict[str, Any]:
+    # Huobi's trade ids don't fit in 64 bits.
+    return {"ch": "market.ethusdt.trade.detail", "ts": 1580000000000 + i,
+            "tick": {"id": 100000000000 + i, "ts": 1580000000000 + i,
+                     "data": [{"id": 10200000000000000000000000 + i * 10 + j, "ts": 1580000000000 + i,
+                               "amount": random.uniform(0.01, 20), "price": random.uniform(180, 220),
+                               "direction": random.choice(["buy", "sell"])} for j in range(3)]}}
+
+
+def ocean_frame(i: int) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"timestamp": 1580000000 + i, "bids": price_levels(50), "asks": price_levels(50)}
+    return {"event": "update", "channel": "market-vetusdt-global", "data": json.dumps(data)}
+
+
+def kucoin_frame(i: int) -> Dict[str, Any]:
+    return {"type": "message", "topic": "/market/level2:ETH-USDT", "subject": "trade.l2update",
+            "data": {"sequenceStart": 1000 * i, "sequenceEnd": 1000 * i + 1, "symbol": "ETH-USDT",
+                     "changes": {"asks": [[p, a, str(1000 * i)] for p, a in price_levels(1)],
+                                 "bids": [[p, a, str(1000 * i + 1)] for p, a in price_levels(1)]}}}
+
+
+def coinbase_pro_frame(i: int) -> Dict[str, Any]:
+    return {"type": "l2update", "product_id": "ETH-USD", "time": "2020-01-26T12:00:00.000000Z",
+            "changes": [[random.choice(["buy", "sell"]), p, a] for p, a in price_levels(2)]}
+
+
+def kraken_frame(i: int) -> List[Any]:
+    return [1234, {"a": [[p, a, f"{1580000000 + i}.123456"] for p, a in price_levels(2)]}, "book-1000", "ETH/USD"]
+
+
+FRAME_GENERATORS: Dict[str, Callable[[int], Any]] = {
+    "binance": binance_frame,
+    "huobi": huobi_frame,
+    "huobi_trades": huobi_trade_frame,
+    "ocean": ocean_frame,
+    "kucoin": kucoin_frame,
+    "coinbase_pro": coinbase_pro_frame,
+    "kraken": kraken_frame,
+}
+
+
+def generate_frames(exchange: str, count: int) -> List[bytes]:
+    frames: List[bytes] = [json.dumps(FRAME_GENERATORS[exchange](i)).encode("utf-8") for i in range(count)]
+    if exchange.startswith("huobi"):
+        frames = [gzip.compress(frame) for frame in frames]
+    return frames
+
+
+def load_frames(frames_dir: str) -> Dict[str, List[bytes]]:
+    frames: Dict[str, List[bytes]] = {}
+    for file_name in sorted(os.listdir(frames_dir)):
+        if not file_name.endswith(".jsonl"):
+            continue
+        exchange: str = file_name[:-len(".jsonl")]
+        with open(os.path.join(frames_dir, file_name), "rb") as fd:
+            lines: List[bytes] = [line.rstrip(b"\n") for line in fd if line.strip()]
+        if exchange.startswith("huobi"):
+            lines = [gzip.compress(line) for line in lines]
+        frames[exchange] = lines
+    return frames
+
+
+def legacy_decode(exchange: str, frame: bytes) -> Any:
+    if exchange.startswith("huobi"):
+        return json.loads(gzip.decompress(frame).decode("utf-8"))
+    msg_str: str = frame.decode("utf-8")
+    if exchange == "ocean":
+        msg: Dict[str, Any] = json.loads(msg_str)
+        msg["data"] = json.loads(msg["data"])
+        return msg
+    if exchange == "kucoin" or ujson is None:
+        return json.loads(msg_str)
+    return ujson.loads(msg_str)
+
+
+def fast_decode(exchange: str, frame: bytes, inflater: Optional[fast_json.Inflater]) -> Any:
+    if inflater is not None:
+        return inflater.loads(frame)
+    msg: Any = fast_json.loads(frame)
+    if exchange == "ocean":
+        msg["data"] = fast_json.loads(msg["data"])
+    return msg
+
+
+def run_benchmark(name: str, exchange: str, decode: Callable[[bytes], Any], frames: List[bytes],
+                  repeat: int = 3) -> float:
+    elapsed: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        for frame in frames:
+            decode(frame)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f"{exchange:>13} {name:>8}: {len(frames)} frames in {elapsed:.3f}s "
+          f"({len(frames) / elapsed:,.0f} frames/s, {sum(len(f) for f in frames) / elapsed / 1e6:,.1f} MB/s)")
+    return elapsed
+
+
+def main():
+    number_of_frames: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    frames_by_exchange: Dict[str, List[bytes]] = (load_frames(sys.argv[2]) if len(sys.argv) > 2 else
+                                                  {exchange: generate_frames(exchange, number_of_frames)
+                                                   for exchange in FRAME_GENERATORS})
+    for exchange, frames in frames_by_exchange.items():
+        baseline: float = run_benchmark("legacy", exchange, lambda frame: legacy_decode(exchange, frame), frames)
+        for backend in fast_json.BACKENDS.keys():
+            fast_json.set_backend(backend)
+            # Frames of one connection are decoded with one inflater.
+            inflater: Optional[fast_json.Inflater] = (fast_json.Inflater(fast_json.GZIP_WBITS)
+                                                      if exchange.startswith("huobi") else None)
+            elapsed: float = run_benchmark(backend, exchange,
+                                           lambda frame: fast_decode(exchange, frame, inflater), frames)
+            print(f"{'':>23}{baseline / elapsed:.2f}x legacy")
+
+
+if __name__ == "__main__":
+    main()
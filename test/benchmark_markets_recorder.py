@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+"""
+Compares the throughput of writing trade fill records through the SQLAlchemy ORM (as `MarketsRecorder` used to do),
+versus the Core-level `executemany` path used by the write-behind `MarketsRecorder`.
+
+Usage: python test/benchmark_markets_recorder.py [number_of_fills] [batch_size]
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import os
+import random
+import tempfile
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List
+)
+from sqlalchemy.engine.base import Engine
+from sqlalchemy.orm import (
+    sessionmaker,
+    Session
+)
+
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType
+)
+from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.model import get_declarative_base
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+
+def generate_fill_events(count: int) -> List[OrderFilledEvent]:
+    return [OrderFilledEvent(timestamp=time.time(),
+                             order_id=f"buy-ETH-USDT-{i // 4}",
+                             trading_pair="ETH-USDT",
+                             trade_type=random.choice([TradeType.BUY, TradeType.SELL]),
+                             order_type=OrderType.LIMIT,
+                             price=Decimal(f"{random.uniform(180, 220):.2f}"),
+                             amount=Decimal(f"{random.uniform(0.1, 2):.4f}"),
+                             trade_fee=TradeFee(Decimal("0.001"), [("BNB", Decimal("0.0001"))]),
+                             exchange_trade_id=str(i))
+            for i in range(count)]
+
+
+def fill_columns(evt: OrderFilledEvent) -> Dict[str, Any]:
+    return {
+        "config_file_path": "conf_pure_mm_0.yml",
+        "strategy": "pure_market_making",
+        "market": "binance",
+        "symbol": evt.trading_pair,
+        "base_asset": "ETH",
+        "quote_asset": "USDT",
+        "timestamp": int(evt.timestamp * 1e3),
+        "order_id": evt.order_id,
+        "trade_type": evt.trade_type.name,
+        "order_type": evt.order_type.name,
+        "price": float(evt.price),
+        "amount": float(evt.amount),
+        "trade_fee": TradeFee.to_json(evt.trade_fee),
+        "exchange_trade_id": evt.exchange_trade_id
+    }
+
+
+def write_orm(session: Session, events: List[OrderFilledEvent], batch_size: int):
+    for i, evt in enumerate(events):
+        columns: Dict[str, Any] = fill_columns(evt)
+        session.add(OrderStatus(order_id=evt.order_id, timestamp=columns["timestamp"], status="OrderFilled"))
+        session.add(TradeFill(**columns))
+        if (i + 1) % batch_size == 0:
+            session.commit()
+    session.commit()
+
+
+def write_core(session: Session, events: List[OrderFilledEvent], batch_size: int):
+    for i in range(0, len(events), batch_size):
+        fills: List[Dict[str, Any]] = [fill_columns(evt) for evt in events[i:i + batch_size]]
+        statuses: List[Dict[str, Any]] = [{"order_id": row["order_id"],
+                                           "timestamp": row["timestamp"],
+                                           "status": "OrderFilled"} for row in fills]
+        session.execute(MarketsRecorder.insert_order_status_stmt, statuses)
+        session.execute(MarketsRecorder.insert_trade_fill_stmt, fills)
+        session.commit()
+
+
+def run_benchmark(name: str,
+                  writer: Callable[[Session, List[OrderFilledEvent], int], None],
+                  events: List[OrderFilledEvent],
+                  batch_size: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        params: Dict[str, Any] = {"db_path": os.path.join(tmp_dir, "benchmark.sqlite"),
+                                  "sqlite_performance_profile": True,
+                                  "sqlite_cache_size": 65536,
+                                  "sqlite_statement_cache_size": 256}
+        engine: Engine = SQLConnectionManager.get_db_engine("sqlite", params)
+        get_declarative_base().metadata.create_all(engine)
+        session: Session = sessionmaker(bind=engine)()
+
+        start: float = time.perf_counter()
+        writer(session, events, batch_size)
+        elapsed: float = time.perf_counter() - start
+        assert session.query(TradeFill).count() == len(events)
+
+        session.close()
+        engine.dispose()
+        print(f"{name:>6}: {len(events)} fills in {elapsed:.3f}s ({len(events) / elapsed:,.0f} fills/s)")
+
+
+def main():
+    number_of_fills: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    batch_size: int = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    events: List[OrderFilledEvent] = generate_fill_events(number_of_fills)
+    run_benchmark("ORM", write_orm, events, batch_size)
+    run_benchmark("Core", write_core, events, batch_size)
+
+
+if __name__ == "__main__":
+    main()
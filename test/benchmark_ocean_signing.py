@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+"""
+Compares the number of OceanEx private requests signed per second by encoding with the PEM key text (as `OceanClient`
+used to do), versus the parsed key `OceanClient` now keeps. Then measures how long the event loop is held up while a
+burst of requests is signed, with and without the signing executor.
+
+Usage: python test/benchmark_ocean_signing.py [number_of_signatures]
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import os
+import tempfile
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List
+)
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+import jwt
+
+from hummingbot.market.ocean import ocean_client
+from hummingbot.market.ocean.ocean_client import OceanClient
+
+
+def generate_key_file(directory: str) -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048, backend=default_backend())
+    path: str = os.path.join(directory, "ocean_private_key.pem")
+    with open(path, "wb") as fd:
+        fd.write(key.private_bytes(encoding=serialization.Encoding.PEM,
+                                   format=serialization.PrivateFormat.TraditionalOpenSSL,
+                                   encryption_algorithm=serialization.NoEncryption()))
+    return path
+
+
+def order_body(i: int) -> Dict[str, Any]:
+    return {"market": "vetusdt", "side": "buy" if i % 2 == 0 else "sell", "volume": "1000",
+            "ord_type": "limit", "price": f"0.00{4000 + i}"}
+
+
+def run_benchmark(name: str, sign: Callable[[Dict[str, Any]], Any], number_of_signatures: int) -> float:
+    start: float = time.perf_counter()
+    for i in range(number_of_signatures):
+        sign(order_body(i))
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:>14}: {number_of_signatures / elapsed:,.0f} signatures/s")
+    return elapsed
+
+
+async def max_loop_stall(client: OceanClient, number_of_signatures: int) -> float:
+    """
+    Signs a burst of requests concurrently, while measuring the longest the event loop went without running a
+    ticker task.
+    """
+    stalls: List[float] = []
+
+    async def ticker():
+        while True:
+            before: float = time.perf_counter()
+            await asyncio.sleep(0)
+            stalls.append(time.perf_counter() - before)
+
+    ticker_task: asyncio.Task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+    await asyncio.gather(*[client._sign_request_body(order_body(i)) for i in range(number_of_signatures)])
+    ticker_task.cancel()
+    return max(stalls)
+
+
+def main():
+    number_of_signatures: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as directory:
+        key_file: str = generate_key_file(directory)
+        with open(key_file) as fd:
+            key_text: str = fd.read()
+        client: OceanClient = OceanClient("ID0000000001", key_file)
+
+        baseline: float = run_benchmark(
+            "PEM text",
+            lambda body: jwt.encode({"uid": "ID0000000001", "data": body}, key_text, algorithm="RS256"),
+            number_of_signatures)
+        elapsed: float = run_benchmark("parsed key", client._encode_request_body, number_of_signatures)
+        print(f"{'':>16}{baseline / elapsed:.2f}x PEM text")
+
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        burst: int = min(number_of_signatures, 200)
+        signing_executor_rate: int = ocean_client.SIGNING_EXECUTOR_RATE
+        for name, rate in (("event loop", burst + 1), ("executor", signing_executor_rate)):
+            ocean_client.SIGNING_EXECUTOR_RATE = rate
+            client = OceanClient("ID0000000001", key_file)
+            stall: float = ev_loop.run_until_complete(max_loop_stall(client, burst))
+            print(f"{name:>14}: longest event loop stall signing {burst} requests {stall * 1e3:.1f}ms")
+        ocean_client.SIGNING_EXECUTOR_RATE = signing_executor_rate
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""
+Measures how long it takes to import the Hummingbot application and to load each connector, each in a fresh
+interpreter, and reports which heavy dependencies get pulled in along the way.
+
+Usage: python test/benchmark_startup.py [number_of_runs] [connector_name ...]
+"""
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import json
+import statistics
+import subprocess
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+from hummingbot.market.connector_registry import MARKET_CLASS_PATHS
+
+PROJECT_ROOT: str = realpath(join(__file__, "../../"))
+HEAVY_MODULES: List[str] = ["web3", "eth_account", "aiokafka", "pandas", "binance", "sqlalchemy"]
+
+MEASURE_SCRIPT: str = """
+import json, sys, time
+sys.path.insert(0, %(root)r)
+start = time.perf_counter()
+import hummingbot.client.hummingbot_application
+app_loaded = time.perf_counter()
+connector = %(connector)r
+if connector is not None:
+    from hummingbot.market.connector_registry import MARKET_CLASSES
+    MARKET_CLASSES[connector]
+end = time.perf_counter()
+print(json.dumps({
+    "application": app_loaded - start,
+    "connector": end - app_loaded,
+    "modules": [m for m in %(heavy_modules)r if m in sys.modules],
+}))
+"""
+
+
+def measure(connector: str = None) -> Dict[str, Any]:
+    script: str = MEASURE_SCRIPT % {"root": PROJECT_ROOT, "connector": connector, "heavy_modules": HEAVY_MODULES}
+    output: bytes = subprocess.check_output([sys.executable, "-c", script])
+    return json.loads(output.decode("utf8").strip().split("\n")[-1])
+
+
+def main():
+    number_of_runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    connectors: List[str] = sys.argv[2:] if len(sys.argv) > 2 else sorted(MARKET_CLASS_PATHS.keys())
+
+    results: List[Dict[str, Any]] = [measure() for _ in range(number_of_runs)]
+    print(f"hummingbot_application import: {statistics.median(r['application'] for r in results):.3f}s median "
+          f"over {number_of_runs} runs, loaded: {', '.join(results[0]['modules']) or '-'}")
+
+    for connector in connectors:
+        results = [measure(connector) for _ in range(number_of_runs)]
+        print(f"{connector:>14}: +{statistics.median(r['connector'] for r in results):.3f}s, "
+              f"loaded: {', '.join(results[0]['modules']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import unittest
+
+from hummingbot.core.data_type.active_order_book import ActiveOrderBook
+
+
+class ActiveOrderBookUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.book: ActiveOrderBook = ActiveOrderBook()
+        self.book.add_order("b1", True, 10.0, 1.0)
+        self.book.add_order("b2", True, 10.0, 2.0)
+        self.book.add_order("b3", True, 9.5, 1.5)
+        self.book.add_order("a1", False, 10.5, 3.0)
+
+    def test_levels(self):
+        self.assertEqual({10.0: 3.0, 9.5: 1.5}, self.book.active_bids)
+        self.assertEqual({10.5: 3.0}, self.book.active_asks)
+        self.assertEqual(4, self.book.order_count)
+        self.assertEqual(0.0, self.book.volume_for_price(False, 10.0))
+
+    def test_order_updates(self):
+        self.assertTrue(self.book.reduce_order_size("b1", 0.25))
+        self.assertTrue(self.book.set_order_size("b2", 4.0))
+        self.assertEqual(4.75, self.book.volume_for_price(True, 10.0))
+
+        self.assertTrue(self.book.remove_order("b2"))
+        self.assertEqual(0.75, self.book.volume_for_price(True, 10.0))
+        self.assertTrue(self.book.remove_order("b1"))
+        self.assertNotIn(10.0, self.book.active_bids)
+
+        self.assertFalse(self.book.remove_order("b1"))
+        self.assertFalse(self.book.set_order_size("missing", 1.0))
+
+    def test_emptied_level_volume(self):
+        self.book.add_order("x1", False, 12.0, 0.1)
+        self.book.add_order("x2", False, 12.0, 0.2)
+        self.book.remove_order("x1")
+        self.book.reduce_order_size("x2", 0.2)
+        self.assertEqual(0.0, self.book.volume_for_price(False, 12.0))
+
+        for i in range(10):
+            self.book.add_order(f"y{i}", False, 13.0, 0.1)
+        for i in range(10):
+            self.book.set_order_size(f"y{i}", 0.0)
+        self.assertEqual(0.0, self.book.volume_for_price(False, 13.0))
+
+    def test_replace_order(self):
+        # An order added again under the same id moves to its new price.
+        self.book.add_order("b3", False, 11.0, 2.0)
+        self.assertEqual({10.0: 3.0}, self.book.active_bids)
+        self.assertEqual({10.5: 3.0, 11.0: 2.0}, self.book.active_asks)
+        self.assertEqual(4, self.book.order_count)
+
+    def test_snapshot_np_arrays(self):
+        bids, asks = self.book.snapshot_np_arrays(1.0, 7)
+        self.assertEqual([[1.0, 10.0, 3.0, 7.0], [1.0, 9.5, 1.5, 7.0]], bids.tolist())
+        self.assertEqual([[1.0, 10.5, 3.0, 7.0]], asks.tolist())
+
+        self.book.clear()
+        bids, asks = self.book.snapshot_np_arrays(1.0, 7)
+        self.assertEqual((0, 4), bids.shape)
+        self.assertEqual((0, 4), asks.shape)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+)
+
+
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_bounded_concurrency(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=3)
+        in_flight: List[int] = [0]
+        max_in_flight: List[int] = [0]
+
+        async def call(i: int) -> int:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            await asyncio.sleep(0.1)
+            in_flight[0] -= 1
+            return i
+
+        start_time: float = time.monotonic()
+        results: List[int] = self.run_async(asyncio.gather(*[
+            scheduler.schedule_async_call(call(i), 1.0) for i in range(9)
+        ]))
+        self.assertEqual(list(range(9)), results)
+        self.assertEqual(3, max_in_flight[0])
+        # Three rounds of three calls, rather than nine calls one after another.
+        self.assertLess(time.monotonic() - start_time, 0.6)
+        self.assertEqual(9, scheduler.metrics.completed)
+        self.assertEqual(0, scheduler.metrics.in_flight)
+
+    def test_priorities(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=1)
+        served: List[str] = []
+
+        async def call(name: str):
+            served.append(name)
+            await asyncio.sleep(0.01)
+
+        async def run():
+            tasks = [asyncio.ensure_future(scheduler.schedule_async_call(call("first"), 1.0))]
+            await asyncio.sleep(0)
+            tasks += [
+                asyncio.ensure_future(scheduler.schedule_async_call(call("low"), 1.0, priority=PRIORITY_LOW)),
+                asyncio.ensure_future(scheduler.schedule_async_call(call("normal"), 1.0)),
+                asyncio.ensure_future(scheduler.schedule_async_call(call("high"), 1.0, priority=PRIORITY_HIGH)),
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual((1, 1, 1), scheduler.metrics.queue_depths)
+            await asyncio.gather(*tasks)
+
+        self.run_async(run())
+        self.assertEqual(["first", "high", "normal", "low"], served)
+
+    def test_timeout_frees_slot(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=1)
+
+        async def slow_call():
+            await asyncio.sleep(10)
+
+        async def fast_call() -> str:
+            return "done"
+
+        async def run():
+            slow = asyncio.ensure_future(scheduler.schedule_async_call(slow_call(), 0.1))
+            fast = asyncio.ensure_future(scheduler.schedule_async_call(fast_call(), 1.0))
+            with self.assertRaises(asyncio.TimeoutError):
+                await slow
+            return await fast
+
+        start_time: float = time.monotonic()
+        self.assertEqual("done", self.run_async(run()))
+        self.assertLess(time.monotonic() - start_time, 1.0)
+        self.assertEqual(1, scheduler.metrics.timed_out)
+        self.assertEqual(1, scheduler.metrics.completed)
+
+    def test_cancelled_calls_are_dropped(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=1)
+        started: List[str] = []
+
+        async def call(name: str):
+            started.append(name)
+            await asyncio.sleep(0.1)
+
+        async def run():
+            first = asyncio.ensure_future(scheduler.schedule_async_call(call("first"), 1.0))
+            second = asyncio.ensure_future(scheduler.schedule_async_call(call("second"), 1.0))
+            await asyncio.sleep(0.01)
+            second.cancel()
+            first.cancel()
+            await asyncio.sleep(0.01)
+            self.assertEqual(0, scheduler.in_flight)
+            self.assertEqual(0, scheduler.queue_depth)
+
+        self.run_async(run())
+        self.assertEqual(["first"], started)
+        self.assertEqual(2, scheduler.metrics.cancelled)
+
+    def test_call_interval(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.05, max_concurrency=4)
+        start_times: List[float] = []
+
+        async def call():
+            start_times.append(time.monotonic())
+
+        self.run_async(asyncio.gather(*[scheduler.schedule_async_call(call(), 1.0) for _ in range(4)]))
+        gaps: List[float] = [b - a for a, b in zip(start_times, start_times[1:])]
+        self.assertTrue(all(gap >= 0.045 for gap in gaps), gaps)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderFilledEvent
+)
+import hummingbot.market.binance.binance_market
+from hummingbot.market.binance.binance_market import BinanceMarket
+
+
+class LocalBinanceClient:
+    """
+    Answers the order status endpoints the way Binance does, recording each call.
+    """
+
+    def __init__(self, *args):
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.trades: List[Dict[str, Any]] = []
+
+    def set_order(self, client_order_id: str, exch_order_id: int, status: str, executed_qty: str):
+        self.orders[client_order_id] = {"symbol": "ETHUSDT", "orderId": exch_order_id,
+                                        "clientOrderId": client_order_id, "status": status, "type": "LIMIT",
+                                        "executedQty": executed_qty, "cummulativeQuoteQty": executed_qty}
+
+    def add_trade(self, trade_id: int, exch_order_id: int, qty: str):
+        self.trades.append({"symbol": "ETHUSDT", "id": trade_id, "orderId": exch_order_id, "price": "1",
+                            "qty": qty, "quoteQty": qty, "commission": "0", "commissionAsset": "ETH"})
+
+    def get_open_orders(self, **params) -> List[Dict[str, Any]]:
+        self.calls.append(("get_open_orders", params))
+        return [order for order in self.orders.values()
+                if order["symbol"] == params["symbol"] and order["status"] in ("NEW", "PARTIALLY_FILLED")]
+
+    def get_order(self, **params) -> Dict[str, Any]:
+        self.calls.append(("get_order", params))
+        return self.orders[params["origClientOrderId"]]
+
+    def get_my_trades(self, **params) -> List[Dict[str, Any]]:
+        self.calls.append(("get_my_trades", params))
+        return [trade for trade in self.trades if trade["symbol"] == params["symbol"]]
+
+
+class BinanceOrderStatusUnitTest(unittest.TestCase):
+    events: List[MarketEvent] = [
+        MarketEvent.OrderFilled,
+        MarketEvent.BuyOrderCompleted
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.client: LocalBinanceClient = LocalBinanceClient()
+        with patch.object(hummingbot.market.binance.binance_market, "BinanceClient", return_value=self.client):
+            self.market: BinanceMarket = BinanceMarket("", "", trading_required=False)
+        # Order status is polled at most every 10 seconds, starting from the clock's start time.
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, 100.0, 200.0)
+        self.market.start(self.clock)
+        self.market.check_network_task.cancel()
+        self.event_logger: EventLogger = EventLogger()
+        for event_tag in self.events:
+            self.market.add_listener(event_tag, self.event_logger)
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def track_order(self, client_order_id: str, exch_order_id: int):
+        self.market.restore_tracking_states({client_order_id: {
+            "client_order_id": client_order_id,
+            "exchange_order_id": str(exch_order_id),
+            "trading_pair": "ETHUSDT",
+            "order_type": "LIMIT",
+            "trade_type": "BUY",
+            "price": "1",
+            "amount": "1",
+            "executed_amount_base": "0",
+            "executed_amount_quote": "0",
+            "fee_asset": None,
+            "fee_paid": "0",
+            "last_state": "NEW"
+        }})
+        self.client.set_order(client_order_id, exch_order_id, "NEW", "0")
+
+    def test_partially_filled_open_order(self):
+        self.track_order("buy-1", 1)
+        self.client.set_order("buy-1", 1, "PARTIALLY_FILLED", "0.4")
+        self.client.add_trade(11, 1, "0.4")
+        self.run_async(self.market._update_order_status())
+
+        # The missed fill is fetched from the trades of the trading pair.
+        self.assertEqual(["get_open_orders", "get_my_trades"], [name for name, _ in self.client.calls])
+        fill, = self.event_logger.event_log
+        self.assertIsInstance(fill, OrderFilledEvent)
+        self.assertEqual(("buy-1", Decimal("0.4"), 11), (fill.order_id, fill.amount, fill.exchange_trade_id))
+        self.assertEqual(Decimal("0.4"), self.market.in_flight_orders["buy-1"].executed_amount_base)
+
+    def test_order_missing_from_open_orders(self):
+        self.track_order("buy-1", 1)
+        self.track_order("buy-2", 2)
+        self.client.set_order("buy-2", 2, "FILLED", "1")
+        self.client.add_trade(21, 2, "1")
+        self.run_async(self.market._update_order_status())
+
+        # Only the order that is no longer open is fetched by itself.
+        self.assertEqual([("get_open_orders", {"symbol": "ETHUSDT"}),
+                          ("get_order", {"symbol": "ETHUSDT", "origClientOrderId": "buy-2"}),
+                          ("get_my_trades", {"symbol": "ETHUSDT"})],
+                         self.client.calls)
+        fill, completed = self.event_logger.event_log
+        self.assertIsInstance(fill, OrderFilledEvent)
+        self.assertIsInstance(completed, BuyOrderCompletedEvent)
+        self.assertEqual(("buy-2", Decimal("1")), (completed.order_id, completed.base_asset_amount))
+        self.assertEqual(["buy-1"], list(self.market.in_flight_orders.keys()))
+
+    def test_unchanged_open_orders(self):
+        self.track_order("buy-1", 1)
+        self.track_order("buy-2", 2)
+        self.run_async(self.market._update_order_status())
+
+        self.assertEqual([("get_open_orders", {"symbol": "ETHUSDT"})], self.client.calls)
+        self.assertEqual(0, len(self.event_logger.event_log))
+        self.assertEqual(["buy-1", "buy-2"], sorted(self.market.in_flight_orders.keys()))
+
+
+if __name__ == "__main__":
+    unittest.main()
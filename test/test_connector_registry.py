@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from collections import OrderedDict
+import os
+import unittest
+
+from hummingbot.market.connector_registry import (
+    MARKET_CLASS_PATHS,
+    ORDER_BOOK_TRACKER_CLASS_PATHS,
+    LazyClassRegistry,
+)
+
+
+class ConnectorRegistryUnitTest(unittest.TestCase):
+    def test_classes_are_imported_on_lookup(self):
+        registry: LazyClassRegistry = LazyClassRegistry({"ordered_dict": "collections.OrderedDict",
+                                                         "missing": "collections.DoesNotExist"})
+        self.assertIn("ordered_dict", registry)
+        self.assertNotIn("binance", registry)
+        self.assertEqual(["ordered_dict", "missing"], list(registry))
+        self.assertFalse(registry.is_loaded("ordered_dict"))
+
+        self.assertIs(OrderedDict, registry["ordered_dict"])
+        self.assertTrue(registry.is_loaded("ordered_dict"))
+        self.assertIsNone(registry.get("binance"))
+        with self.assertRaises(AttributeError):
+            registry["missing"]
+
+    def test_class_paths_point_to_connector_modules(self):
+        self.assertEqual(set(MARKET_CLASS_PATHS.keys()), set(ORDER_BOOK_TRACKER_CLASS_PATHS.keys()))
+        for class_path in list(MARKET_CLASS_PATHS.values()) + list(ORDER_BOOK_TRACKER_CLASS_PATHS.values()):
+            module_path: str = join(realpath(join(__file__, "../../")), *class_path.split(".")[:-1])
+            self.assertTrue(os.path.exists(module_path + ".py") or os.path.exists(module_path + ".pyx"), class_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import gzip
+import json
+import unittest
+import zlib
+
+from hummingbot.core.utils import fast_json
+
+
+class FastJSONUnitTest(unittest.TestCase):
+    def tearDown(self):
+        fast_json.set_backend(next(name for name in ("orjson", "ujson", "json") if name in fast_json.BACKENDS))
+
+    def test_loads(self):
+        msg = {"e": "depthUpdate", "E": 1580000000000, "b": [["199.99", "1.5"]], "p": 0.1, "m": True, "x": None}
+        for backend in fast_json.BACKENDS.keys():
+            fast_json.set_backend(backend)
+            self.assertEqual(backend, fast_json.backend_name())
+            self.assertEqual(msg, fast_json.loads(json.dumps(msg)))
+            self.assertEqual(msg, fast_json.loads(json.dumps(msg).encode("utf-8")))
+            self.assertEqual(msg, fast_json.loads(memoryview(json.dumps(msg).encode("utf-8"))))
+            self.assertEqual({"s": "ünïcode"}, fast_json.loads('{"s": "ünïcode"}'.encode("utf-8")))
+            with self.assertRaises(ValueError):
+                fast_json.loads(b'{"e": ')
+
+    def test_big_ints(self):
+        msg = {"id": 102000000000000000000000001, "ts": 1580000000000, "min": -9223372036854775809,
+               "price": 0.12345678901234567890, "ids": [18446744073709551615, 18446744073709551616]}
+        for backend in fast_json.BACKENDS.keys():
+            fast_json.set_backend(backend)
+            decoded = fast_json.loads(json.dumps(msg).encode("utf-8"))
+            self.assertEqual(msg, decoded)
+            self.assertIsInstance(decoded["id"], int)
+            self.assertIsInstance(decoded["min"], int)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            fast_json.set_backend("simplejson-9000")
+
+    def test_gzip_inflater(self):
+        inflater: fast_json.Inflater = fast_json.Inflater(fast_json.GZIP_WBITS)
+        for i in range(3):
+            frame: bytes = gzip.compress(json.dumps({"ping": i}).encode("utf-8"))
+            self.assertEqual({"ping": i}, inflater.loads(frame))
+
+    def test_deflate_stream_inflater(self):
+        # One compressor per connection, flushed after each frame.
+        compressor = zlib.compressobj(wbits=fast_json.RAW_DEFLATE_WBITS)
+        inflater: fast_json.Inflater = fast_json.Inflater(fast_json.RAW_DEFLATE_WBITS)
+        for i in range(3):
+            frame: bytes = (compressor.compress(json.dumps({"seq": i, "data": "x" * 100}).encode("utf-8")) +
+                            compressor.flush(zlib.Z_SYNC_FLUSH))
+            self.assertEqual({"seq": i, "data": "x" * 100}, inflater.loads(frame))
+
+
+if __name__ == "__main__":
+    unittest.main()
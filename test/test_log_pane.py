@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import threading
+from typing import List
+import unittest
+
+from prompt_toolkit.layout.controls import UIContent
+
+from hummingbot.client.ui.log_pane import (
+    LogPane,
+    LogRingBuffer,
+    LogSearchField,
+)
+
+
+class LogRingBufferUnitTest(unittest.TestCase):
+    def test_append_past_capacity(self):
+        lines: LogRingBuffer = LogRingBuffer(3)
+        for i in range(5):
+            lines.append(f"line {i}")
+        self.assertEqual(["line 2", "line 3", "line 4"], list(lines))
+        self.assertEqual("line 4", lines[-1])
+        self.assertEqual(2, lines.first_line_number)
+        self.assertEqual(4, lines.last_line_number)
+
+    def test_extend_past_capacity(self):
+        lines: LogRingBuffer = LogRingBuffer(3)
+        lines.append("line 0")
+        lines.extend([f"line {i}" for i in range(1, 6)])
+        self.assertEqual(["line 3", "line 4", "line 5"], list(lines))
+        self.assertEqual(3, lines.first_line_number)
+        self.assertEqual(5, lines.last_line_number)
+
+
+class LogPaneUnitTest(unittest.TestCase):
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.search_field: LogSearchField = LogSearchField([("", "")], [("", "Search >>> ")])
+        self.log_pane: LogPane = LogPane(max_line_count=100, initial_text="Running Logs",
+                                         search_field=self.search_field)
+
+    def visible_text(self, content: UIContent) -> List[str]:
+        return ["".join(text for _, text in content.get_line(row)) for row in range(content.line_count)]
+
+    def test_follows_latest_line(self):
+        self.log_pane.log("first\nsecond")
+        content: UIContent = self.log_pane.create_content()
+        self.assertEqual(["Running Logs", "first", "second"], self.visible_text(content))
+        self.assertEqual(2, content.cursor_position.y)
+
+        self.log_pane.scroll_up(2)
+        self.log_pane.log("third")
+        self.assertEqual(0, self.log_pane.create_content().cursor_position.y)
+        self.log_pane.scroll_down(5)
+        self.assertEqual(3, self.log_pane.create_content().cursor_position.y)
+
+    def test_log_from_another_thread(self):
+        thread: threading.Thread = threading.Thread(target=self.log_pane.log, args=("from thread",))
+        thread.start()
+        thread.join()
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual("from thread", self.log_pane.log_lines[-1])
+
+    def test_search(self):
+        for i in range(10):
+            self.log_pane.log(f"Order {i} {'filled' if i % 3 == 0 else 'created'}")
+        self.log_pane.start_search()
+        self.search_field.buffer.text = "FILLED"
+
+        content: UIContent = self.log_pane.create_content()
+        self.assertEqual(10, content.cursor_position.y)
+        self.assertEqual([("", "Order 9 "), ("class:search.current", "filled")], content.get_line(10))
+        self.assertEqual([("", "Order 6 "), ("class:search", "filled")], content.get_line(7))
+
+        matches: List[int] = []
+        for _ in range(5):
+            self.log_pane.search_next()
+            matches.append(self.log_pane.create_content().cursor_position.y)
+        # Older matches first, then wraps around to the latest one.
+        self.assertEqual([7, 4, 1, 10, 7], matches)
+
+        self.log_pane.stop_search()
+        self.assertEqual([("", "Order 9 filled")], self.log_pane.create_content().get_line(10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+import json
+import os
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List
+)
+import unittest
+
+from hummingbot.logger.log_server_client import LogServerClient
+
+
+class LogServerClientUnitTest(unittest.TestCase):
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.received: List[List[Dict[str, Any]]] = []
+        self.available: bool = True
+        self.tmp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.runner: web.AppRunner = self.ev_loop.run_until_complete(self.start_server())
+        self.client: LogServerClient = LogServerClient(self.url, spool_dir=self.tmp_dir.name)
+
+    def tearDown(self):
+        if self.client._shared_client is not None:
+            self.ev_loop.run_until_complete(self.client._shared_client.close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+        self.tmp_dir.cleanup()
+
+    async def handle_logs(self, request: web.Request) -> web.Response:
+        if not self.available:
+            return web.Response(status=503, text="Unavailable")
+        self.assertEqual("gzip", request.headers["Content-Encoding"])
+        # aiohttp inflates gzip encoded request bodies.
+        self.received.append(json.loads(await request.read()))
+        return web.Response(text="OK")
+
+    async def start_server(self) -> web.AppRunner:
+        app: web.Application = web.Application()
+        app.router.add_post("/logs", self.handle_logs)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port: int = site._server.sockets[0].getsockname()[1]
+        self.url: str = f"http://127.0.0.1:{port}"
+        return runner
+
+    def make_request(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "url": f"{self.url}/logs",
+            "method": "POST",
+            "request_obj": {
+                "headers": {"Content-Type": "application/json"},
+                "data": messages,
+                "params": {"ddsource": "hummingbot-client"}
+            }
+        }
+
+    def queue_requests(self, count: int, start: int = 0):
+        for i in range(start, start + count):
+            self.client._pending_requests.append(self.make_request([{"msg": f"log {i}"}]))
+
+    def test_batches_are_merged_and_split(self):
+        self.queue_requests(LogServerClient.MAX_BATCH_SIZE + 10)
+        self.assertTrue(self.ev_loop.run_until_complete(self.client.flush()))
+
+        self.assertEqual(2, len(self.received))
+        self.assertEqual(LogServerClient.MAX_BATCH_SIZE, len(self.received[0]))
+        self.assertEqual(10, len(self.received[1]))
+        self.assertEqual({"msg": "log 0"}, self.received[0][0])
+        self.assertEqual(0, self.client.pending_requests_count)
+
+    def test_spool_when_server_unavailable(self):
+        self.available = False
+        self.queue_requests(5)
+        self.assertFalse(self.ev_loop.run_until_complete(self.client.flush()))
+        self.assertEqual(1, len(os.listdir(self.tmp_dir.name)))
+
+        self.available = True
+        self.queue_requests(5, start=5)
+        self.assertTrue(self.ev_loop.run_until_complete(self.client.flush()))
+        self.assertEqual(0, len(os.listdir(self.tmp_dir.name)))
+        # Spooled logs are sent before newer ones.
+        self.assertEqual([f"log {i}" for i in range(10)], [entry["msg"] for batch in self.received for entry in batch])
+
+    def test_stop_sends_pending_requests(self):
+        self.queue_requests(3)
+        self.client.stop()
+        self.assertEqual(0, self.client.pending_requests_count)
+        self.assertEqual(0, len(os.listdir(self.tmp_dir.name)))
+        self.assertEqual([[{"msg": "log 0"}, {"msg": "log 1"}, {"msg": "log 2"}]], self.received)
+
+    def test_stop_spools_pending_requests(self):
+        self.available = False
+        self.queue_requests(3)
+        self.client.stop()
+        self.assertEqual(0, self.client.pending_requests_count)
+        self.assertEqual(1, len(os.listdir(self.tmp_dir.name)))
+
+        self.available = True
+        self.assertTrue(self.ev_loop.run_until_complete(self.client.flush()))
+        self.assertEqual([[{"msg": "log 0"}, {"msg": "log 1"}, {"msg": "log 2"}]], self.received)
+
+    def test_spool_form_body(self):
+        self.available = False
+        self.client._pending_requests.append(self.make_request({"metric": "volume", "value": "1.5"}))
+        self.assertFalse(self.ev_loop.run_until_complete(self.client.flush()))
+
+        spool_files: List[str] = self.client._spool_files()
+        self.assertEqual(1, len(spool_files))
+        self.assertEqual(b"metric=volume&value=1.5", self.client._read_spooled_batch(spool_files[0])["body"])
+
+    def test_spool_size_is_bounded(self):
+        self.client.MAX_SPOOL_SIZE = 1024
+        self.available = False
+        for i in range(20):
+            self.queue_requests(20, start=i * 20)
+            self.ev_loop.run_until_complete(self.client.flush())
+        spool_size: int = sum(os.path.getsize(join(self.tmp_dir.name, f)) for f in os.listdir(self.tmp_dir.name))
+        self.assertLessEqual(spool_size, 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
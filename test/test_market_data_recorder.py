@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+import tempfile
+from typing import Dict
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType
+)
+from hummingbot.market.market_data_recorder import (
+    MarketDataRecorder,
+    MarketDataStore,
+    OrderBookSampleBatch,
+    TradeSampleBatch
+)
+
+
+class MarketDataStoreUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.store: MarketDataStore = MarketDataStore(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def make_order_book_batch(start_timestamp: int, count: int) -> OrderBookSampleBatch:
+        batch: OrderBookSampleBatch = OrderBookSampleBatch()
+        for i in range(count):
+            bids: np.ndarray = np.array([[100.0 - i, 1.0], [99.0 - i, 2.0], [np.nan, np.nan]])
+            asks: np.ndarray = np.array([[101.0 + i, 1.5], [102.0 + i, 2.5], [103.0 + i, 3.5]])
+            batch.append(start_timestamp + i * 100, bids, asks)
+        return batch
+
+    def test_order_book_samples_round_trip(self):
+        self.store.write_order_book_samples("binance", "ETHUSDT", self.make_order_book_batch(1000, 5))
+        self.store.write_order_book_samples("binance", "ETHUSDT", self.make_order_book_batch(2000, 5))
+
+        samples: pd.DataFrame = self.store.load_order_book_samples("binance", "ETHUSDT")
+        self.assertEqual(10, len(samples))
+        self.assertEqual([1000, 1100, 1200, 1300, 1400, 2000, 2100, 2200, 2300, 2400], list(samples.index))
+        self.assertEqual(100.0, samples["bid_price_0"].iloc[0])
+        self.assertEqual(2.5, samples["ask_amount_1"].iloc[0])
+        self.assertTrue(np.isnan(samples["bid_price_2"].iloc[0]))
+
+    def test_order_book_samples_time_range(self):
+        self.store.write_order_book_samples("binance", "ETHUSDT", self.make_order_book_batch(1000, 5))
+        self.store.write_order_book_samples("binance", "ETHUSDT", self.make_order_book_batch(2000, 5))
+        self.store.write_order_book_samples("binance", "BTCUSDT", self.make_order_book_batch(1000, 5))
+
+        samples: pd.DataFrame = self.store.load_order_book_samples("binance", "ETHUSDT", 1300, 2100)
+        self.assertEqual([1300, 1400, 2000, 2100], list(samples.index))
+        self.assertEqual(0, len(self.store.load_order_book_samples("binance", "ETHUSDT", 3000)))
+        self.assertEqual(0, len(self.store.load_order_book_samples("kucoin", "ETH-USDT")))
+
+    def test_trades_round_trip(self):
+        batch: TradeSampleBatch = TradeSampleBatch()
+        batch.append(1000, 1, 100.5, 0.1)
+        batch.append(1500, 2, 100.4, 0.2)
+        self.store.write_trades("binance", "ETHUSDT", batch)
+        self.store.write_trades("binance", "ETHUSDT", TradeSampleBatch())
+
+        trades: pd.DataFrame = self.store.load_trades("binance", "ETHUSDT")
+        self.assertEqual([1000, 1500], list(trades.index))
+        self.assertEqual([1, 2], list(trades["trade_type"]))
+        self.assertEqual([100.5, 100.4], list(trades["price"]))
+        self.assertEqual([0.1, 0.2], list(trades["amount"]))
+
+    def test_same_time_range_is_not_overwritten(self):
+        self.store.write_order_book_samples("binance", "ETHUSDT", self.make_order_book_batch(1000, 1))
+        self.store.write_order_book_samples("binance", "ETHUSDT", self.make_order_book_batch(1000, 1))
+        self.store.write_order_book_samples("binance", "ETHUSDT", self.make_order_book_batch(1000, 1))
+        self.assertEqual([1000, 1000, 1000], list(self.store.load_order_book_samples("binance", "ETHUSDT").index))
+
+
+class MockMarket:
+    name: str = "binance"
+    display_name: str = "binance_PaperTrade"
+
+    def __init__(self):
+        self.order_books: Dict[str, OrderBook] = {}
+
+
+class MarketDataRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.store: MarketDataStore = MarketDataStore(self.tmp_dir.name)
+        self.order_book: OrderBook = OrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(100.0, 1.0, 1), OrderBookRow(99.0, 2.0, 1)],
+                                       [OrderBookRow(101.0, 1.0, 1)],
+                                       1)
+        self.market: MockMarket = MockMarket()
+        self.market.order_books["ETHUSDT"] = self.order_book
+        self.recorder: MarketDataRecorder = MarketDataRecorder([self.market], self.store, depth=2)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_samples_on_top_of_book_change(self):
+        self.recorder.watch_order_books()
+        # Below the top of the book.
+        self.order_book.apply_diffs([OrderBookRow(99.0, 3.0, 2)], [], 2)
+        self.order_book.apply_diffs([OrderBookRow(100.0, 1.5, 3)], [], 3)
+        self.order_book.apply_diffs([], [OrderBookRow(100.5, 1.0, 4)], 4)
+        self.order_book.apply_snapshot([OrderBookRow(100.0, 1.5, 5), OrderBookRow(99.0, 3.0, 5)],
+                                       [OrderBookRow(100.5, 1.0, 5), OrderBookRow(101.0, 1.0, 5)],
+                                       5)
+        # Already recorded order books aren't sampled again.
+        self.recorder.watch_order_books()
+        self.recorder.flush()
+
+        samples: pd.DataFrame = self.store.load_order_book_samples("binance_PaperTrade", "ETHUSDT")
+        self.assertEqual([1.0, 1.5, 1.5], list(samples["bid_amount_0"]))
+        self.assertEqual([2.0, 3.0, 3.0], list(samples["bid_amount_1"]))
+        self.assertEqual([101.0, 101.0, 100.5], list(samples["ask_price_0"]))
+        self.assertTrue(np.isnan(samples["ask_price_1"].iloc[0]))
+        self.assertEqual(101.0, samples["ask_price_1"].iloc[2])
+        self.assertEqual(0, len(self.store.load_order_book_samples("binance", "ETHUSDT")))
+
+    def test_trades(self):
+        self.recorder.watch_order_books()
+        self.order_book.apply_trade(OrderBookTradeEvent("ETHUSDT", 1.5, TradeType.BUY, Decimal("101"), Decimal("0.5")))
+        self.recorder.flush()
+
+        trades: pd.DataFrame = self.store.load_trades("binance_PaperTrade", "ETHUSDT")
+        self.assertEqual([1500], list(trades.index))
+        self.assertEqual([TradeType.BUY.value], list(trades["trade_type"]))
+        self.assertEqual([101.0], list(trades["price"]))
+
+    def test_replaced_order_book(self):
+        self.recorder.watch_order_books()
+        new_order_book: OrderBook = OrderBook()
+        new_order_book.apply_snapshot([OrderBookRow(90.0, 1.0, 1)], [OrderBookRow(91.0, 1.0, 1)], 1)
+        self.market.order_books["ETHUSDT"] = new_order_book
+        self.recorder.watch_order_books()
+        # The replaced order book isn't recorded anymore.
+        self.order_book.apply_diffs([OrderBookRow(100.0, 5.0, 2)], [], 2)
+        new_order_book.apply_diffs([OrderBookRow(90.0, 5.0, 2)], [], 2)
+        self.recorder.flush()
+        # Nor is any order book once the recorder is stopped.
+        self.recorder.stop()
+        new_order_book.apply_diffs([OrderBookRow(90.0, 6.0, 3)], [], 3)
+        self.recorder.flush()
+
+        samples: pd.DataFrame = self.store.load_order_book_samples("binance_PaperTrade", "ETHUSDT")
+        self.assertEqual([100.0, 90.0, 90.0], list(samples["bid_price_0"]))
+        self.assertEqual([1.0, 1.0, 5.0], list(samples["bid_amount_0"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    Dict,
+    List
+)
+import unittest
+
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.market_mid_price import MidPriceService
+
+
+class MockOrderBook:
+    def __init__(self, bid: float, ask: float):
+        self.bid: float = bid
+        self.ask: float = ask
+
+    def get_price(self, is_buy: bool) -> float:
+        return self.ask if is_buy else self.bid
+
+
+class MockMarket:
+    name: str = "binance"
+
+    def __init__(self, order_books: Dict[str, MockOrderBook]):
+        self.order_books: Dict[str, MockOrderBook] = order_books
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair.replace("-", "")
+
+
+class MockMidPriceService(MidPriceService):
+    def __init__(self):
+        super().__init__()
+        self.fetch_count: int = 0
+        self.kraken_requests: List[str] = []
+
+    async def fetch_binance_prices(self) -> Dict[str, Decimal]:
+        self.fetch_count += 1
+        await asyncio.sleep(0.01)
+        return {"ETH-USDT": Decimal("200.5"), "BTC-USDT": Decimal("9000")}
+
+    async def fetch_kraken_prices(self, trading_pair: str) -> Dict[str, Decimal]:
+        self.kraken_requests.append(trading_pair)
+        await asyncio.sleep(0.01)
+        return {"ETH-USD": Decimal("199.5")} if trading_pair == "ETH-USD" else {}
+
+
+class MidPriceServiceUnitTest(unittest.TestCase):
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.service: MockMidPriceService = MockMidPriceService()
+
+    def test_concurrent_requests_are_coalesced(self):
+        prices = self.ev_loop.run_until_complete(safe_gather(
+            self.service.get_mid_price("binance", "ETH-USDT"),
+            self.service.get_mid_price("binance", "BTC-USDT"),
+            self.service.get_mid_price("binance", "XRP-USDT"),
+        ))
+        self.assertEqual([Decimal("200.5"), Decimal("9000"), None], prices)
+        self.assertEqual(1, self.service.fetch_count)
+
+        # Prices are kept until they expire.
+        self.ev_loop.run_until_complete(self.service.get_mid_price("binance", "ETH-USDT"))
+        self.assertEqual(1, self.service.fetch_count)
+
+    def test_cached_mid_price_does_not_wait(self):
+        self.assertIsNone(self.service.get_cached_mid_price("binance", "ETH-USDT"))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(Decimal("200.5"), self.service.get_cached_mid_price("binance", "ETH-USDT"))
+        self.assertEqual(1, self.service.fetch_count)
+
+    def test_prefetch(self):
+        # Exchanges without a ticker set endpoint need the trading pair.
+        self.service.prefetch("kraken")
+        self.service.prefetch("binance")
+        self.assertEqual([], self.service.kraken_requests)
+        self.service.prefetch("kraken", "ETH-USD")
+        self.service.prefetch("kraken", "ETH-USD")
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(["ETH-USD"], self.service.kraken_requests)
+        self.assertEqual(1, self.service.fetch_count)
+
+        self.assertEqual(Decimal("199.5"), self.service.get_cached_mid_price("kraken", "ETH-USD"))
+        self.assertEqual(Decimal("200.5"), self.service.get_cached_mid_price("binance", "ETH-USDT"))
+        self.assertEqual(["ETH-USD"], self.service.kraken_requests)
+        self.assertEqual(1, self.service.fetch_count)
+
+    def test_live_order_book_is_preferred(self):
+        market: MockMarket = MockMarket({"ETHUSDT": MockOrderBook(199.0, 201.0),
+                                         "BTCUSDT": MockOrderBook(float("nan"), float("nan"))})
+        self.service.add_markets([market])
+        self.assertEqual(Decimal("200"), self.ev_loop.run_until_complete(
+            self.service.get_mid_price("binance", "ETH-USDT")))
+        self.assertEqual(0, self.service.fetch_count)
+        # Falls back to the ticker prices when the order book is empty.
+        self.assertEqual(Decimal("9000"), self.ev_loop.run_until_complete(
+            self.service.get_mid_price("binance", "BTC-USDT")))
+        self.assertEqual(1, self.service.fetch_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
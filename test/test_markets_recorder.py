@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import tempfile
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+import unittest
+
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType
+)
+from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class MockMarket:
+    name: str = "binance"
+    display_name: str = "binance_PaperTrade"
+
+    def __init__(self):
+        self.tracking_states: Dict[str, Any] = {}
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    config_file_path: str = "conf_pure_mm_0.yml"
+
+    def setUp(self):
+        self.tmp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=join(self.tmp_dir.name, "trades.sqlite"))
+        self.market: MockMarket = MockMarket()
+        self.recorder: MarketsRecorder = MarketsRecorder(self.sql,
+                                                         [self.market],
+                                                         self.config_file_path,
+                                                         "pure_market_making",
+                                                         flush_interval=60.0,
+                                                         flush_batch_size=10)
+
+    def tearDown(self):
+        self.recorder.flush()
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def create_order(self, order_id: str):
+        self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value,
+                                        self.market,
+                                        BuyOrderCreatedEvent(time.time(), OrderType.LIMIT, "ETH-USDT", Decimal("1"),
+                                                             Decimal("200"), order_id))
+
+    def fill_order(self, order_id: str):
+        self.recorder._did_fill_order(MarketEvent.OrderFilled.value,
+                                      self.market,
+                                      OrderFilledEvent(time.time(), order_id, "ETH-USDT", TradeType.BUY,
+                                                       OrderType.LIMIT, Decimal("200"), Decimal("0.5"),
+                                                       TradeFee(Decimal("0.001")), "1"))
+
+    def cancel_order(self, order_id: str):
+        self.recorder._did_cancel_order(MarketEvent.OrderCancelled.value,
+                                        self.market,
+                                        OrderCancelledEvent(time.time(), order_id))
+
+    def get_recorded(self) -> Tuple[List[Order], List[OrderStatus], List[TradeFill]]:
+        with self.sql.begin() as session:
+            return (session.query(Order).order_by(Order.id).all(),
+                    session.query(OrderStatus).order_by(OrderStatus.id).all(),
+                    session.query(TradeFill).all())
+
+    def test_records_are_buffered_until_flush(self):
+        self.create_order("buy-1")
+        self.fill_order("buy-1")
+        self.assertEqual(4, self.recorder.pending_records_count)
+        self.assertEqual(([], [], []), self.get_recorded())
+
+        self.recorder.flush()
+        self.assertEqual(0, self.recorder.pending_records_count)
+        orders, order_statuses, trade_fills = self.get_recorded()
+        self.assertEqual(["buy-1"], [order.id for order in orders])
+        self.assertEqual("OrderFilled", orders[0].last_status)
+        self.assertEqual(["BuyOrderCreated", "OrderFilled"], [status.status for status in order_statuses])
+        self.assertEqual(["buy-1"], [fill.order_id for fill in trade_fills])
+        self.assertEqual("binance_PaperTrade", trade_fills[0].market)
+
+    def test_flush_batch_size(self):
+        for i in range(5):
+            self.create_order(f"buy-{i}")
+        # 10 rows are pending after the 5th order.
+        self.assertEqual(0, self.recorder.pending_records_count)
+        self.assertEqual(5, len(self.get_recorded()[0]))
+
+    def test_status_of_recorded_orders(self):
+        self.create_order("buy-1")
+        self.recorder.flush()
+        self.cancel_order("buy-1")
+        # Orders that were never recorded don't get status rows.
+        self.cancel_order("buy-2")
+        self.recorder.flush()
+
+        orders, order_statuses, _ = self.get_recorded()
+        self.assertEqual("OrderCancelled", orders[0].last_status)
+        self.assertEqual([("buy-1", "BuyOrderCreated"), ("buy-1", "OrderCancelled")],
+                         [(status.order_id, status.status) for status in order_statuses])
+
+    def test_failed_batch_is_written_one_by_one(self):
+        self.create_order("buy-1")
+        self.recorder.flush()
+        # The duplicate order fails the whole batch, and then only itself.
+        self.create_order("buy-1")
+        self.create_order("buy-2")
+        self.fill_order("buy-2")
+        self.recorder.flush()
+
+        orders, order_statuses, trade_fills = self.get_recorded()
+        self.assertEqual(["buy-1", "buy-2"], [order.id for order in orders])
+        self.assertEqual("OrderFilled", orders[1].last_status)
+        self.assertEqual(4, len(order_statuses))
+        self.assertEqual(["buy-2"], [fill.order_id for fill in trade_fills])
+        self.assertEqual(0, self.recorder.pending_records_count)
+
+    def test_reads_flush_first(self):
+        self.create_order("buy-1")
+        self.fill_order("buy-1")
+        self.assertEqual(["buy-1"], [fill.order_id for fill in
+                                     self.recorder.get_trades_for_config(self.config_file_path)])
+        self.assertEqual(["buy-1"], [order.id for order in
+                                     self.recorder.get_orders_for_config_and_market(self.config_file_path,
+                                                                                    self.market)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+
+from hummingbot.core.management.metrics import (
+    EventLoopLagMonitor,
+    GaugeSample,
+    Histogram,
+    MetricsHTTPServer,
+    MetricsRegistry,
+    queue_depth_gauges,
+)
+
+
+class QueueOwner:
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    def metrics_gauges(self):
+        return queue_depth_gauges("QueueOwner", [("stream", self.queue)])
+
+
+class MetricsUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_histogram(self):
+        histogram: Histogram = Histogram("test", bounds=(1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0, 10.0):
+            histogram.observe(value)
+        self.assertEqual([1, 2, 1, 1], histogram.bucket_counts)
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(16.5, histogram.sum)
+        self.assertEqual(10.0, histogram.max)
+        self.assertAlmostEqual(1.75, histogram.quantile(0.5))
+        self.assertEqual(10.0, histogram.quantile(1.0))
+
+    def test_prometheus_text(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        histogram: Histogram = registry.histogram("tick_seconds", (("iterator", "Strategy"),), "Tick time.",
+                                                  bounds=(0.01, 0.1))
+        histogram.observe(0.005)
+        histogram.observe(0.05)
+        owner: QueueOwner = QueueOwner()
+        owner.queue.put_nowait(1)
+        registry.add_gauge_source(owner)
+        text: str = registry.prometheus_text()
+        self.assertIn("# HELP tick_seconds Tick time.", text)
+        self.assertIn("# TYPE tick_seconds histogram", text)
+        self.assertIn('tick_seconds_bucket{iterator="Strategy",le="0.01"} 1', text)
+        self.assertIn('tick_seconds_bucket{iterator="Strategy",le="0.1"} 2', text)
+        self.assertIn('tick_seconds_bucket{iterator="Strategy",le="+Inf"} 2', text)
+        self.assertIn('tick_seconds_count{iterator="Strategy"} 2', text)
+        self.assertIn('hummingbot_queue_depth{owner="QueueOwner",queue="stream"} 1.0', text)
+
+        # Gauge sources are weakly referenced.
+        del owner
+        self.assertEqual([], registry.gauges())
+
+    def test_event_loop_lag(self):
+        monitor: EventLoopLagMonitor = EventLoopLagMonitor(interval=0.01)
+        monitor.start()
+
+        async def block_event_loop():
+            await asyncio.sleep(0.05)
+            time.sleep(0.1)
+            await asyncio.sleep(0.05)
+
+        self.run_async(block_event_loop())
+        monitor.stop()
+        self.assertGreater(monitor.histogram.count, 0)
+        self.assertGreaterEqual(monitor.histogram.max, 0.05)
+
+    def test_http_server(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        registry.histogram("tick_seconds").observe(0.1)
+        server: MetricsHTTPServer = MetricsHTTPServer(0, registry=registry)
+
+        async def fetch(path: str) -> bytes:
+            await server.start()
+            port: int = server._server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            response: bytes = await reader.read()
+            writer.close()
+            server.stop()
+            return response
+
+        response: bytes = self.run_async(fetch("/metrics"))
+        self.assertTrue(response.startswith(b"HTTP/1.1 200 OK"))
+        self.assertIn(b"tick_seconds_count 1", response)
+        self.assertTrue(self.run_async(fetch("/other")).startswith(b"HTTP/1.1 404"))
+
+    def test_summary_lines(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        registry.histogram("tick_seconds").observe(0.002)
+        registry.add_gauge_source(self)
+        lines = registry.summary_lines()
+        self.assertTrue(any(line.strip().startswith("tick_seconds") and "2.000" in line for line in lines))
+        self.assertTrue(any("depth" in line for line in lines))
+
+    def test_reset(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        histogram: Histogram = registry.histogram("tick_seconds", bounds=(0.01, 0.1))
+        histogram.observe(0.05)
+        registry.reset()
+        self.assertEqual([0, 0, 0], histogram.bucket_counts)
+        self.assertEqual((0, 0.0, 0.0), (histogram.count, histogram.sum, histogram.max))
+
+        # Histograms kept by their observers are still reported after a reset.
+        histogram.observe(0.002)
+        self.assertIs(histogram, registry.histogram("tick_seconds"))
+        self.assertIn("tick_seconds_count 1", registry.prometheus_text())
+        self.assertTrue(any(line.strip().startswith("tick_seconds") and "2.000" in line
+                            for line in registry.summary_lines()))
+
+    def metrics_gauges(self):
+        return [GaugeSample("depth", (), 3)]
+
+
+if __name__ == "__main__":
+    unittest.main()
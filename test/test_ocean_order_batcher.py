@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    List
+)
+import unittest
+
+from hummingbot.market.ocean.ocean_client import OceanException
+from hummingbot.market.ocean.ocean_order_batcher import OceanOrderBatcher
+
+
+class LocalOceanClient:
+    """
+    Answers order requests the way OceanEx does, recording each request.
+    """
+
+    def __init__(self):
+        self.requests: List[Any] = []
+        self.next_id: int = 1
+        self.rejected_volume: str = "0"
+
+    def _create(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        if order["volume"] == self.rejected_volume:
+            return {"code": 1001, "message": "volume too small"}
+        self.next_id += 1
+        return {"id": self.next_id, "state": "wait", **order}
+
+    async def create_order(self, **params) -> Dict[str, Any]:
+        self.requests.append(("create_order", params))
+        return {"code": 0, "message": "Operation successful", "data": self._create(params)}
+
+    async def create_multiple_orders(self, symbol: str, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        self.requests.append(("create_multiple_orders", symbol, orders))
+        return {"code": 0, "message": "Operation successful", "data": [self._create(order) for order in orders]}
+
+    async def cancel_order(self, order_id: int) -> Dict[str, Any]:
+        self.requests.append(("cancel_order", order_id))
+        return {"code": 0, "message": "Operation successful", "data": {"id": order_id, "state": "cancelling"}}
+
+    async def cancel_multiple_orders(self, order_ids: List[int]) -> Dict[str, Any]:
+        self.requests.append(("cancel_multiple_orders", order_ids))
+        if any(order_id < 0 for order_id in order_ids):
+            return {"code": -1, "message": "invalid order id"}
+        return {"code": 0, "message": "Operation successful",
+                "data": [{"id": order_id, "state": "cancelling"} for order_id in order_ids if order_id != 404]}
+
+
+class OceanOrderBatcherUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.client: LocalOceanClient = LocalOceanClient()
+        self.batcher: OceanOrderBatcher = OceanOrderBatcher(self.client, max_batch_size=10)
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    @staticmethod
+    def order(side: str, volume: str) -> Dict[str, Any]:
+        return {"side": side, "volume": volume, "ord_type": "limit", "price": "0.01"}
+
+    def test_create_batches_per_market(self):
+        orders = [("vetusdt", self.order("buy", f"{i + 1}")) for i in range(20)]
+        orders.append(("vetbtc", self.order("sell", "7")))
+        results = self.run_async(asyncio.gather(*[self.batcher.create_order(market, order)
+                                                  for market, order in orders]))
+        self.assertEqual([order["volume"] for _, order in orders], [result["volume"] for result in results])
+        self.assertEqual(len(orders), len({result["id"] for result in results}))
+        self.assertEqual(3, self.batcher.create_request_count)
+        self.assertEqual([("create_multiple_orders", "vetusdt"), ("create_multiple_orders", "vetusdt"),
+                          ("create_order", None)],
+                         [(request[0], request[1] if len(request) > 2 else None) for request in self.client.requests])
+
+    def test_create_failures(self):
+        self.client.rejected_volume = "2"
+
+        async def create(volume: str):
+            try:
+                return await self.batcher.create_order("vetusdt", self.order("buy", volume))
+            except OceanException as e:
+                return e
+
+        results = self.run_async(asyncio.gather(create("1"), create("2"), create("3")))
+        self.assertEqual("1", results[0]["volume"])
+        self.assertIsInstance(results[1], OceanException)
+        self.assertEqual("3", results[2]["volume"])
+
+    def test_cancel(self):
+        order_ids: List[int] = list(range(100, 105)) + [404]
+        results = self.run_async(asyncio.gather(*[self.batcher.cancel_order(order_id) for order_id in order_ids],
+                                                return_exceptions=True))
+        self.assertEqual([("cancel_multiple_orders", order_ids)], self.client.requests)
+        self.assertEqual(order_ids[:-1], [result["id"] for result in results[:-1]])
+        self.assertIsInstance(results[-1], OceanException)
+
+        # A lone cancel uses the single order endpoint.
+        self.assertEqual("cancelling", self.run_async(self.batcher.cancel_order(7))["state"])
+        self.assertEqual(("cancel_order", 7), self.client.requests[-1])
+
+    def test_cancel_request_failure(self):
+        results = self.run_async(asyncio.gather(self.batcher.cancel_order(1), self.batcher.cancel_order(-1),
+                                                return_exceptions=True))
+        self.assertTrue(all(isinstance(result, OceanException) for result in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent
+)
+import hummingbot.market.ocean.ocean_market
+from hummingbot.market.ocean.ocean_market import OceanMarket
+
+
+class LocalOceanClient:
+    """
+    Answers order status requests the way OceanEx does, recording each request.
+    """
+
+    def __init__(self):
+        self.requests: List[Any] = []
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self.open_orders_available: bool = True
+
+    def set_order(self, exch_order_id: int, state: str, executed_volume: str = "0", market: str = "vetusdt"):
+        self.orders[exch_order_id] = {"id": exch_order_id, "market": market, "state": state,
+                                      "executed_volume": executed_volume, "avg_price": "0.01"}
+
+    async def get_order_status_filtered(self,
+                                        market: str,
+                                        states: List[str],
+                                        limit: int,
+                                        page: int) -> Dict[str, Any]:
+        self.requests.append(("get_order_status_filtered", market, page))
+        if not self.open_orders_available:
+            return {"code": -1, "message": "service unavailable"}
+        entries: List[Dict[str, Any]] = [entry for entry in self.orders.values()
+                                         if entry["market"] == market and entry["state"] in states]
+        page_entries: List[Dict[str, Any]] = entries[(page - 1) * limit:page * limit]
+        # Filtered orders are grouped by market.
+        data: List[Dict[str, Any]] = [{"market": market, "orders": page_entries}] if len(page_entries) > 0 else []
+        return {"code": 0, "message": "Operation successful", "data": data}
+
+    async def get_order_status(self, order_ids: List[int]) -> Dict[str, Any]:
+        self.requests.append(("get_order_status", order_ids))
+        return {"code": 0, "message": "Operation successful",
+                "data": [self.orders[order_id] for order_id in order_ids if order_id in self.orders]}
+
+
+class LocalOceanMarket(OceanMarket):
+    OPEN_ORDERS_PAGE_LIMIT = 2
+    ORDER_STATUS_CHUNK_SIZE = 3
+
+
+class OceanOrderStatusUnitTest(unittest.TestCase):
+    events: List[MarketEvent] = [
+        MarketEvent.OrderFilled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.client: LocalOceanClient = LocalOceanClient()
+        with patch.object(hummingbot.market.ocean.ocean_market, "OceanClient", return_value=self.client):
+            self.market: LocalOceanMarket = LocalOceanMarket("", "", trading_required=False)
+        self.event_logger: EventLogger = EventLogger()
+        for event_tag in self.events:
+            self.market.add_listener(event_tag, self.event_logger)
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def track_order(self, client_order_id: str, exch_order_id: Optional[int], trading_pair: str = "vetusdt"):
+        self.market.restore_tracking_states({client_order_id: {
+            "client_order_id": client_order_id,
+            "exchange_order_id": str(exch_order_id) if exch_order_id is not None else None,
+            "trading_pair": trading_pair,
+            "order_type": "LIMIT",
+            "trade_type": "BUY",
+            "price": "0.01",
+            "amount": "100",
+            "executed_amount_base": "0",
+            "executed_amount_quote": "0",
+            "fee_asset": None,
+            "fee_paid": "0",
+            "last_state": "wait"
+        }})
+
+    def test_open_orders_over_several_pages(self):
+        for i in range(5):
+            self.track_order(f"buy-{i}", i + 1)
+            self.client.set_order(i + 1, "wait")
+        self.track_order("buy-btc", 10, "vetbtc")
+        self.client.set_order(10, "wait", market="vetbtc")
+        self.run_async(self.market._update_order_status_now())
+
+        self.assertEqual([("get_order_status_filtered", "vetbtc", 1), ("get_order_status_filtered", "vetusdt", 1),
+                          ("get_order_status_filtered", "vetusdt", 2), ("get_order_status_filtered", "vetusdt", 3)],
+                         sorted(self.client.requests))
+        # Unchanged open orders are left as they are.
+        self.assertEqual(0, len(self.event_logger.event_log))
+        self.assertEqual(6, len(self.market.in_flight_orders))
+
+    def test_order_updates_in_chunks(self):
+        for i in range(7):
+            self.track_order(f"buy-{i}", i + 1)
+            self.client.set_order(i + 1, "done", "100")
+        self.run_async(self.market._update_order_status_now())
+
+        self.assertEqual([("get_order_status_filtered", "vetusdt", 1),
+                          ("get_order_status", [1, 2, 3]),
+                          ("get_order_status", [4, 5, 6]),
+                          ("get_order_status", [7])],
+                         self.client.requests)
+        self.assertEqual(7, len([evt for evt in self.event_logger.event_log if isinstance(evt, OrderFilledEvent)]))
+        self.assertEqual(7, len([evt for evt in self.event_logger.event_log
+                                 if isinstance(evt, BuyOrderCompletedEvent)]))
+        self.assertEqual(0, len(self.market.in_flight_orders))
+
+    def test_orders_missing_from_open_orders(self):
+        self.track_order("buy-open", 1)
+        self.client.set_order(1, "wait", "40")
+        self.track_order("buy-cancelled", 2)
+        self.client.set_order(2, "cancel")
+        self.track_order("buy-unknown", 3)
+        self.run_async(self.market._update_order_status_now())
+
+        # Only the orders that are no longer open are fetched by id.
+        self.assertEqual([("get_order_status_filtered", "vetusdt", 1), ("get_order_status", [2, 3])],
+                         self.client.requests)
+        fill, = [evt for evt in self.event_logger.event_log if isinstance(evt, OrderFilledEvent)]
+        self.assertEqual(("buy-open", 40), (fill.order_id, fill.amount))
+        self.assertEqual(["buy-cancelled"], [evt.order_id for evt in self.event_logger.event_log
+                                             if isinstance(evt, OrderCancelledEvent)])
+        # Orders the exchange doesn't know about are failed.
+        self.assertEqual(["buy-unknown"], [evt.order_id for evt in self.event_logger.event_log
+                                           if isinstance(evt, MarketOrderFailureEvent)])
+        self.assertEqual(["buy-open"], list(self.market.in_flight_orders.keys()))
+
+    def test_fallback_to_order_updates(self):
+        for i in range(4):
+            self.track_order(f"buy-{i}", i + 1)
+            self.client.set_order(i + 1, "wait")
+        self.client.set_order(4, "done", "100")
+        self.client.open_orders_available = False
+        self.run_async(self.market._update_order_status_now())
+
+        # All the orders of a market whose open orders couldn't be fetched are fetched by id.
+        self.assertEqual([("get_order_status_filtered", "vetusdt", 1),
+                          ("get_order_status", [1, 2, 3]),
+                          ("get_order_status", [4])],
+                         self.client.requests)
+        self.assertEqual(["buy-3"], [evt.order_id for evt in self.event_logger.event_log
+                                     if isinstance(evt, BuyOrderCompletedEvent)])
+        self.assertEqual(0, len([evt for evt in self.event_logger.event_log
+                                 if isinstance(evt, MarketOrderFailureEvent)]))
+        self.assertEqual(["buy-0", "buy-1", "buy-2"], sorted(self.market.in_flight_orders.keys()))
+
+    def test_order_without_exchange_order_id(self):
+        self.track_order("buy-1", 1)
+        self.client.set_order(1, "wait")
+        self.track_order("buy-no-id", None)
+        self.run_async(self.market._update_order_status_now())
+
+        self.assertEqual([("get_order_status_filtered", "vetusdt", 1)], self.client.requests)
+        self.assertEqual(["buy-no-id"], [evt.order_id for evt in self.event_logger.event_log
+                                         if isinstance(evt, MarketOrderFailureEvent)])
+        self.assertEqual(["buy-1"], list(self.market.in_flight_orders.keys()))
+
+
+if __name__ == "__main__":
+    unittest.main()
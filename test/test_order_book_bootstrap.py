@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+from typing import (
+    Dict,
+    List
+)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_bootstrap import OrderBookBootstrap
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    RateLimiter
+)
+
+
+def make_entry(trading_pair: str) -> OrderBookTrackerEntry:
+    return OrderBookTrackerEntry(trading_pair, time.time(), OrderBook())
+
+
+class OrderBookBootstrapUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_concurrent_loading(self):
+        trading_pairs: List[str] = [f"PAIR{i}" for i in range(8)]
+        in_flight: List[int] = [0]
+        max_in_flight: List[int] = [0]
+        ready: List[str] = []
+
+        async def fetch_entry(trading_pair: str) -> OrderBookTrackerEntry:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            await asyncio.sleep(0.1)
+            in_flight[0] -= 1
+            return make_entry(trading_pair)
+
+        bootstrap: OrderBookBootstrap = OrderBookBootstrap(fetch_entry,
+                                                           max_concurrency=4,
+                                                           on_entry=lambda entry: ready.append(entry.trading_pair))
+        start_time: float = time.monotonic()
+        entries: Dict[str, OrderBookTrackerEntry] = self.run_async(bootstrap.run(trading_pairs))
+        self.assertLess(time.monotonic() - start_time, 0.4)
+        self.assertEqual(4, max_in_flight[0])
+        self.assertEqual(trading_pairs, list(entries.keys()))
+        self.assertEqual(set(trading_pairs), set(ready))
+
+    def test_rate_limited_loading(self):
+        trading_pairs: List[str] = [f"PAIR{i}" for i in range(4)]
+        request_times: List[float] = []
+        rate_limiter: RateLimiter = RateLimiter([RateLimit("weight", 20, 1.0)], period_safety_margin=0.0)
+
+        async def fetch_entry(trading_pair: str) -> OrderBookTrackerEntry:
+            request_times.append(time.monotonic())
+            return make_entry(trading_pair)
+
+        bootstrap: OrderBookBootstrap = OrderBookBootstrap(fetch_entry, rate_limiter=rate_limiter, request_weight=10)
+        self.run_async(bootstrap.run(trading_pairs))
+        # Two requests fit in the bucket, the next ones wait for it to refill.
+        self.assertGreater(request_times[-1] - request_times[0], 0.9)
+
+    def test_bulk_loading_with_fallback(self):
+        trading_pairs: List[str] = [f"PAIR{i}" for i in range(5)]
+        bulk_requests: List[List[str]] = []
+        single_requests: List[str] = []
+
+        async def bulk_fetch(pairs: List[str]) -> Dict[str, OrderBookTrackerEntry]:
+            bulk_requests.append(pairs)
+            return {trading_pair: make_entry(trading_pair) for trading_pair in pairs if trading_pair != "PAIR3"}
+
+        async def fetch_entry(trading_pair: str) -> OrderBookTrackerEntry:
+            single_requests.append(trading_pair)
+            return make_entry(trading_pair)
+
+        bootstrap: OrderBookBootstrap = OrderBookBootstrap(fetch_entry, bulk_fetch=bulk_fetch, bulk_size=2)
+        entries: Dict[str, OrderBookTrackerEntry] = self.run_async(bootstrap.run(trading_pairs))
+        self.assertEqual([["PAIR0", "PAIR1"], ["PAIR2", "PAIR3"], ["PAIR4"]], bulk_requests)
+        self.assertEqual(["PAIR3"], single_requests)
+        self.assertEqual(trading_pairs, list(entries.keys()))
+
+    def test_retries(self):
+        attempts: Dict[str, int] = {"GOOD": 0, "FLAKY": 0, "BAD": 0}
+
+        async def fetch_entry(trading_pair: str) -> OrderBookTrackerEntry:
+            attempts[trading_pair] += 1
+            if trading_pair == "BAD" or (trading_pair == "FLAKY" and attempts[trading_pair] < 2):
+                raise IOError("Snapshot not available.")
+            return make_entry(trading_pair)
+
+        bootstrap: OrderBookBootstrap = OrderBookBootstrap(fetch_entry, max_attempts=3, retry_interval=0.01)
+        entries: Dict[str, OrderBookTrackerEntry] = self.run_async(bootstrap.run(["GOOD", "FLAKY", "BAD"]))
+        self.assertEqual(["GOOD", "FLAKY"], list(entries.keys()))
+        self.assertEqual({"GOOD": 1, "FLAKY": 2, "BAD": 3}, attempts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
+
+
+def snapshot_message(trading_pair: str) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": trading_pair,
+        "update_id": 1,
+        "bids": [],
+        "asks": []
+    }, timestamp=time.time())
+
+
+class OrderBookSnapshotSchedulerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def test_refreshes_are_spread_evenly(self):
+        scheduler: OrderBookSnapshotScheduler = OrderBookSnapshotScheduler(refresh_interval=100.0, request_budget=1.0)
+        scheduler.set_trading_pairs(["A", "B", "C", "D"])
+        due_times: List[float] = sorted(scheduler.due_time(trading_pair) for trading_pair in ["A", "B", "C", "D"])
+        gaps: List[float] = [b - a for a, b in zip(due_times, due_times[1:])]
+        for gap in gaps:
+            self.assertAlmostEqual(25.0, gap, places=3)
+
+        scheduler.set_trading_pairs(["A", "C"])
+        self.assertEqual(["A", "C"], scheduler.trading_pairs)
+
+    def test_request_budget_stretches_interval(self):
+        scheduler: OrderBookSnapshotScheduler = OrderBookSnapshotScheduler(refresh_interval=100.0, request_budget=0.5)
+        scheduler.set_trading_pairs([f"PAIR{i}" for i in range(100)])
+        # 100 trading pairs at 0.5 requests per second take 200 seconds.
+        self.assertEqual(200.0, scheduler.refresh_interval)
+
+    def test_urgent_refresh_comes_first(self):
+        scheduler: OrderBookSnapshotScheduler = OrderBookSnapshotScheduler(refresh_interval=100.0, request_budget=1.0)
+        scheduler.set_trading_pairs(["A", "B", "C"])
+        scheduler.request_refresh("C")
+        scheduler.request_refresh("C")
+        scheduler.request_refresh("UNKNOWN")
+        self.assertEqual(("C", None), scheduler._pop_due_trading_pair())
+        trading_pair, wait_time = scheduler._pop_due_trading_pair()
+        self.assertIsNone(trading_pair)
+        self.assertAlmostEqual(100.0 / 3, wait_time, places=1)
+
+    def test_active_trading_pairs_refresh_more_often(self):
+        scheduler: OrderBookSnapshotScheduler = OrderBookSnapshotScheduler(refresh_interval=100.0,
+                                                                           min_refresh_interval=10.0,
+                                                                           request_budget=1.0)
+        scheduler.set_trading_pairs(["QUIET", "BUSY"])
+        start_time: float = time.monotonic()
+        scheduler._last_refresh_times = {"QUIET": start_time - 10.0, "BUSY": start_time - 10.0}
+        scheduler.record_activity("QUIET", 10)
+        scheduler.record_activity("BUSY", 90)
+        scheduler._reschedule("QUIET", True)
+        scheduler._reschedule("BUSY", True)
+        # BUSY has 9 times QUIET's activity, and 1.8 times the mean.
+        self.assertAlmostEqual(100.0, scheduler.due_time("QUIET") - start_time, places=1)
+        self.assertAlmostEqual(100.0 / 1.8, scheduler.due_time("BUSY") - start_time, places=1)
+
+    def test_run(self):
+        scheduler: OrderBookSnapshotScheduler = OrderBookSnapshotScheduler(refresh_interval=0.2, request_budget=100.0)
+        output: asyncio.Queue = asyncio.Queue()
+        fetched: List[str] = []
+
+        async def get_trading_pairs() -> List[str]:
+            return ["A", "B"]
+
+        async def fetch_snapshot(trading_pair: str) -> OrderBookMessage:
+            fetched.append(trading_pair)
+            if trading_pair == "B" and fetched.count("B") == 1:
+                raise IOError("Snapshot not available.")
+            return snapshot_message(trading_pair)
+
+        async def run():
+            task: asyncio.Task = asyncio.ensure_future(scheduler.run(get_trading_pairs, fetch_snapshot, output))
+            await asyncio.sleep(0.5)
+            task.cancel()
+
+        self.ev_loop.run_until_complete(run())
+        trading_pairs: List[str] = [output.get_nowait().trading_pair for _ in range(output.qsize())]
+        # B's failed snapshot is retried after RETRY_INTERVAL, after the test is over.
+        self.assertEqual(["B"], [trading_pair for trading_pair in fetched if trading_pair == "B"])
+        self.assertGreaterEqual(trading_pairs.count("A"), 2)
+        self.assertNotIn("B", trading_pairs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import math
+import time
+import unittest
+
+from hummingbot.data_feed.price_oracle import (
+    PriceOracle,
+    order_book_price_key,
+    usd_price_key,
+)
+
+
+class MockOrderBook:
+    def __init__(self, bid: float, ask: float):
+        self.bid = bid
+        self.ask = ask
+
+    def get_price(self, is_buy: bool) -> float:
+        return self.ask if is_buy else self.bid
+
+
+class MockMarket:
+    name = "mock_market"
+
+    def __init__(self, order_book: MockOrderBook):
+        self.order_book = order_book
+
+    def get_order_book(self, trading_pair: str) -> MockOrderBook:
+        return self.order_book
+
+
+class PriceOracleUnitTest(unittest.TestCase):
+    def test_versions_and_staleness(self):
+        oracle: PriceOracle = PriceOracle(max_age=60)
+        key: str = usd_price_key("eth")
+        self.assertIsNone(oracle.get_price(key))
+
+        oracle.set_price(key, Decimal("200"), "test")
+        oracle.set_price(key, Decimal("201"), "test")
+        self.assertEqual(Decimal("201"), oracle.get_price(key))
+        self.assertEqual(2, oracle.get_entry(key).version)
+
+        oracle.set_price(key, Decimal("202"), "test", timestamp=time.time() - 120)
+        self.assertTrue(oracle.is_stale(key))
+        self.assertIsNone(oracle.get_price(key))
+        self.assertEqual(Decimal("202"), oracle.get_price(key, max_age=300))
+
+    def test_subscriptions(self):
+        oracle: PriceOracle = PriceOracle()
+        first_id: int = oracle.subscribe(["ETH-USD", "BTC-USD"])
+        second_id: int = oracle.subscribe(["ETH-USD"])
+        self.assertEqual({"ETH-USD", "BTC-USD"}, oracle.subscribed_keys)
+        self.assertEqual(["ETH-USD", "BTC-USD"], sorted(oracle.stale_keys(), reverse=True))
+
+        oracle.unsubscribe(first_id)
+        self.assertTrue(oracle.is_subscribed("ETH-USD"))
+        self.assertFalse(oracle.any_subscribed(["BTC-USD", "DAI-USD"]))
+        oracle.unsubscribe(second_id)
+        self.assertEqual(set(), oracle.subscribed_keys)
+
+    def test_order_book_prices(self):
+        oracle: PriceOracle = PriceOracle()
+        order_book: MockOrderBook = MockOrderBook(99.0, 101.0)
+        market: MockMarket = MockMarket(order_book)
+        key: str = oracle.add_order_book(market, "ETH-USDT")
+        self.assertEqual(order_book_price_key("mock_market", "ETH-USDT"), key)
+        self.assertEqual(Decimal("100"), oracle.get_price(key))
+
+        order_book.ask = 103.0
+        self.assertEqual(Decimal("101"), oracle.get_price(key))
+        self.assertEqual(2, oracle.get_entry(key).version)
+
+        order_book.bid = math.nan
+        self.assertEqual(Decimal("101"), oracle.get_price(key))
+
+        oracle.remove_order_book(market, "ETH-USDT")
+        oracle.set_price(key, Decimal("50"), "test", timestamp=0)
+        self.assertIsNone(oracle.get_price(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import io
+import logging
+import unittest
+
+from hummingbot.logger.queue_log_handler import (
+    LogQueueListener,
+    QueueLogHandler
+)
+
+
+class QueueLogHandlerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.stream: io.StringIO = io.StringIO()
+        self.stream_handler: logging.StreamHandler = logging.StreamHandler(self.stream)
+        self.stream_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+        self.logger: logging.Logger = logging.getLogger("test_queue_log_handler")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.handlers = [self.stream_handler]
+
+    def tearDown(self):
+        LogQueueListener.uninstall()
+        self.logger.handlers = []
+
+    def test_records_written_by_listener(self):
+        listener: LogQueueListener = LogQueueListener.install([self.logger])
+        self.assertIsInstance(self.logger.handlers[0], QueueLogHandler)
+        for i in range(10):
+            self.logger.info("Message %d", i)
+        LogQueueListener.uninstall()
+
+        self.assertEqual([self.stream_handler], self.logger.handlers)
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual([f"INFO - Message {i}" for i in range(10)], lines)
+        self.assertEqual({"test_queue_log_handler": 10}, listener.rate_counter.totals)
+
+    def test_handler_level_respected(self):
+        self.stream_handler.setLevel(logging.WARNING)
+        LogQueueListener.install([self.logger])
+        self.logger.info("Not written")
+        self.logger.warning("Written")
+        LogQueueListener.uninstall()
+        self.assertEqual(["WARNING - Written"], self.stream.getvalue().splitlines())
+
+    def test_overload_drops_and_summarizes(self):
+        # Don't start the writer thread, so the queue fills up.
+        listener: LogQueueListener = LogQueueListener(max_queue_size=3)
+        listener.wrap_logger(self.logger)
+        for i in range(5):
+            self.logger.info("Message %d", i)
+        self.logger.error("Error")
+        self.assertEqual(3, listener.dropped_count)
+
+        listener.start()
+        listener.stop()
+        self.logger.warning("Recovered")
+        listener.start()
+        listener.stop()
+        listener.unwrap_loggers()
+
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(["INFO - Message 0",
+                          "INFO - Message 1",
+                          "INFO - Message 2",
+                          "WARNING - Log queue overloaded - dropped 3 log records (1 ERROR, 2 INFO).",
+                          "WARNING - Recovered"], lines)
+        self.assertEqual(0, listener.dropped_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
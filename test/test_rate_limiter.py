@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.utils.asyncio_throttle import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    RateLimit,
+    RateLimiter,
+)
+
+
+class RateLimiterUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    async def _run_tasks(self, rate_limiter: RateLimiter, tasks) -> List[str]:
+        served: List[str] = []
+
+        async def task(name: str, request_weight: int, endpoint: str, priority: int):
+            async with rate_limiter.weighted_task(request_weight, endpoint, priority):
+                served.append(name)
+
+        await asyncio.gather(*[task(*args) for args in tasks])
+        return served
+
+    def test_capacity_and_wait_time(self):
+        rate_limiter: RateLimiter = RateLimiter([RateLimit("weight", 10, 0.5)], period_safety_margin=0)
+        start: float = time.time()
+        served: List[str] = self.run_async(self._run_tasks(rate_limiter, [
+            ("a", 6, None, PRIORITY_LOW), ("b", 4, None, PRIORITY_LOW), ("c", 5, None, PRIORITY_LOW)
+        ]))
+        elapsed: float = time.time() - start
+        self.assertEqual(["a", "b", "c"], served)
+        # "c" has to wait for 5 tokens to be refilled at 20 tokens per second.
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.5)
+
+    def test_priorities(self):
+        rate_limiter: RateLimiter = RateLimiter([RateLimit("weight", 1, 0.05)], period_safety_margin=0)
+        served: List[str] = self.run_async(self._run_tasks(rate_limiter, [
+            ("poll_1", 1, None, PRIORITY_LOW), ("poll_2", 1, None, PRIORITY_LOW), ("poll_3", 1, None, PRIORITY_LOW),
+            ("cancel", 1, None, PRIORITY_HIGH)
+        ]))
+        # The first poll is served right away, the cancel is served before the waiting polls.
+        self.assertEqual(["poll_1", "cancel", "poll_2", "poll_3"], served)
+
+    def test_endpoint_weights(self):
+        rate_limiter: RateLimiter = RateLimiter(
+            [RateLimit("weight", 100, 1.0), RateLimit("orders", 2, 1.0, counts_all_requests=False)],
+            endpoint_weights={"create_order": {"weight": 1, "orders": 1}}
+        )
+        self.assertEqual({"weight": 5}, rate_limiter.request_weights(5))
+        self.assertEqual({"weight": 1, "orders": 1}, rate_limiter.request_weights(5, "create_order"))
+        self.run_async(self._run_tasks(rate_limiter, [
+            ("create_1", 1, "create_order", PRIORITY_LOW), ("create_2", 1, "create_order", PRIORITY_LOW),
+            ("poll", 10, None, PRIORITY_LOW)
+        ]))
+        self.assertLess(rate_limiter.available_tokens("orders"), 1)
+        self.assertAlmostEqual(88, rate_limiter.available_tokens("weight"), delta=1)
+
+    def test_cancelled_waiter(self):
+        rate_limiter: RateLimiter = RateLimiter([RateLimit("weight", 1, 0.1)], period_safety_margin=0)
+
+        async def run():
+            await rate_limiter.acquire()
+            waiter = asyncio.ensure_future(rate_limiter.acquire())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.sleep(0)
+            await asyncio.wait_for(rate_limiter.acquire(), timeout=1.0)
+
+        self.run_async(run())
+        self.assertEqual(0, rate_limiter.waiting_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
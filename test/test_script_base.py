@@ -5,7 +5,7 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
 
 import unittest
 from decimal import Decimal
-from statistics import mean
+from statistics import mean, median
 from hummingbot.script.script_base import ScriptBase
 
 
@@ -68,6 +68,36 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         expected_chg = (15 - 5) / 5
         self.assertEqual(expected_chg, script_base.avg_price_volatility(10, 1))
 
+    def test_bounded_mid_price_history(self):
+        script_base = ScriptBase()
+        script_base.mid_price_history_capacity = 10
+        script_base.mid_prices = list(range(1, 16))
+        # Only the last 10 mid prices are kept
+        self.assertEqual(10, len(script_base.mid_prices))
+        self.assertEqual([6, 7, 8, 9, 10, 11, 12, 13, 14, 15], list(script_base.mid_prices))
+        self.assertEqual(mean([7, 11, 15]), script_base.avg_mid_price(4, 3))
+        # The rolling average follows newly appended mid prices
+        script_base.mid_prices.append(20)
+        self.assertEqual(mean([8, 12, 20]), script_base.avg_mid_price(4, 3))
+        self.assertEqual(20, script_base.mid_price)
+
+    def test_rolling_stats_after_wrap_around(self):
+        script_base = ScriptBase()
+        script_base.mid_price_history_capacity = 10
+        script_base.mid_prices = list(range(1, 40))
+        self.assertIsNone(script_base.avg_mid_price(4, 5))
+        self.assertIsNone(script_base.avg_price_volatility(3, 4))
+        script_base.mid_prices.extend(range(40, 60))
+        # The rolling statistics agree with the samples of the kept history, whenever they were first used. The
+        # lambdas take the path that computes the changes from the samples.
+        for interval, length in [(4, 5), (3, 4), (2, 5), (9, 2), (1, 10), (1, 11), (10, 1)]:
+            samples = script_base.mid_prices.samples(interval, length)
+            self.assertEqual(None if samples is None else mean(samples), script_base.avg_mid_price(interval, length))
+            self.assertEqual(script_base.locate_central_price_volatility(interval, length, lambda c: mean(c)),
+                             script_base.avg_price_volatility(interval, length))
+            self.assertEqual(script_base.locate_central_price_volatility(interval, length, lambda c: median(c)),
+                             script_base.median_price_volatility(interval, length))
+
     def test_round_by_step(self):
         self.assertEqual(Decimal("1.75"), ScriptBase.round_by_step(Decimal("1.8"), Decimal("0.25")))
         self.assertEqual(Decimal("1.75"), ScriptBase.round_by_step(Decimal("1.75"), Decimal("0.25")))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import unittest
+
+from hummingbot.script.script_channel import (
+    ScriptChannel,
+    decode_message,
+    encode_message,
+    MSG_LOG,
+    MSG_TICK,
+)
+from hummingbot.script.script_interface import PMMParameters
+
+
+class ScriptChannelUnitTest(unittest.TestCase):
+    def test_encode_decode(self):
+        payload = (Decimal("100.5"), {"bid_spread": Decimal("0.01")}, {"binance": {"ETH": None}})
+        self.assertEqual((MSG_TICK, payload), decode_message(encode_message(MSG_TICK, payload)))
+
+    def test_messages_are_handled_on_arrival(self):
+        ev_loop = asyncio.new_event_loop()
+        parent, child = ScriptChannel.create_pair()
+        received = []
+        child.listen(lambda msg_type, payload: received.append((msg_type, payload)), ev_loop)
+        parent.send(MSG_LOG, "first")
+        parent.send(MSG_LOG, "second")
+        ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual([(MSG_LOG, "first"), (MSG_LOG, "second")], received)
+
+        parent.close()
+        ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertFalse(child.is_listening)
+        child.close()
+        ev_loop.close()
+
+    def test_parameter_updates(self):
+        self.assertIn("bid_spread", PMMParameters.parameter_names())
+        params = PMMParameters()
+        params.update({"bid_spread": Decimal("0.01"), "order_levels": 2})
+        self.assertEqual(Decimal("0.01"), params.bid_spread)
+        self.assertEqual(2, params.order_levels)
+        self.assertIsNone(params.ask_spread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -111,7 +111,7 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         try:
             script_file = realpath(join(__file__, "../../scripts/update_parameters_test_script.py"))
 
-            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, 0.01, True)
+            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, True)
             self.clock.add_iterator(self._script_iterator)
             strategy = self.multi_levels_strategy
 
@@ -145,7 +145,7 @@ class ScriptIteratorUnitTest(unittest.TestCase):
     async def _test_price_band_price_ceiling_breach_async(self):
         try:
             script_file = realpath(join(__file__, "../../scripts/price_band_script.py"))
-            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, 0.01, True)
+            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, True)
             self.clock.add_iterator(self._script_iterator)
             strategy = self.multi_levels_strategy
 
@@ -170,7 +170,7 @@ class ScriptIteratorUnitTest(unittest.TestCase):
     async def _test_price_band_price_floor_breach_async(self):
         try:
             script_file = realpath(join(__file__, "../../scripts/price_band_script.py"))
-            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, 0.01, True)
+            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, True)
             self.clock.add_iterator(self._script_iterator)
 
             strategy = self.multi_levels_strategy
@@ -195,7 +195,7 @@ class ScriptIteratorUnitTest(unittest.TestCase):
     async def _test_strategy_ping_pong_on_ask_fill(self):
         try:
             script_file = realpath(join(__file__, "../../scripts/ping_pong_script.py"))
-            self._script_iterator = ScriptIterator(script_file, [self.market], self.one_level_strategy, 0.01, True)
+            self._script_iterator = ScriptIterator(script_file, [self.market], self.one_level_strategy, True)
             self.clock.add_iterator(self._script_iterator)
 
             strategy = self.one_level_strategy
@@ -232,7 +232,7 @@ class ScriptIteratorUnitTest(unittest.TestCase):
     async def _test_strategy_ping_pong_on_bid_fill(self):
         try:
             script_file = realpath(join(__file__, "../../scripts/ping_pong_script.py"))
-            self._script_iterator = ScriptIterator(script_file, [self.market], self.one_level_strategy, 0.01, True)
+            self._script_iterator = ScriptIterator(script_file, [self.market], self.one_level_strategy, True)
             self.clock.add_iterator(self._script_iterator)
 
             strategy = self.one_level_strategy
@@ -269,7 +269,7 @@ class ScriptIteratorUnitTest(unittest.TestCase):
     async def _test_dynamic_price_band_price_async(self):
         try:
             script_file = realpath(join(__file__, "../../scripts/dynamic_price_band_script.py"))
-            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, 0.01, True)
+            self._script_iterator = ScriptIterator(script_file, [self.market], self.multi_levels_strategy, True)
             self.clock.add_iterator(self._script_iterator)
 
             strategy = self.multi_levels_strategy
@@ -326,7 +326,7 @@ class ScriptIteratorUnitTest(unittest.TestCase):
     async def _test_spreads_adjusted_on_volatility_async(self):
         try:
             script_file = realpath(join(__file__, "../../scripts/spreads_adjusted_on_volatility_script.py"))
-            self._script_iterator = ScriptIterator(script_file, [self.market], self.one_level_strategy, 0.01, True)
+            self._script_iterator = ScriptIterator(script_file, [self.market], self.one_level_strategy, True)
             self.clock.add_iterator(self._script_iterator)
 
             strategy = self.one_level_strategy
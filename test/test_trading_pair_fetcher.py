@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+import tempfile
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+
+
+class MockTradingPairFetcher(TradingPairFetcher):
+    def __init__(self, *args, **kwargs):
+        self.binance_trading_pairs: List[str] = ["ETH-USDT", "BTC-USDT"]
+        self.fetch_count: int = 0
+        super().__init__(*args, **kwargs)
+
+    async def fetch_binance_trading_pairs(self) -> List[str]:
+        self.fetch_count += 1
+        await asyncio.sleep(0.01)
+        return self.binance_trading_pairs
+
+
+class TradingPairFetcherUnitTest(unittest.TestCase):
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.tmp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.cache_path: str = join(self.tmp_dir.name, "trading_pairs_cache.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_fetch_on_request_and_cache(self):
+        fetcher: MockTradingPairFetcher = MockTradingPairFetcher(self.cache_path, exchanges=[])
+        self.assertEqual([], fetcher.get_trading_pairs("binance"))
+        # Only one fetch is started for concurrent requests.
+        self.assertEqual([], fetcher.get_trading_pairs("binance"))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(1, fetcher.fetch_count)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], fetcher.get_trading_pairs("binance"))
+
+        with open(self.cache_path) as fd:
+            self.assertEqual(["ETH-USDT", "BTC-USDT"], json.load(fd)["binance"]["trading_pairs"])
+
+        # A new fetcher serves the fresh cached trading pairs without fetching them.
+        fetcher = MockTradingPairFetcher(self.cache_path, exchanges=["binance"])
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], fetcher.get_trading_pairs("binance"))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(0, fetcher.fetch_count)
+
+    def test_stale_cache_is_refreshed(self):
+        with open(self.cache_path, "w") as fd:
+            json.dump({"binance": {"timestamp": time.time() - TradingPairFetcher.CACHE_TTL - 1,
+                                   "trading_pairs": ["ETH-USDT"]}}, fd)
+        fetcher: MockTradingPairFetcher = MockTradingPairFetcher(self.cache_path, exchanges=["binance"])
+        self.assertEqual(["ETH-USDT"], fetcher.get_trading_pairs("binance"))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(1, fetcher.fetch_count)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], fetcher.get_trading_pairs("binance"))
+
+    def test_failed_fetch_keeps_cache(self):
+        with open(self.cache_path, "w") as fd:
+            json.dump({"binance": {"timestamp": 0, "trading_pairs": ["ETH-USDT"]}}, fd)
+        fetcher: MockTradingPairFetcher = MockTradingPairFetcher(self.cache_path, exchanges=[])
+        fetcher.binance_trading_pairs = []
+        self.ev_loop.run_until_complete(fetcher.fetch_all(["binance"]))
+        self.assertEqual(["ETH-USDT"], fetcher.get_trading_pairs("binance"))
+        # Failed fetches aren't retried right away.
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(1, fetcher.fetch_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
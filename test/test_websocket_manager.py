@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set
+)
+import unittest
+import websockets
+
+from hummingbot.core.utils.websocket_manager import (
+    WebSocketManager,
+    WebSocketSubscription
+)
+
+
+class LocalExchange:
+    """
+    A websocket server standing in for an exchange with a Pusher-like protocol.
+    """
+
+    def __init__(self):
+        self.server: Optional[Any] = None
+        self.subscriptions: Dict[Any, Set[str]] = {}
+        self.connection_count: int = 0
+        # Greets every connection, and then drops it.
+        self.greet_and_drop: bool = False
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    async def start(self):
+        self.server = await websockets.serve(self._handler, "127.0.0.1", 0)
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handler(self, ws, path=None):
+        self.connection_count += 1
+        if self.greet_and_drop:
+            await ws.send(json.dumps({"event": "connection_established"}))
+            await ws.close()
+            return
+        self.subscriptions[ws] = set()
+        try:
+            async for raw_msg in ws:
+                msg: Dict[str, Any] = json.loads(raw_msg)
+                if msg["event"] == "subscribe":
+                    self.subscriptions[ws].add(msg["channel"])
+                elif msg["event"] == "unsubscribe":
+                    self.subscriptions[ws].discard(msg["channel"])
+                elif msg["event"] == "pong":
+                    await ws.send(json.dumps({"event": "pong_received"}))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            del self.subscriptions[ws]
+
+    @property
+    def channels(self) -> List[str]:
+        return sorted(channel for channels in self.subscriptions.values() for channel in channels)
+
+    async def publish(self, channel: str, data: Any):
+        for ws, channels in list(self.subscriptions.items()):
+            if channel in channels:
+                await ws.send(json.dumps({"event": "update", "channel": channel, "data": data}))
+
+    async def drop_connections(self):
+        for ws in list(self.subscriptions.keys()):
+            await ws.close()
+
+
+class WebSocketManagerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.exchange: LocalExchange = LocalExchange()
+        self.run_async(self.exchange.start())
+        self.manager: WebSocketManager = WebSocketManager(
+            "local",
+            self.exchange.url,
+            subscribe_messages=lambda channels: [{"event": "subscribe", "channel": c} for c in channels],
+            unsubscribe_messages=lambda channels: [{"event": "unsubscribe", "channel": c} for c in channels],
+            get_channel=lambda msg: msg.get("channel"),
+            reply=lambda msg: {"event": "pong"} if msg["event"] == "ping" else None,
+            max_channels_per_connection=2,
+            max_connections=3,
+            min_backoff=0.05,
+            max_backoff=0.1
+        )
+
+    def tearDown(self):
+        self.manager.stop()
+        self.run_async(self.exchange.stop())
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    async def wait_for(self, condition, timeout: float = 2.0):
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(wait(), timeout)
+
+    async def next_messages(self, subscription: WebSocketSubscription, count: int) -> List[Any]:
+        return [await asyncio.wait_for(subscription.queue.get(), 1.0) for _ in range(count)]
+
+    def test_routing(self):
+        async def run():
+            trades: WebSocketSubscription = self.manager.subscribe(["trades-a", "trades-b"])
+            books: WebSocketSubscription = self.manager.subscribe(["book-a", "trades-a"])
+            await self.wait_for(lambda: len(self.exchange.channels) == 3)
+            await self.exchange.publish("trades-a", 1)
+            await self.exchange.publish("book-a", 2)
+            await self.exchange.publish("trades-b", 3)
+            self.assertEqual([1, 3], [msg["data"] for msg in await self.next_messages(trades, 2)])
+            self.assertEqual([1, 2], [msg["data"] for msg in await self.next_messages(books, 2)])
+        self.run_async(run())
+
+    def test_sharding(self):
+        async def run():
+            self.manager.subscribe([f"channel-{i}" for i in range(5)])
+            await self.wait_for(lambda: len(self.exchange.channels) == 5)
+            self.assertEqual(3, len(self.manager.connections))
+            self.assertEqual(3, self.exchange.connection_count)
+            self.assertEqual([2, 2, 1], [len(channels) for channels in self.exchange.subscriptions.values()])
+
+            # Beyond the connection limit, channels go on the least loaded connection.
+            self.manager.subscribe(["channel-5", "channel-6"])
+            await self.wait_for(lambda: len(self.exchange.channels) == 7)
+            self.assertEqual(3, len(self.manager.connections))
+        self.run_async(run())
+
+    def test_unsubscribe(self):
+        async def run():
+            first: WebSocketSubscription = self.manager.subscribe(["channel-0", "channel-1"])
+            second: WebSocketSubscription = self.manager.subscribe(["channel-1", "channel-2"])
+            await self.wait_for(lambda: len(self.exchange.channels) == 3)
+            first.close()
+            await self.wait_for(lambda: self.exchange.channels == ["channel-1", "channel-2"])
+            async with second:
+                pass
+            await self.wait_for(lambda: len(self.exchange.subscriptions) == 0)
+            self.assertEqual(0, len(self.manager.connections))
+        self.run_async(run())
+
+    def test_resubscribe_after_drop(self):
+        async def run():
+            subscription: WebSocketSubscription = self.manager.subscribe(["channel-0", "channel-1", "channel-2"])
+            await self.wait_for(lambda: len(self.exchange.channels) == 3)
+            await self.exchange.drop_connections()
+            await self.wait_for(lambda: self.exchange.connection_count == 4 and len(self.exchange.channels) == 3)
+            await self.exchange.publish("channel-2", "after")
+            self.assertEqual(["after"], [msg["data"] for msg in await self.next_messages(subscription, 1)])
+            self.assertEqual(2, sum(stats.reconnects for stats in self.manager.connection_stats()))
+        self.run_async(run())
+
+    def test_backoff_while_unreachable(self):
+        async def run():
+            subscription: WebSocketSubscription = self.manager.subscribe(["channel-0"])
+            await self.wait_for(lambda: len(self.exchange.channels) == 1)
+            await self.exchange.stop()
+            await self.exchange.drop_connections()
+            await asyncio.sleep(0.5)
+            # Immediate reconnection, then at most 0.1s between attempts.
+            self.assertGreater(self.manager.connection_stats()[0].reconnects, 3)
+            self.assertFalse(self.manager.connection_stats()[0].connected)
+            subscription.close()
+            await self.exchange.start()
+        self.run_async(run())
+
+    def test_backoff_while_dropped_after_greeting(self):
+        async def run():
+            self.exchange.greet_and_drop = True
+            subscription: WebSocketSubscription = self.manager.subscribe(["channel-0"])
+            await self.wait_for(lambda: self.exchange.connection_count >= 5)
+            # The greetings don't reset the backoff.
+            self.assertGreaterEqual(self.manager.connections[0]._failed_attempts, 4)
+            subscription.close()
+        self.run_async(run())
+
+    def test_control_messages_and_stats(self):
+        async def run():
+            subscription: WebSocketSubscription = self.manager.subscribe(["channel-0"])
+            await self.wait_for(lambda: len(self.exchange.channels) == 1)
+            for ws in self.exchange.subscriptions.keys():
+                await ws.send(json.dumps({"event": "ping"}))
+            # The pong is answered with a message of no channel, which isn't routed.
+            await self.wait_for(lambda: self.manager.connection_stats()[0].message_count == 2)
+            await self.exchange.publish("channel-0", "data")
+            self.assertEqual(["data"], [msg["data"] for msg in await self.next_messages(subscription, 1)])
+            self.assertTrue(subscription.queue.empty())
+            gauges = {sample.name for sample in self.manager.metrics_gauges()}
+            self.assertIn("hummingbot_websocket_messages_per_second", gauges)
+        self.run_async(run())
+
+
+if __name__ == "__main__":
+    unittest.main()